@@ -23,6 +23,7 @@ from domain.auth.models.bases.user_sync_profile import UserSyncProfile
 from domain.master.models.bases.raw_economic_data import RawEconomicData  # Bronze
 from domain.master.models.bases.raw_market_timeseries import RawMarketTimeseries  # Bronze
 from domain.master.models.bases.raw_opportunity_data import RawOpportunityData  # Bronze
+from domain.master.models.bases.api_quota_usage import ApiQuotaUsage  # API 쿼터 원장
 
 target_metadata = Base.metadata
 
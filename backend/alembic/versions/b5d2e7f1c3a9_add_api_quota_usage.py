@@ -0,0 +1,41 @@
+"""api_quota_usage (외부 API 쿼터 원장 — Redis 폴백)."""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision: str = "b5d2e7f1c3a9"
+down_revision: Union[str, None] = "a3f8c2d1e9b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "api_quota_usage",
+        sa.Column("provider", sa.String(length=50), nullable=False, comment="쿼터 단위"),
+        sa.Column("period_key", sa.String(length=10), nullable=False, comment="YYYY-MM-DD 또는 YYYY-MM"),
+        sa.Column("used", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("scheduled_used", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "by_job",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default="{}",
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("provider", "period_key"),
+        comment="외부 API 키별 기간(일/월) 호출 사용량",
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("api_quota_usage")
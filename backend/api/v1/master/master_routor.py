@@ -3,8 +3,7 @@
 from __future__ import annotations
 
 import logging
-import tempfile
-import uuid
+import shutil
 from datetime import datetime
 from pathlib import Path
 
@@ -21,11 +20,25 @@ from fastapi import (
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.api_quota import QuotaPriority, get_quota_ledger, quota_context
 from core.config.settings import get_settings
 from core.database import AsyncSessionLocal, get_db
 from core.scheduler import list_jobs as scheduler_list_jobs
 from core.scheduler import run_job_now as scheduler_run_job_now
-from domain.master.hub.services.bronze_economic_ingest_service import BronzeEconomicIngestService
+from domain.master.hub.services.bronze_economic_ingest_service import (
+    WORDPRESS_SITE_KEYS,
+    BronzeEconomicIngestService,
+)
+from domain.master.hub.services.collectors.economic.common.content_store import (
+    FileTooLargeError,
+    store_stream,
+)
+from domain.master.hub.services.moef_upload_jobs import (
+    MOEF_UPLOAD_MAX_BYTES,
+    get_upload_jobs,
+    iter_upload_chunks,
+    run_moef_upload_job,
+)
 from domain.master.hub.services.bronze_market_timeseries_ingest_service import (
     BronzeMarketTimeseriesIngestService,
 )
@@ -115,6 +128,10 @@ class WowtaleArchiveRequest(BaseModel):
             "['funding', 'venture-capital', 'Global-news']"
         ),
     )
+    resume: bool = Field(
+        default=True,
+        description="같은 인자로 중단된 Backfill 이 있으면 체크포인트 다음 페이지부터 이어서 수집",
+    )
 
 
 _ARCHIVE_INVESTMENT_FILTER_SLUGS: frozenset[str] = frozenset({"Global-news"})
@@ -165,6 +182,7 @@ async def run_wowtale_archive_bronze(
                 from_date=from_date,
                 fetch_article_body=body.fetch_article_body,
                 categories=categories,
+                resume=body.resume,
             )
         logger.info("Wowtale archive backfill 완료: %s", result)
 
@@ -175,7 +193,92 @@ async def run_wowtale_archive_bronze(
         "message": (
             f"Wowtale 아카이브 Backfill이 백그라운드에서 시작되었습니다. "
             f"max_pages={body.max_pages}, from_date={body.from_date}, "
-            f"fetch_article_body={body.fetch_article_body}"
+            f"fetch_article_body={body.fetch_article_body}, resume={body.resume}"
+        ),
+    }
+
+
+class WordPressBackfillRequest(BaseModel):
+    """WordPress REST API 대량 Backfill 요청 파라미터."""
+
+    site: str = Field(description="wowtale / platum / venturesquare / startup_recipe")
+    categories: list[str] | None = Field(
+        default=None,
+        description="카테고리 slug 목록. 미입력 시 사이트 기본값 (Wowtale: funding·venture-capital·Global-news)",
+    )
+    from_date: str | None = Field(default=None, description="이 날짜 이후 글만 (YYYY-MM-DD)")
+    to_date: str | None = Field(default=None, description="이 날짜 이전 글만 (YYYY-MM-DD)")
+    max_requests: int | None = Field(
+        default=None, ge=1, le=1000, description="posts 요청 횟수 상한 (요청당 100건)"
+    )
+    html_fallback: bool = Field(
+        default=True,
+        description="REST API 가 막혀 있으면 HTML 아카이브 크롤러로 폴백 (Wowtale 만 지원)",
+    )
+
+
+@router.post(
+    "/bronze/economic/wordpress-backfill",
+    status_code=202,
+    summary="WordPress REST API 대량 Backfill (비동기)",
+)
+async def run_wordpress_backfill_bronze(
+    body: WordPressBackfillRequest,
+    background_tasks: BackgroundTasks,
+):
+    """``wp-json/wp/v2/posts`` 를 100건 단위로 받아 `raw_economic_data`에 적재 (Backfill 전용).
+
+    HTML 아카이브 크롤(기사당 요청 2회 + HTML 파싱)보다 요청 수가 한 자릿수 이상 적다.
+    **202 Accepted** 로 즉시 응답하고 BackgroundTask에서 실행한다.
+    """
+    from datetime import timedelta, timezone
+
+    _KST = timezone(timedelta(hours=9))
+
+    if body.site not in WORDPRESS_SITE_KEYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"site 는 {', '.join(WORDPRESS_SITE_KEYS)} 중 하나입니다.",
+        )
+
+    dates: dict[str, datetime | None] = {}
+    for name in ("from_date", "to_date"):
+        raw = getattr(body, name)
+        try:
+            dates[name] = datetime.strptime(raw, "%Y-%m-%d").replace(tzinfo=_KST) if raw else None
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail=f"{name} 형식은 YYYY-MM-DD 입니다. 예: 2025-01-01",
+            ) from None
+
+    categories: list[tuple[str, bool]] | None = None
+    if body.categories:
+        categories = [
+            (slug, slug in _ARCHIVE_INVESTMENT_FILTER_SLUGS)
+            for slug in body.categories
+        ]
+
+    async def _run_backfill() -> None:
+        async with AsyncSessionLocal() as bg_session:
+            svc = BronzeEconomicIngestService(bg_session, None)
+            result = await svc.ingest_wordpress_backfill(
+                body.site,
+                categories=categories,
+                from_date=dates["from_date"],
+                to_date=dates["to_date"],
+                max_requests=body.max_requests,
+                html_fallback=body.html_fallback,
+            )
+        logger.info("WordPress REST backfill 완료: %s", result)
+
+    background_tasks.add_task(_run_backfill)
+
+    return {
+        "status": "accepted",
+        "message": (
+            f"{body.site} WordPress REST Backfill이 백그라운드에서 시작되었습니다. "
+            f"from_date={body.from_date}, to_date={body.to_date}, max_requests={body.max_requests}"
         ),
     }
 
@@ -262,7 +365,7 @@ async def run_yahoo_market_timeseries_bronze(
     ),
     db: AsyncSession = Depends(get_db),
 ):
-    """Yahoo Finance 16티커 일별 OHLCV → `raw_market_timeseries` upsert.
+    """Yahoo Finance 유니버스(`yahoo-universe.yml`) 일별 OHLCV → `raw_market_timeseries` upsert.
 
     급증 신호(`raw_economic_data`)와 분리된 **연속 시계열** Bronze.
     Silver에서 거래대금 추세·20일 평균 대비 비율·섹터 모멘텀 산출에 사용.
@@ -363,6 +466,73 @@ async def run_venturesquare_economic_bronze(
         ) from None
 
 
+@router.post("/bronze/economic/wordpress-rss")
+async def run_wordpress_rss_economic_bronze(
+    sites: list[str] | None = Query(
+        None,
+        description="wowtale / platum / venturesquare / startup_recipe (미입력 시 전부)",
+    ),
+    max_items: int = Query(50, ge=1, le=100, description="사이트별 최대 수집 건수"),
+    fetch_article_if_short: bool = Query(
+        True,
+        description="RSS 본문이 짧으면 기사 permalink 를 GET 해 보완",
+    ),
+    db: AsyncSession = Depends(get_db),
+):
+    """WordPress RSS 사이트들을 동시에 수집해 `raw_economic_data`에 적재 (사이트별 결과)."""
+    svc = BronzeEconomicIngestService(db, None)
+    try:
+        return await svc.ingest_wordpress_rss(
+            sites=sites,
+            max_items=max_items,
+            fetch_article_if_short=fetch_article_if_short,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception:
+        logger.exception("WordPress RSS Bronze ingest 실패")
+        raise HTTPException(
+            status_code=502,
+            detail="WordPress RSS 수집 중 오류가 발생했습니다.",
+        ) from None
+
+
+@router.post("/bronze/economic/wordpress-sitemap")
+async def run_wordpress_sitemap_economic_bronze(
+    sites: list[str] | None = Query(
+        None,
+        description="wowtale / platum / venturesquare / startup_recipe (미입력 시 전부)",
+    ),
+    initial_lookback_days: int = Query(
+        14, ge=1, le=365, description="워터마크가 없을 때(첫 실행·reset) 볼 기간(일)"
+    ),
+    max_urls: int = Query(500, ge=1, le=5000, description="사이트별 1회 처리 URL 상한"),
+    max_unresolved_attempts: int = Query(
+        3, ge=1, le=50, description="REST 에 없는 URL 재시도 실행 횟수 (이후 워터마크를 넘김)"
+    ),
+    reset: bool = Query(False, description="사이트맵 워터마크를 지우고 다시 시작"),
+    db: AsyncSession = Depends(get_db),
+):
+    """사이트맵 lastmod 기준으로 직전 실행 이후 새로 올라온 WordPress 글만 `raw_economic_data`에 적재."""
+    svc = BronzeEconomicIngestService(db, None)
+    try:
+        return await svc.ingest_wordpress_sitemap(
+            sites=sites,
+            initial_lookback_days=initial_lookback_days,
+            max_urls=max_urls,
+            max_unresolved_attempts=max_unresolved_attempts,
+            reset=reset,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception:
+        logger.exception("WordPress 사이트맵 Bronze ingest 실패")
+        raise HTTPException(
+            status_code=502,
+            detail="WordPress 사이트맵 수집 중 오류가 발생했습니다.",
+        ) from None
+
+
 # ---------------------------------------------------------------------------
 # 정부 문서 (전략 A·B) — GOVT_DOCS_COLLECTION_STRATEGY.md 구현
 # ---------------------------------------------------------------------------
@@ -551,12 +721,18 @@ class MoefBatchIngestRequest(BaseModel):
     """
 
     paths: list[str] = Field(
-        ..., min_length=1, description="서버에서 접근 가능한 로컬 파일 경로 리스트"
+        ...,
+        min_length=1,
+        description="서버에서 접근 가능한 로컬 파일·디렉터리 경로 리스트 (디렉터리는 하위 지원 파일 전체)",
     )
     source_type: str | None = Field(
         default=None,
         description="명시 시 모든 파일을 동일 source_type 으로 적재 (예: GOVT_MOEF_BUDGET)",
     )
+    force: bool = Field(
+        default=False,
+        description="True 면 매니페스트상 이미 적재된 파일도 다시 파싱",
+    )
 
 
 @router.post("/bronze/economic/moef-local-pdfs")
@@ -574,6 +750,7 @@ async def run_moef_local_pdfs_bronze(
         return await svc.ingest_moef_local_pdfs(
             paths=body.paths,
             source_type=body.source_type,
+            force=body.force,
         )
     except Exception:
         logger.exception("MOEF 로컬 PDF Bronze ingest 실패")
@@ -596,89 +773,61 @@ async def upload_moef_budget_file(
 ):
     """파일 업로드 + 비동기 백그라운드 파싱 (504 Gateway Timeout 방지).
 
-    **응답**: `202 Accepted` — 업로드 즉시 수락, 실제 파싱·적재는 `BackgroundTasks` 가 수행.
+    업로드는 1MB 청크로 잡 전용 디렉터리에 스트리밍 저장하며 SHA-256 을 동시에 계산한다
+    (API 메모리 사용 = 청크 1개, 상한 ``MOEF_UPLOAD_MAX_BYTES`` 초과 시 413).
+    같은 내용의 잡이 진행 중이면 그 잡을 돌려준다.
+
+    **응답**: `202 Accepted` — `job_id` 로 `GET /bronze/economic/moef-upload/{job_id}` 진행 조회.
     """
-    # 임시 저장 (파일 크기에 비례한 디스크 사용)
-    safe_suffix = Path(file.filename or "upload").suffix.lower() or ".bin"
-    tmp_dir = Path(tempfile.gettempdir()) / "moef_uploads"
-    tmp_dir.mkdir(parents=True, exist_ok=True)
-    job_id = uuid.uuid4().hex
-    tmp_path = tmp_dir / f"{job_id}{safe_suffix}"
-
-    # 청크 단위 저장 — 대용량(수십 MB) 안전
+    jobs = get_upload_jobs()
+    original_filename = file.filename or "upload"
+    safe_suffix = Path(original_filename).suffix.lower() or ".bin"
+    job = jobs.create(original_filename)
     try:
-        with tmp_path.open("wb") as f:
-            while True:
-                chunk = await file.read(1024 * 1024)
-                if not chunk:
-                    break
-                f.write(chunk)
+        stored = await store_stream(
+            iter_upload_chunks(file.read),
+            job.upload_dir,
+            suffix=safe_suffix,
+            max_bytes=MOEF_UPLOAD_MAX_BYTES,
+        )
+    except FileTooLargeError as e:
+        jobs.discard(job)
+        shutil.rmtree(job.upload_dir, ignore_errors=True)
+        raise HTTPException(status_code=413, detail=f"파일이 너무 큽니다 ({e.limit // (1024 * 1024)}MB 초과).") from None
+    except Exception:
+        jobs.discard(job)
+        shutil.rmtree(job.upload_dir, ignore_errors=True)
+        logger.exception("MOEF 업로드 저장 실패 file=%s", original_filename)
+        raise HTTPException(status_code=500, detail="업로드 파일 저장 중 오류가 발생했습니다.") from None
     finally:
         await file.close()
 
-    original_filename = file.filename or tmp_path.name
+    active = jobs.claim(job, stored)
+    if active is not None:
+        shutil.rmtree(job.upload_dir, ignore_errors=True)
+        return {**active.to_dict(), "duplicate_of_active_job": True}
+
     # 파일명에 잡음(공백·괄호·기호) 가능 — Path.stem 으로 확장자만 정리한 기본 제목.
     fallback_title = Path(original_filename).stem
     background_tasks.add_task(
-        _run_moef_upload_job,
-        tmp_path=str(tmp_path),
-        original_filename=original_filename,
+        run_moef_upload_job,
+        job,
+        stored,
         source_type=source_type,
         raw_title=raw_title or fallback_title,
         source_url=source_url,
         published_at=published_at,
     )
+    return job.to_dict()
 
-    return {
-        "job_id": job_id,
-        "status": "queued",
-        "tmp_path": str(tmp_path),
-        "original_filename": file.filename,
-        "received_size_bytes": tmp_path.stat().st_size,
-    }
 
-
-async def _run_moef_upload_job(
-    *,
-    tmp_path: str,
-    original_filename: str,
-    source_type: str | None,
-    raw_title: str | None,
-    source_url: str | None,
-    published_at: datetime | None,
-) -> None:
-    """`BackgroundTasks` 에서 호출되는 적재 잡 — 독립 세션·예외 격리."""
-    path = Path(tmp_path)
-    try:
-        # raw_title 가 들어왔다면 deterministic URL 보존 위해 source_url 우선 사용
-        async with AsyncSessionLocal() as session:
-            svc = BronzeEconomicIngestService(session, None)
-            try:
-                result = await svc.ingest_moef_local_pdfs(
-                    paths=[path],
-                    source_type=source_type,
-                    source_url=source_url,
-                    published_at=published_at,
-                    raw_title=raw_title,
-                    original_filename=original_filename,
-                )
-                logger.info(
-                    "MOEF upload job done file=%s result=%s",
-                    original_filename,
-                    result,
-                )
-            finally:
-                await session.close()
-    except Exception:
-        logger.exception(
-            "MOEF upload job 실패 file=%s tmp=%s", original_filename, tmp_path
-        )
-    finally:
-        # 디스크 정리 (실패해도 무시)
-        try:
-            path.unlink(missing_ok=True)
-        except Exception:
-            pass
+@router.get("/bronze/economic/moef-upload/{job_id}")
+async def get_moef_upload_job(job_id: str):
+    """업로드 잡 진행 상태 — stage(uploaded/parsing/inserting/inserted/failed), 페이지 진행률, 단계별 소요 시간."""
+    job = get_upload_jobs().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="알 수 없는 job_id 입니다 (완료 후 오래됐거나 서버 재시작).")
+    return job.to_dict()
 
 
 @router.delete("/bronze/economic/by-source-type/{source_type}")
@@ -867,6 +1016,10 @@ async def run_naver_datalab_bronze(
         naver_client_secret=settings.naver_client_secret,
     )
     try:
+        # 과거 구간 지정 = 백필 → 스케줄 잡 예약분을 침범하지 않도록 BACKFILL 우선순위로 차감
+        if start_date:
+            with quota_context("naver_datalab_backfill", QuotaPriority.BACKFILL):
+                return await svc.ingest_naver_datalab(start_date=start_date, end_date=end_date)
         return await svc.ingest_naver_datalab(start_date=start_date, end_date=end_date)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -901,6 +1054,9 @@ async def run_naver_search_bronze(
         naver_client_secret=settings.naver_client_secret,
     )
     try:
+        if target_date:
+            with quota_context("naver_search_backfill", QuotaPriority.BACKFILL):
+                return await svc.ingest_naver_search(target_date=target_date)
         return await svc.ingest_naver_search(target_date=target_date)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
@@ -982,3 +1138,24 @@ async def run_scheduler_job_now(job_id: str):
         raise HTTPException(status_code=404, detail=str(e)) from e
     except RuntimeError as e:
         raise HTTPException(status_code=503, detail=str(e)) from e
+
+
+# ---------------------------------------------------------------------------
+# 외부 API 쿼터 원장
+# ---------------------------------------------------------------------------
+
+
+@router.get("/quota")
+async def get_api_quota(
+    provider: str | None = Query(None, description="dart / naver_search / naver_datalab / kipris / alio / smes / subsidy24"),
+):
+    """키별 현재 기간(일/월) 사용량과 잔여 호출 수.
+
+    - ``remaining``: 스케줄 잡 기준 잔여 (한도 - 사용량)
+    - ``remaining_unscheduled``: 수동 실행·백필이 쓸 수 있는 잔여 (스케줄 예약분 제외)
+    - ``by_job``: 잡별 사용량 (수동 엔드포인트는 ``manual``)
+    """
+    ledger = get_quota_ledger()
+    if provider and provider not in ledger.policies:
+        raise HTTPException(status_code=404, detail=f"unknown provider: {provider}")
+    return {"providers": await ledger.snapshot(provider)}
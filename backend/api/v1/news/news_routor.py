@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from typing import Optional, List
 import os
 import logging
@@ -50,45 +50,15 @@ async def get_latest_news(
 ):
     """
     최신 뉴스 조회 (여러 카테고리 통합)
-    - 여러 카테고리의 최신 뉴스를 통합하여 반환
-    - 중복 제거 및 정렬 처리
+    - 카테고리들의 RSS 피드를 중복 없이 한 번씩 병렬 수집 (피드 캐시 경유)
+    - 날짜순 병합 및 중복 제거, 직렬화된 응답은 피드가 갱신될 때까지 재사용
     """
     try:
-        # Spring Boot와 동일한 카테고리 목록
-        categories = ["경제", "개발", "이슈", "정치", "사회", "과학", "기술", "엔터테인먼트", "스포츠", "세계"]
-        per_category = 15
-        
-        all_articles = []
-        
-        # 각 카테고리별로 뉴스 수집
-        for category in categories:
-            try:
-                articles = await news_service.search_news(category, per_category, 1)
-                all_articles.extend(articles)
-                logger.info(f"카테고리 '{category}' 뉴스 수집 완료: {len(articles)}개")
-            except Exception as e:
-                logger.warning(f"카테고리 {category} 뉴스 수집 실패: {e}")
-                continue
-        
-        # 중복 제거 (제목 기준)
-        unique_articles = news_service._remove_duplicates(all_articles)
-        
-        logger.info(f"중복 제거 후 기사 수: {len(unique_articles)}개")
-        
-        # 요청한 개수만큼만 반환
-        final_articles = unique_articles[:display] if display else unique_articles
-        
-        logger.info(f"최종 반환 기사 수: {len(final_articles)}개")
-        
-        return {
-            "success": True,
-            "articles": [article.dict() for article in final_articles],
-            "count": len(final_articles)
-        }
+        body = await news_service.get_latest_news_response(display)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error(f"최신 뉴스 조회 실패: {e}", exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"최신 뉴스 조회 실패: {str(e)}"
         )
-
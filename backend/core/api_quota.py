@@ -0,0 +1,433 @@
+"""외부 API 키 쿼터 원장 (공통 인프라).
+
+같은 키를 여러 잡이 나눠 쓴다. 일·월 한도는 아래와 같다.
+
+  - DART      : dart · dart_periodic · dart_ipo · nps_portfolio · 수동 엔드포인트 (일 20,000)
+  - Naver 검색 : news_service(/api/news/search) · naver_search (일 25,000)
+  - Naver DataLab : naver_datalab (일 1,000)
+  - KIPRIS    : kipris_patents (월 1,000)
+  - 공공데이터포털 : ALIO · SMES · 보조금24 (API 별 일 한도)
+
+모든 요청은 전송 직전에 ``charge(provider)`` 로 1건씩 차감한다. 수집기는 HTTP 클라이언트에
+`httpx_quota_hook` / `aiohttp_quota_trace` 를 달기만 하면 된다.
+
+우선순위 예약:
+  - ``reserve`` 건은 **스케줄 잡 전용**이다. 수동 실행·백필은 ``limit - (reserve - 스케줄 사용량)``
+    까지만 쓸 수 있다. 그래서 남는 쿼터만 소비하고 일일 수집 몫을 잠식하지 않는다.
+  - 잡 이름·우선순위는 ``quota_context`` (contextvar) 로 전달된다. 스케줄러가 잡마다 설정하며,
+    설정이 없으면 ``manual`` 로 본다.
+
+저장소:
+  - 기본은 Redis 해시 ``quota:<provider>:<period_key>`` 이고, Lua 스크립트로 한도 확인과 차감을 원자적으로 처리한다.
+  - Redis 장애 시에는 Postgres ``api_quota_usage`` 조건부 UPDATE 로 폴백한다. 60초 후 Redis 를 재시도한다.
+  - 두 저장소 모두 실패하면 **통과(fail-open)** 하고 경고만 남긴다. 원장 장애로 수집을 멈추지 않는다.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Any
+
+import aiohttp
+import httpx
+import redis.asyncio as redis
+from sqlalchemy import Integer, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from core.config.settings import get_settings
+from core.database import AsyncSessionLocal
+from domain.master.models.bases.api_quota_usage import ApiQuotaUsage
+
+logger = logging.getLogger(__name__)
+
+_KST = timezone(timedelta(hours=9))
+
+# Redis 장애 후 재시도까지 Postgres 만 사용하는 시간(초)
+_REDIS_RETRY_SEC = 60.0
+
+
+class QuotaPriority(str, Enum):
+    SCHEDULED = "scheduled"  # 스케줄러 잡 — 예약분 사용 가능
+    MANUAL = "manual"  # 수동 엔드포인트·사용자 요청
+    BACKFILL = "backfill"  # 대량 백필
+
+
+@dataclass(frozen=True)
+class QuotaPolicy:
+    provider: str
+    limit: int
+    period: str  # "day" | "month"
+    reserve: int  # 스케줄 잡 전용 예약분
+    description: str = ""
+
+    def period_key(self, now: datetime | None = None) -> str:
+        now = (now or datetime.now(_KST)).astimezone(_KST)
+        return now.strftime("%Y-%m-%d" if self.period == "day" else "%Y-%m")
+
+    def ttl_seconds(self) -> int:
+        return 2 * 86400 if self.period == "day" else 35 * 86400
+
+
+DEFAULT_POLICIES: dict[str, QuotaPolicy] = {
+    p.provider: p
+    for p in (
+        QuotaPolicy("dart", 20_000, "day", 5_000, "OpenDART 인증키"),
+        QuotaPolicy("naver_search", 25_000, "day", 5_000, "Naver 검색 API (뉴스)"),
+        QuotaPolicy("naver_datalab", 1_000, "day", 300, "Naver DataLab 검색어 트렌드"),
+        QuotaPolicy("kipris", 1_000, "month", 200, "KIPRIS PLUS 특허 검색"),
+        QuotaPolicy("alio", 1_000, "day", 300, "공공데이터포털 ALIO 사업정보"),
+        QuotaPolicy("smes", 1_000, "day", 300, "공공데이터포털 중기부 사업공고"),
+        QuotaPolicy("subsidy24", 10_000, "day", 2_000, "공공데이터포털(odcloud) 보조금24"),
+    )
+}
+
+
+class QuotaExceededError(RuntimeError):
+    """우선순위별 허용 한도를 넘는 요청."""
+
+    def __init__(self, provider: str, job: str, priority: QuotaPriority, used: int) -> None:
+        super().__init__(
+            f"API quota exceeded provider={provider} job={job} priority={priority.value} used={used}"
+        )
+        self.provider = provider
+        self.job = job
+        self.priority = priority
+
+
+# ---------------------------------------------------------------------------
+# 잡 컨텍스트
+# ---------------------------------------------------------------------------
+
+
+_CONTEXT: contextvars.ContextVar[tuple[str, QuotaPriority]] = contextvars.ContextVar(
+    "api_quota_context", default=("manual", QuotaPriority.MANUAL)
+)
+
+
+@contextmanager
+def quota_context(job: str, priority: QuotaPriority = QuotaPriority.MANUAL) -> Iterator[None]:
+    """이 블록 안(하위 task·to_thread 포함)의 차감을 ``job``/``priority`` 로 기록."""
+    token = _CONTEXT.set((job, priority))
+    try:
+        yield
+    finally:
+        _CONTEXT.reset(token)
+
+
+def current_quota_context() -> tuple[str, QuotaPriority]:
+    return _CONTEXT.get()
+
+
+# ---------------------------------------------------------------------------
+# 원장
+# ---------------------------------------------------------------------------
+
+
+# KEYS[1]=hash, ARGV: n, limit, reserve, is_scheduled(0/1), job, ttl
+# 반환: 차감 후 used, 거절 시 -(현재 used) - 1
+_CHARGE_LUA = """
+local used = tonumber(redis.call('HGET', KEYS[1], 'used') or '0')
+local sched = tonumber(redis.call('HGET', KEYS[1], 'scheduled') or '0')
+local n = tonumber(ARGV[1])
+local cap = tonumber(ARGV[2])
+if ARGV[4] ~= '1' then
+  cap = cap - math.max(0, tonumber(ARGV[3]) - sched)
+end
+if used + n > cap then
+  return -used - 1
+end
+redis.call('HINCRBY', KEYS[1], 'used', n)
+if ARGV[4] == '1' then
+  redis.call('HINCRBY', KEYS[1], 'scheduled', n)
+end
+redis.call('HINCRBY', KEYS[1], 'job:' .. ARGV[5], n)
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[6]))
+return used + n
+"""
+
+
+def _load_policies(overrides: str | None) -> dict[str, QuotaPolicy]:
+    policies = dict(DEFAULT_POLICIES)
+    if not overrides:
+        return policies
+    try:
+        parsed = json.loads(overrides)
+    except ValueError:
+        logger.warning("[api_quota] API_QUOTA_LIMITS JSON 파싱 실패 — 기본 한도 사용")
+        return policies
+    for provider, spec in (parsed or {}).items():
+        if not isinstance(spec, dict):
+            continue
+        base = policies.get(provider) or QuotaPolicy(provider, 0, "day", 0)
+        fields = {k: spec[k] for k in ("limit", "period", "reserve") if k in spec}
+        policies[provider] = replace(base, **fields)
+    return policies
+
+
+def _allowed_cap(policy: QuotaPolicy, scheduled_used: int, priority: QuotaPriority) -> int:
+    if priority is QuotaPriority.SCHEDULED:
+        return policy.limit
+    return policy.limit - max(0, policy.reserve - scheduled_used)
+
+
+class ApiQuotaLedger:
+    """provider 별 기간 사용량 원장. ``charge`` 는 허용 시 차감, 초과 시 `QuotaExceededError`."""
+
+    def __init__(
+        self,
+        policies: dict[str, QuotaPolicy],
+        *,
+        redis_client: redis.Redis | None,
+        key_prefix: str = "quota:",
+        enabled: bool = True,
+    ) -> None:
+        self._policies = policies
+        self._redis = redis_client
+        self._prefix = key_prefix
+        self._enabled = enabled
+        self._redis_down_until = 0.0
+
+    @property
+    def policies(self) -> dict[str, QuotaPolicy]:
+        return self._policies
+
+    def _redis_usable(self) -> bool:
+        return self._redis is not None and time.monotonic() >= self._redis_down_until
+
+    def _mark_redis_down(self, exc: Exception) -> None:
+        if self._redis_down_until <= time.monotonic():
+            logger.warning("[api_quota] Redis 사용 불가 — Postgres 원장으로 폴백: %s", exc)
+        self._redis_down_until = time.monotonic() + _REDIS_RETRY_SEC
+
+    def _key(self, policy: QuotaPolicy, period_key: str) -> str:
+        return f"{self._prefix}{policy.provider}:{period_key}"
+
+    async def charge(
+        self,
+        provider: str,
+        n: int = 1,
+        *,
+        job: str | None = None,
+        priority: QuotaPriority | None = None,
+    ) -> int | None:
+        """``n`` 건 차감 → 차감 후 사용량 (원장 미사용·미등록 provider·저장소 장애 시 None)."""
+        policy = self._policies.get(provider)
+        if not self._enabled or policy is None:
+            return None
+        ctx_job, ctx_priority = current_quota_context()
+        job = job or ctx_job
+        priority = priority or ctx_priority
+        period_key = policy.period_key()
+
+        if self._redis_usable():
+            try:
+                result = int(
+                    await self._redis.eval(  # type: ignore[union-attr]
+                        _CHARGE_LUA,
+                        1,
+                        self._key(policy, period_key),
+                        n,
+                        policy.limit,
+                        policy.reserve,
+                        "1" if priority is QuotaPriority.SCHEDULED else "0",
+                        job,
+                        policy.ttl_seconds(),
+                    )
+                )
+            except (redis.RedisError, OSError) as e:
+                self._mark_redis_down(e)
+            else:
+                if result < 0:
+                    used = -result - 1
+                    raise QuotaExceededError(provider, job, priority, used)
+                return result
+
+        try:
+            return await self._charge_postgres(policy, period_key, n, job, priority)
+        except (SQLAlchemyError, OSError):
+            logger.warning("[api_quota] Postgres 원장 차감 실패 — 통과 provider=%s", provider, exc_info=True)
+            return None
+
+    async def _charge_postgres(
+        self,
+        policy: QuotaPolicy,
+        period_key: str,
+        n: int,
+        job: str,
+        priority: QuotaPriority,
+    ) -> int:
+        t = ApiQuotaUsage
+        is_scheduled = priority is QuotaPriority.SCHEDULED
+        cap = (
+            literal(policy.limit)
+            if is_scheduled
+            else literal(policy.limit) - func.greatest(0, literal(policy.reserve) - t.scheduled_used)
+        )
+        job_count = func.coalesce(t.by_job[job].astext.cast(Integer), 0) + n
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                pg_insert(t)
+                .values(provider=policy.provider, period_key=period_key)
+                .on_conflict_do_nothing(index_elements=["provider", "period_key"])
+            )
+            row = (
+                await session.execute(
+                    update(t)
+                    .where(t.provider == policy.provider, t.period_key == period_key, t.used + n <= cap)
+                    .values(
+                        used=t.used + n,
+                        scheduled_used=t.scheduled_used + (n if is_scheduled else 0),
+                        by_job=t.by_job.op("||")(func.jsonb_build_object(job, job_count)),
+                        updated_at=func.now(),
+                    )
+                    .returning(t.used)
+                )
+            ).first()
+            if row is None:
+                used = (
+                    await session.execute(
+                        select(t.used).where(t.provider == policy.provider, t.period_key == period_key)
+                    )
+                ).scalar_one()
+                await session.rollback()
+                raise QuotaExceededError(policy.provider, job, priority, used)
+            await session.commit()
+            return int(row[0])
+
+    async def _usage(self, policy: QuotaPolicy, period_key: str) -> tuple[int, int, dict[str, int]]:
+        if self._redis_usable():
+            try:
+                raw = await self._redis.hgetall(self._key(policy, period_key))  # type: ignore[union-attr]
+            except (redis.RedisError, OSError) as e:
+                self._mark_redis_down(e)
+            else:
+                fields = {
+                    (k.decode() if isinstance(k, bytes) else k): int(v) for k, v in raw.items()
+                }
+                by_job = {k[4:]: v for k, v in fields.items() if k.startswith("job:")}
+                return fields.get("used", 0), fields.get("scheduled", 0), by_job
+
+        t = ApiQuotaUsage
+        async with AsyncSessionLocal() as session:
+            row = (
+                await session.execute(
+                    select(t.used, t.scheduled_used, t.by_job).where(
+                        t.provider == policy.provider, t.period_key == period_key
+                    )
+                )
+            ).first()
+        if row is None:
+            return 0, 0, {}
+        return int(row[0]), int(row[1]), {k: int(v) for k, v in (row[2] or {}).items()}
+
+    async def snapshot(self, provider: str | None = None) -> list[dict[str, Any]]:
+        """provider 별 현재 기간 사용량·잔여 (스케줄 잡 / 그 외 우선순위 기준)."""
+        out: list[dict[str, Any]] = []
+        for policy in self._policies.values():
+            if provider and policy.provider != provider:
+                continue
+            period_key = policy.period_key()
+            try:
+                used, scheduled_used, by_job = await self._usage(policy, period_key)
+            except (SQLAlchemyError, OSError):
+                logger.warning("[api_quota] 사용량 조회 실패 provider=%s", policy.provider, exc_info=True)
+                used, scheduled_used, by_job = 0, 0, {}
+            out.append(
+                {
+                    **asdict(policy),
+                    "period_key": period_key,
+                    "used": used,
+                    "scheduled_used": scheduled_used,
+                    "remaining": max(0, policy.limit - used),
+                    "remaining_unscheduled": max(
+                        0, _allowed_cap(policy, scheduled_used, QuotaPriority.MANUAL) - used
+                    ),
+                    "by_job": by_job,
+                }
+            )
+        return out
+
+
+_LEDGER: ApiQuotaLedger | None = None
+
+
+def get_quota_ledger() -> ApiQuotaLedger:
+    """프로세스 공용 원장 (settings 의 Redis·한도 사용)."""
+    global _LEDGER
+    if _LEDGER is None:
+        settings = get_settings()
+        client: redis.Redis | None
+        try:
+            client = redis.Redis(
+                host=settings.redis_host,
+                port=settings.redis_port,
+                password=settings.redis_password,
+                ssl=settings.redis_ssl_enabled,
+                decode_responses=False,
+                socket_timeout=2.0,
+                socket_connect_timeout=2.0,
+            )
+        except Exception:
+            logger.warning("[api_quota] Redis 클라이언트 생성 실패 — Postgres 원장만 사용", exc_info=True)
+            client = None
+        _LEDGER = ApiQuotaLedger(
+            _load_policies(settings.api_quota_limits),
+            redis_client=client,
+            key_prefix=settings.redis_quota_prefix,
+            enabled=settings.api_quota_enabled,
+        )
+    return _LEDGER
+
+
+async def charge(provider: str, n: int = 1) -> int | None:
+    """현재 `quota_context` 로 ``provider`` 쿼터 ``n`` 건 차감."""
+    return await get_quota_ledger().charge(provider, n)
+
+
+# ---------------------------------------------------------------------------
+# HTTP 클라이언트 훅
+# ---------------------------------------------------------------------------
+
+
+def httpx_quota_hook(provider: str) -> Callable[[httpx.Request], Awaitable[None]]:
+    """``httpx.AsyncClient(event_hooks={"request": [httpx_quota_hook("dart")]})``."""
+
+    async def _hook(request: httpx.Request) -> None:
+        await charge(provider)
+
+    return _hook
+
+
+def aiohttp_quota_trace(provider: str) -> aiohttp.TraceConfig:
+    """``aiohttp.ClientSession(trace_configs=[aiohttp_quota_trace("kipris")])``."""
+
+    async def _on_request_start(session: Any, ctx: Any, params: Any) -> None:
+        await charge(provider)
+
+    trace = aiohttp.TraceConfig()
+    trace.on_request_start.append(_on_request_start)
+    return trace
+
+
+__all__ = [
+    "DEFAULT_POLICIES",
+    "ApiQuotaLedger",
+    "QuotaExceededError",
+    "QuotaPolicy",
+    "QuotaPriority",
+    "aiohttp_quota_trace",
+    "charge",
+    "current_quota_context",
+    "get_quota_ledger",
+    "httpx_quota_hook",
+    "quota_context",
+]
@@ -211,7 +211,20 @@ class Settings(BaseSettings):
         validation_alias=AliasChoices("SCHEDULER_WEEKLY_AT",),
     )
 
+    # 외부 API 쿼터 원장 (core.api_quota) — DART/Naver/KIPRIS/공공데이터포털 키 공유 한도
+    #   - false 면 차감·거절 없이 통과 (원장 미기록)
+    #   - API_QUOTA_LIMITS: 기본 한도 덮어쓰기 JSON, 예) {"dart": {"limit": 40000, "reserve": 8000}}
+    api_quota_enabled: bool = Field(
+        default=True,
+        validation_alias=AliasChoices("API_QUOTA_ENABLED",),
+    )
+    api_quota_limits: Optional[str] = Field(
+        default=None,
+        validation_alias=AliasChoices("API_QUOTA_LIMITS",),
+    )
+
     # Redis Key Prefixes
+    redis_quota_prefix: str = "quota:"
     redis_refresh_token_prefix: str = "refreshToken:"
     redis_user_tokens_prefix: str = "user:tokens:"
     redis_state_prefix: str = "oauth:state:"
@@ -0,0 +1,238 @@
+"""HTML 파싱 공통 계층 — 게시판·RSS·뉴스 추출의 빠른 경로.
+
+호출부 대부분이 ``BeautifulSoup(html, "html.parser")`` 로 전체 트리를 만든 뒤 텍스트 한 덩어리나
+첫 ``<img>`` 만 꺼내 쓴다. 순수 파이썬 ``html.parser`` 가 가장 느린 백엔드이므로:
+
+  - ``make_soup()``   : 트리 탐색(select/find_parent 등)이 필요한 곳 — bs4 API 는 그대로,
+    백엔드만 lxml(C) 로 (``HTML_PARSER``).
+  - ``html_text()`` / ``select_text()`` / ``text_and_first_image()`` : 텍스트·이미지만 필요한 곳 —
+    bs4 트리 없이 lxml 로 직접 파싱하고 **한 번의 순회**로 텍스트와 첫 이미지를 함께 뽑는다.
+    지원 셀렉터는 실제 쓰는 단순 형태(``tag``, ``.cls``, ``tag.cls``, ``#id``, 자손 공백, ``>``)뿐이다.
+
+lxml 미설치·파싱 예외·미지원 셀렉터는 bs4(html.parser) 경로로 폴백하며 결과는 bs4 ``get_text`` 와
+같다 (script/style/template·주석 제외, ``strip=True`` 면 조각별 strip 후 빈 조각 제거).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from typing import Any
+
+from bs4 import BeautifulSoup
+
+try:  # lxml 은 requirements 에 있으나 최소 환경에서도 import 가능하도록
+    import lxml.html as _lxml_html
+    from lxml import etree as _etree
+except ImportError:  # pragma: no cover
+    _lxml_html = None
+    _etree = None
+
+logger = logging.getLogger(__name__)
+
+HTML_PARSER = "lxml" if _lxml_html is not None else "html.parser"
+
+# bs4 get_text 기본값과 동일하게 텍스트에서 제외하는 요소
+_SKIP_TEXT_TAGS = frozenset({"script", "style", "template"})
+_IMG_ATTRS = ("src", "data-src", "data-lazy-src")
+
+_SIMPLE_SELECTOR_RE = re.compile(r"^(?P<tag>[a-zA-Z][\w-]*|\*)?(?P<rest>(?:[.#][\w-]+)*)$")
+
+
+def make_soup(html: str | bytes) -> BeautifulSoup:
+    """bs4 트리 — 가능한 가장 빠른 백엔드."""
+    return BeautifulSoup(html, HTML_PARSER)
+
+
+# ---------------------------------------------------------------------------
+# selector → XPath
+# ---------------------------------------------------------------------------
+
+
+@lru_cache(maxsize=256)
+def _compile_selector(selector: str) -> Any | None:
+    """단순 CSS 셀렉터 → 컴파일된 XPath. 미지원 문법이면 None."""
+    if _etree is None:
+        return None
+    parts: list[str] = []
+    axis = "//"
+    for token in selector.replace(">", " > ").split():
+        if token == ">":
+            axis = "/"
+            continue
+        m = _SIMPLE_SELECTOR_RE.match(token)
+        if not m or not (m.group("tag") or m.group("rest")):
+            return None
+        step = m.group("tag") or "*"
+        for kind, name in re.findall(r"([.#])([\w-]+)", m.group("rest")):
+            if kind == ".":
+                step += f"[contains(concat(' ', normalize-space(@class), ' '), ' {name} ')]"
+            else:
+                step += f"[@id='{name}']"
+        parts.append(axis + step)
+        axis = "//"
+    if not parts or axis == "/":
+        return None
+    return _etree.XPath("".join(parts))
+
+
+# ---------------------------------------------------------------------------
+# lxml fast path
+# ---------------------------------------------------------------------------
+
+
+def _parse(html: str) -> Any:
+    return _lxml_html.document_fromstring(html)
+
+
+def _walk(el: Any, pieces: list[str], want_image: bool) -> dict[str, str] | None:
+    """문서 순서 텍스트 조각 수집 + (선택) 첫 ``<img>`` 속성. 재귀 대신 스택."""
+    image: dict[str, str] | None = None
+    stack: list[tuple[Any, bool]] = [(el, False)]
+    while stack:
+        node, is_tail = stack.pop()
+        if is_tail:
+            if node.tail:
+                pieces.append(node.tail)
+            continue
+        tag = node.tag
+        if not isinstance(tag, str):  # 주석·처리명령 — 본문 제외, tail 은 유지
+            continue
+        if want_image and image is None and tag == "img":
+            image = dict(node.attrib)
+        if tag in _SKIP_TEXT_TAGS:
+            continue
+        if node.text:
+            pieces.append(node.text)
+        for child in reversed(node):
+            stack.append((child, True))
+            stack.append((child, False))
+    return image
+
+
+def _join(pieces: Iterable[str], separator: str, strip: bool) -> str:
+    if strip:
+        return separator.join(p for p in (s.strip() for s in pieces) if p)
+    return separator.join(pieces)
+
+
+def _node_text(node: Any, separator: str, strip: bool) -> str:
+    pieces: list[str] = []
+    _walk(node, pieces, want_image=False)
+    return _join(pieces, separator, strip)
+
+
+def _soup_text(node: Any, separator: str, strip: bool) -> str:
+    return node.get_text(separator=separator, strip=strip)
+
+
+# ---------------------------------------------------------------------------
+# public API
+# ---------------------------------------------------------------------------
+
+
+def html_text(html: str | None, *, separator: str = "", strip: bool = False) -> str:
+    """``BeautifulSoup(html).get_text(separator, strip)`` 와 같은 결과."""
+    return text_and_first_image(html, separator=separator, strip=strip, want_image=False)[0]
+
+
+def text_and_first_image(
+    html: str | None,
+    *,
+    separator: str = "",
+    strip: bool = False,
+    want_image: bool = True,
+) -> tuple[str, dict[str, str] | None]:
+    """텍스트와 첫 ``<img>`` 속성 dict 를 한 번의 파싱·순회로. 이미지가 없으면 None."""
+    if not html:
+        return "", None
+    if _lxml_html is not None:
+        try:
+            root = _parse(html)
+            pieces: list[str] = []
+            image = _walk(root, pieces, want_image)
+            return _join(pieces, separator, strip), image
+        except Exception:
+            logger.debug("lxml 파싱 실패 — html.parser 폴백", exc_info=True)
+    soup = BeautifulSoup(html, "html.parser")
+    img = soup.find("img") if want_image else None
+    return _soup_text(soup, separator, strip), (dict(img.attrs) if img else None)
+
+
+def first_image_src(attrs: dict[str, str] | None, keys: Sequence[str] = _IMG_ATTRS) -> str | None:
+    """``<img>`` 속성에서 src → data-src → data-lazy-src 순 첫 값."""
+    if not attrs:
+        return None
+    for key in keys:
+        value = attrs.get(key)
+        if isinstance(value, list):  # bs4 다중값 속성
+            value = " ".join(value)
+        if value:
+            return value
+    return None
+
+
+def select_text(
+    html: str | None,
+    selectors: Sequence[str],
+    *,
+    separator: str = "\n",
+    strip: bool = True,
+    min_len: int = 0,
+    fallback: str = "body",
+) -> str:
+    """``selectors`` 중 처음 매칭(텍스트 길이 ``min_len`` 초과)된 노드의 텍스트.
+
+    없으면 ``fallback`` — ``"body"``(body, 없으면 문서 전체) · ``"document"`` · ``"none"``(빈 문자열).
+    """
+    if not html:
+        return ""
+    compiled = [_compile_selector(s) for s in selectors]
+    if _lxml_html is not None and all(c is not None for c in compiled):
+        try:
+            root = _parse(html)
+            for xp in compiled:
+                found = xp(root)
+                if not found:
+                    continue
+                text = _node_text(found[0], separator, strip)
+                if len(text) > min_len:
+                    return text
+            return _fallback_text(root, fallback, separator, strip, lxml=True)
+        except Exception:
+            logger.debug("lxml select 실패 — html.parser 폴백", exc_info=True)
+
+    soup = BeautifulSoup(html, "html.parser")
+    for sel in selectors:
+        node = soup.select_one(sel)
+        if not node:
+            continue
+        text = _soup_text(node, separator, strip)
+        if len(text) > min_len:
+            return text
+    return _fallback_text(soup, fallback, separator, strip, lxml=False)
+
+
+def _fallback_text(root: Any, fallback: str, separator: str, strip: bool, *, lxml: bool) -> str:
+    if fallback == "none":
+        return ""
+    if lxml:
+        node = root
+        if fallback == "body":
+            body = root.find("body")
+            node = body if body is not None else root
+        return _node_text(node, separator, strip)
+    node = (root.body or root) if fallback == "body" else root
+    return _soup_text(node, separator, strip)
+
+
+__all__ = [
+    "HTML_PARSER",
+    "first_image_src",
+    "html_text",
+    "make_soup",
+    "select_text",
+    "text_and_first_image",
+]
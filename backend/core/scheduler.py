@@ -21,7 +21,7 @@ APScheduler ``AsyncIOScheduler`` 를 FastAPI 이벤트 루프 위에 띄워, ``B
 
 - **일일** (오전 9 시 KST):
   DART B/IPO/NPS · MSIT 보도자료/사업공고/R&D 예산 · MFDS/MSS · 보조금24 ·
-  Wowtale/Platum/Venturesquare/StartupRecipe · Yahoo OHLCV · SMES Opportunity
+  WordPress RSS(Wowtale/Platum/Venturesquare/StartupRecipe 동시 수집, 잡 1개) · Yahoo OHLCV · SMES Opportunity
 - **주간** (월요일 오전 9 시 KST):
   ALIO · Yahoo Finance ETF/Macro · BOK ECOS · DART 정기공시 · KIPRIS · Naver DataLab
 
@@ -38,6 +38,7 @@ from typing import Any, Callable, Awaitable
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
+from core.api_quota import QuotaPriority, quota_context
 from core.config.settings import get_settings
 from core.database import AsyncSessionLocal
 from domain.master.hub.services.bronze_economic_ingest_service import (
@@ -71,7 +72,9 @@ async def _run_job(
     """
     logger.info("[scheduler] job start: %s", job_name)
     try:
-        result = await coro_factory()
+        # 외부 API 호출은 이 잡 이름 + 스케줄 우선순위(예약분 사용 가능)로 쿼터 원장에 차감된다.
+        with quota_context(job_name, QuotaPriority.SCHEDULED):
+            result = await coro_factory()
         logger.info("[scheduler] job done : %s result=%s", job_name, result)
     except Exception:
         logger.exception("[scheduler] job FAILED: %s", job_name)
@@ -107,30 +110,18 @@ async def _job_dart() -> dict[str, Any] | None:
         return await svc.ingest_dart(include_ownership_disclosure=False)
 
 
-async def _job_wowtale() -> dict[str, Any]:
+async def _job_wordpress_rss() -> dict[str, Any]:
+    # Wowtale/Platum/Venturesquare/StartupRecipe — 피드·permalink 를 한 잡에서 동시에 받는다
     async with AsyncSessionLocal() as session:
         svc = BronzeEconomicIngestService(session, None)
-        return await svc.ingest_wowtale(max_items=50, fetch_article_if_short=True)
+        return await svc.ingest_wordpress_rss(max_items=50, fetch_article_if_short=True)
 
 
-async def _job_platum() -> dict[str, Any]:
+async def _job_wordpress_sitemap() -> dict[str, Any]:
+    # RSS 창에서 밀려난 글 보완 — 사이트맵 lastmod 워터마크 이후 URL 만 받는다
     async with AsyncSessionLocal() as session:
         svc = BronzeEconomicIngestService(session, None)
-        return await svc.ingest_platum(max_items=50, fetch_article_if_short=True)
-
-
-async def _job_venturesquare() -> dict[str, Any]:
-    async with AsyncSessionLocal() as session:
-        svc = BronzeEconomicIngestService(session, None)
-        return await svc.ingest_venturesquare(
-            max_items=50, fetch_article_if_short=True
-        )
-
-
-async def _job_startup_recipe() -> dict[str, Any]:
-    async with AsyncSessionLocal() as session:
-        svc = BronzeEconomicIngestService(session, None)
-        return await svc.ingest_startup_recipe(max_items=50)
+        return await svc.ingest_wordpress_sitemap()
 
 
 async def _job_yahoo_market_timeseries() -> dict[str, Any]:
@@ -324,10 +315,8 @@ async def _job_yahoo_macro() -> dict[str, Any]:
 # (job_id, factory, group)
 _DAILY_JOBS: tuple[tuple[str, Callable[[], Awaitable[Any]]], ...] = (
     ("dart",              _job_dart),
-    ("wowtale",           _job_wowtale),
-    ("platum",            _job_platum),
-    ("venturesquare",     _job_venturesquare),
-    ("startup_recipe",    _job_startup_recipe),
+    ("wordpress_rss",     _job_wordpress_rss),
+    ("wordpress_sitemap", _job_wordpress_sitemap),
     ("yahoo_market_ts",   _job_yahoo_market_timeseries),
     ("msit_press",        _job_msit_press),
     ("msit_biz",          _job_msit_biz),
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, func, or_, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from domain.auth.hub.repositories.base_repository import BaseRepository
@@ -38,9 +38,46 @@ class EconomicRepository(BaseRepository):
 
         return await self._execute_with_retry(_execute)
 
-    async def insert_many_skip_duplicates(self, rows: list[EconomicCollectDto]) -> int:
-        """URL 단위 유니크 제약 기준 ON CONFLICT DO NOTHING (배치 1회 커밋)."""
+    async def ids_by_source_urls(
+        self, source_urls: list[str], *, without_parse_error: bool = False
+    ) -> dict[str, int]:
+        """source_url → id (존재하는 것만). ``without_parse_error`` 면 파싱 실패 행은 뺀다."""
+        urls = list(dict.fromkeys(u for u in source_urls if u))
+        if not urls:
+            return {}
+
+        async def _execute() -> dict[str, int]:
+            q = select(RawEconomicData.source_url, RawEconomicData.id).where(
+                RawEconomicData.source_url.in_(urls)
+            )
+            if without_parse_error:
+                q = q.where(
+                    or_(
+                        RawEconomicData.raw_metadata.is_(None),
+                        ~RawEconomicData.raw_metadata.has_key("parse_error"),
+                    )
+                )
+            result = await self.session.execute(q)
+            return {url: int(row_id) for url, row_id in result.all()}
+
+        return await self._execute_with_retry(_execute)
+
+    async def existing_ids(self, ids: list[int]) -> set[int]:
+        """주어진 id 중 아직 존재하는 것."""
+        wanted = list(dict.fromkeys(i for i in ids if i is not None))
+        if not wanted:
+            return set()
+
+        async def _execute() -> set[int]:
+            q = select(RawEconomicData.id).where(RawEconomicData.id.in_(wanted))
+            result = await self.session.execute(q)
+            return {int(i) for i in result.scalars().all()}
+
+        return await self._execute_with_retry(_execute)
 
+    @staticmethod
+    def _payload(rows: list[EconomicCollectDto]) -> list[dict[str, Any]]:
+        """DTO → INSERT 값 (URL 없는 행·배치 내 중복 URL 제외, 컬럼 길이 절단)."""
         seen_batch: set[str] = set()
         payload: list[dict[str, Any]] = []
         for dto in rows:
@@ -63,7 +100,11 @@ class EconomicRepository(BaseRepository):
                     "published_at": dto.published_at,
                 }
             )
+        return payload
 
+    async def insert_many_skip_duplicates(self, rows: list[EconomicCollectDto]) -> int:
+        """URL 단위 유니크 제약 기준 ON CONFLICT DO NOTHING (배치 1회 커밋)."""
+        payload = self._payload(rows)
         if not payload:
             return 0
 
@@ -81,3 +122,40 @@ class EconomicRepository(BaseRepository):
             return inserted
 
         return await self._execute_with_retry(_execute)
+
+    async def upsert_replacing_parse_errors(self, rows: list[EconomicCollectDto]) -> dict[str, int]:
+        """신규 URL 은 INSERT, 기존 행은 ``raw_metadata.parse_error`` 가 있을 때만 덮어쓴다.
+
+        파싱 실패로 남은 행을 같은 (결정적) URL 의 정상 결과로 교체하기 위한 것 — 정상 행은 건드리지 않는다.
+
+        Returns:
+            이번에 삽입·갱신된 행의 source_url → id
+        """
+        payload = self._payload(rows)
+        if not payload:
+            return {}
+
+        stmt = pg_insert(RawEconomicData).values(payload)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["source_url"],
+            set_={
+                "source_type": stmt.excluded.source_type,
+                "raw_title": stmt.excluded.raw_title,
+                "investor_name": stmt.excluded.investor_name,
+                "target_company_or_fund": stmt.excluded.target_company_or_fund,
+                "investment_amount": stmt.excluded.investment_amount,
+                "currency": stmt.excluded.currency,
+                "raw_metadata": stmt.excluded.raw_metadata,
+                "published_at": stmt.excluded.published_at,
+                "collected_at": func.now(),
+            },
+            where=RawEconomicData.raw_metadata.has_key("parse_error"),
+        ).returning(RawEconomicData.source_url, RawEconomicData.id)
+
+        async def _execute() -> dict[str, int]:
+            result = await self.session.execute(stmt)
+            written = {url: int(row_id) for url, row_id in result.all()}
+            await self.session.commit()
+            return written
+
+        return await self._execute_with_retry(_execute)
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from datetime import date
 from typing import Any
 
+from sqlalchemy import select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.sql import func
 
@@ -12,36 +14,84 @@ from domain.master.models.bases.raw_market_timeseries import RawMarketTimeseries
 from domain.master.models.transfer.market_timeseries_dto import MarketTimeseriesDto
 
 
+# asyncpg 바인드 파라미터 상한(32767) 대비 — 13컬럼 × 1000행 단위로 나눠 upsert.
+_UPSERT_CHUNK_SIZE = 1000
+
+
 class MarketTimeseriesRepository(BaseRepository):
+    async def fetch_close_volume(
+        self,
+        *,
+        tickers: list[str] | None = None,
+        since: date | None = None,
+    ) -> list[tuple[str, date, float, int]]:
+        """백테스트용 (ticker, trade_date, close, volume) 행 — ticker·거래일 순 정렬."""
+
+        async def _execute() -> list[tuple[str, date, float, int]]:
+            q = select(
+                RawMarketTimeseries.ticker,
+                RawMarketTimeseries.trade_date,
+                RawMarketTimeseries.close_price,
+                RawMarketTimeseries.volume,
+            )
+            if tickers:
+                q = q.where(RawMarketTimeseries.ticker.in_(tickers))
+            if since is not None:
+                q = q.where(RawMarketTimeseries.trade_date >= since)
+            q = q.order_by(RawMarketTimeseries.ticker, RawMarketTimeseries.trade_date)
+            result = await self.session.execute(q)
+            return [
+                (ticker, trade_date, float(close), int(volume))
+                for ticker, trade_date, close, volume in result.all()
+            ]
+
+        return await self._execute_with_retry(_execute)
+
     async def upsert_many(self, rows: list[MarketTimeseriesDto]) -> int:
+        """DTO 목록을 dict 행으로 바꿔 ``upsert_rows`` 로 위임."""
+        return await self.upsert_rows(
+            [
+                {
+                    "ticker": dto.ticker.strip()[:32],
+                    "trade_date": dto.trade_date,
+                    "source_type": dto.source_type[:50],
+                    "asset_name": dto.asset_name[:255],
+                    "theme": dto.theme[:100] if dto.theme else None,
+                    "currency": dto.currency[:10],
+                    "open_price": dto.open_price,
+                    "high_price": dto.high_price,
+                    "low_price": dto.low_price,
+                    "close_price": dto.close_price,
+                    "volume": dto.volume,
+                    "turnover_amount": dto.turnover_amount,
+                    "raw_metadata": dto.raw_metadata,
+                }
+                for dto in rows
+            ]
+        )
+
+    async def upsert_rows(self, rows: list[dict[str, Any]]) -> int:
         """(ticker, trade_date) 기준 INSERT … ON CONFLICT DO UPDATE.
 
+        ``rows`` 는 컬럼명 키를 가진 dict (Collector 의 columnar 변환 결과 그대로).
+
         Returns:
             처리된 행 수(신규+갱신). 배치 내 동일 키는 마지막 값만 반영.
         """
-        seen: dict[tuple[str, str], dict[str, Any]] = {}
-        for dto in rows:
-            key = (dto.ticker.strip(), dto.trade_date.isoformat())
-            seen[key] = {
-                "ticker": dto.ticker.strip()[:32],
-                "trade_date": dto.trade_date,
-                "source_type": dto.source_type[:50],
-                "asset_name": dto.asset_name[:255],
-                "theme": dto.theme[:100] if dto.theme else None,
-                "currency": dto.currency[:10],
-                "open_price": dto.open_price,
-                "high_price": dto.high_price,
-                "low_price": dto.low_price,
-                "close_price": dto.close_price,
-                "volume": dto.volume,
-                "turnover_amount": dto.turnover_amount,
-                "raw_metadata": dto.raw_metadata,
-            }
+        seen: dict[tuple[str, Any], dict[str, Any]] = {}
+        for row in rows:
+            seen[(row["ticker"], row["trade_date"])] = row
 
         payload = list(seen.values())
         if not payload:
             return 0
 
+        total = 0
+        for i in range(0, len(payload), _UPSERT_CHUNK_SIZE):
+            total += await self._upsert_chunk(payload[i : i + _UPSERT_CHUNK_SIZE])
+        return total
+
+    async def _upsert_chunk(self, payload: list[dict[str, Any]]) -> int:
         stmt = pg_insert(RawMarketTimeseries).values(payload)
         update_cols = {
             "source_type": stmt.excluded.source_type,
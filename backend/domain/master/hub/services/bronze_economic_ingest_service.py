@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections import Counter
+from dataclasses import replace
 from datetime import datetime, timezone
 from typing import Any
 
@@ -14,8 +16,14 @@ from pathlib import Path
 
 from domain.master.hub.repositories.economic_repository import EconomicRepository
 from domain.master.hub.services.collectors.economic.dart.dart_collector import DartEconomicCollector
+from domain.master.hub.services.collectors.economic.moef.moef_ingest_manifest import (
+    ManifestEntry,
+    MoefIngestManifest,
+    get_moef_manifest,
+)
 from domain.master.hub.services.collectors.economic.moef.moef_local_pdf_collector import (
     MoefLocalPdfCollector,
+    expand_paths,
 )
 from domain.master.hub.services.collectors.economic.msit.msit_bbs_collector import (
     BIZ_BOARD,
@@ -83,6 +91,10 @@ from domain.master.hub.services.collectors.economic.venturesquare.venturesquare_
     VenturesquareEconomicCollector,
 )
 from domain.master.hub.services.collectors.economic.wowtale.wowtale_collector import WowtaleEconomicCollector
+from domain.master.hub.services.collectors.economic.common.wordpress_rss import (
+    WordPressFeedSite,
+    collect_sites as collect_wordpress_sites,
+)
 from domain.master.hub.services.collectors.economic.yahoo.yahoo_finance_collector import (
     YahooFinanceEtfCollector,
 )
@@ -98,6 +110,18 @@ from sqlalchemy import select
 
 logger = logging.getLogger(__name__)
 
+# `ingest_wordpress_rss` 대상 — 키 순서 = 결과 순서
+_WORDPRESS_RSS_SITES: dict[str, WordPressFeedSite] = {
+    site.key: site
+    for site in (
+        WowtaleEconomicCollector.SITE,
+        PlatumEconomicCollector.SITE,
+        VenturesquareEconomicCollector.SITE,
+        StartupRecipeEconomicCollector.SITE,
+    )
+}
+WORDPRESS_SITE_KEYS: tuple[str, ...] = tuple(_WORDPRESS_RSS_SITES)
+
 
 def _resolve_board(base: BoardConfig, target_year: int | None) -> BoardConfig:
     """target_year 가 명시되면 BoardConfig 의 연도만 override 한 인스턴스 반환."""
@@ -211,41 +235,54 @@ class BronzeEconomicIngestService:
         max_pages: int = 50,
         from_date: datetime | None = None,
         fetch_article_body: bool = True,
-        sleep_sec: float = 1.0,
+        sleep_sec: float | None = None,
         categories: list[tuple[str, bool]] | None = None,
+        resume: bool = True,
     ) -> dict[str, Any]:
         """Wowtale 카테고리 아카이브 크롤링 (Backfill 전용).
 
         RSS 수집기(ingest_wowtale)가 최근 50건만 제공하는 한계를 보완.
-        기본 대상: funding, venture-capital, Global-news 카테고리.
+        기본 대상: funding, venture-capital, Global-news 카테고리 (동시 순회).
+        페이지마다 바로 적재하고 체크포인트를 남기므로, 중단된 실행은 같은 인자로 다시 부르면 이어간다.
 
         Args:
             max_pages: 카테고리당 최대 순회 페이지 수 (페이지당 ~20건).
             from_date: 이 날짜 이전 기사에 도달하면 해당 카테고리 수집 중단.
             fetch_article_body: True면 기사 상세 페이지를 추가 GET해 본문 추출.
-            sleep_sec: 페이지 요청 간 대기 시간(초).
+            sleep_sec: wowtale.net 요청 간 최소 간격(초, 전체 공유). None 이면 크롤러 기본값.
             categories: (slug, apply_investment_filter) 튜플 리스트.
                         None이면 기본값(funding / venture-capital / Global-news).
+            resume: False 면 체크포인트를 무시하고 1페이지부터.
         """
         from domain.master.hub.services.collectors.economic.wowtale.wowtale_archive_crawler import (
+            ARCHIVE_MIN_INTERVAL_SECONDS,
             WowtaleArchiveCrawler,
         )
 
         crawler = WowtaleArchiveCrawler(
-            sleep_sec=sleep_sec,
+            sleep_sec=ARCHIVE_MIN_INTERVAL_SECONDS if sleep_sec is None else sleep_sec,
             fetch_article_body=fetch_article_body,
+            resume=resume,
         )
+        # 카테고리가 동시에 돌므로 같은 세션 사용(적재)은 직렬화한다
+        insert_lock = asyncio.Lock()
+        inserted = 0
+
+        async def insert_page(_slug: str, page_dtos: list[EconomicCollectDto]) -> None:
+            nonlocal inserted
+            async with insert_lock:
+                inserted += await self._economic_repo.insert_many_skip_duplicates(page_dtos)
+
         dtos: list[EconomicCollectDto] = []
         try:
             dtos = await crawler.crawl_all(
                 categories=categories,
                 max_pages=max_pages,
                 from_date=from_date,
+                on_page=insert_page,
             )
         except Exception:
-            logger.exception("Wowtale 아카이브 크롤링 실패. 빈 결과로 진행합니다.")
-
-        inserted = await self._economic_repo.insert_many_skip_duplicates(dtos)
+            logger.exception("Wowtale 아카이브 크롤링 실패. 적재된 페이지까지로 진행합니다.")
 
         type_counts = dict(Counter(d.source_type for d in dtos).most_common(20))
         result: dict[str, Any] = {
@@ -254,10 +291,292 @@ class BronzeEconomicIngestService:
             "inserted": inserted,
             "not_inserted": max(0, len(dtos) - inserted),
             "source_type_counts": type_counts,
+            "categories": crawler.stats,
         }
         logger.info("Bronze economic Wowtale archive ingest: %s", result)
         return result
 
+    async def ingest_wordpress_backfill(
+        self,
+        site: str,
+        *,
+        categories: list[tuple[str, bool]] | None = None,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        max_requests: int | None = None,
+        html_fallback: bool = True,
+        max_pages: int = 50,
+        fetch_article_body: bool = True,
+    ) -> dict[str, Any]:
+        """WordPress REST API(``wp-json/wp/v2/posts``) 대량 Backfill — 요청 1회당 100건, HTML 파싱 없음.
+
+        배치(요청 1회분)마다 바로 적재한다. REST 가 막혀 있으면 Wowtale 은 HTML 아카이브 크롤러
+        (`ingest_wowtale_archive`, ``max_pages``·``fetch_article_body`` 사용)로 폴백한다.
+
+        Args:
+            site: ``wowtale`` / ``platum`` / ``venturesquare`` / ``startup_recipe``.
+            categories: (slug, apply_investment_filter) 목록. None 이면 사이트 기본값
+                        (Wowtale: 아카이브 크롤러 기본 카테고리, Platum·Venturesquare: funding,
+                        StartupRecipe: 전체 글 + 투자 키워드 필터).
+            from_date / to_date: 게시일 범위 (``after`` / ``before``).
+            max_requests: posts 요청 횟수 상한 (요청당 100건). None 이면 범위 끝까지.
+        """
+        from domain.master.hub.services.collectors.economic.common.wordpress_rest import (
+            RestCategory,
+            WordPressRestUnavailable,
+            backfill_site,
+        )
+        from domain.master.hub.services.collectors.economic.wowtale.wowtale_archive_crawler import (
+            _CATEGORY_SOURCE_TYPE as WOWTALE_CATEGORY_SOURCE_TYPE,
+            WowtaleArchiveCrawler,
+        )
+
+        wp_site = _WORDPRESS_RSS_SITES.get(site)
+        if wp_site is None:
+            raise ValueError(f"unknown wordpress site: {site}")
+        if categories is None:
+            categories = {
+                "wowtale": list(WowtaleArchiveCrawler.DEFAULT_CATEGORIES),
+                "platum": [("funding", False)],
+                "venturesquare": [("funding", False)],
+            }.get(site, [])
+        overrides = WOWTALE_CATEGORY_SOURCE_TYPE if site == "wowtale" else {}
+        rest_categories = [
+            RestCategory(slug, apply_filter, overrides.get(slug)) for slug, apply_filter in categories
+        ]
+
+        # 배치가 올 때마다 누적 — 중간에 실패해도 그때까지의 fetched·stats 를 보고한다
+        inserted = 0
+        dtos: list[EconomicCollectDto] = []
+        stats: dict[str, int] = {}
+        error: str | None = None
+
+        async def insert_batch(batch: list[EconomicCollectDto]) -> None:
+            nonlocal inserted
+            dtos.extend(batch)
+            inserted += await self._economic_repo.insert_many_skip_duplicates(batch)
+
+        try:
+            await backfill_site(
+                wp_site,
+                categories=rest_categories,
+                from_date=from_date,
+                to_date=to_date,
+                max_requests=max_requests,
+                on_batch=insert_batch,
+                stats=stats,
+            )
+        except WordPressRestUnavailable as e:
+            logger.warning("%s REST API 사용 불가: %s", wp_site.label, e)
+            if html_fallback and site == "wowtale":
+                result = await self.ingest_wowtale_archive(
+                    max_pages=max_pages,
+                    from_date=from_date,
+                    fetch_article_body=fetch_article_body,
+                    categories=categories,
+                )
+                result["mode"] = "html_fallback"
+                return result
+            return {
+                "source": f"{site}_rest_backfill",
+                "mode": "rest",
+                "fetched": len(dtos),
+                "inserted": inserted,
+                **stats,
+                "error": f"rest_unavailable: {e}",
+            }
+        except Exception as e:
+            logger.exception("%s REST Backfill 실패. 적재된 배치까지로 진행합니다.", wp_site.label)
+            error = f"backfill_failed: {e!r}"
+
+        type_counts = dict(Counter(d.source_type for d in dtos).most_common(20))
+        result = {
+            "source": f"{site}_rest_backfill",
+            "mode": "rest",
+            "fetched": len(dtos),
+            "inserted": inserted,
+            "not_inserted": max(0, len(dtos) - inserted),
+            "source_type_counts": type_counts,
+            **stats,
+        }
+        if error is not None:
+            result["error"] = error
+        logger.info("Bronze economic WordPress REST backfill: %s", result)
+        return result
+
+    async def ingest_wordpress_sitemap(
+        self,
+        *,
+        sites: list[str] | None = None,
+        initial_lookback_days: int = 14,
+        max_urls: int = 500,
+        max_unresolved_attempts: int = 3,
+        reset: bool = False,
+    ) -> dict[str, Any]:
+        """사이트맵 ``lastmod`` + 워터마크로 직전 실행 이후 새로 올라온 글만 수집.
+
+        RSS 창(~50건)에서 밀려난 글을 아카이브 Backfill 없이 채운다. 사이트별로
+        글 사이트맵 스캔 → 이미 적재된 URL 제외 → 남은 URL 을 slug 로 묶어 REST 조회 → 적재 →
+        워터마크 갱신. 사이트맵 일부를 못 읽었거나 REST 가 실패한 사이트는 워터마크를 올리지 않고,
+        REST 에 없던 글이 있으면 그중 가장 오래된 ``lastmod`` 직전까지만 올린다 (다음 실행이 재시도).
+        같은 URL 이 ``max_unresolved_attempts`` 번 연속 풀리지 않으면 포기하고 워터마크를 넘긴다.
+
+        수정된 글(``lastmod`` 만 바뀐 기존 URL)은 스캔에는 잡히지만 ``ids_by_source_urls`` 로
+        이미 적재된 URL 을 빼므로 다시 수집하지 않는다 — 새 URL 만 들어온다.
+
+        Args:
+            sites: 사이트 키 목록. None 이면 전부.
+            initial_lookback_days: 워터마크가 없을 때(첫 실행·reset) 볼 기간.
+            max_urls: 사이트별 1회 처리 URL 상한 (이미 적재된 URL 은 세지 않음) — 넘으면
+                      **오래된 쪽부터** 처리하고 워터마크는 처리한 범위까지만 올린다 (다음 실행이 이어서).
+            max_unresolved_attempts: REST 에 없는 URL 을 재시도할 실행 횟수 — 그 뒤로는 워터마크를 막지 않는다.
+            reset: 워터마크를 지우고 ``initial_lookback_days`` 부터 다시 본다.
+        """
+        from datetime import timedelta
+
+        import httpx
+
+        from domain.master.hub.services.collectors.economic.common.host_rate_budget import (
+            HostRateBudget,
+        )
+        from domain.master.hub.services.collectors.economic.common.sitemap import (
+            get_sitemap_watermarks,
+        )
+        from domain.master.hub.services.collectors.economic.common.wordpress_rest import (
+            REST_HOST_CONCURRENCY,
+            REST_MIN_INTERVAL_SECONDS,
+            REST_TIMEOUT_SECONDS,
+            WordPressRestUnavailable,
+            fetch_posts_by_urls,
+            scan_site_sitemap,
+        )
+        from domain.master.hub.services.collectors.economic.common.wordpress_rss import (
+            make_wordpress_client,
+        )
+
+        keys = list(sites) if sites else list(_WORDPRESS_RSS_SITES)
+        unknown = [k for k in keys if k not in _WORDPRESS_RSS_SITES]
+        if unknown:
+            raise ValueError(f"unknown wordpress site(s): {unknown}")
+
+        scope = "wordpress_sitemap"
+        store = get_sitemap_watermarks()
+        # 워터마크 저장소는 SQLite 블로킹 I/O — 이벤트 루프를 막지 않도록 스레드에서
+        if reset:
+            for key in keys:
+                await asyncio.to_thread(store.clear, scope, key)
+        floor = datetime.now(tz=timezone(timedelta(hours=9))) - timedelta(days=initial_lookback_days)
+        since = {key: await asyncio.to_thread(store.get, scope, key) or floor for key in keys}
+        budget = HostRateBudget(
+            min_interval=REST_MIN_INTERVAL_SECONDS, max_concurrency=REST_HOST_CONCURRENCY
+        )
+
+        started = time.monotonic()
+        per_site: dict[str, dict[str, Any]] = {}
+        async with make_wordpress_client(timeout=httpx.Timeout(REST_TIMEOUT_SECONDS)) as client:
+            # 1) 사이트맵 스캔 — 사이트(호스트)별 동시
+            scans = await asyncio.gather(
+                *(
+                    scan_site_sitemap(
+                        client, _WORDPRESS_RSS_SITES[k], since=since[k], budget=budget
+                    )
+                    for k in keys
+                ),
+                return_exceptions=True,
+            )
+
+            # 2) 이미 적재된 URL 제외 (세션 공유 → 순차)
+            todo: dict[str, list[str]] = {}
+            lastmods: dict[str, dict[str, datetime | None]] = {}
+            for key, scan in zip(keys, scans):
+                row: dict[str, Any] = {"source": key, "since": since[key].isoformat()}
+                per_site[key] = row
+                if isinstance(scan, BaseException):
+                    logger.error("%s 사이트맵 스캔 실패: %r", _WORDPRESS_RSS_SITES[key].label, scan)
+                    row["error"] = f"sitemap_failed: {scan!r}"
+                    continue
+                row.update(scan.stats())
+                # 이미 적재된 URL 을 먼저 뺀 뒤 상한 적용 — 적재된 URL 이 처리 창을 차지하지 않는다
+                existing = await self._economic_repo.ids_by_source_urls([u.loc for u in scan.urls])
+                row["already_stored"] = len(existing)
+                new_urls = [u for u in scan.urls if u.loc not in existing]
+                # 최신순 → 상한을 넘으면 오래된 쪽부터 처리하고 워터마크도 그만큼만
+                batch = new_urls[-max_urls:] if max_urls > 0 else new_urls
+                row["truncated"] = len(batch) < len(new_urls)
+                if row["truncated"]:
+                    row["watermark_candidate"] = batch[0].lastmod
+                else:
+                    row["watermark_candidate"] = scan.urls[0].lastmod if scan.urls else None
+                lastmods[key] = {u.loc: u.lastmod for u in batch}
+                todo[key] = [u.loc for u in batch]
+
+            # 3) 새 URL 만 REST 조회 — 사이트별 동시
+            fetched = await asyncio.gather(
+                *(
+                    fetch_posts_by_urls(client, _WORDPRESS_RSS_SITES[k], todo[k], budget=budget)
+                    for k in todo
+                ),
+                return_exceptions=True,
+            )
+
+        # 4) 적재 → 워터마크 (순차)
+        for key, outcome in zip(todo, fetched):
+            row = per_site[key]
+            candidate = row.pop("watermark_candidate")
+            if isinstance(outcome, BaseException):
+                reason = (
+                    "rest_unavailable"
+                    if isinstance(outcome, WordPressRestUnavailable)
+                    else "fetch_failed"
+                )
+                logger.error("%s 사이트맵 증분 조회 실패: %r", _WORDPRESS_RSS_SITES[key].label, outcome)
+                row["error"] = f"{reason}: {outcome!r}"
+                continue
+            dtos, stats, unresolved_urls = outcome
+            inserted = await self._economic_repo.insert_many_skip_duplicates(dtos)
+            row.update(
+                fetched=len(dtos),
+                inserted=inserted,
+                not_inserted=max(0, len(dtos) - inserted),
+                **stats,
+            )
+            # REST 에 없던 글은 다음 실행에서 다시 보도록 가장 오래된 lastmod 직전까지만 —
+            # 단 max_unresolved_attempts 번 넘게 풀리지 않은 URL 은 포기 (워터마크를 영영 막지 않게)
+            missing = set(unresolved_urls)
+            attempts = await asyncio.to_thread(
+                store.track_unresolved,
+                scope,
+                key,
+                unresolved_urls,
+                [u for u in todo[key] if u not in missing],
+            )
+            retry = [u for u in unresolved_urls if attempts.get(u, 0) < max_unresolved_attempts]
+            row["unresolved_given_up"] = len(unresolved_urls) - len(retry)
+            if row["unresolved_given_up"]:
+                logger.warning(
+                    "%s 사이트맵: REST 에 없는 URL %s건 %s회 재시도 후 포기",
+                    _WORDPRESS_RSS_SITES[key].label,
+                    row["unresolved_given_up"],
+                    max_unresolved_attempts,
+                )
+            pending = [lastmods[key].get(u) for u in retry]
+            pending = [lm for lm in pending if lm is not None]
+            if pending and candidate is not None:
+                candidate = min(candidate, min(pending) - timedelta(microseconds=1))
+            if candidate is not None and not row["sitemaps_failed"]:
+                advanced = await asyncio.to_thread(store.advance, scope, key, candidate)
+                row["watermark"] = advanced.isoformat()
+
+        result: dict[str, Any] = {
+            "source": "wordpress_sitemap",
+            "fetched": sum(r.get("fetched", 0) for r in per_site.values()),
+            "inserted": sum(r.get("inserted", 0) for r in per_site.values()),
+            "collect_seconds": round(time.monotonic() - started, 3),
+            "sites": per_site,
+        }
+        logger.info("Bronze economic WordPress sitemap ingest: %s", result)
+        return result
+
     async def ingest_platum(
         self,
         *,
@@ -452,6 +771,68 @@ class BronzeEconomicIngestService:
         logger.info("Bronze economic Venturesquare ingest: %s", result)
         return result
 
+    async def ingest_wordpress_rss(
+        self,
+        *,
+        sites: list[str] | None = None,
+        max_items: int = 50,
+        fetch_article_if_short: bool = True,
+    ) -> dict[str, Any]:
+        """WordPress RSS 4개 사이트(Wowtale·Platum·Venturesquare·StartupRecipe) 동시 수집 → 사이트별 적재.
+
+        피드·permalink GET 은 공유 클라이언트 하나로 동시에 진행하고 (소요 ≈ 가장 느린 사이트),
+        적재는 세션을 공유하므로 사이트 순서대로 한다. 결과 행은 개별 ``ingest_<site>`` 와 같은 모양.
+
+        Args:
+            sites: 사이트 키 목록 (``wowtale`` / ``platum`` / ``venturesquare`` / ``startup_recipe``).
+                   None 이면 전부.
+        """
+        keys = list(sites) if sites else list(_WORDPRESS_RSS_SITES)
+        unknown = [k for k in keys if k not in _WORDPRESS_RSS_SITES]
+        if unknown:
+            raise ValueError(f"unknown wordpress rss site(s): {unknown}")
+
+        started = time.monotonic()
+        collected = await collect_wordpress_sites(
+            [_WORDPRESS_RSS_SITES[k] for k in keys],
+            max_items=max_items,
+            fetch_article_if_short=fetch_article_if_short,
+        )
+        collect_seconds = round(time.monotonic() - started, 3)
+
+        per_site: dict[str, dict[str, Any]] = {}
+        for key in keys:
+            outcome = collected[key]
+            dtos: list[EconomicCollectDto] = []
+            skipped_noise = 0
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    "%s 경제 Bronze 수집 실패. 빈 결과로 진행합니다: %r",
+                    _WORDPRESS_RSS_SITES[key].label,
+                    outcome,
+                )
+            else:
+                dtos, skipped_noise = outcome
+            inserted = await self._economic_repo.insert_many_skip_duplicates(dtos)
+            per_site[key] = {
+                "source": key,
+                "fetched": len(dtos),
+                "inserted": inserted,
+                "not_inserted": max(0, len(dtos) - inserted),
+                "skipped_noise": skipped_noise,
+                "failed": isinstance(outcome, BaseException),
+            }
+
+        result: dict[str, Any] = {
+            "source": "wordpress_rss",
+            "fetched": sum(r["fetched"] for r in per_site.values()),
+            "inserted": sum(r["inserted"] for r in per_site.values()),
+            "collect_seconds": collect_seconds,
+            "sites": per_site,
+        }
+        logger.info("Bronze economic WordPress RSS ingest: %s", result)
+        return result
+
     async def ingest_alio_projects(
         self,
         *,
@@ -814,40 +1195,128 @@ class BronzeEconomicIngestService:
         source_url: str | None = None,
         raw_title: str | None = None,
         original_filename: str | None = None,
+        force: bool = False,
+        content_hashes: dict[Path, str] | None = None,
+        preparsed: dict[Path, dict[str, Any]] | None = None,
     ) -> dict[str, Any]:
         """기재부 거시 예산안·국가재정운용계획 — 로컬 PDF 시드/업로드 적재.
 
         업로드 시나리오에서는 라우터가 tmp_dir 의 UUID 파일명으로 저장하므로,
         ``original_filename`` (또는 ``raw_title``) 을 명시적으로 넘겨야 사람이 읽을 수 있는
         제목이 남는다. 시드 배치(여러 파일)에서는 None 권장.
+
+        ``paths`` 에 디렉터리를 주면 하위 지원 파일 전체를 스캔한다. 매니페스트
+        (경로·크기·mtime·SHA-256 → 행 id)로 이미 적재된 내용은 파싱하지 않고 건너뛰며
+        (``skipped_unchanged``), ``force=True`` 면 전부 다시 파싱한다.
+
+        파싱에 실패한 파일은 적재하지 않고(``stats.skipped_parse_error``) 다음 스캔에서 다시 시도한다.
+        이전 실행이 남긴 ``parse_error`` 행은 같은 URL 의 정상 결과로 덮어쓴다.
+
+        업로드 잡처럼 호출부가 이미 해시·파싱을 끝냈으면 ``content_hashes`` · ``preparsed`` 로 넘겨
+        파일을 다시 읽거나 파싱하지 않게 한다.
         """
         collector = MoefLocalPdfCollector()
+        manifest = get_moef_manifest()
+        expanded = expand_paths(paths)
+        plan = await asyncio.to_thread(manifest.plan, expanded, known_hashes=content_hashes)
+
+        fresh = list(plan.fresh)
+        known = list(plan.known)
+        duplicates = list(plan.duplicates)
+        if force:
+            fresh, known = fresh + known, []
+        elif known:
+            # 매니페스트가 가리키는 행이 purge 등으로 사라졌으면 다시 적재
+            alive = await self._economic_repo.existing_ids([e.row_id for e in known if e.row_id])
+            stale = [e for e in known if e.row_id not in alive]
+            if stale:
+                fresh_hashes = {e.sha256 for e in fresh}
+                for entry in stale:
+                    if entry.sha256 in fresh_hashes:
+                        duplicates.append(entry)
+                    else:
+                        fresh_hashes.add(entry.sha256)
+                        fresh.append(entry)
+                known = [e for e in known if e.row_id in alive]
+
         dtos: list[EconomicCollectDto] = []
         stats: dict[str, int] = {}
-        try:
-            dtos, stats = await asyncio.to_thread(
-                collector.collect_paths,
-                [Path(p) for p in paths],
-                source_type=source_type,
-                published_at=published_at,
-                source_url=source_url,
-                raw_title=raw_title,
-                original_filename=original_filename,
-            )
-        except Exception:
-            logger.exception("MOEF local PDF 수집 실패. 빈 결과로 진행합니다.")
-
-        inserted = await self._economic_repo.insert_many_skip_duplicates(dtos)
+        if fresh:
+            try:
+                dtos, stats = await asyncio.to_thread(
+                    collector.collect_paths,
+                    [e.path for e in fresh],
+                    source_type=source_type,
+                    published_at=published_at,
+                    source_url=source_url,
+                    raw_title=raw_title,
+                    original_filename=original_filename,
+                    content_hashes={e.path: e.sha256 for e in fresh if e.sha256},
+                    preparsed=preparsed,
+                )
+            except Exception:
+                logger.exception("MOEF local PDF 수집 실패. 빈 결과로 진행합니다.")
+        stats["missing"] = len(plan.missing)
+        stats["skipped_unchanged"] = len(known)
+        stats["duplicate_content"] = len(duplicates)
+
+        # 파싱 실패는 행으로 남기지 않는다 — 결정적 source_url 이라 남기면 다음 스캔의 정상 결과가
+        # 중복으로 버려진다. 건수만 stats(parse_failed / skipped_parse_error)에 남기고, 매니페스트에도
+        # 기록하지 않아 다음 스캔에서 재시도
+        good = [d for d in dtos if not (d.raw_metadata or {}).get("parse_error")]
+        stats["skipped_parse_error"] = len(dtos) - len(good)
+        # 예전 실행이 남긴 parse_error 행은 정상 결과로 덮어쓴다
+        written = await self._economic_repo.upsert_replacing_parse_errors(good)
+        await self._record_moef_manifest(manifest, fresh, known, duplicates, good, written)
         result = {
             "source": "moef_local_pdf",
             "fetched": len(dtos),
-            "inserted": inserted,
-            "not_inserted": max(0, len(dtos) - inserted),
+            "inserted": len(written),
+            "not_inserted": max(0, len(good) - len(written)),
             "stats": stats,
         }
         logger.info("Bronze economic MOEF local PDF ingest: %s", result)
         return result
 
+    async def _record_moef_manifest(
+        self,
+        manifest: MoefIngestManifest,
+        fresh: list[ManifestEntry],
+        known: list[ManifestEntry],
+        duplicates: list[ManifestEntry],
+        dtos: list[EconomicCollectDto],
+        written: dict[str, int],
+    ) -> None:
+        """이번 실행에서 삽입·갱신된 행 id 를 매니페스트에 기록 (``dtos`` 는 파싱 성공분만).
+
+        삽입되지 않은 URL 은 이미 정상 행이 있는 경우(매니페스트 유실·``force``)만 그 id 를 쓴다 —
+        ``parse_error`` 행은 `upsert_replacing_parse_errors` 가 덮어쓰므로 여기 남아 있으면 기록하지 않는다.
+        """
+        url_by_hash = {
+            meta["content_sha256"]: dto.source_url
+            for dto in dtos
+            if (meta := dto.raw_metadata or {}).get("content_sha256") and dto.source_url
+        }
+        ids = dict(written)
+        existing = [u for u in url_by_hash.values() if u not in ids]
+        if existing:
+            try:
+                ids.update(
+                    await self._economic_repo.ids_by_source_urls(existing, without_parse_error=True)
+                )
+            except Exception:
+                logger.exception("MOEF manifest 기존 행 id 조회 실패 — 이번에 적재된 행만 기록")
+        row_by_hash = {h: ids[u] for h, u in url_by_hash.items() if u in ids}
+        entries = list(known)
+        for entry in fresh + duplicates:
+            row_id = row_by_hash.get(entry.sha256 or "")
+            if row_id is not None:
+                entries.append(replace(entry, row_id=row_id))
+        try:
+            await asyncio.to_thread(manifest.record, entries)
+        except Exception:
+            logger.exception("MOEF manifest 기록 실패")
+
     # --- watermark helpers --------------------------------------------------
 
     async def _latest_source_url(self, source_type: str) -> str | None:
@@ -13,7 +13,6 @@ from domain.master.hub.repositories.market_timeseries_repository import (
 from domain.master.hub.services.collectors.economic.yahoo.yahoo_market_timeseries_collector import (
     YahooMarketTimeseriesCollector,
 )
-from domain.master.models.transfer.market_timeseries_dto import MarketTimeseriesDto
 
 logger = logging.getLogger(__name__)
 
@@ -27,25 +26,30 @@ class BronzeMarketTimeseriesIngestService:
         *,
         period: str | None = None,
         incremental: bool = True,
+        validate: bool = False,
     ) -> dict[str, Any]:
-        """Yahoo Finance 16티커 일별 OHLCV → `raw_market_timeseries` upsert.
+        """Yahoo Finance 유니버스(`yahoo-universe.yml`) 일별 OHLCV → `raw_market_timeseries` upsert.
+
+        Collector 의 columnar 변환 결과(dict 행)를 DTO 생성 없이 바로 upsert 한다.
 
         Args:
             period: yfinance period. None이면 incremental=True→1mo, False→1y.
             incremental: False면 초기 backfill(기본 1y).
+            validate: True면 적재 전 행마다 ``MarketTimeseriesDto`` 스키마 검증.
         """
         collector = YahooMarketTimeseriesCollector()
-        rows: list[MarketTimeseriesDto] = []
+        rows: list[dict[str, Any]] = []
         failed = 0
         try:
-            rows, failed = await collector.collect(
+            rows, failed = await collector.collect_rows(
                 period=period,
                 incremental=incremental,
+                validate=validate,
             )
         except Exception:
             logger.exception("Yahoo market timeseries 수집 실패")
 
-        upserted = await self._repo.upsert_many(rows)
+        upserted = await self._repo.upsert_rows(rows)
 
         result: dict[str, Any] = {
             "source": "yahoo_market_timeseries",
@@ -23,6 +23,8 @@ from urllib.parse import quote
 import aiohttp
 import xmltodict
 
+from core.api_quota import aiohttp_quota_trace
+from domain.master.hub.services.collectors.economic.common.keyword_matcher import KeywordMatcher
 from domain.master.models.transfer.economic_collect_dto import EconomicCollectDto
 
 logger = logging.getLogger(__name__)
@@ -117,26 +119,29 @@ def _parse_datetime_kst(value: Any) -> Optional[datetime]:
     return None
 
 
+# 앞 규칙이 우선 (R&D → 창업 → 중소기업)
+_SOURCE_TYPE_MATCHER: KeywordMatcher[str] = KeywordMatcher(
+    (
+        ("R&D", "GOVT_ALIO_RND"),
+        ("연구개발", "GOVT_ALIO_RND"),
+        ("기술개발", "GOVT_ALIO_RND"),
+        ("창업", "GOVT_ALIO_STARTUP"),
+        ("스타트업", "GOVT_ALIO_STARTUP"),
+        ("예비창업", "GOVT_ALIO_STARTUP"),
+        ("중소기업", "GOVT_ALIO_SME"),
+        ("소상공인", "GOVT_ALIO_SME"),
+    )
+)
+# 영문 키워드(AI, IoT, ESG …)는 대소문자 무시 — 한글은 casefold 영향 없음
+_KEYWORD_MATCHER: KeywordMatcher[str] = KeywordMatcher(_KEYWORDS, casefold=True)
+
+
 def _classify_source_type(title: str) -> str:
-    t = title or ""
-    if any(k in t for k in ("R&D", "연구개발", "기술개발")):
-        return "GOVT_ALIO_RND"
-    if any(k in t for k in ("창업", "스타트업", "예비창업")):
-        return "GOVT_ALIO_STARTUP"
-    if any(k in t for k in ("중소기업", "소상공인")):
-        return "GOVT_ALIO_SME"
-    return "GOVT_ALIO_PROJECT"
+    return _SOURCE_TYPE_MATCHER.first(title, "GOVT_ALIO_PROJECT")
 
 
 def _matches_keyword(biz_nm: str, biz_purpose: str | None) -> bool:
-    combined = f"{biz_nm or ''} {biz_purpose or ''}"
-    cf = combined.casefold()
-    for kw in _KEYWORDS:
-        needle = kw.casefold() if kw.isascii() else kw
-        hay = cf if kw.isascii() else combined
-        if needle in hay:
-            return True
-    return False
+    return _KEYWORD_MATCHER.any(f"{biz_nm or ''} {biz_purpose or ''}")
 
 
 def _inst_passes_whitelist(inst_nm: str | None, whitelist: tuple[str, ...] | None) -> bool:
@@ -266,7 +271,7 @@ class AlioPublicInstProjectCollector:
         }
 
         timeout = aiohttp.ClientTimeout(total=45)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with aiohttp.ClientSession(timeout=timeout, trace_configs=[aiohttp_quota_trace("alio")]) as session:
             try:
                 async with session.get(self.BASE_URL, params=params) as resp:
                     body_text = await resp.text()
@@ -0,0 +1,29 @@
+"""수집기 로컬 디스크 캐시 루트.
+
+DART corp-code 마스터, 상세 API 응답, 파싱된 문서 등 **프로세스 재시작 후에도
+재사용할 가치가 있는** 중간 산출물을 한 루트 아래 하위 디렉터리로 나눠 보관한다.
+
+  - 기본 루트: ``<tempfile.gettempdir()>/bronze_cache``
+  - 운영에서는 ``BRONZE_CACHE_DIR`` 로 영속 볼륨 경로를 지정한다.
+
+본 모듈은 **수집기(collector) 내부 전용**이다.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+_CACHE_DIR_ENV = "BRONZE_CACHE_DIR"
+
+
+def cache_root() -> Path:
+    return Path(os.getenv(_CACHE_DIR_ENV) or Path(tempfile.gettempdir()) / "bronze_cache")
+
+
+def cache_dir(name: str) -> Path:
+    """``<root>/<name>`` 디렉터리를 만들어 반환."""
+    path = cache_root() / name
+    path.mkdir(parents=True, exist_ok=True)
+    return path
@@ -5,8 +5,12 @@ Bronze 단계에서는 정형화하지 않고 `raw_metadata.full_text` 에 보
 Silver 단계에서 LLM/RAG 가 처리한다.
 
 라이브러리 정책:
-  - PDF  : pdfplumber (이미 의존성에 포함)
-  - Excel: pandas + openpyxl
+  - PDF  : 엔진 선택 ``DOC_PDF_ENGINE`` (auto | pymupdf | pdfplumber, 기본 auto)
+      · pymupdf   : C 추출 문자 좌표로 pdfplumber 와 같은 방식(행 클러스터링 + 간격 기반 띄어쓰기)
+                    으로 텍스트를 재구성 — 수십 배 빠름. 표 위주 페이지만 pdfplumber 로 폴백.
+      · pdfplumber: 기존 경로 (PyMuPDF 미설치 시 auto 의 선택)
+  - Excel: .xlsx 는 openpyxl ``read_only`` 스트리밍 (행 단위 텍스트, 숨김·빈 시트 제외,
+           ``DOC_EXCEL_MAX_ROWS`` 행 상한). .xls·openpyxl 미설치 시 pandas ``read_excel``.
   - HWPX : 표준 라이브러리만 (ZIP + XML) — pyhwpx 등 외부 패키지 불필요
   - HWP(이진): 본 유틸에서는 미지원 (필요 시 별도 의존성 추가)
 """
@@ -15,8 +19,12 @@ from __future__ import annotations
 
 import io
 import logging
+import math
+import os
 import re
 import zipfile
+from datetime import datetime
+from datetime import time as dt_time
 from pathlib import Path
 from typing import Any
 from xml.etree import ElementTree as ET
@@ -26,12 +34,46 @@ logger = logging.getLogger(__name__)
 
 _SUPPORTED_EXTS = (".pdf", ".xlsx", ".xls", ".hwpx")
 
+# 파서(엔진)별 버전 — 추출 결과(텍스트·extras)가 달라지는 변경을 하면 해당 파서만 올린다.
+# `parsed_doc_cache` 키의 일부이므로 올린 파서의 캐시 항목만 무효화된다.
+PARSER_VERSIONS: dict[str, str] = {
+    "pymupdf": "pymupdf-1",
+    "pdfplumber": "pdfplumber-1",
+    "openpyxl-stream": "openpyxl-stream-2",
+    "pandas": "pandas-1",
+    "hwpx-zip-xml": "hwpx-zip-xml-1",
+}
+_FORMAT_PARSERS = {".hwpx": "hwpx-zip-xml"}
+
+PDF_ENGINES = ("pymupdf", "pdfplumber")
+
 
 def supports(file_path: Path | str) -> bool:
     ext = Path(file_path).suffix.lower()
     return ext in _SUPPORTED_EXTS
 
 
+def resolve_format(file_path: Path | str) -> str | None:
+    """파싱에 쓸 포맷 확장자 — 확장자 우선, 미지원이면 매직 바이트로 재추정. 모르면 None."""
+    path = Path(file_path)
+    ext = path.suffix.lower()
+    if ext in _SUPPORTED_EXTS:
+        return ext
+    return _sniff_format(path)
+
+
+def parser_version(file_path: Path | str) -> str | None:
+    """``parse_document`` 가 이 파일에 쓸 파서의 버전 (미지원 포맷이면 None)."""
+    fmt = resolve_format(file_path)
+    if fmt == ".pdf":
+        parser = pdf_engine()
+    elif fmt in (".xlsx", ".xls"):
+        parser = excel_engine(fmt)
+    else:
+        parser = _FORMAT_PARSERS.get(fmt or "")
+    return PARSER_VERSIONS.get(parser) if parser else None
+
+
 def parse_document(file_path: Path | str) -> dict[str, Any]:
     """확장자에 따라 적절한 파서 호출.
 
@@ -47,12 +89,7 @@ def parse_document(file_path: Path | str) -> dict[str, Any]:
         If parsing fails, returns dict with `error` key.
     """
     path = Path(file_path)
-    ext = path.suffix.lower()
-
-    if ext not in _SUPPORTED_EXTS:
-        sniffed = _sniff_format(path)
-        if sniffed:
-            ext = sniffed
+    ext = resolve_format(path) or path.suffix.lower()
 
     if ext == ".pdf":
         return parse_pdf(path)
@@ -114,12 +151,123 @@ def _sniff_format(path: Path) -> str | None:
     return None
 
 
+# ---------------------------------------------------------------------------
+# PDF — 엔진 선택
+# ---------------------------------------------------------------------------
+
+# pdfplumber ``extract_text`` 기본값과 같은 허용오차 (pt)
+_PDF_X_TOLERANCE = 3.0
+_PDF_Y_TOLERANCE = 3.0
+# 표 위주 페이지 판정 — 열 간격(허용오차의 4배 초과)이 3개 이상인 행이 30% 이상(최소 6행)
+_TABLE_COLUMN_GAP = _PDF_X_TOLERANCE * 4
+_TABLE_MIN_GAPS_PER_ROW = 3
+_TABLE_MIN_ROWS = 6
+_TABLE_ROW_RATIO = 0.3
+_MULTI_SPACE = re.compile(r"[ \t]+")
+
+PageRange = tuple[int, int]
+
+
+def _import_pymupdf() -> Any | None:
+    try:
+        import pymupdf  # type: ignore[import-not-found]
+    except ImportError:
+        try:
+            import fitz as pymupdf  # type: ignore[import-not-found, no-redef]  # PyMuPDF < 1.24
+        except ImportError:
+            return None
+    return pymupdf
+
+
+def pdf_engine() -> str:
+    """``DOC_PDF_ENGINE`` 해석 — auto 는 PyMuPDF 가 있으면 pymupdf, 없으면 pdfplumber."""
+    engine = (os.getenv("DOC_PDF_ENGINE") or "auto").strip().lower()
+    if engine == "pdfplumber":
+        return engine
+    if engine not in ("auto", "pymupdf"):
+        logger.warning("알 수 없는 DOC_PDF_ENGINE=%s — auto 로 처리", engine)
+    return "pymupdf" if _import_pymupdf() is not None else "pdfplumber"
+
+
+def pdf_page_count(pdf_path: Path | str) -> int | None:
+    """페이지 수 (PyMuPDF 로 xref 만 읽음). PyMuPDF 미설치·열기 실패면 None."""
+    pymupdf = _import_pymupdf()
+    if pymupdf is None:
+        return None
+    try:
+        with pymupdf.open(pdf_path) as doc:
+            return doc.page_count
+    except Exception:
+        return None
+
+
+def pdf_page_ranges(page_count: int, parts: int, *, min_pages: int = 1) -> list[PageRange]:
+    """``[start, stop)`` 구간 최대 ``parts`` 개 — 구간당 최소 ``min_pages`` 쪽."""
+    if page_count <= 0:
+        return []
+    size = max(min_pages, math.ceil(page_count / max(1, parts)))
+    return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+
+def parse_pdf(
+    pdf_path: Path,
+    *,
+    engine: str | None = None,
+    pages: PageRange | None = None,
+) -> dict[str, Any]:
+    """PDF 텍스트 추출. ``pages`` 를 주면 ``[start, stop)`` 구간만 (``page_count`` 는 전체 쪽수).
+
+    구간 결과는 `merge_pdf_parts` 로 합치면 전체 파싱과 같은 결과가 된다.
+    """
+    engine = engine or pdf_engine()
+    if engine == "pymupdf":
+        return _parse_pdf_pymupdf(pdf_path, pages)
+    return _parse_pdf_pdfplumber(pdf_path, pages)
+
+
+def merge_pdf_parts(pdf_path: Path, parts: list[dict[str, Any]]) -> dict[str, Any]:
+    """페이지 구간별 `parse_pdf` 결과를 문서 하나로. 한 구간이라도 실패하면 그 오류를 반환."""
+    if not parts:
+        return _error(pdf_path, pdf_engine(), "no pages parsed")
+    for part in parts:
+        if part.get("error"):
+            return part
+    full_text = "\n\n".join(p["full_text"] for p in parts if p.get("full_text"))
+    merged = dict(parts[0])
+    merged["full_text"] = full_text
+    merged["full_text_length"] = len(full_text)
+    if "table_fallback_pages" in merged:
+        merged["table_fallback_pages"] = sum(p.get("table_fallback_pages", 0) for p in parts)
+    return merged
+
+
+def _page_bounds(pages: PageRange | None, page_count: int) -> PageRange:
+    if pages is None:
+        return 0, page_count
+    return max(0, pages[0]), min(page_count, pages[1])
+
+
+def _pdf_result(
+    pdf_path: Path, page_count: int, texts: list[str], method: str, **extras: Any
+) -> dict[str, Any]:
+    full_text = "\n\n".join(t for t in texts if t)
+    return {
+        "file_name": pdf_path.name,
+        "file_size_bytes": pdf_path.stat().st_size,
+        "page_count": page_count,
+        "full_text": full_text,
+        "full_text_length": len(full_text),
+        "extraction_method": method,
+        **extras,
+    }
+
+
 # ---------------------------------------------------------------------------
 # PDF (pdfplumber)
 # ---------------------------------------------------------------------------
 
 
-def parse_pdf(pdf_path: Path) -> dict[str, Any]:
+def _parse_pdf_pdfplumber(pdf_path: Path, pages: PageRange | None = None) -> dict[str, Any]:
     try:
         import pdfplumber  # type: ignore[import-not-found]
     except ImportError as e:
@@ -129,31 +277,242 @@ def parse_pdf(pdf_path: Path) -> dict[str, Any]:
         pages_text: list[str] = []
         with pdfplumber.open(pdf_path) as pdf:
             page_count = len(pdf.pages)
-            for page in pdf.pages:
+            start, stop = _page_bounds(pages, page_count)
+            for page in pdf.pages[start:stop]:
                 text = page.extract_text()
                 if text:
                     pages_text.append(text)
-
-        full_text = "\n\n".join(pages_text)
-        return {
-            "file_name": pdf_path.name,
-            "file_size_bytes": pdf_path.stat().st_size,
-            "page_count": page_count,
-            "full_text": full_text,
-            "full_text_length": len(full_text),
-            "extraction_method": "pdfplumber",
-        }
+        return _pdf_result(pdf_path, page_count, pages_text, "pdfplumber")
     except Exception as e:
         logger.exception("PDF 파싱 실패: %s", pdf_path)
         return _error(pdf_path, "pdfplumber", str(e))
 
 
 # ---------------------------------------------------------------------------
-# Excel (pandas)
+# PDF (PyMuPDF fast path)
 # ---------------------------------------------------------------------------
 
 
+def _parse_pdf_pymupdf(pdf_path: Path, pages: PageRange | None = None) -> dict[str, Any]:
+    pymupdf = _import_pymupdf()
+    if pymupdf is None:
+        return _parse_pdf_pdfplumber(pdf_path, pages)
+
+    try:
+        texts: dict[int, str] = {}
+        table_pages: list[int] = []
+        with pymupdf.open(pdf_path) as doc:
+            page_count = doc.page_count
+            start, stop = _page_bounds(pages, page_count)
+            for i in range(start, stop):
+                text, tabular = _pymupdf_page_text(doc[i], pymupdf.TEXTFLAGS_TEXT)
+                texts[i] = text
+                if tabular:
+                    table_pages.append(i)
+    except Exception as e:
+        logger.exception("PDF 파싱 실패 (pymupdf): %s", pdf_path)
+        return _error(pdf_path, "pymupdf", str(e))
+
+    fallback_pages = 0
+    if table_pages:
+        fallback_pages = _pdfplumber_pages(pdf_path, table_pages, texts)
+    return _pdf_result(
+        pdf_path,
+        page_count,
+        [texts[i] for i in sorted(texts)],
+        "pymupdf",
+        table_fallback_pages=fallback_pages,
+    )
+
+
+def _pdfplumber_pages(pdf_path: Path, page_indexes: list[int], texts: dict[int, str]) -> int:
+    """표 위주 페이지를 pdfplumber 로 다시 추출해 ``texts`` 를 덮어씀. 덮어쓴 페이지 수 반환."""
+    try:
+        import pdfplumber  # type: ignore[import-not-found]
+    except ImportError:
+        return 0
+    done = 0
+    try:
+        with pdfplumber.open(pdf_path) as pdf:
+            for i in page_indexes:
+                texts[i] = pdf.pages[i].extract_text() or ""
+                done += 1
+    except Exception:
+        logger.warning("표 페이지 pdfplumber 폴백 실패 — PyMuPDF 결과 유지: %s", pdf_path, exc_info=True)
+    return done
+
+
+def _pymupdf_page_text(page: Any, flags: int) -> tuple[str, bool]:
+    """페이지 텍스트와 표 위주 여부.
+
+    PyMuPDF 의 블록/라인 순서는 한글 문서(HWP 변환 PDF)에서 글꼴이 바뀔 때마다 조각나고,
+    공백 글리프가 없는 문서는 띄어쓰기가 사라진다. 그래서 문자 좌표만 가져와
+    pdfplumber 와 같은 규칙(top 기준 행 클러스터링 → x 정렬 → 간격 > 허용오차면 공백)으로 재구성한다.
+    """
+    chars: list[tuple[float, float, float, str]] = []
+    for block in page.get_text("rawdict", flags=flags)["blocks"]:
+        for line in block.get("lines", ()):
+            for span in line["spans"]:
+                for ch in span["chars"]:
+                    x0, top, x1, _bottom = ch["bbox"]
+                    chars.append((top, x0, x1, ch["c"]))
+    if not chars:
+        return "", False
+
+    chars.sort()
+    rows: list[list[tuple[float, float, float, str]]] = []
+    row: list[tuple[float, float, float, str]] = []
+    last_top = chars[0][0]
+    for ch in chars:
+        if ch[0] - last_top > _PDF_Y_TOLERANCE:
+            rows.append(row)
+            row = []
+        row.append(ch)
+        last_top = ch[0]
+    rows.append(row)
+
+    lines: list[str] = []
+    tabular_rows = 0
+    for row in rows:
+        row.sort(key=lambda c: c[1])
+        buf: list[str] = []
+        prev_x1: float | None = None
+        prev_ink_x1: float | None = None
+        column_gaps = 0
+        for _top, x0, x1, c in row:
+            if prev_x1 is not None and x0 - prev_x1 > _PDF_X_TOLERANCE:
+                buf.append(" ")
+            buf.append(c)
+            prev_x1 = x1
+            if not c.isspace():
+                if prev_ink_x1 is not None and x0 - prev_ink_x1 > _TABLE_COLUMN_GAP:
+                    column_gaps += 1
+                prev_ink_x1 = x1
+        text = _MULTI_SPACE.sub(" ", "".join(buf)).strip()
+        if text:
+            lines.append(text)
+            if column_gaps >= _TABLE_MIN_GAPS_PER_ROW:
+                tabular_rows += 1
+
+    tabular = tabular_rows >= _TABLE_MIN_ROWS and tabular_rows >= len(lines) * _TABLE_ROW_RATIO
+    return "\n".join(lines), tabular
+
+
+# ---------------------------------------------------------------------------
+# Excel — .xlsx 스트리밍(openpyxl read_only) / .xls pandas
+# ---------------------------------------------------------------------------
+
+DEFAULT_EXCEL_MAX_ROWS = 200_000
+
+
+def _import_openpyxl() -> Any | None:
+    try:
+        import openpyxl  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return openpyxl
+
+
+def excel_engine(fmt: str) -> str:
+    """``.xlsx`` 는 openpyxl 스트리밍, ``.xls``(BIFF) 는 openpyxl 이 못 읽으므로 pandas."""
+    if fmt == ".xlsx" and _import_openpyxl() is not None:
+        return "openpyxl-stream"
+    return "pandas"
+
+
+def _excel_max_rows() -> int:
+    try:
+        return int(os.getenv("DOC_EXCEL_MAX_ROWS") or DEFAULT_EXCEL_MAX_ROWS)
+    except ValueError:
+        return DEFAULT_EXCEL_MAX_ROWS
+
+
 def parse_excel(excel_path: Path) -> dict[str, Any]:
+    fmt = excel_path.suffix.lower()
+    if fmt not in (".xlsx", ".xls"):
+        fmt = _sniff_format(excel_path) or fmt
+    if excel_engine(fmt) == "openpyxl-stream":
+        return _parse_excel_stream(excel_path)
+    return _parse_excel_pandas(excel_path)
+
+
+def _cell_text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else str(value)
+    if isinstance(value, datetime):
+        return value.date().isoformat() if value.time() == dt_time() else value.isoformat(sep=" ")
+    return str(value).strip()
+
+
+def _parse_excel_stream(excel_path: Path) -> dict[str, Any]:
+    """워크북 전체를 메모리에 올리지 않고 시트·행 순서대로 텍스트화.
+
+    행은 셀을 탭으로 잇고(뒤쪽 빈 셀 제거), 빈 행·빈 시트·숨김 시트는 건너뛴다.
+    시트의 저장된 범위(dimension)는 무시하고 실제 셀을 끝까지 읽는다.
+    전체 ``DOC_EXCEL_MAX_ROWS`` 행을 넘으면 거기서 멈추고 ``truncated=True``.
+    """
+    openpyxl = _import_openpyxl()
+    max_rows = _excel_max_rows()
+    chunks: list[str] = []
+    sheet_count = 0
+    hidden_sheets = 0
+    row_count = 0
+    truncated = False
+    try:
+        wb = openpyxl.load_workbook(excel_path, read_only=True, data_only=True)
+    except Exception as e:
+        logger.exception("Excel 파싱 실패: %s", excel_path)
+        return _error(excel_path, "openpyxl-stream", str(e))
+    try:
+        for ws in wb.worksheets:
+            if getattr(ws, "sheet_state", "visible") != "visible":
+                hidden_sheets += 1
+                continue
+            # 시트에 저장된 <dimension> 을 믿지 않는다 — 기계 생성 xlsx 는 ref="A1" 로 틀린 경우가 많아
+            # 그대로 두면 read_only 가 A1 한 칸만 돌려준다
+            ws.reset_dimensions()
+            lines: list[str] = []
+            for values in ws.iter_rows(values_only=True):
+                cells = [_cell_text(v) for v in values]
+                while cells and not cells[-1]:
+                    cells.pop()
+                if not cells:
+                    continue
+                if row_count >= max_rows:
+                    truncated = True
+                    break
+                lines.append("\t".join(cells))
+                row_count += 1
+            if lines:
+                sheet_count += 1
+                chunks.append(f"[시트: {ws.title}]")
+                chunks.append("\n".join(lines))
+            if truncated:
+                logger.warning("Excel 행 상한(%d) 도달 — 이후 생략: %s", max_rows, excel_path)
+                break
+    except Exception as e:
+        logger.exception("Excel 파싱 실패: %s", excel_path)
+        return _error(excel_path, "openpyxl-stream", str(e))
+    finally:
+        wb.close()
+
+    full_text = "\n\n".join(chunks)
+    return {
+        "file_name": excel_path.name,
+        "file_size_bytes": excel_path.stat().st_size,
+        "sheet_count": sheet_count,
+        "hidden_sheet_count": hidden_sheets,
+        "row_count": row_count,
+        "truncated": truncated,
+        "full_text": full_text,
+        "full_text_length": len(full_text),
+        "extraction_method": "openpyxl-stream",
+    }
+
+
+def _parse_excel_pandas(excel_path: Path) -> dict[str, Any]:
     try:
         import pandas as pd  # type: ignore[import-not-found]
     except ImportError as e:
@@ -22,7 +22,9 @@ from urllib.parse import parse_qs, urlencode, urljoin, urlparse
 
 import httpx
 import requests
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
+
+from core.html_parse import make_soup
 
 logger = logging.getLogger(__name__)
 
@@ -221,7 +223,7 @@ def parse_bbs_list_rows(html: str) -> list[dict[str, Any]]:
         list of {title, url, published_at(datetime|None), published_year(int|None), raw_date}.
         제목 링크가 없는 행(헤더 등)은 자동 제외.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     rows: list[Tag] = []
     for sel in _LIST_ROW_SELECTORS:
         rows = soup.select(sel)
@@ -299,7 +301,7 @@ def _build_view_url_from_id(title_tag: Tag, base: str, ntt_id: str) -> str:
 
 def find_pagination_anchor(html: str) -> int | None:
     """페이지네이션에서 `마지막 페이지` 번호를 추출 (가능한 경우)."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     for a in soup.select("a"):
         href = a.get("href", "")
         m = re.search(r"page(?:Index)?=(\d+)", href)
@@ -336,7 +338,7 @@ _ATTACH_YYMMDD_BEFORE_FILE_RE = re.compile(
 
 def extract_action_form_params(html: str) -> dict[str, str]:
     """`form[name=actionForm]` hidden 값 — `view.do` GET 쿼리 재구성용."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     form = soup.select_one("form[name=actionForm]")
     out: dict[str, str] = {}
     if not form:
@@ -351,7 +353,7 @@ def extract_action_form_params(html: str) -> dict[str, str]:
 
 def extract_fn_detail_ntt_ids(html: str, *, max_ids: int = 500) -> list[int]:
     """`#result .board_list` 영역의 `fn_detail(숫자)` 를 **문서 순서대로** 중복 제거 추출."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     root = soup.select_one("#result .board_list") or soup
     chunk = str(root)
     seen: set[int] = set()
@@ -378,7 +380,7 @@ def parse_msit_bbs_view_summary(html: str) -> tuple[str, datetime | None, str]:
 
     등록일 메타가 없는 경우가 많아 **첨부파일명 선두 YYMMDD** 로 KST 자정 근사치를 만든다.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     bv = soup.select_one("div.board_view")
 
     title = ""
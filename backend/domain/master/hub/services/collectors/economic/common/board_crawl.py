@@ -0,0 +1,212 @@
+"""정부 게시판(BBS) 증분 크롤 공통 엔진 — MSIT · MFDS · MSS.
+
+게시판별 컬렉터가 각자 구현하던 ``목록 페이지 → 필터 → 상세 본문`` 루프를 하나로 모은다.
+게시판 고유 로직(목록 파싱·필터·워터마크·상세 파싱·DTO 변환)은 ``BoardCrawlSpec`` 구현체가
+담당하고, 엔진은 순서·동시성·예의(politeness)만 책임진다.
+
+  - 생산자/소비자 파이프라인: 목록 페이지를 순차로 넘기며 채택 행을 큐에 넣으면
+    상세 워커(``detail_concurrency`` 개)가 즉시 본문을 받는다 — 다음 목록 페이지 대기와
+    상세 GET 이 겹친다.
+  - 워터마크 행(``RowAction.STOP``)을 만나면 그 페이지에서 목록 순회를 끝낸다
+    (미리 다음 페이지를 받아 두지 않으므로 증분 실행은 보통 목록 1페이지로 끝난다).
+  - 목록 페이지 사이 ``page_delay`` 초 대기, 상세 GET 동시성 상한 — 세 게시판 동일.
+  - 결과 DTO 는 목록 순서를 유지한다.
+
+상세 HTML 을 목록 단계에서 이미 받은 행은 ``PREFETCHED_HTML_KEY`` 에 넣어 두면
+엔진이 재요청 없이 사용한다 (MSIT div 폴백).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Protocol
+
+import httpx
+
+from domain.master.hub.services.collectors.economic.common._msit_common import async_get_html
+from domain.master.models.transfer.economic_collect_dto import EconomicCollectDto
+
+logger = logging.getLogger(__name__)
+
+DETAIL_FETCH_CONCURRENCY = 5
+PAGE_DELAY_SECONDS = 0.35
+PREFETCHED_HTML_KEY = "_prefetched_view_html"
+
+
+class RowAction(str, Enum):
+    KEEP = "keep"
+    SKIP = "skip"
+    # 건너뛰되 현재 페이지까지만 보고 목록 순회 종료 (예: 대상 연도보다 오래된 행 등장)
+    SKIP_LAST_PAGE = "skip_last_page"
+    # 워터마크 도달 — 즉시 목록 순회 종료
+    STOP = "stop"
+
+
+@dataclass(frozen=True)
+class RowDecision:
+    action: RowAction
+    stat: str | None = None  # 증가시킬 stats 키
+
+
+KEEP = RowDecision(RowAction.KEEP)
+
+
+class BoardCrawlSpec(Protocol):
+    """게시판별 플러그인. 인스턴스는 1회 수집(워터마크 포함) 단위로 만든다."""
+
+    board_key: str
+
+    def page_url(self, page: int) -> str: ...
+
+    async def list_rows(
+        self, client: httpx.AsyncClient, html: str, page: int
+    ) -> list[dict[str, Any]]:
+        """목록 HTML → 정규화 row dict 목록 (빈 목록이면 순회 종료)."""
+        ...
+
+    def decide(self, row: dict[str, Any]) -> RowDecision: ...
+
+    def detail_url(self, row: dict[str, Any]) -> str | None: ...
+
+    def parse_detail(self, html: str, row: dict[str, Any]) -> str: ...
+
+    def to_dto(self, row: dict[str, Any], body_text: str) -> EconomicCollectDto: ...
+
+
+async def crawl_board(
+    spec: BoardCrawlSpec,
+    client: httpx.AsyncClient,
+    *,
+    max_pages: int,
+    max_items: int,
+    fetch_body: bool = True,
+    stats: dict[str, int] | None = None,
+    detail_concurrency: int = DETAIL_FETCH_CONCURRENCY,
+    page_delay: float = PAGE_DELAY_SECONDS,
+) -> list[EconomicCollectDto]:
+    """목록·상세 파이프라인 실행 → 목록 순서대로 DTO.
+
+    ``stats`` 에는 ``pages_fetched``·``fetched_total``·``body_failed`` 와
+    ``spec.decide`` 가 지정한 키를 누적한다.
+    """
+    st = stats if stats is not None else {}
+    for key in ("pages_fetched", "fetched_total", "body_failed"):
+        st.setdefault(key, 0)
+
+    kept: list[dict[str, Any]] = []
+    bodies: list[str] = []
+    queue: asyncio.Queue[int | None] = asyncio.Queue()
+    n_workers = max(1, detail_concurrency) if fetch_body else 0
+
+    async def produce() -> None:
+        try:
+            for page in range(1, max_pages + 1):
+                url = spec.page_url(page)
+                logger.info("[%s] page=%s url=%s", spec.board_key, page, url)
+                try:
+                    html = await async_get_html(client, url, timeout=30.0)
+                    rows = await spec.list_rows(client, html, page)
+                except Exception:
+                    logger.exception("[%s] list fetch/parse failed page=%s", spec.board_key, page)
+                    return
+                st["pages_fetched"] += 1
+                if not rows:
+                    logger.info("[%s] no list rows page=%s — stop", spec.board_key, page)
+                    return
+                if _consume_page(spec, rows, st, kept, bodies, queue, max_items):
+                    return
+                await asyncio.sleep(page_delay)
+        finally:
+            for _ in range(n_workers):
+                queue.put_nowait(None)
+
+    async def work() -> None:
+        while (idx := await queue.get()) is not None:
+            try:
+                bodies[idx] = await _fetch_body(spec, client, kept[idx], st)
+            except Exception:
+                st["body_failed"] += 1
+                logger.exception("[%s] body parse failed row=%s", spec.board_key, idx)
+
+    await asyncio.gather(produce(), *(work() for _ in range(n_workers)))
+
+    if not fetch_body:
+        for i, row in enumerate(kept):
+            pref = row.get(PREFETCHED_HTML_KEY)
+            if isinstance(pref, str) and pref:
+                bodies[i] = spec.parse_detail(pref, row)
+
+    out: list[EconomicCollectDto] = []
+    for row, body in zip(kept, bodies):
+        r = dict(row)
+        r.pop(PREFETCHED_HTML_KEY, None)
+        out.append(spec.to_dto(r, body))
+    logger.info("[%s] collected dtos=%s stats=%s", spec.board_key, len(out), st)
+    return out
+
+
+def _consume_page(
+    spec: BoardCrawlSpec,
+    rows: list[dict[str, Any]],
+    stats: dict[str, int],
+    kept: list[dict[str, Any]],
+    bodies: list[str],
+    queue: asyncio.Queue[int | None],
+    max_items: int,
+) -> bool:
+    """한 페이지 행 판정 → 채택 행은 상세 큐로. 반환 True 면 목록 순회 종료."""
+    last_page = False
+    for row in rows:
+        stats["fetched_total"] += 1
+        decision = spec.decide(row)
+        if decision.stat:
+            stats[decision.stat] = stats.get(decision.stat, 0) + 1
+        if decision.action is RowAction.STOP:
+            return True
+        if decision.action is RowAction.SKIP_LAST_PAGE:
+            last_page = True
+            continue
+        if decision.action is RowAction.SKIP:
+            continue
+        kept.append(dict(row))
+        bodies.append("")
+        queue.put_nowait(len(kept) - 1)
+        if len(kept) >= max_items:
+            return True
+    return last_page
+
+
+async def _fetch_body(
+    spec: BoardCrawlSpec,
+    client: httpx.AsyncClient,
+    row: dict[str, Any],
+    stats: dict[str, int],
+) -> str:
+    pref = row.get(PREFETCHED_HTML_KEY)
+    if isinstance(pref, str) and pref:
+        return spec.parse_detail(pref, row)
+    url = spec.detail_url(row)
+    if not url:
+        return ""
+    try:
+        html = await async_get_html(client, url, timeout=30.0)
+    except Exception:
+        stats["body_failed"] += 1
+        logger.exception("[%s] body fetch failed url=%s", spec.board_key, url)
+        return ""
+    return spec.parse_detail(html, row)
+
+
+__all__ = [
+    "BoardCrawlSpec",
+    "DETAIL_FETCH_CONCURRENCY",
+    "KEEP",
+    "PAGE_DELAY_SECONDS",
+    "PREFETCHED_HTML_KEY",
+    "RowAction",
+    "RowDecision",
+    "crawl_board",
+]
@@ -0,0 +1,109 @@
+"""첨부 파일 내용 주소(content-addressed) 임시 저장.
+
+다운로드·업로드 바이트를 청크 단위로 디스크에 쓰면서 SHA-256 을 동시에 계산하고,
+완료되면 ``<sha256><suffix>`` 로 원자적 rename 한다.
+
+  - 메모리 사용 = 청크 하나. 응답 전체를 버퍼링하지 않는다.
+  - ``max_bytes`` 초과 시 즉시 중단하고 부분 파일을 지운다 (`FileTooLargeError`).
+  - 같은 내용은 같은 경로 → 여러 목록 행이 같은 첨부를 가리켜도 파싱 전에 중복을 알 수 있고,
+    동시에 같은 파일명을 쓰던 경합도 사라진다.
+  - ingest 후 `remove_files` / 오래된 잔여물은 `gc_directory` 로 정리.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import time
+import uuid
+from collections.abc import AsyncIterable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_PART_SUFFIX = ".part"
+
+
+class FileTooLargeError(Exception):
+    """``max_bytes`` 상한 초과."""
+
+    def __init__(self, limit: int, seen: int) -> None:
+        super().__init__(f"file exceeds {limit} bytes (got >= {seen})")
+        self.limit = limit
+        self.seen = seen
+
+
+@dataclass(frozen=True)
+class StoredFile:
+    path: Path
+    sha256: str
+    size_bytes: int
+
+
+async def store_stream(
+    chunks: AsyncIterable[bytes],
+    directory: Path,
+    *,
+    suffix: str = "",
+    max_bytes: int | None = None,
+) -> StoredFile:
+    """청크 스트림을 ``directory/<sha256><suffix>`` 로 저장. 실패 시 부분 파일은 남기지 않는다."""
+    directory.mkdir(parents=True, exist_ok=True)
+    part = directory / f".{uuid.uuid4().hex}{_PART_SUFFIX}"
+    digest = hashlib.sha256()
+    size = 0
+    try:
+        with part.open("wb") as f:
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                size += len(chunk)
+                if max_bytes is not None and size > max_bytes:
+                    raise FileTooLargeError(max_bytes, size)
+                digest.update(chunk)
+                f.write(chunk)
+        sha256 = digest.hexdigest()
+        path = directory / f"{sha256}{suffix.lower()}"
+        os.replace(part, path)
+    except BaseException:
+        part.unlink(missing_ok=True)
+        raise
+    return StoredFile(path=path, sha256=sha256, size_bytes=size)
+
+
+def remove_files(paths: Iterable[Path]) -> int:
+    """ingest 가 끝난 임시 파일 삭제. 지운 개수 반환."""
+    removed = 0
+    for path in set(paths):
+        try:
+            path.unlink(missing_ok=True)
+            removed += 1
+        except OSError:
+            logger.warning("temporary file cleanup failed path=%s", path)
+    return removed
+
+
+def gc_directory(directory: Path, *, older_than_seconds: float) -> int:
+    """중단된 실행이 남긴 파일(``.part`` 포함) 중 오래된 것 삭제."""
+    if not directory.is_dir():
+        return 0
+    cutoff = time.time() - older_than_seconds
+    stale: list[Path] = []
+    for path in directory.iterdir():
+        try:
+            if path.is_file() and path.stat().st_mtime < cutoff:
+                stale.append(path)
+        except OSError:
+            continue
+    return remove_files(stale)
+
+
+__all__ = [
+    "FileTooLargeError",
+    "StoredFile",
+    "gc_directory",
+    "remove_files",
+    "store_stream",
+]
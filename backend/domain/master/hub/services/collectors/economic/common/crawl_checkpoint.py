@@ -0,0 +1,131 @@
+"""크롤 체크포인트 (SQLite, 디스크) — 중단된 Backfill 을 멈춘 지점부터 재개.
+
+장시간 아카이브 순회(수백 페이지)가 중간에 죽으면 처음부터 다시 돌던 문제를 막는다.
+크롤러는 페이지 하나를 **적재까지 마친 뒤** ``(scope, key) → (page, last_url)`` 을 기록하고,
+다음 실행은 ``done`` 이 아닌 체크포인트의 다음 페이지부터 시작한다.
+
+  - ``scope`` : 크롤러 종류 (예: ``wowtale_archive``)
+  - ``key``   : 1회 Backfill 을 식별하는 값 (카테고리 + 컷오프 등 결과에 영향을 주는 인자)
+  - ``done``  : 범위를 끝까지 돈 경우 — 다음 실행은 처음부터 새로 시작한다.
+
+파일은 ``BRONZE_CACHE_DIR/crawl/checkpoints.sqlite3``.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from domain.master.hub.services.collectors.economic.common._cache_dir import cache_dir
+
+logger = logging.getLogger(__name__)
+
+_DB_FILENAME = "checkpoints.sqlite3"
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS checkpoints (
+        scope      TEXT NOT NULL,
+        key        TEXT NOT NULL,
+        page       INTEGER NOT NULL,
+        last_url   TEXT,
+        done       INTEGER NOT NULL DEFAULT 0,
+        updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (scope, key)
+    )
+"""
+
+
+@dataclass(frozen=True)
+class CrawlCheckpoint:
+    page: int                 # 적재까지 끝난 마지막 페이지
+    last_url: str | None      # 그 페이지의 마지막 항목 URL
+    done: bool
+    updated_at: str
+
+
+class CrawlCheckpointStore:
+    """블로킹 I/O (SQLite 커밋) — 비동기 호출부는 ``asyncio.to_thread`` 로 부른다 (스레드 안전)."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path or (cache_dir("crawl") / _DB_FILENAME)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self._path, check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get(self, scope: str, key: str) -> CrawlCheckpoint | None:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT page, last_url, done, updated_at FROM checkpoints WHERE scope = ? AND key = ?",
+                (scope, key),
+            ).fetchone()
+        if row is None:
+            return None
+        return CrawlCheckpoint(page=row[0], last_url=row[1], done=bool(row[2]), updated_at=row[3])
+
+    def save(
+        self,
+        scope: str,
+        key: str,
+        *,
+        page: int,
+        last_url: str | None,
+        done: bool = False,
+    ) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (scope, key, page, last_url, done, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)",
+                (scope, key, page, last_url, int(done)),
+            )
+            conn.commit()
+
+    def clear(self, scope: str, key: str | None = None) -> int:
+        """체크포인트 삭제 (``key`` 없으면 scope 전체). 지운 행 수."""
+        with self._lock:
+            conn = self._connect()
+            if key is None:
+                cur = conn.execute("DELETE FROM checkpoints WHERE scope = ?", (scope,))
+            else:
+                cur = conn.execute(
+                    "DELETE FROM checkpoints WHERE scope = ? AND key = ?", (scope, key)
+                )
+            conn.commit()
+            return cur.rowcount
+
+
+_DEFAULT_STORE: CrawlCheckpointStore | None = None
+_default_lock = threading.Lock()
+
+
+def get_crawl_checkpoints() -> CrawlCheckpointStore:
+    """프로세스 공용 체크포인트 저장소 (기본 경로)."""
+    global _DEFAULT_STORE
+    with _default_lock:
+        if _DEFAULT_STORE is None:
+            _DEFAULT_STORE = CrawlCheckpointStore()
+        return _DEFAULT_STORE
+
+
+__all__ = [
+    "CrawlCheckpoint",
+    "CrawlCheckpointStore",
+    "get_crawl_checkpoints",
+]
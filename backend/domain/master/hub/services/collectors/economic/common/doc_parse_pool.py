@@ -0,0 +1,471 @@
+"""첨부 문서 파싱 전용 프로세스 풀 — 문서별 타임아웃·메모리 상한·병렬 큐.
+
+`parse_document` (pdfplumber 페이지 순회, pandas `read_excel`, HWPX XML)는 CPU 바운드라
+`asyncio.to_thread` 로 돌려도 GIL 을 쥐고 다른 수집·API 요청을 멈추게 하고, 비정상 PDF 하나가
+잡 전체를 무한정 붙잡을 수 있다. 본 모듈은 파싱을 별도 프로세스로 보내 여러 코어에서 병렬로 돌린다.
+
+  - 워커 수 ``DOC_PARSE_WORKERS`` (기본 min(4, CPU)), ``spawn`` 컨텍스트
+    (uvicorn·DB 풀 스레드가 있는 프로세스를 fork 하지 않기 위해).
+  - 문서별 타임아웃 ``DOC_PARSE_TIMEOUT`` 초 (기본 120):
+      · 워커 안에서 SIGALRM 으로 파이썬 코드 수준 중단 → ``error`` dict 반환
+      · C 확장에서 멈춰 신호가 안 먹으면 부모가 ``+grace`` 후 풀을 죽이고 재생성
+        (같이 돌던 문서는 새 풀에서 1회 재시도)
+  - 워커 메모리 상한 ``DOC_PARSE_MEMORY_MB`` (RLIMIT_AS, 기본 2048, 0 이면 미적용) —
+    초과 시 해당 문서만 ``MemoryError`` → ``error`` dict.
+  - 동시 실행 = 워커 수. 제출 시점이 곧 실행 시점이 되도록 부모가 슬롯을 관리한다.
+  - 큰 PDF(``DOC_PDF_PARALLEL_MIN_PAGES`` 쪽 이상, 기본 100, PyMuPDF 엔진)는 페이지 구간으로 나눠
+    여러 워커에 동시에 보내고 `merge_pdf_parts` 로 합친다 (구간별로 같은 타임아웃 적용).
+  - 제출 전 `parsed_doc_cache` (파일 SHA-256 + 파서 버전) 를 조회해 같은 파일은 파싱하지 않고,
+    성공 결과는 저장한다 (``use_cache=False`` 또는 ``DOC_PARSE_CACHE=0`` 으로 우회).
+
+반환 형식은 `parse_document` 와 동일하며, 예외 대신 ``error`` 키로 실패를 알린다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+
+from domain.master.hub.services.collectors.economic.common._doc_parsers import (
+    PageRange,
+    merge_pdf_parts,
+    parse_document,
+    parse_pdf,
+    pdf_engine,
+    pdf_page_count,
+    pdf_page_ranges,
+    resolve_format,
+)
+from domain.master.hub.services.collectors.economic.common.parsed_doc_cache import (
+    CacheKey,
+    ParsedDocumentCache,
+    get_parsed_doc_cache,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT_SECONDS = 120.0
+DEFAULT_MEMORY_LIMIT_MB = 2048
+# 워커 spawn + pdfplumber/pandas import 시간 여유 (부모 측 하드 타임아웃 = timeout + grace)
+_HARD_TIMEOUT_GRACE_SECONDS = 15.0
+# 한 워커가 처리할 최대 문서 수 — 파서 라이브러리의 메모리 단편화 누적 방지
+_MAX_TASKS_PER_CHILD = 50
+DEFAULT_PARALLEL_MIN_PAGES = 100
+# 페이지 구간 하나의 최소 쪽수 — 구간마다 PDF 를 다시 여는 비용보다 커야 이득
+_MIN_PAGES_PER_PART = 25
+
+
+class _ParseTimeout(BaseException):
+    """워커 내부 SIGALRM — 파서의 ``except Exception`` 에 삼켜지지 않도록 BaseException."""
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name) or default)
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name) or default)
+    except ValueError:
+        return default
+
+
+def _failure(path: Path, message: str) -> dict[str, Any]:
+    try:
+        size = path.stat().st_size
+    except OSError:
+        size = 0
+    return {
+        "file_name": path.name,
+        "file_size_bytes": size,
+        "extraction_method": None,
+        "error": message,
+    }
+
+
+# ---------------------------------------------------------------------------
+# worker side
+# ---------------------------------------------------------------------------
+
+
+def _init_worker(memory_limit_mb: int) -> None:
+    if memory_limit_mb <= 0:
+        return
+    try:
+        import resource
+    except ImportError:  # pragma: no cover — Windows
+        return
+    limit = memory_limit_mb * 1024 * 1024
+    _soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _on_alarm(signum: int, frame: Any) -> None:
+    raise _ParseTimeout()
+
+
+def _parse_in_worker(path_str: str, timeout: float, pages: PageRange | None = None) -> dict[str, Any]:
+    path = Path(path_str)
+    use_alarm = timeout > 0 and hasattr(signal, "setitimer")
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return parse_pdf(path, pages=pages) if pages is not None else parse_document(path)
+    except _ParseTimeout:
+        return _failure(path, f"parse timeout after {timeout:.0f}s")
+    except MemoryError:
+        return _failure(path, "parse aborted: worker memory limit exceeded")
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+# ---------------------------------------------------------------------------
+# parent side
+# ---------------------------------------------------------------------------
+
+
+class DocumentParsePool:
+    """`parse_document` 를 프로세스 풀에서 실행. 스레드·이벤트 루프 어디서 불러도 안전."""
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        timeout: float | None = None,
+        memory_limit_mb: int | None = None,
+        use_cache: bool = True,
+        parallel_min_pages: int | None = None,
+    ) -> None:
+        cpu = os.cpu_count() or 1
+        self.max_workers = max(1, max_workers or _env_int("DOC_PARSE_WORKERS", min(4, cpu)))
+        self.timeout = timeout if timeout is not None else _env_float(
+            "DOC_PARSE_TIMEOUT", DEFAULT_TIMEOUT_SECONDS
+        )
+        self.memory_limit_mb = (
+            memory_limit_mb
+            if memory_limit_mb is not None
+            else _env_int("DOC_PARSE_MEMORY_MB", DEFAULT_MEMORY_LIMIT_MB)
+        )
+        self.use_cache = use_cache
+        self.parallel_min_pages = parallel_min_pages or _env_int(
+            "DOC_PDF_PARALLEL_MIN_PAGES", DEFAULT_PARALLEL_MIN_PAGES
+        )
+        self._slots = threading.BoundedSemaphore(self.max_workers)
+        self._lock = threading.Lock()
+        self._executor: ProcessPoolExecutor | None = None
+        self._generation = 0
+
+    # --- executor lifecycle -------------------------------------------------
+
+    def _get_executor(self) -> tuple[ProcessPoolExecutor, int]:
+        with self._lock:
+            if self._executor is None:
+                kwargs: dict[str, Any] = {
+                    "max_workers": self.max_workers,
+                    "mp_context": multiprocessing.get_context("spawn"),
+                    "initializer": _init_worker,
+                    "initargs": (self.memory_limit_mb,),
+                }
+                if sys.version_info >= (3, 11):
+                    kwargs["max_tasks_per_child"] = _MAX_TASKS_PER_CHILD
+                self._executor = ProcessPoolExecutor(**kwargs)
+                self._generation += 1
+            return self._executor, self._generation
+
+    def _reset(self, generation: int) -> None:
+        """하드 타임아웃 — 멈춘 워커를 포함해 풀 전체를 죽이고 다음 제출 때 재생성."""
+        with self._lock:
+            if self._executor is None or generation != self._generation:
+                return  # 다른 스레드가 이미 재생성
+            executor, self._executor = self._executor, None
+        for proc in list((getattr(executor, "_processes", None) or {}).values()):
+            try:
+                proc.kill()
+            except Exception:
+                pass
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    # --- submission ---------------------------------------------------------
+
+    def _submit(self, path: Path, pages: PageRange | None) -> tuple[Future[dict[str, Any]], int]:
+        """슬롯을 이미 확보한 상태에서 호출. 완료 시 슬롯 반환."""
+        for _ in range(2):
+            executor, generation = self._get_executor()
+            try:
+                fut = executor.submit(_parse_in_worker, str(path), self.timeout, pages)
+            except BrokenProcessPool:
+                # 워커가 죽어(OOM kill 등) 깨진 풀 — 재생성 후 1회 더
+                self._reset(generation)
+                continue
+            except Exception:
+                self._slots.release()
+                raise
+            fut.add_done_callback(lambda _f: self._slots.release())
+            return fut, generation
+        self._slots.release()
+        raise BrokenProcessPool("document parse pool unavailable")
+
+    async def _acquire_async(self) -> None:
+        acquiring = asyncio.ensure_future(asyncio.to_thread(self._slots.acquire))
+        try:
+            await asyncio.shield(acquiring)
+        except asyncio.CancelledError:
+            # 대기 중 취소돼도 스레드는 결국 슬롯을 잡으므로 즉시 돌려준다.
+            acquiring.add_done_callback(lambda _f: self._slots.release())
+            raise
+
+    def _hard_timeout(self) -> float | None:
+        return self.timeout + _HARD_TIMEOUT_GRACE_SECONDS if self.timeout > 0 else None
+
+    # --- parsed-document cache ----------------------------------------------
+
+    def _cache_lookup(
+        self, path: Path, sha256: str | None = None
+    ) -> tuple[ParsedDocumentCache | None, CacheKey | None, dict[str, Any] | None]:
+        """(cache, key, hit). 캐시 장애는 파싱을 막지 않도록 경고만 남기고 우회."""
+        cache = get_parsed_doc_cache() if self.use_cache else None
+        if cache is None:
+            return None, None, None
+        try:
+            key = cache.key_for(path, sha256)
+            hit = cache.get(key, path) if key is not None else None
+        except Exception:
+            logger.warning("[doc-parse] cache lookup failed file=%s", path.name, exc_info=True)
+            return None, None, None
+        if hit is not None:
+            logger.info("[doc-parse] cache hit file=%s sha256=%s", path.name, key[0][:12])
+        return cache, key, hit
+
+    @staticmethod
+    def _cache_store(
+        cache: ParsedDocumentCache | None, key: CacheKey | None, result: dict[str, Any]
+    ) -> None:
+        if cache is None or key is None:
+            return
+        try:
+            cache.put(key, result)
+        except Exception:
+            logger.warning("[doc-parse] cache store failed file=%s", result.get("file_name"), exc_info=True)
+
+    # --- parsing --------------------------------------------------------------
+
+    def parse_sync(self, path: Path | str, *, sha256: str | None = None) -> dict[str, Any]:
+        """블로킹 파싱 (스레드/배치용). 실패·타임아웃도 ``error`` dict 로 반환.
+
+        ``sha256`` 은 호출부가 이미 계산한 파일 해시 (캐시 키 재계산 생략).
+        """
+        path = Path(path)
+        cache, key, hit = self._cache_lookup(path, sha256)
+        if hit is not None:
+            return hit
+        result = self._parse_uncached_sync(path)
+        self._cache_store(cache, key, result)
+        return result
+
+    async def parse(
+        self,
+        path: Path | str,
+        *,
+        sha256: str | None = None,
+        on_pages: Callable[[int, int], None] | None = None,
+    ) -> dict[str, Any]:
+        """비동기 파싱 — 이벤트 루프를 막지 않는다 (해시·캐시 I/O 도 스레드에서).
+
+        ``on_pages(done, total)`` 는 페이지 병렬 PDF 의 구간이 끝날 때마다, 그 외에는 완료 시 1회.
+        """
+        path = Path(path)
+        cache, key, hit = await asyncio.to_thread(self._cache_lookup, path, sha256)
+        if hit is not None:
+            result = hit
+        else:
+            result = await self._parse_uncached(path, on_pages)
+            await asyncio.to_thread(self._cache_store, cache, key, result)
+        if on_pages is not None and result.get("page_count"):
+            on_pages(result["page_count"], result["page_count"])
+        return result
+
+    def _split_pdf(self, path: Path) -> list[PageRange] | None:
+        """페이지 병렬 대상이면 구간 목록, 아니면 None."""
+        if self.max_workers < 2 or resolve_format(path) != ".pdf" or pdf_engine() != "pymupdf":
+            return None
+        page_count = pdf_page_count(path)
+        if not page_count or page_count < self.parallel_min_pages:
+            return None
+        ranges = pdf_page_ranges(page_count, self.max_workers, min_pages=_MIN_PAGES_PER_PART)
+        if len(ranges) < 2:
+            return None
+        logger.info("[doc-parse] page-parallel file=%s pages=%d parts=%d", path.name, page_count, len(ranges))
+        return ranges
+
+    def _parse_uncached_sync(self, path: Path) -> dict[str, Any]:
+        ranges = self._split_pdf(path)
+        if ranges is None:
+            return self._run_sync(path, None)
+        with ThreadPoolExecutor(max_workers=len(ranges), thread_name_prefix="doc-parse-part") as waiters:
+            parts = list(waiters.map(lambda r: self._run_sync(path, r), ranges))
+        return merge_pdf_parts(path, parts)
+
+    async def _parse_uncached(
+        self, path: Path, on_pages: Callable[[int, int], None] | None = None
+    ) -> dict[str, Any]:
+        ranges = await asyncio.to_thread(self._split_pdf, path)
+        if ranges is None:
+            return await self._run(path, None)
+        total = ranges[-1][1]
+        done = 0
+
+        async def run_part(pages: PageRange) -> dict[str, Any]:
+            nonlocal done
+            part = await self._run(path, pages)
+            done += pages[1] - pages[0]
+            if on_pages is not None:
+                on_pages(done, total)
+            return part
+
+        parts = await asyncio.gather(*(run_part(r) for r in ranges))
+        return merge_pdf_parts(path, list(parts))
+
+    def _run_sync(self, path: Path, pages: PageRange | None) -> dict[str, Any]:
+        for attempt in range(2):
+            self._slots.acquire()
+            try:
+                fut, generation = self._submit(path, pages)
+            except Exception as exc:
+                return _failure(path, f"parse pool submit failed: {exc}")
+            try:
+                return fut.result(timeout=self._hard_timeout())
+            except FutureTimeoutError:
+                logger.error("[doc-parse] hard timeout — 풀 재생성 file=%s", path.name)
+                self._reset(generation)
+                return _failure(path, f"parse timeout after {self.timeout:.0f}s (worker killed)")
+            except BrokenProcessPool:
+                self._reset(generation)
+                if attempt == 0:
+                    logger.warning("[doc-parse] 풀 재생성으로 중단 — 재시도 file=%s", path.name)
+                    continue
+                return _failure(path, "parse worker crashed")
+            except Exception as exc:
+                logger.exception("[doc-parse] worker error file=%s", path.name)
+                return _failure(path, str(exc))
+        return _failure(path, "parse worker crashed")
+
+    async def _run(self, path: Path, pages: PageRange | None) -> dict[str, Any]:
+        for attempt in range(2):
+            await self._acquire_async()
+            try:
+                fut, generation = self._submit(path, pages)
+            except Exception as exc:
+                return _failure(path, f"parse pool submit failed: {exc}")
+            try:
+                return await asyncio.wait_for(asyncio.wrap_future(fut), timeout=self._hard_timeout())
+            except asyncio.TimeoutError:
+                logger.error("[doc-parse] hard timeout — 풀 재생성 file=%s", path.name)
+                self._reset(generation)
+                return _failure(path, f"parse timeout after {self.timeout:.0f}s (worker killed)")
+            except BrokenProcessPool:
+                self._reset(generation)
+                if attempt == 0:
+                    logger.warning("[doc-parse] 풀 재생성으로 중단 — 재시도 file=%s", path.name)
+                    continue
+                return _failure(path, "parse worker crashed")
+            except Exception as exc:
+                logger.exception("[doc-parse] worker error file=%s", path.name)
+                return _failure(path, str(exc))
+        return _failure(path, "parse worker crashed")
+
+    async def parse_many(
+        self,
+        paths: Sequence[Path | str],
+        *,
+        sha256s: Sequence[str | None] | None = None,
+        on_result: Callable[[int, dict[str, Any]], None] | None = None,
+    ) -> list[dict[str, Any]]:
+        """여러 문서 병렬 파싱 (입력 순서 유지). ``on_result(index, result)`` 는 완료 순으로 호출."""
+        hashes = list(sha256s) if sha256s is not None else [None] * len(paths)
+
+        async def one(i: int) -> dict[str, Any]:
+            result = await self.parse(paths[i], sha256=hashes[i])
+            if on_result is not None:
+                on_result(i, result)
+            return result
+
+        return list(await asyncio.gather(*(one(i) for i in range(len(paths)))))
+
+    def parse_many_sync(
+        self,
+        paths: Sequence[Path | str],
+        *,
+        sha256s: Sequence[str | None] | None = None,
+        on_result: Callable[[int, dict[str, Any]], None] | None = None,
+    ) -> list[dict[str, Any]]:
+        """동기 호출부용 `parse_many` — 워커 수만큼 스레드로 대기하며 병렬 제출.
+
+        ``on_result`` 는 대기 스레드에서 완료 순으로 호출된다 (진행률 보고용).
+        """
+        hashes = list(sha256s) if sha256s is not None else [None] * len(paths)
+
+        def one(i: int) -> dict[str, Any]:
+            result = self.parse_sync(paths[i], sha256=hashes[i])
+            if on_result is not None:
+                on_result(i, result)
+            return result
+
+        if len(paths) <= 1:
+            return [one(i) for i in range(len(paths))]
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="doc-parse") as waiters:
+            return list(waiters.map(one, range(len(paths))))
+
+
+_pool: DocumentParsePool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_parse_pool() -> DocumentParsePool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DocumentParsePool()
+        return _pool
+
+
+def shutdown_parse_pool() -> None:
+    """앱 종료 시 워커 정리 (FastAPI lifespan)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+__all__ = [
+    "DEFAULT_MEMORY_LIMIT_MB",
+    "DEFAULT_PARALLEL_MIN_PAGES",
+    "DEFAULT_TIMEOUT_SECONDS",
+    "DocumentParsePool",
+    "get_parse_pool",
+    "shutdown_parse_pool",
+]
@@ -0,0 +1,409 @@
+"""뉴스 본문 금융 엔티티 추출 — 금액 · 투자 라운드 · 투자사 · 투자 대상, 컴파일된 정규식 1회 스캔.
+
+스타트업 미디어 수집기(Wowtale·Platum·Venturesquare·StartupRecipe, 아카이브·REST Backfill)가
+단위별 정규식 6개를 본문 전체(최대 12,000자)에 차례로 돌리던 금액 추출과, 수집기마다 복붙된
+``_extract_investor_from_title`` 을 하나로 모은다.
+
+  - 모든 패턴을 리터럴로 시작하는 평평한 대안(`_BRANCHES`)으로 묶은 정규식 하나를 모듈 import 시
+    컴파일하고, ``finditer`` 한 번으로 제목+본문을 훑는다 (분기 끝 마커의 ``m.lastgroup`` 으로 종류 판별).
+  - 결과는 종류별 `Mention` (원문 조각·span·정규화 값). span 은 ``title + "\\n" + body`` 기준이며
+    ``title_len`` 이하이면 제목 안이다.
+  - `extract_many` 는 문서 여러 건을 ``\\x00`` 으로 이어 **한 번** 스캔한 뒤 문서별로 나눈다
+    (Backfill 배치처럼 문서가 많아도 정규식 스캔은 1회).
+
+금액 규칙 (기존 `extract_investment_amount_krw` 호환 + 보완):
+  - ``N조`` / ``N억`` 은 ``원`` 없이도, ``N만`` / ``N천`` 은 ``원`` 이 붙을 때만 금액으로 본다.
+  - 복합 표기를 한 금액으로 합친다: ``1조 5000억`` · ``3억 5천만 원`` · ``2천억 원``.
+  - 소수(``1.5조``)를 읽는다 — 기존 패턴은 ``5조`` 로 잘못 읽었다.
+  - ``달러``·``엔``·``유로``·``위안`` 이 붙은 금액은 통화를 표시하고 원화 최댓값(`amount_krw`)에서 뺀다.
+
+투자사·대상은 규칙 기반 **후보**다 (Silver LLM 단계 힌트). ``investor_name`` 필드는 사이트별 기존
+제목 규칙을 그대로 쓴다 — `title_first_token` (Wowtale·Platum·Venturesquare), `title_lead_name`
+(StartupRecipe, 선행 ``[…]`` 태그 제거 + ``‧`` 구분).
+
+성능 비교: ``scripts/financial_entities_benchmark.py``.
+"""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Final
+
+# 숫자: 쉼표 정수(1,000) · 소수(1.5) · 정수
+_NUM: Final = r"\d+(?:,\d{3})*(?:\.\d+)?"
+# 단위: (천|백|십)? + (조|억|만)  또는  천
+_UNIT: Final = r"[천백십]?[조억만]|천"
+# 한글 통화명 뒤에는 한글이 오지 않거나 조사만 온다 — "50억 엔터테인먼트·엔진·엔비디아", "원자력" 등을
+# 통화로 읽지 않으면서 "5천만 원을", "1억 엔의" 는 살린다
+_CUR_END: Final = (
+    r"(?:(?![가-힣])|(?=을|를|은|는|이|의|에|과|와|도|만|씩|대|으로|로|까지|부터|가량|어치|짜리|이상|이하))"
+)
+_CUR: Final = rf"(?:원|엔|유로|위안){_CUR_END}|달러"
+
+AMOUNT: Final = "amount"
+ROUND: Final = "round"
+INVESTOR: Final = "investor"
+TARGET: Final = "target"
+_INVESTOR_EN: Final = "investor_en"
+_FROM_INVESTOR: Final = "from_investor"
+
+_INVESTOR_SUFFIXES: Final = (
+    "벤처스",
+    "파트너스",
+    "인베스트먼트",
+    "캐피탈",
+    "캐피털",
+    "자산운용",
+    "액셀러레이터",
+    "엑셀러레이터",
+    "벤처투자",
+    "기술투자",
+    "창업투자",
+    "투자조합",
+)
+
+# sre 는 정규식 전체가 리터럴로 시작하는 분기의 평평한 대안이면 그 첫 글자 집합을 미리 만들어
+# 집합에 없는 위치(본문 대부분의 글자)를 C 루프에서 건너뛴다. 그래서 분기는 모두 **리터럴 한 글자**로
+# 시작하게 펼친다 — 숫자 ``\d`` 는 0~9 열 갈래로, ``[Pp]re`` 같은 대소문자 집합은 표기별로.
+# 이름 그룹·비캡처 묶음·단어 경계(lookbehind)·문자집합을 분기 맨 앞에 두면 모든 위치에서 분기
+# 전체를 시도해 기존 단위별 정규식 6개보다 느려진다. 종류는 분기 끝의 빈 이름 그룹
+# (``(?P<amount0>)`` 등 — 마지막에 닫히므로 ``m.lastgroup``)으로 구분하고, 이름은 매치 뒤
+# `_WORD_BEFORE` 로 거꾸로 붙인다.
+_AMOUNT_TAIL: Final = (
+    rf"\d*(?:,\d{{3}})*(?:\.\d+)?\s*(?:{_UNIT})"
+    rf"(?:\s*{_NUM}\s*(?:{_UNIT})){{0,2}}(?:\s*(?:{_CUR}))?"
+)
+_BRANCHES: Final[tuple[tuple[str, str], ...]] = (
+    # 금액 — 최대 3마디 (1조 2천억 5000만 원). 마디·통화는 `_amount` 가 다시 나눈다
+    *((digit + _AMOUNT_TAIL, AMOUNT) for digit in "0123456789"),
+    # 투자 라운드 (영문은 앞 글자 경계를 `_round` 에서, 라벨은 끝 글자로 정한다)
+    *(
+        (rf"{pre}-?\s?(?:[Ii][Pp][Oo]|(?:[Ss]eries\s?)?[A-Ha-h])(?![A-Za-z])", ROUND)
+        for pre in ("Pre", "pre", "PRE")
+    ),
+    (r"프리\s?(?:IPO|(?:시리즈\s?)?[A-H])(?![A-Za-z])", ROUND),
+    (r"시리즈\s?[A-H](?![A-Za-z])", ROUND),
+    *((rf"{s}eries\s?[A-Ha-h](?![A-Za-z])", ROUND) for s in "Ss"),
+    (r"시드(?:(?![가-힣])|(?=투자|라운드|단계|펀딩|머니))", ROUND),
+    *((rf"{s}eed(?![A-Za-z])", ROUND) for s in "Ss"),
+    (r"엔젤\s?(?:투자|라운드)", ROUND),
+    (r"브(?:릿|리)지\s?(?:투자|라운드)", ROUND),
+    *((rf"{b}ridge\s+round", ROUND) for b in "Bb"),
+    # 투자사 — 업권 접미사 (앞 이름은 거꾸로 확장)
+    *((suffix, INVESTOR) for suffix in _INVESTOR_SUFFIXES),
+    *(
+        (rf"{suffix}(?![A-Za-z])", _INVESTOR_EN)
+        for suffix in ("Ventures", "Partners", "Capital", "Investments", "Investment")
+    ),
+    # 투자사 — "X로부터 (투자 유치)"
+    (r"으로부터", _FROM_INVESTOR),
+    (r"로부터", _FROM_INVESTOR),
+    # 투자 대상 — "X에 (50억 원을) 투자" ("에" 만 소비 — 사이의 금액도 잡히도록)
+    (r"에(?=\s(?:[^\s\x00]+\s){0,3}?투자(?!자|사|조합|업|금))", TARGET),
+)
+_PATTERN: Final = re.compile(
+    "|".join(f"{rx}(?P<{kind}{i}>)" for i, (rx, kind) in enumerate(_BRANCHES))
+)
+# lastgroup(마커 이름) → 종류
+_GROUP_KIND: Final[dict[str, str]] = {
+    f"{kind}{i}": kind for i, (_rx, kind) in enumerate(_BRANCHES)
+}
+_AMOUNT_PART: Final = re.compile(rf"({_NUM})\s*({_UNIT})")
+_AMOUNT_CUR: Final = re.compile(rf"(?:{_CUR})$")
+# 매치 바로 앞 이름 (단어 글자 연속) / 영문 고유명 (대문자로 시작하는 단어 1~3개)
+_WORD_BEFORE: Final = re.compile(r"[가-힣A-Za-z0-9&]{1,20}$")
+_EN_NAME_BEFORE: Final = re.compile(r"(?:[A-Z][A-Za-z0-9&]*\s){1,3}$")
+# 거꾸로 확장할 때 보는 길이 — 국문 이름은 최대 20자, 영문은 단어 3개
+_LOOKBACK_KO: Final = 20
+_LOOKBACK_EN: Final = 60
+
+_UNIT_BASE: Final[dict[str, int]] = {"조": 10**12, "억": 10**8, "만": 10**4, "천": 10**3}
+_UNIT_PREFIX: Final[dict[str, int]] = {"천": 1000, "백": 100, "십": 10}
+_CURRENCY: Final[dict[str, str]] = {
+    "원": "KRW",
+    "달러": "USD",
+    "엔": "JPY",
+    "유로": "EUR",
+    "위안": "CNY",
+}
+# 접미사만 있는 일반명사·시점 표현 — 후보에서 뺀다
+_GENERIC_NAMES: Final = frozenset(
+    {
+        "벤처캐피탈",
+        "벤처캐피털",
+        "창업투자",
+        "벤처투자",
+        "기술투자",
+        "투자조합",
+        "최근",
+        "올해",
+        "지난해",
+        "이번",
+        "국내",
+        "해외",
+        "기업",
+        "회사",
+        "스타트업",
+        "분야",
+        "사업",
+    }
+)
+
+_BRACKET_PREFIX_RE: Final = re.compile(r"^\s*\[[^\]]{0,30}\]\s*")
+_LEAD_TOKEN_RE: Final = re.compile(r"^([^,·‧]+)")
+_FIRST_TOKEN_RE: Final = re.compile(r"^([^,·]+)")
+
+
+@dataclass(frozen=True, slots=True)
+class Mention:
+    kind: str                  # amount / round / investor / target
+    text: str                  # 원문 조각
+    start: int
+    end: int
+    value: int | str           # amount: 통화 단위 정수 / round: 정규화 라벨 / 그 외: 이름
+    currency: str | None = None  # amount 전용 (단위 뒤 통화 표기 없으면 KRW)
+
+
+@dataclass(frozen=True, slots=True)
+class FinancialEntities:
+    title_len: int
+    amounts: tuple[Mention, ...] = ()
+    rounds: tuple[Mention, ...] = ()
+    investors: tuple[Mention, ...] = ()
+    targets: tuple[Mention, ...] = ()
+
+    @property
+    def amount_krw(self) -> int | None:
+        """원화 금액 중 최댓값 (헤드라인 규모가 보통 최대) — 기존 `extract_investment_amount_krw` 값."""
+        values = [int(m.value) for m in self.amounts if m.currency == "KRW"]
+        return max(values) if values else None
+
+    @property
+    def round_labels(self) -> list[str]:
+        return _unique(m.value for m in self.rounds)
+
+    @property
+    def investor_names(self) -> list[str]:
+        return _unique(m.value for m in self.investors)
+
+    @property
+    def target_names(self) -> list[str]:
+        return _unique(m.value for m in self.targets)
+
+    def metadata(self) -> dict[str, list[str]]:
+        """``raw_metadata`` 에 붙일 후보 요약 (빈 항목 생략)."""
+        out: dict[str, list[str]] = {}
+        if labels := self.round_labels:
+            out["round_labels"] = labels
+        if names := self.investor_names:
+            out["investor_candidates"] = names[:10]
+        if names := self.target_names:
+            out["target_candidates"] = names[:10]
+        return out
+
+
+def _unique(values: Iterable[int | str]) -> list[str]:
+    return list(dict.fromkeys(str(v) for v in values))
+
+
+def title_first_token(title: str) -> str | None:
+    """제목 첫 토큰(``,`` / ``·`` 앞) — 임시 투자사명 (Phase 1 규칙, Wowtale·Platum·Venturesquare).
+
+    예: "카카오벤처스, AI 스타트업에 투자" → "카카오벤처스"
+    """
+    match = _FIRST_TOKEN_RE.match(title)
+    if not match:
+        return None
+    candidate = match.group(1).strip()
+    if not candidate or len(candidate) >= 50:
+        return None
+    return candidate[:255]
+
+
+def title_lead_name(title: str) -> str | None:
+    """선행 ``[…]`` 태그를 뗀 제목의 첫 토큰(``,`` / ``·`` / ``‧`` 앞) — StartupRecipe 규칙.
+
+    예: "[투자] 카카오벤처스‧알토스, AI 스타트업에 투자" → "카카오벤처스"
+    """
+    stripped = _BRACKET_PREFIX_RE.sub("", title).strip()
+    match = _LEAD_TOKEN_RE.match(stripped)
+    if not match:
+        return None
+    candidate = match.group(1).strip()
+    if not candidate or len(candidate) >= 50:
+        return None
+    return candidate[:255]
+
+
+def _to_number(raw: str) -> float | int:
+    raw = raw.replace(",", "")
+    return float(raw) if "." in raw else int(raw)
+
+
+def _unit_value(unit: str) -> int:
+    if len(unit) == 2:
+        return _UNIT_PREFIX[unit[0]] * _UNIT_BASE[unit[1]]
+    return _UNIT_BASE[unit]
+
+
+def _amount(m: re.Match[str], offset: int) -> Mention | None:
+    raw = m.group()
+    parts = _AMOUNT_PART.findall(raw)
+    cur = _AMOUNT_CUR.search(raw)
+    currency = cur.group() if cur else None
+    # 만·천 단위는 "원" 등 통화가 붙어야 금액 (3천 명, 5만 건 제외)
+    if currency is None and parts[0][1][-1] not in "조억":
+        return None
+    value = int(round(sum(_to_number(n) * _unit_value(u) for n, u in parts)))
+    if value <= 0:
+        return None
+    return Mention(
+        AMOUNT,
+        raw,
+        m.start() - offset,
+        m.end() - offset,
+        value,
+        _CURRENCY[currency] if currency else "KRW",
+    )
+
+
+def _round(m: re.Match[str], text: str, offset: int) -> Mention | None:
+    raw = m.group()
+    start = m.start()
+    # 영문 라운드는 단어 중간(presale, overseas 등)이 아니어야 한다
+    if raw[0].isascii() and start > 0 and text[start - 1].isascii() and text[start - 1].isalpha():
+        return None
+    upper = raw.upper()
+    if "IPO" in upper:
+        label = "Pre-IPO"
+    elif upper.startswith(("PRE", "프리")):
+        label = f"Pre-{upper[-1]}"
+    elif upper.startswith(("SERIES", "시리즈")):
+        label = f"Series {upper[-1]}"
+    elif "시드" in raw or upper == "SEED":
+        label = "Seed"
+    elif "엔젤" in raw:
+        label = "Angel"
+    else:
+        label = "Bridge"
+    return Mention(ROUND, raw, start - offset, m.end() - offset, label)
+
+
+def _name_before(
+    kind: str,
+    text: str,
+    end: int,
+    offset: int,
+    *,
+    suffix: str = "",
+    english: bool = False,
+    min_len: int = 1,
+) -> Mention | None:
+    """``text[:end]`` 끝에 붙은 이름 + ``suffix`` → Mention (span 은 suffix 포함)."""
+    if english:
+        found = _EN_NAME_BEFORE.search(text, max(0, end - _LOOKBACK_EN), end)
+    else:
+        found = _WORD_BEFORE.search(text, max(0, end - _LOOKBACK_KO), end)
+    if found is None or len(found.group()) < min_len:
+        return None
+    start = found.start()
+    name = found.group() + suffix
+    if name in _GENERIC_NAMES or name.isdigit():
+        return None
+    return Mention(kind, name, start - offset, start + len(name) - offset, name)
+
+
+def _collect(
+    matches: Iterable[re.Match[str]], text: str, offset: int, title: str
+) -> FinancialEntities:
+    amounts: list[Mention] = []
+    rounds: list[Mention] = []
+    investors: list[Mention] = []
+    targets: list[Mention] = []
+    mention: Mention | None
+    group_kind = _GROUP_KIND
+    for m in matches:
+        kind = group_kind[m.lastgroup]
+        if kind == AMOUNT:
+            mention = _amount(m, offset)
+            bucket = amounts
+        elif kind == ROUND:
+            mention = _round(m, text, offset)
+            bucket = rounds
+        elif kind == INVESTOR:
+            mention = _name_before(INVESTOR, text, m.start(), offset, suffix=m.group())
+            bucket = investors
+        elif kind == _INVESTOR_EN:
+            mention = _name_before(
+                INVESTOR, text, m.start(), offset, suffix=m.group(), english=True
+            )
+            bucket = investors
+        elif kind == _FROM_INVESTOR:
+            mention = _name_before(INVESTOR, text, m.start(), offset, min_len=2)
+            bucket = investors
+        else:
+            mention = _name_before(TARGET, text, m.start(), offset, min_len=2)
+            bucket = targets
+        if mention is not None:
+            bucket.append(mention)
+    # "회사명, 시리즈A 투자 유치" — 제목 첫 토큰이 투자 대상
+    if "유치" in title and (lead := title_lead_name(title)):
+        start = title.find(lead)
+        if lead not in (t.value for t in targets) and not any(i.value == lead for i in investors):
+            targets.insert(0, Mention(TARGET, lead, start, start + len(lead), lead))
+    return FinancialEntities(
+        title_len=len(title),
+        amounts=tuple(amounts),
+        rounds=tuple(rounds),
+        investors=tuple(investors),
+        targets=tuple(targets),
+    )
+
+
+def _document(title: str, body: str) -> str:
+    return f"{title}\n{body}" if body else title
+
+
+def extract(title: str, body: str = "") -> FinancialEntities:
+    """제목 + 본문 1건 → `FinancialEntities` (정규식 1회 스캔)."""
+    title = title or ""
+    text = _document(title, body or "")
+    return _collect(_PATTERN.finditer(text), text, 0, title)
+
+
+def extract_many(docs: Sequence[tuple[str, str]]) -> list[FinancialEntities]:
+    """(제목, 본문) 여러 건 → 입력 순서대로 결과. 전체를 ``\\x00`` 으로 이어 한 번만 스캔한다."""
+    if not docs:
+        return []
+    texts = [_document(t or "", b or "") for t, b in docs]
+    starts: list[int] = []
+    pos = 0
+    for text in texts:
+        starts.append(pos)
+        pos += len(text) + 1
+    joined = "\x00".join(texts)
+    buckets: list[list[re.Match[str]]] = [[] for _ in texts]
+    # 패턴·이름 확장 모두 \x00 을 넘지 않으므로 (숫자·단어·\s 에 없음) 매치는 문서 하나에 속한다.
+    # 매치는 위치 순이므로 문서 경계를 앞으로만 옮긴다
+    doc = 0
+    next_start = starts[1] if len(starts) > 1 else pos
+    for m in _PATTERN.finditer(joined):
+        if m.start() >= next_start:
+            doc = bisect_right(starts, m.start()) - 1
+            next_start = starts[doc + 1] if doc + 1 < len(starts) else pos
+        buckets[doc].append(m)
+    return [
+        _collect(bucket, joined, starts[i], docs[i][0] or "") for i, bucket in enumerate(buckets)
+    ]
+
+__all__ = [
+    "FinancialEntities",
+    "Mention",
+    "extract",
+    "extract_many",
+    "title_first_token",
+    "title_lead_name",
+]
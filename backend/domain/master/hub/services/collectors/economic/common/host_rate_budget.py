@@ -0,0 +1,53 @@
+"""호스트별 요청 예산 — 동시 요청 수 상한 + 요청 시작 간 최소 간격.
+
+크롤러가 카테고리·상세 페이지를 동시에 받더라도 한 사이트에 가는 요청은
+``max_concurrency`` 개, 초당 ``1 / min_interval`` 회를 넘지 않게 한다.
+기존의 ``time.sleep(sleep_sec)`` (작업 하나가 자기 요청 사이에만 쉬던 방식)을 대체한다 —
+예산은 같은 호스트를 쓰는 모든 작업이 공유한다.
+
+    budget = HostRateBudget(min_interval=0.25, max_concurrency=4)
+    async with budget.slot(url):
+        resp = await client.get(url)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+
+
+class HostRateBudget:
+    def __init__(self, *, min_interval: float, max_concurrency: int) -> None:
+        self._min_interval = max(0.0, min_interval)
+        self._max_concurrency = max(1, max_concurrency)
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._next_start: dict[str, float] = {}
+
+    @property
+    def min_interval(self) -> float:
+        return self._min_interval
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """``url`` 호스트의 예산 1칸을 잡고 있는 동안 요청한다."""
+        host = (urlsplit(url).hostname or "").lower()
+        sem = self._semaphores.get(host)
+        if sem is None:
+            sem = self._semaphores[host] = asyncio.Semaphore(self._max_concurrency)
+        async with sem:
+            # 이벤트 루프 단일 스레드 — 예약(읽기·갱신) 사이에 await 가 없어 별도 락이 필요 없다
+            now = asyncio.get_running_loop().time()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self._min_interval
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
+
+__all__ = ["HostRateBudget"]
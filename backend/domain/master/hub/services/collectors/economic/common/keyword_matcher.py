@@ -0,0 +1,165 @@
+"""수집기 공용 키워드 매처 — 우선순위 규칙 · 다중 패턴 1회 스캔.
+
+DART 보고서명 필터/분류, RSS(Wowtale·Platum·Venturesquare·StartupRecipe) 투자 키워드 필터와
+source_type 규칙, MFDS·ALIO 키워드 필터가 각자 ``for kw in KEYWORDS: if kw in title`` 루프를
+복붙해 쓰던 것을 하나로 모은다.
+
+  - 규칙은 ``(키워드, 값)`` 또는 키워드 문자열. **튜플 순서 = 우선순위** (앞이 높음)
+  - ``first()``  : 매칭된 규칙 중 우선순위가 가장 높은 값 (기존 "최초 매칭 규칙" 분류와 동일)
+  - ``any()``    : 하나라도 매칭되는지 (기존 필터와 동일)
+  - ``matches()``: 매칭된 모든 규칙 (우선순위 순)
+  - 매처는 모듈 import 시 1회 컴파일해 모듈 상수로 둔다.
+
+엔진:
+  - 패턴 수가 ``AC_MIN_PATTERNS`` 이상이면 Aho-Corasick 오토마톤(완전 DFA 전이표)으로 텍스트를
+    한 번만 훑는다 — 비용 O(len(text)), 패턴 수와 무관.
+  - 그보다 적으면 우선순위 순 부분문자열 검사(C 구현 ``str.__contains__``)를 쓴다. CPython 에서는
+    순수 파이썬 문자 단위 오토마톤 순회가 수십 개 패턴의 C 검색보다 느리기 때문이다
+    (``scripts/keyword_matcher_benchmark.py`` 로 교차점 확인).
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+# 이 이상이면 Aho-Corasick 엔진 (벤치마크 교차점: 제목 ≈ 64 패턴, 본문 2천자 ≈ 200 패턴 — 수집기는 주로 제목)
+AC_MIN_PATTERNS = 64
+
+
+class _AhoCorasick:
+    """패턴 인덱스 출력용 Aho-Corasick — goto/fail 을 완전 DFA 전이표로 펼쳐 둔다."""
+
+    __slots__ = ("_delta", "_out")
+
+    def __init__(self, patterns: Sequence[str]) -> None:
+        goto: list[dict[str, int]] = [{}]
+        out: list[list[int]] = [[]]
+        for idx, pattern in enumerate(patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    goto.append({})
+                    out.append([])
+                    nxt = goto[state][ch] = len(goto) - 1
+                state = nxt
+            out[state].append(idx)
+
+        fail = [0] * len(goto)
+        delta: list[dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            # BFS 순서상 fail 상태의 전이표는 이미 완성되어 있다.
+            row = dict(delta[fail[state]])
+            row.update(goto[state])
+            delta[state] = row
+            out[state] = out[state] + out[fail[state]]
+            for ch, nxt in goto[state].items():
+                fail[nxt] = delta[fail[state]].get(ch, 0)
+                queue.append(nxt)
+
+        self._delta = delta
+        self._out = [tuple(sorted(set(o))) for o in out]
+
+    def iter_hits(self, text: str) -> Iterable[tuple[int, ...]]:
+        delta = self._delta
+        out = self._out
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            hits = out[state]
+            if hits:
+                yield hits
+
+
+class KeywordMatcher(Generic[T]):
+    """우선순위 키워드 규칙 매처. 빈 문자열 키워드는 무시한다."""
+
+    __slots__ = ("_patterns", "_values", "_rules", "_casefold", "_ac")
+
+    def __init__(
+        self,
+        rules: Iterable[str | tuple[str, T]],
+        *,
+        casefold: bool = False,
+        engine: str = "auto",
+    ) -> None:
+        patterns: list[str] = []
+        values: list[Any] = []
+        for rule in rules:
+            keyword, value = (rule, rule) if isinstance(rule, str) else rule
+            if not keyword:
+                continue
+            patterns.append(keyword.casefold() if casefold else keyword)
+            values.append(value)
+        self._patterns = tuple(patterns)
+        self._values = tuple(values)
+        self._rules = tuple(zip(self._patterns, self._values))
+        self._casefold = casefold
+        use_ac = engine == "ac" or (engine == "auto" and len(patterns) >= AC_MIN_PATTERNS)
+        self._ac = _AhoCorasick(self._patterns) if use_ac else None
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    @property
+    def engine(self) -> str:
+        return "ac" if self._ac is not None else "scan"
+
+    def _prep(self, text: str | None) -> str:
+        if not text:
+            return ""
+        return text.casefold() if self._casefold else text
+
+    def match_indices(self, text: str | None) -> list[int]:
+        """매칭된 규칙 인덱스 (우선순위 순, 중복 없음)."""
+        text = self._prep(text)
+        if self._ac is None:
+            return [i for i, p in enumerate(self._patterns) if p in text]
+        seen: set[int] = set()
+        for hits in self._ac.iter_hits(text):
+            seen.update(hits)
+        return sorted(seen)
+
+    def matches(self, text: str | None) -> list[tuple[str, T]]:
+        """매칭된 ``(키워드, 값)`` 전부 — 우선순위 순."""
+        return [(self._patterns[i], self._values[i]) for i in self.match_indices(text)]
+
+    def any(self, text: str | None) -> bool:
+        text = self._prep(text)
+        if self._ac is None:
+            return any(p in text for p in self._patterns)
+        for _ in self._ac.iter_hits(text):
+            return True
+        return False
+
+    def first(self, text: str | None, default: T | None = None) -> T | None:
+        """우선순위가 가장 높은 매칭 규칙의 값 (없으면 ``default``)."""
+        text = self._prep(text)
+        if self._ac is None:
+            for p, v in self._rules:
+                if p in text:
+                    return v
+            return default
+        best: int | None = None
+        for hits in self._ac.iter_hits(text):
+            if best is None or hits[0] < best:
+                best = hits[0]
+                if best == 0:
+                    break
+        return default if best is None else self._values[best]
+
+
+@lru_cache(maxsize=64)
+def matcher_for(keywords: tuple[str, ...], *, casefold: bool = False) -> KeywordMatcher[str]:
+    """설정값(게시판별 키워드 등)처럼 런타임에 정해지는 키워드 튜플용 캐시 매처."""
+    return KeywordMatcher(keywords, casefold=casefold)
+
+
+__all__ = ["AC_MIN_PATTERNS", "KeywordMatcher", "matcher_for"]
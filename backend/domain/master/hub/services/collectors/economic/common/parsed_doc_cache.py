@@ -0,0 +1,163 @@
+"""파싱된 첨부 문서 영속 캐시 (SQLite, 디스크) — 파일 내용 해시 기준.
+
+MSIT mId=63 예산 첨부와 MOEF PDF 는 수집·업로드 때마다 새로 내려받아 처음부터 다시 파싱한다
+(300쪽 예산서 PDF 한 건에 수십 초). 같은 바이트의 파일은 같은 파싱 결과를 내므로
+**파일 SHA-256 + 파서 버전** 을 키로 결과(``full_text`` 와 page_count 등 extras)를 보관해,
+동일 파일 재수집은 조회 한 번으로 끝낸다.
+
+  - key = ``(sha256, parser_version)`` — 파서 버전은 `_doc_parsers.PARSER_VERSIONS` (파서·엔진별).
+    파서 하나를 고치고 버전을 올리면 그 파서의 항목만 무효화된다.
+  - ``error`` 가 있는 결과(타임아웃·메모리 초과 포함)는 저장하지 않는다 — 다음 실행에서 재시도.
+  - ``file_name`` / ``file_size_bytes`` 는 조회 시점 파일 기준으로 덮어쓴다 (임시 파일명이 매번 다름).
+
+값은 zlib 압축 JSON, 파일은 ``BRONZE_CACHE_DIR/documents/parsed.sqlite3``.
+``DOC_PARSE_CACHE=0`` 이면 조회·저장하지 않는다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+from typing import Any
+
+from domain.master.hub.services.collectors.economic.common._cache_dir import cache_dir
+from domain.master.hub.services.collectors.economic.common._doc_parsers import parser_version
+
+logger = logging.getLogger(__name__)
+
+_DB_FILENAME = "parsed.sqlite3"
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS parsed (
+        sha256         TEXT NOT NULL,
+        parser_version TEXT NOT NULL,
+        body           BLOB NOT NULL,
+        parsed_at      TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (sha256, parser_version)
+    )
+"""
+
+# 파일마다 달라지는 값 — 저장하지 않고 조회 시 현재 파일로 채운다
+_FILE_KEYS = ("file_name", "file_size_bytes")
+
+CacheKey = tuple[str, str]
+
+
+def _pack(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+
+def _unpack(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+def file_sha256(path: Path | str) -> str:
+    """파일 전체 SHA-256 (1MB 단위 스트리밍)."""
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_enabled() -> bool:
+    return (os.getenv("DOC_PARSE_CACHE") or "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+class ParsedDocumentCache:
+    """(sha256, parser_version) → `parse_document` 결과. 블로킹 I/O — 비동기 호출부는 스레드로."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path or (cache_dir("documents") / _DB_FILENAME)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self._path, check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @staticmethod
+    def key_for(path: Path | str, sha256: str | None = None) -> CacheKey | None:
+        """파일의 캐시 키 (저장하며 해시를 이미 구했다면 ``sha256`` 로 재계산 생략).
+
+        미지원 포맷·읽기 실패면 None (캐시 우회).
+        """
+        version = parser_version(path)
+        if version is None:
+            return None
+        if sha256:
+            return sha256, version
+        try:
+            return file_sha256(path), version
+        except OSError:
+            return None
+
+    def get(self, key: CacheKey, path: Path | str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT body FROM parsed WHERE sha256 = ? AND parser_version = ?", key
+            ).fetchone()
+        if row is None:
+            return None
+        result: dict[str, Any] = _unpack(row[0])
+        path = Path(path)
+        result["file_name"] = path.name
+        try:
+            result["file_size_bytes"] = path.stat().st_size
+        except OSError:
+            pass
+        return result
+
+    def put(self, key: CacheKey, result: dict[str, Any]) -> bool:
+        """성공 결과만 저장. 저장했으면 True."""
+        if result.get("error"):
+            return False
+        body = _pack({k: v for k, v in result.items() if k not in _FILE_KEYS})
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO parsed (sha256, parser_version, body) VALUES (?, ?, ?)",
+                (*key, body),
+            )
+            conn.commit()
+        return True
+
+
+_DEFAULT_CACHE: ParsedDocumentCache | None = None
+_default_lock = threading.Lock()
+
+
+def get_parsed_doc_cache() -> ParsedDocumentCache | None:
+    """프로세스 공용 캐시 인스턴스 (기본 경로). ``DOC_PARSE_CACHE=0`` 이면 None."""
+    global _DEFAULT_CACHE
+    if not cache_enabled():
+        return None
+    with _default_lock:
+        if _DEFAULT_CACHE is None:
+            _DEFAULT_CACHE = ParsedDocumentCache()
+        return _DEFAULT_CACHE
+
+
+__all__ = [
+    "ParsedDocumentCache",
+    "file_sha256",
+    "get_parsed_doc_cache",
+]
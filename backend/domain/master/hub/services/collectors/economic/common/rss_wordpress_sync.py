@@ -7,7 +7,8 @@ import re
 from typing import Final
 
 import httpx
-from bs4 import BeautifulSoup
+
+from core.html_parse import select_text
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,13 @@ _DEFAULT_UA: Final[str] = (
     "Mozilla/5.0 (compatible; RoadmapBronze/1.0) "
     "AppleWebKit/537.36 (KHTML, like Gecko)"
 )
+_WP_CONTENT_SELECTORS: Final[tuple[str, ...]] = (
+    "article .entry-content",
+    "div.entry-content",
+    "article.post",
+    "main article",
+    "div.post-content",
+)
 
 
 def fetch_html_sync(url: str, *, timeout: float = 20.0, tag: str = "rss") -> str:
@@ -39,20 +47,13 @@ def wordpress_main_text(html: str, *, max_len: int = 12000) -> str:
     if not html:
         return ""
     try:
-        soup = BeautifulSoup(html, "html.parser")
-        for sel in (
-            "article .entry-content",
-            "div.entry-content",
-            "article.post",
-            "main article",
-            "div.post-content",
-        ):
-            node = soup.select_one(sel)
-            if node:
-                t = node.get_text(separator=" ", strip=True)
-                if len(t) > 80:
-                    return re.sub(r"\s+", " ", t).strip()[:max_len]
-        text = soup.get_text(separator=" ", strip=True)
+        text = select_text(
+            html,
+            _WP_CONTENT_SELECTORS,
+            separator=" ",
+            min_len=80,
+            fallback="document",
+        )
         return re.sub(r"\s+", " ", text).strip()[:max_len]
     except Exception:
         return ""
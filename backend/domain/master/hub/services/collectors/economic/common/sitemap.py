@@ -0,0 +1,380 @@
+"""XML 사이트맵 기반 변경 감지 — ``lastmod`` + 저장된 하이워터마크(high-water mark).
+
+RSS 는 최신 ~50건만 노출하므로 실행 사이에 밀려난 글은 아카이브 Backfill 없이는 잃는다.
+사이트맵은 사이트의 **모든** URL 과 ``lastmod`` 를 주므로, 직전 실행 때 본 가장 늦은
+``lastmod``(워터마크)보다 새로운 URL 만 골라 받으면 요청을 최소로 유지하면서 빠짐없이 모은다.
+
+  - ``robots.txt`` 의 ``Sitemap:`` 줄로 루트 사이트맵을 찾는다 (없으면 호출부 기본 경로).
+  - 사이트맵 인덱스의 자식 중 ``lastmod`` 가 워터마크 이하인 파일은 **받지 않는다**
+    — 증분 실행은 보통 인덱스 1회 + 자식 1~2개로 끝난다.
+  - ``.xml.gz`` (gzip 본문)도 읽는다. 파싱은 lxml (외부 엔티티·네트워크 해석 끔).
+  - 워터마크는 호출부가 **적재까지 끝낸 뒤** `SitemapWatermarkStore.advance` 로 올린다
+    — 도중에 죽으면 다음 실행이 같은 범위를 다시 본다.
+  - 조회에 실패한 URL 의 재시도 횟수는 `SitemapWatermarkStore.track_unresolved` 로 센다
+    — 호출부가 몇 번 뒤 포기하고 워터마크를 넘길 수 있게.
+
+워터마크 파일은 ``BRONZE_CACHE_DIR/crawl/sitemap_watermarks.sqlite3``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import logging
+import sqlite3
+import threading
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Final
+from urllib.parse import urljoin, urlsplit
+
+import httpx
+from lxml import etree
+
+from domain.master.hub.services.collectors.economic.common._cache_dir import cache_dir
+from domain.master.hub.services.collectors.economic.common.host_rate_budget import HostRateBudget
+
+logger = logging.getLogger(__name__)
+
+_KST = timezone(timedelta(hours=9))
+
+SITEMAP_TIMEOUT_SECONDS: Final = 30.0
+# 인덱스 → 자식 → (드물게) 손자. 잘못된 순환 참조 방지용 상한
+SITEMAP_MAX_FILES: Final = 200
+_DB_FILENAME: Final = "sitemap_watermarks.sqlite3"
+
+_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, recover=True, huge_tree=True)
+
+
+@dataclass(frozen=True)
+class SitemapUrl:
+    loc: str
+    lastmod: datetime | None
+
+
+@dataclass
+class SitemapScan:
+    """1회 스캔 결과. ``urls`` 는 ``lastmod`` 최신순."""
+
+    urls: list[SitemapUrl] = field(default_factory=list)
+    max_lastmod: datetime | None = None       # 이번 스캔에서 본 가장 늦은 lastmod (워터마크 후보)
+    sitemaps_fetched: int = 0
+    sitemaps_skipped: int = 0                 # 인덱스 lastmod 로 건너뛴 자식 사이트맵
+    sitemaps_failed: int = 0
+    urls_seen: int = 0
+    urls_without_lastmod: int = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "sitemaps_fetched": self.sitemaps_fetched,
+            "sitemaps_skipped": self.sitemaps_skipped,
+            "sitemaps_failed": self.sitemaps_failed,
+            "sitemap_urls_seen": self.urls_seen,
+            "sitemap_urls_changed": len(self.urls),
+            "sitemap_urls_without_lastmod": self.urls_without_lastmod,
+        }
+
+
+def parse_lastmod(raw: str | None) -> datetime | None:
+    """W3C Datetime (``2026-05-01`` / ``2026-05-01T12:00:00+09:00`` / ``...Z``) → aware datetime.
+
+    시간대가 없으면 KST 로 본다 (수집 대상이 국내 사이트).
+    """
+    text = (raw or "").strip()
+    if not text:
+        return None
+    try:
+        value = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return value if value.tzinfo else value.replace(tzinfo=_KST)
+
+
+def parse_sitemap(content: bytes) -> tuple[list[SitemapUrl], list[SitemapUrl]]:
+    """사이트맵 바이트 → (자식 사이트맵 목록, URL 목록). 인덱스면 앞쪽, urlset 이면 뒤쪽이 찬다."""
+    if content[:2] == b"\x1f\x8b":
+        content = gzip.decompress(content)
+    root = etree.fromstring(content, _PARSER)
+    if root is None:
+        return [], []
+    children: list[SitemapUrl] = []
+    urls: list[SitemapUrl] = []
+    # 네임스페이스(0.9 / 접두사 유무)와 무관하게 local-name 으로 읽는다
+    for node in root:
+        if not isinstance(node.tag, str):
+            continue
+        kind = etree.QName(node).localname
+        if kind not in ("sitemap", "url"):
+            continue
+        loc = lastmod = None
+        for child in node:
+            if not isinstance(child.tag, str):
+                continue
+            name = etree.QName(child).localname
+            if name == "loc":
+                loc = (child.text or "").strip()
+            elif name == "lastmod":
+                lastmod = child.text
+        if not loc:
+            continue
+        entry = SitemapUrl(loc=loc, lastmod=parse_lastmod(lastmod))
+        (children if kind == "sitemap" else urls).append(entry)
+    return children, urls
+
+
+async def _get_bytes(
+    client: httpx.AsyncClient, url: str, *, budget: HostRateBudget | None
+) -> bytes:
+    if budget is None:
+        resp = await client.get(url, timeout=SITEMAP_TIMEOUT_SECONDS)
+    else:
+        async with budget.slot(url):
+            resp = await client.get(url, timeout=SITEMAP_TIMEOUT_SECONDS)
+    resp.raise_for_status()
+    return resp.content
+
+
+async def discover_sitemaps(
+    client: httpx.AsyncClient,
+    base_url: str,
+    *,
+    fallback: Sequence[str] = ("/sitemap.xml",),
+    budget: HostRateBudget | None = None,
+) -> list[str]:
+    """``robots.txt`` 의 ``Sitemap:`` URL 목록. 없거나 못 읽으면 ``fallback`` 경로."""
+    parts = urlsplit(base_url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    found: list[str] = []
+    try:
+        text = (await _get_bytes(client, f"{origin}/robots.txt", budget=budget)).decode(
+            "utf-8", "replace"
+        )
+        for line in text.splitlines():
+            key, _, value = line.partition(":")
+            if key.strip().lower() == "sitemap" and value.strip():
+                url = urljoin(origin + "/", value.strip())
+                if url not in found:
+                    found.append(url)
+    except Exception as e:
+        logger.info("robots.txt 읽기 실패 origin=%s err=%s", origin, e.__class__.__name__)
+    return found or [urljoin(origin + "/", p) for p in fallback]
+
+
+async def scan_sitemaps(
+    client: httpx.AsyncClient,
+    roots: Sequence[str],
+    *,
+    since: datetime | None,
+    sitemap_filter: Callable[[str], bool] | None = None,
+    url_filter: Callable[[str], bool] | None = None,
+    budget: HostRateBudget | None = None,
+    max_files: int = SITEMAP_MAX_FILES,
+) -> SitemapScan:
+    """루트 사이트맵부터 내려가며 ``lastmod > since`` 인 URL 을 모은다.
+
+    ``since`` 가 None 이면 전 URL (``lastmod`` 없는 URL 포함). ``since`` 가 있으면 ``lastmod`` 없는
+    URL 은 새 글인지 알 수 없으므로 세기만 한다. ``sitemap_filter`` 는 인덱스의 자식 사이트맵 URL
+    (예: 글 사이트맵만), ``url_filter`` 는 최종 URL 에 적용한다. 같은 단계의 사이트맵은 동시에 받는다.
+
+    ``sitemaps_failed`` 가 0 이 아니면 못 본 URL 이 있을 수 있다 — 호출부는 워터마크를 올리지 않는다.
+    """
+    scan = SitemapScan()
+    seen_files: set[str] = set()
+    seen_urls: set[str] = set()
+    level = list(dict.fromkeys(roots))
+
+    while level and len(seen_files) < max_files:
+        level = level[: max_files - len(seen_files)]
+        seen_files.update(level)
+        results = await asyncio.gather(
+            *(_get_bytes(client, u, budget=budget) for u in level), return_exceptions=True
+        )
+        next_level: list[str] = []
+        for url, content in zip(level, results):
+            if isinstance(content, BaseException):
+                scan.sitemaps_failed += 1
+                logger.warning("sitemap GET 실패 url=%s err=%r", url, content)
+                continue
+            scan.sitemaps_fetched += 1
+            try:
+                children, urls = await asyncio.to_thread(parse_sitemap, content)
+            except Exception:
+                scan.sitemaps_failed += 1
+                logger.exception("sitemap 파싱 실패 url=%s", url)
+                continue
+            for child in children:
+                if child.loc in seen_files or (sitemap_filter and not sitemap_filter(child.loc)):
+                    continue
+                if since is not None and child.lastmod is not None and child.lastmod <= since:
+                    scan.sitemaps_skipped += 1
+                    continue
+                next_level.append(child.loc)
+            for entry in urls:
+                if entry.loc in seen_urls or (url_filter and not url_filter(entry.loc)):
+                    continue
+                seen_urls.add(entry.loc)
+                scan.urls_seen += 1
+                if entry.lastmod is None:
+                    scan.urls_without_lastmod += 1
+                    if since is not None:
+                        continue
+                elif since is not None and entry.lastmod <= since:
+                    continue
+                if entry.lastmod is not None and (
+                    scan.max_lastmod is None or entry.lastmod > scan.max_lastmod
+                ):
+                    scan.max_lastmod = entry.lastmod
+                scan.urls.append(entry)
+        level = list(dict.fromkeys(next_level))
+
+    oldest = datetime.min.replace(tzinfo=timezone.utc)
+    scan.urls.sort(key=lambda e: e.lastmod or oldest, reverse=True)
+    return scan
+
+
+class SitemapWatermarkStore:
+    """``(scope, key) → 마지막으로 처리한 lastmod`` + 미해결 URL 재시도 횟수.
+
+    블로킹 I/O (SQLite 커밋) — 비동기 호출부는 ``asyncio.to_thread`` 로 부른다 (스레드 안전).
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path or (cache_dir("crawl") / _DB_FILENAME)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self._path, check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS watermarks (
+                    scope      TEXT NOT NULL,
+                    key        TEXT NOT NULL,
+                    lastmod    TEXT NOT NULL,
+                    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (scope, key)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS unresolved_urls (
+                    scope      TEXT NOT NULL,
+                    key        TEXT NOT NULL,
+                    url        TEXT NOT NULL,
+                    attempts   INTEGER NOT NULL DEFAULT 0,
+                    updated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (scope, key, url)
+                )
+                """
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get(self, scope: str, key: str) -> datetime | None:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT lastmod FROM watermarks WHERE scope = ? AND key = ?", (scope, key)
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def advance(self, scope: str, key: str, lastmod: datetime) -> datetime:
+        """워터마크를 ``lastmod`` 로 올린다 (뒤로 가지 않음). 저장된 값 반환."""
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT lastmod FROM watermarks WHERE scope = ? AND key = ?", (scope, key)
+            ).fetchone()
+            if row is not None and datetime.fromisoformat(row[0]) >= lastmod:
+                return datetime.fromisoformat(row[0])
+            conn.execute(
+                "INSERT OR REPLACE INTO watermarks (scope, key, lastmod, updated_at) "
+                "VALUES (?, ?, ?, CURRENT_TIMESTAMP)",
+                (scope, key, lastmod.isoformat()),
+            )
+            conn.commit()
+            return lastmod
+
+    def track_unresolved(
+        self,
+        scope: str,
+        key: str,
+        unresolved: Sequence[str],
+        resolved: Sequence[str] = (),
+    ) -> dict[str, int]:
+        """이번 실행에서 못 찾은 URL 의 누적 시도 횟수를 1 올려 반환. ``resolved`` 는 목록에서 뺀다."""
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "DELETE FROM unresolved_urls WHERE scope = ? AND key = ? AND url = ?",
+                [(scope, key, url) for url in resolved],
+            )
+            conn.executemany(
+                "INSERT INTO unresolved_urls (scope, key, url, attempts) VALUES (?, ?, ?, 1) "
+                "ON CONFLICT (scope, key, url) DO UPDATE SET attempts = attempts + 1, "
+                "updated_at = CURRENT_TIMESTAMP",
+                [(scope, key, url) for url in unresolved],
+            )
+            attempts: dict[str, int] = {}
+            for url in unresolved:
+                row = conn.execute(
+                    "SELECT attempts FROM unresolved_urls WHERE scope = ? AND key = ? AND url = ?",
+                    (scope, key, url),
+                ).fetchone()
+                attempts[url] = int(row[0]) if row else 0
+            conn.commit()
+            return attempts
+
+    def clear(self, scope: str, key: str | None = None) -> int:
+        """워터마크·미해결 URL 삭제 (``key`` 없으면 scope 전체) — 다음 실행은 초기 lookback 부터.
+        지운 워터마크 행 수."""
+        with self._lock:
+            conn = self._connect()
+            if key is None:
+                conn.execute("DELETE FROM unresolved_urls WHERE scope = ?", (scope,))
+                cur = conn.execute("DELETE FROM watermarks WHERE scope = ?", (scope,))
+            else:
+                conn.execute(
+                    "DELETE FROM unresolved_urls WHERE scope = ? AND key = ?", (scope, key)
+                )
+                cur = conn.execute(
+                    "DELETE FROM watermarks WHERE scope = ? AND key = ?", (scope, key)
+                )
+            conn.commit()
+            return cur.rowcount
+
+
+_DEFAULT_STORE: SitemapWatermarkStore | None = None
+_default_lock = threading.Lock()
+
+
+def get_sitemap_watermarks() -> SitemapWatermarkStore:
+    """프로세스 공용 워터마크 저장소 (기본 경로)."""
+    global _DEFAULT_STORE
+    with _default_lock:
+        if _DEFAULT_STORE is None:
+            _DEFAULT_STORE = SitemapWatermarkStore()
+        return _DEFAULT_STORE
+
+
+__all__ = [
+    "SitemapScan",
+    "SitemapUrl",
+    "SitemapWatermarkStore",
+    "discover_sitemaps",
+    "get_sitemap_watermarks",
+    "parse_lastmod",
+    "parse_sitemap",
+    "scan_sitemaps",
+]
@@ -0,0 +1,376 @@
+"""WordPress RSS 공통 비동기 수집 엔진 — Wowtale · Platum · Venturesquare · StartupRecipe.
+
+네 사이트 컬렉터가 거의 같은 코드를 복붙해 쓰면서 ``feedparser.parse(URL)`` 을 스레드에서 동기로 돌리고,
+본문이 짧은 항목은 ``fetch_html_sync`` 로 **기사마다 새 httpx.Client** 를 만들어 순차 GET 했다
+(50건이면 TLS 핸드셰이크 50번이 직렬). 사이트 고유 값(피드 URL·키워드·분류 규칙·길이 기준)은
+``WordPressFeedSite`` 설정으로 빼고, 엔진은 가져오기·파싱·동시성만 책임진다.
+
+  - 피드는 공유 ``httpx.AsyncClient`` 로 바이트를 받아 ``feedparser.parse(bytes)`` 로 파싱
+    (feedparser 의 내장 urllib 다운로드를 쓰지 않는다 — 타임아웃·재시도·커넥션 재사용 통일).
+  - permalink 본문 보완은 사이트별 ``permalink_concurrency`` 개까지 동시에 같은 클라이언트로 받는다.
+  - `collect_sites` 는 여러 사이트를 동시에 수집 — 전체 소요 ≈ 가장 느린 사이트 1개.
+  - 결과 DTO 는 피드 순서를 유지한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import re
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import feedparser
+import httpx
+
+from core.html_parse import html_text
+from domain.master.hub.services.collectors.economic.common.financial_entities import (
+    FinancialEntities,
+    extract_many,
+    title_first_token,
+)
+from domain.master.hub.services.collectors.economic.common.keyword_matcher import KeywordMatcher
+from domain.master.hub.services.collectors.economic.common.rss_wordpress_sync import (
+    wordpress_main_text,
+)
+from domain.master.models.transfer.economic_collect_dto import EconomicCollectDto
+
+logger = logging.getLogger(__name__)
+
+_KST = timezone(timedelta(hours=9))
+
+DEFAULT_HEADERS: dict[str, str] = {
+    "User-Agent": (
+        "Mozilla/5.0 (compatible; RoadmapBronze/1.0) "
+        "AppleWebKit/537.36 (KHTML, like Gecko)"
+    ),
+    "Accept-Language": "ko-KR,ko;q=0.9",
+}
+FEED_TIMEOUT_SECONDS = 20.0
+PERMALINK_TIMEOUT_SECONDS = 20.0
+PERMALINK_CONCURRENCY = 4
+_FEED_RETRIES = 2
+_FEED_BACKOFF_BASE = 0.6
+# 제목+태그로 걸러지지 않은 글을 본문으로 재검사할 때 보는 앞부분 길이
+_BODY_FILTER_CHARS = 2000
+
+
+@dataclass(frozen=True)
+class WordPressFeedSite:
+    """사이트별 설정. 컬렉터 모듈이 import 시 1개 만들어 둔다."""
+
+    key: str                                   # 결과·로그 키 ("wowtale")
+    label: str                                 # 로그 표기 ("Wowtale")
+    rss_url: str
+    relevance: KeywordMatcher[str]             # 투자/자본 노이즈 필터
+    classifier: KeywordMatcher[str]            # 제목+태그 → source_type
+    default_source_type: str
+    feed_text_max_len: int = 8000
+    # 피드 본문이 이보다 짧으면 permalink GET 으로 보완. None 이면 보완하지 않음
+    min_chars_page_fetch: int | None = 280
+    permalink_text_max_len: int = 12000
+    # 제목+태그 미매칭 시 본문 앞부분으로 한 번 더 검사 (태그 시그널이 없는 사이트)
+    filter_on_body: bool = False
+    extract_amount: bool = True
+    # 묶음(digest) 글 판별 — 매칭되면 필터 없이 통과, ``digest_source_type`` 으로 적재
+    digest_title: re.Pattern[str] | None = None
+    digest_source_type: str | None = None
+    investor_name: Callable[[str], str | None] = title_first_token
+    permalink_concurrency: int = PERMALINK_CONCURRENCY
+
+
+def make_wordpress_client(**kwargs: Any) -> httpx.AsyncClient:
+    """피드·permalink 공용 클라이언트 — 사이트 여러 개를 동시에 돌려도 호스트별 커넥션을 재사용."""
+    kw: dict[str, Any] = {
+        "headers": dict(DEFAULT_HEADERS),
+        "follow_redirects": True,
+        "timeout": httpx.Timeout(FEED_TIMEOUT_SECONDS),
+        "limits": httpx.Limits(max_connections=32, max_keepalive_connections=16),
+    }
+    kw.update(kwargs)
+    return httpx.AsyncClient(**kw)
+
+
+async def fetch_feed(client: httpx.AsyncClient, site: WordPressFeedSite) -> Any:
+    """피드 바이트 GET(네트워크 오류만 재시도) → ``feedparser.parse(bytes)`` (스레드)."""
+    attempt = 0
+    while True:
+        try:
+            resp = await client.get(site.rss_url, timeout=FEED_TIMEOUT_SECONDS)
+            resp.raise_for_status()
+            break
+        except (httpx.ConnectError, httpx.ReadError, httpx.WriteError, httpx.TimeoutException) as e:
+            if attempt >= _FEED_RETRIES:
+                raise
+            wait = _FEED_BACKOFF_BASE * (2**attempt)
+            attempt += 1
+            logger.warning(
+                "%s RSS GET 재시도 attempt=%s/%s wait=%.2fs err=%s",
+                site.label,
+                attempt,
+                _FEED_RETRIES,
+                wait,
+                e.__class__.__name__,
+            )
+            await asyncio.sleep(wait)
+
+    feed = await asyncio.to_thread(feedparser.parse, resp.content)
+    if feed.bozo:
+        logger.warning("%s RSS 파싱 경고: %s", site.label, feed.bozo_exception)
+    return feed
+
+
+async def fetch_permalink_html(
+    client: httpx.AsyncClient, url: str, *, tag: str = "rss"
+) -> str:
+    """기사 permalink HTML. 실패는 빈 문자열 (피드 본문으로 진행)."""
+    try:
+        resp = await client.get(url, timeout=PERMALINK_TIMEOUT_SECONDS)
+        resp.raise_for_status()
+        return resp.text
+    except Exception:
+        logger.warning("[%s] article fetch failed url=%s", tag, url, exc_info=False)
+        return ""
+
+
+def parse_published_at(entry: Any, *, label: str = "RSS") -> datetime | None:
+    """RSS pubDate → KST datetime.
+
+    우선순위:
+      1) `published_parsed` (UTC struct_time) → KST 변환 (가장 안전)
+      2) `published` (RFC 2822 문자열) → parsedate_to_datetime
+    """
+    parsed = entry.get("published_parsed")
+    if parsed:
+        try:
+            ts = time.mktime(parsed)
+            return datetime.fromtimestamp(ts, tz=timezone.utc).astimezone(_KST)
+        except (ValueError, TypeError, OverflowError):
+            logger.warning("%s published_parsed 변환 실패: %s", label, parsed)
+
+    pub_str = entry.get("published", "")
+    if pub_str:
+        try:
+            dt = parsedate_to_datetime(pub_str)
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            return dt.astimezone(_KST)
+        except (ValueError, TypeError, OverflowError):
+            logger.warning("%s published 문자열 파싱 실패: %s", label, pub_str)
+
+    return None
+
+
+def entry_html_content(entry: Any) -> str:
+    """기사 전문(`content:encoded`)을 우선, 없으면 요약본을 사용."""
+    content_list = entry.get("content") or []
+    if content_list:
+        try:
+            first = content_list[0]
+            value = first.get("value") if isinstance(first, dict) else getattr(first, "value", "")
+            if value:
+                return str(value)
+        except (AttributeError, IndexError, TypeError):
+            pass
+    return entry.get("summary", "") or ""
+
+
+def html_to_text(html: str, *, max_len: int = 8000) -> str:
+    if not html:
+        return ""
+    try:
+        text = html_text(html, separator=" ", strip=True)
+    except Exception:
+        text = html
+    text = re.sub(r"\s+", " ", text).strip()
+    return text[:max_len]
+
+
+@dataclass
+class _Candidate:
+    entry: Any
+    title: str
+    link: str
+    tags: list[str]
+    full_text: str
+    content_source: str
+    is_digest: bool
+
+
+def _select_entries(
+    site: WordPressFeedSite, entries: Sequence[Any], max_items: int
+) -> tuple[list[_Candidate], int]:
+    """노이즈 필터 통과 항목 + 스킵 건수 (피드 순서 유지)."""
+    kept: list[_Candidate] = []
+    skipped = 0
+    for entry in entries[:max_items]:
+        title = (entry.get("title") or "").strip()
+        link = (entry.get("link") or "").strip()
+        if not title or not link:
+            continue
+
+        tags = [t.term for t in entry.get("tags", []) if getattr(t, "term", None)]
+        is_digest = bool(site.digest_title and site.digest_title.search(title))
+        full_text: str | None = None
+
+        if not is_digest and not site.relevance.any(title + " " + " ".join(tags)):
+            if not site.filter_on_body:
+                skipped += 1
+                continue
+            full_text = html_to_text(entry_html_content(entry), max_len=site.feed_text_max_len)
+            if not site.relevance.any(full_text[:_BODY_FILTER_CHARS]):
+                skipped += 1
+                continue
+
+        if full_text is None:
+            full_text = html_to_text(entry_html_content(entry), max_len=site.feed_text_max_len)
+        kept.append(
+            _Candidate(
+                entry=entry,
+                title=title,
+                link=link,
+                tags=tags,
+                full_text=full_text,
+                content_source="content_encoded" if entry.get("content") else "summary",
+                is_digest=is_digest,
+            )
+        )
+    return kept, skipped
+
+
+async def _fill_short_bodies(
+    client: httpx.AsyncClient, site: WordPressFeedSite, candidates: list[_Candidate]
+) -> None:
+    """피드 본문이 짧은 항목만 permalink 본문으로 교체 (사이트별 동시성 상한)."""
+    threshold = site.min_chars_page_fetch
+    if threshold is None:
+        return
+    short = [c for c in candidates if len(c.full_text) < threshold]
+    if not short:
+        return
+    sem = asyncio.Semaphore(max(1, site.permalink_concurrency))
+
+    async def fill(c: _Candidate) -> None:
+        async with sem:
+            page_html = await fetch_permalink_html(client, c.link, tag=site.key)
+        page_text = wordpress_main_text(page_html) if page_html else ""
+        if len(page_text) > len(c.full_text):
+            c.full_text = page_text[: site.permalink_text_max_len]
+            c.content_source = "permalink_html"
+
+    await asyncio.gather(*(fill(c) for c in short))
+
+
+def _to_dto(
+    site: WordPressFeedSite, c: _Candidate, entities: FinancialEntities
+) -> EconomicCollectDto:
+    if c.is_digest and site.digest_source_type:
+        source_type = site.digest_source_type
+    else:
+        source_type = site.classifier.first(
+            c.title + " " + " ".join(c.tags), site.default_source_type
+        )
+    investment_amount = entities.amount_krw if site.extract_amount else None
+    # 묶음글은 제목 첫 토큰이 회사명이 아닐 확률이 높으므로 investor_name 추출을 생략한다.
+    investor_name = None if c.is_digest else site.investor_name(c.title)
+
+    raw_metadata: dict[str, object] = {}
+    if guid := c.entry.get("id", ""):
+        raw_metadata["guid"] = guid
+    if c.tags:
+        raw_metadata["tags"] = c.tags
+    if c.is_digest:
+        raw_metadata["is_digest"] = True
+    if c.full_text:
+        raw_metadata["content_text"] = c.full_text
+        raw_metadata["content_source"] = c.content_source
+    elif summary := c.entry.get("summary", ""):
+        raw_metadata["summary"] = summary[:2000]
+    if investment_amount is not None:
+        raw_metadata["investment_amount_krw_extracted"] = investment_amount
+        raw_metadata["investment_amount_extraction"] = "regex_korean_units"
+    if not c.is_digest:
+        raw_metadata.update(entities.metadata())
+
+    return EconomicCollectDto(
+        source_type=source_type,
+        source_url=c.link,
+        raw_title=c.title[:500],
+        investor_name=investor_name,
+        target_company_or_fund=None,
+        investment_amount=investment_amount,
+        raw_metadata=raw_metadata or None,
+        published_at=parse_published_at(c.entry, label=site.label),
+    )
+
+
+async def collect_site(
+    client: httpx.AsyncClient,
+    site: WordPressFeedSite,
+    *,
+    max_items: int = 50,
+    fetch_article_if_short: bool = True,
+) -> tuple[list[EconomicCollectDto], int]:
+    """사이트 1개 수집 → (DTO 리스트, 노이즈 필터로 스킵된 건수). 피드 GET 실패는 예외 전파."""
+    try:
+        feed = await fetch_feed(client, site)
+    except Exception:
+        logger.exception("%s RSS 수집 실패", site.label)
+        raise
+
+    candidates, skipped = _select_entries(site, feed.entries, max_items)
+    if fetch_article_if_short:
+        await _fill_short_bodies(client, site, candidates)
+    # 제목+본문 엔티티 추출은 후보 전체를 한 번에 스캔
+    entities = extract_many([(c.title, c.full_text) for c in candidates])
+    out = [_to_dto(site, c, e) for c, e in zip(candidates, entities)]
+
+    logger.info("%s RSS 수집 완료: %s건 (노이즈 스킵 %s건)", site.label, len(out), skipped)
+    return out, skipped
+
+
+async def collect_sites(
+    sites: Sequence[WordPressFeedSite],
+    *,
+    max_items: int = 50,
+    fetch_article_if_short: bool = True,
+    client: httpx.AsyncClient | None = None,
+) -> dict[str, tuple[list[EconomicCollectDto], int] | BaseException]:
+    """여러 사이트 동시 수집. 사이트 키 → 결과 또는 예외 (한 사이트 실패가 나머지를 막지 않음)."""
+
+    async def run(c: httpx.AsyncClient) -> dict[str, tuple[list[EconomicCollectDto], int] | BaseException]:
+        results = await asyncio.gather(
+            *(
+                collect_site(
+                    c,
+                    site,
+                    max_items=max_items,
+                    fetch_article_if_short=fetch_article_if_short,
+                )
+                for site in sites
+            ),
+            return_exceptions=True,
+        )
+        return {site.key: res for site, res in zip(sites, results)}
+
+    if client is not None:
+        return await run(client)
+    async with make_wordpress_client() as own:
+        return await run(own)
+
+
+__all__ = [
+    "WordPressFeedSite",
+    "collect_site",
+    "collect_sites",
+    "entry_html_content",
+    "fetch_feed",
+    "fetch_permalink_html",
+    "html_to_text",
+    "make_wordpress_client",
+    "parse_published_at",
+]
@@ -0,0 +1,235 @@
+"""DART 재무정보 일괄다운로드 파일 → R&D·CAPEX 로컬 스토어.
+
+`fnlttSinglAcntAll` 을 법인마다 1회씩 호출(상한 200건)하던 재무 보강을, 금감원이 분기마다
+공개하는 **재무정보 일괄다운로드** 파일(상장사 전체 BS/PL/CF, 탭 구분 텍스트)로 대체한다.
+
+  - 원본: https://opendart.fss.or.kr/disclosureinfo/fnltt/dwld/main.do
+    (예: ``2024_4Q_PL_*.zip`` / ``2024_4Q_CF_*.zip`` — ZIP 안에 cp949 TSV)
+  - 한 번의 벡터화 패스로 전체 상장사의 R&D(IS/CIS)·CAPEX(CF) 를 추출
+  - 결과만 ``BRONZE_CACHE_DIR/dart/bulk_financials.csv.gz`` 에 보관
+    (컬럼: stock_code, bsns_year, reprt_code, rnd, capex)
+
+다중회사 API(`fnlttMultiAcnt`)는 주요계정(자산·매출 등)만 내려주고 연구개발비·유형자산취득
+계정이 없어 본 용도에 쓰지 않는다.
+
+적재: ``python scripts/dart_bulk_financials_ingest.py <zip|txt|디렉터리> ...``
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import os
+import re
+import zipfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+import pandas as pd
+
+from domain.master.hub.services.collectors.economic.common._cache_dir import cache_dir
+
+logger = logging.getLogger(__name__)
+
+_STORE_FILENAME = "bulk_financials.csv.gz"
+_ENCODINGS = ("cp949", "utf-8-sig")
+
+# R&D 추출 키워드 (IS/CIS: 손익계산서)
+RND_KEYWORDS: tuple[str, ...] = ("연구개발", "연구비", "개발비")
+# CAPEX 추출 키워드 (CF: 현금흐름표)
+CAPEX_KEYWORDS: tuple[str, ...] = ("유형자산취득", "유형자산의취득", "설비투자")
+
+# 일괄다운로드 `보고서종류` → reprt_code
+_REPORT_KIND_CODE: dict[str, str] = {
+    "사업보고서": "11011",
+    "반기보고서": "11012",
+    "1분기보고서": "11013",
+    "3분기보고서": "11014",
+}
+
+_STORE_COLUMNS = ["stock_code", "bsns_year", "reprt_code", "rnd", "capex"]
+
+StoreKey = tuple[str, str, str]
+
+# 프로세스 내 메모 — (스토어 경로) → (mtime, key → (rnd, capex))
+_LOADED: dict[Path, tuple[float, dict[StoreKey, tuple[int | None, int | None]]]] = {}
+
+
+def store_path() -> Path:
+    return cache_dir("dart") / _STORE_FILENAME
+
+
+# ---------------------------------------------------------------------------
+# 원본 파일 읽기
+# ---------------------------------------------------------------------------
+
+
+def _read_tsv(raw: bytes) -> pd.DataFrame:
+    for enc in _ENCODINGS:
+        try:
+            text = raw.decode(enc)
+            break
+        except UnicodeDecodeError:
+            continue
+    else:
+        raise ValueError("재무정보 일괄 파일 인코딩 판별 실패")
+    return pd.read_csv(io.StringIO(text), sep="\t", dtype=str, keep_default_na=False, on_bad_lines="skip")
+
+
+def _iter_raw_files(paths: Iterable[Path]) -> Iterator[tuple[str, bytes]]:
+    for path in paths:
+        if path.is_dir():
+            yield from _iter_raw_files(sorted(p for p in path.iterdir() if p.suffix.lower() in (".zip", ".txt")))
+        elif path.suffix.lower() == ".zip":
+            with zipfile.ZipFile(path) as zf:
+                for name in zf.namelist():
+                    if name.lower().endswith(".txt"):
+                        yield f"{path.name}:{name}", zf.read(name)
+        elif path.suffix.lower() == ".txt":
+            yield path.name, path.read_bytes()
+
+
+def _current_amount_column(columns: Iterable[str]) -> str | None:
+    """당기 금액 컬럼 — 분·반기 파일은 ``당기 반기 누적`` 처럼 누적 컬럼을 우선한다."""
+    current = [c for c in columns if c.strip().startswith("당기")]
+    if not current:
+        return None
+    return next((c for c in current if "누적" in c), current[0])
+
+
+def _normalize_frame(df: pd.DataFrame) -> pd.DataFrame | None:
+    """원본 TSV → [stock_code, bsns_year, reprt_code, sj_div, account_nm, amount] (별도재무제표만)."""
+    df.columns = [str(c).strip() for c in df.columns]
+    required = {"재무제표종류", "종목코드", "결산기준일", "보고서종류", "항목명"}
+    amount_col = _current_amount_column(df.columns)
+    if not required.issubset(df.columns) or amount_col is None:
+        return None
+
+    kind = df["재무제표종류"]
+    sj_div = pd.Series(pd.NA, index=df.index, dtype="object")
+    sj_div[kind.str.contains("현금흐름표", regex=False)] = "CF"
+    sj_div[kind.str.contains("손익계산서", regex=False)] = "IS"
+    # fnlttSinglAcntAll(fs_div=OFS) 경로와 같게 별도재무제표만 사용
+    mask = sj_div.notna() & ~kind.str.contains("연결", regex=False)
+    if not mask.any():
+        return None
+
+    df = df.loc[mask]
+    return pd.DataFrame(
+        {
+            "stock_code": df["종목코드"].str.strip("[] "),
+            "bsns_year": df["결산기준일"].str.slice(0, 4),
+            "reprt_code": df["보고서종류"].str.strip().map(_REPORT_KIND_CODE),
+            "sj_div": sj_div[mask],
+            "account_nm": df["항목명"].str.replace(r"\s+", "", regex=True),
+            "amount": pd.to_numeric(df[amount_col].str.replace(",", "", regex=False), errors="coerce").abs(),
+        }
+    ).dropna(subset=["reprt_code", "amount"])
+
+
+def _keyword_sum(frame: pd.DataFrame, keywords: tuple[str, ...], name: str) -> pd.Series:
+    pattern = "|".join(re.escape(k) for k in keywords)
+    hit = frame.loc[frame["account_nm"].str.contains(pattern, regex=True) & (frame["amount"] > 0)]
+    return hit.groupby(["stock_code", "bsns_year", "reprt_code"])["amount"].sum().rename(name)
+
+
+def extract_rnd_capex(frames: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """정규화 프레임들 → 키별 R&D(IS) · CAPEX(CF) 합계 (한 번의 groupby)."""
+    frames = [f for f in frames if f is not None and not f.empty]
+    if not frames:
+        return pd.DataFrame(columns=_STORE_COLUMNS)
+    allf = pd.concat(frames, ignore_index=True)
+    rnd = _keyword_sum(allf.loc[allf["sj_div"] == "IS"], RND_KEYWORDS, "rnd")
+    capex = _keyword_sum(allf.loc[allf["sj_div"] == "CF"], CAPEX_KEYWORDS, "capex")
+    out = pd.concat([rnd, capex], axis=1).reset_index()
+    for col in ("rnd", "capex"):
+        out[col] = out[col].round().astype("Int64")
+    return out[_STORE_COLUMNS]
+
+
+def build_store(paths: Iterable[Path], *, out: Path | None = None, merge: bool = True) -> pd.DataFrame:
+    """일괄 파일들 → 추출 결과를 스토어에 저장 (기존 스토어와 키 기준 병합, 신규 우선)."""
+    frames: list[pd.DataFrame] = []
+    for label, raw in _iter_raw_files(Path(p) for p in paths):
+        try:
+            frame = _normalize_frame(_read_tsv(raw))
+        except (ValueError, pd.errors.ParserError) as e:
+            logger.warning("재무정보 일괄 파일 파싱 실패 %s: %s", label, e)
+            continue
+        if frame is None:
+            logger.info("재무정보 일괄 파일 스킵(대상 재무제표 아님) %s", label)
+            continue
+        logger.info("재무정보 일괄 파일 %s: %s 행", label, len(frame))
+        frames.append(frame)
+
+    extracted = extract_rnd_capex(frames)
+    target = out or store_path()
+    if merge and target.exists():
+        existing = read_store(target)
+        extracted = (
+            pd.concat([existing, extracted], ignore_index=True)
+            .drop_duplicates(subset=["stock_code", "bsns_year", "reprt_code"], keep="last")
+            .reset_index(drop=True)
+        )
+
+    tmp = target.with_name(target.name + ".tmp")
+    extracted.to_csv(tmp, index=False, compression="gzip")
+    os.replace(tmp, target)
+    logger.info("재무정보 일괄 스토어 저장: %s 키 → %s", len(extracted), target)
+    return extracted
+
+
+def read_store(path: Path | None = None) -> pd.DataFrame:
+    df = pd.read_csv(
+        path or store_path(),
+        dtype={"stock_code": str, "bsns_year": str, "reprt_code": str},
+        compression="gzip",
+    )
+    for col in ("rnd", "capex"):
+        df[col] = df[col].astype("Int64")
+    return df[_STORE_COLUMNS]
+
+
+class DartBulkFinancials:
+    """(stock_code, bsns_year, reprt_code) → {rnd, capex}. 스토어가 없으면 빈 인덱스."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path or store_path()
+        self._by_key: dict[StoreKey, tuple[int | None, int | None]] = {}
+
+    def load(self) -> "DartBulkFinancials":
+        try:
+            mtime = self._path.stat().st_mtime
+        except FileNotFoundError:
+            return self
+        cached = _LOADED.get(self._path)
+        if cached is None or cached[0] != mtime:
+            df = read_store(self._path)
+            index = {
+                (s, y, r): (None if pd.isna(rnd) else int(rnd), None if pd.isna(capex) else int(capex))
+                for s, y, r, rnd, capex in df.itertuples(index=False, name=None)
+            }
+            cached = (mtime, index)
+            _LOADED[self._path] = cached
+        self._by_key = cached[1]
+        return self
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def lookup(self, stock_code: str, bsns_year: str, reprt_code: str) -> dict[str, int | None] | None:
+        entry = self._by_key.get((stock_code, bsns_year, reprt_code))
+        if entry is None:
+            return None
+        return {"rnd": entry[0], "capex": entry[1]}
+
+
+__all__ = [
+    "CAPEX_KEYWORDS",
+    "RND_KEYWORDS",
+    "DartBulkFinancials",
+    "build_store",
+    "extract_rnd_capex",
+    "read_store",
+    "store_path",
+]
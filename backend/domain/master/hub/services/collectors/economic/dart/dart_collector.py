@@ -1,4 +1,4 @@
-"""DART Open API 기반 경제 Bronze 수집 — `dart-fss` (동기) + 스레드 오프로딩.
+"""DART Open API 기반 경제 Bronze 수집 — 네이티브 async `list.json` 클라이언트.
 
 공시 카테고리(`pblntf_ty`):
   - A: 정기공시
@@ -15,6 +15,10 @@ Phase 1 고도화 (2026-05-11):
 
 2026-05-12:
   - `pblntf_ty=D` 지분공시 병행 수집 (대량보유·의결권 대량보유 중심, 제목 키워드 필터)
+
+목록 조회:
+  - `dart_fss.search` (동기 + 프로세스마다 corpCode ZIP 파싱) → `DartListClient` (async, 페이지·유형 병렬)
+  - corp-code 마스터는 `DartCorpCodeMaster` 디스크 인덱스(일 1회 갱신)로 로드
 """
 
 from __future__ import annotations
@@ -25,9 +29,13 @@ from collections.abc import Callable, Sequence
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-import dart_fss as dart
 import httpx
 
+from core.api_quota import httpx_quota_hook
+from domain.master.hub.services.collectors.economic.common.keyword_matcher import KeywordMatcher
+from domain.master.hub.services.collectors.economic.dart.dart_corp_code_master import (
+    DartCorpCodeMaster,
+)
 from domain.master.hub.services.collectors.economic.dart.dart_detail_fetcher import (
     DartDetailRoute,
     extract_amount,
@@ -35,6 +43,13 @@ from domain.master.hub.services.collectors.economic.dart.dart_detail_fetcher imp
     fetch_detail,
     route_for_title,
 )
+from domain.master.hub.services.collectors.economic.dart.dart_list_client import (
+    DartListClient,
+)
+from domain.master.hub.services.collectors.economic.dart.dart_response_cache import (
+    DartResponseCache,
+    get_response_cache,
+)
 from domain.master.models.transfer.economic_collect_dto import EconomicCollectDto
 
 logger = logging.getLogger(__name__)
@@ -113,12 +128,13 @@ _CLASSIFICATION_RULES: tuple[tuple[str, str], ...] = (
 )
 
 
+_REPORT_MATCHER: KeywordMatcher[str] = KeywordMatcher(_REPORT_KEYWORDS)
+_CLASSIFIER: KeywordMatcher[str] = KeywordMatcher(_CLASSIFICATION_RULES)
+
+
 def _classify_source_type(title: str) -> str:
     """공시 제목 기반 source_type 자동 분류."""
-    for keyword, stype in _CLASSIFICATION_RULES:
-        if keyword in title:
-            return stype
-    return "DART_MAJOR_SECURITIES_ACQUISITION"
+    return _CLASSIFIER.first(title, "DART_MAJOR_SECURITIES_ACQUISITION")
 
 
 # 지분공시(D): 자본 흐름의 역방향·포지션 변화 (기관/대주주)
@@ -141,12 +157,13 @@ _OWNERSHIP_CLASSIFICATION_RULES: tuple[tuple[str, str], ...] = (
 _DEFAULT_OWNERSHIP_SOURCE_TYPE = "DART_OWNERSHIP_DISCLOSURE"
 
 
+_D_REPORT_MATCHER: KeywordMatcher[str] = KeywordMatcher(_D_REPORT_KEYWORDS)
+_OWNERSHIP_CLASSIFIER: KeywordMatcher[str] = KeywordMatcher(_OWNERSHIP_CLASSIFICATION_RULES)
+
+
 def _classify_source_type_ownership(title: str) -> str:
     """지분공시(D) 제목 기반 source_type."""
-    for keyword, stype in _OWNERSHIP_CLASSIFICATION_RULES:
-        if keyword in title:
-            return stype
-    return _DEFAULT_OWNERSHIP_SOURCE_TYPE
+    return _OWNERSHIP_CLASSIFIER.first(title, _DEFAULT_OWNERSHIP_SOURCE_TYPE)
 
 
 def _published_at_kst_from_rcept_dt(rcept_dt: str | None) -> datetime | None:
@@ -159,156 +176,118 @@ def _published_at_kst_from_rcept_dt(rcept_dt: str | None) -> datetime | None:
         return None
 
 
+def _items_to_dtos(
+    items: Sequence[dict[str, Any]],
+    *,
+    pblntf_ty: str,
+    title_matcher: KeywordMatcher[str],
+    classify_source_type: Callable[[str], str],
+) -> list[EconomicCollectDto]:
+    """list.json 항목 → 제목 키워드 필터 + source_type 분류된 DTO."""
+    out: list[EconomicCollectDto] = []
+    for item in items:
+        title = str(item.get("report_nm") or "")
+        if not title_matcher.any(title):
+            continue
+
+        rcp = str(item.get("rcept_no") or "").strip()
+        if not rcp:
+            continue
+
+        rcept_dt = str(item.get("rcept_dt") or "").strip()
+        if len(rcept_dt) > 8 and rcept_dt[:8].isdigit():
+            rcept_dt = rcept_dt[:8]
+        published_at = _published_at_kst_from_rcept_dt(rcept_dt if len(rcept_dt) == 8 else None)
+
+        url = f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={rcp}"
+
+        source_type = classify_source_type(title)
+
+        raw_title = title.strip()
+        if not raw_title:
+            raw_title = f"공시_{rcp}"
+        if len(raw_title) > 500:
+            raw_title = raw_title[:497] + "..."
+
+        investor_name = str(item.get("corp_name") or "").strip() or None
+
+        # 주요사항보고서 상세 API는 corp_code + bgn_de + end_de 가 필수이므로
+        # 리스트 단계에서 raw_metadata 에 보존한다.
+        raw_metadata: dict[str, Any] = {
+            "rcept_no": rcp,
+            "rcept_dt": rcept_dt if len(rcept_dt) == 8 else None,
+            "corp_code": str(item.get("corp_code") or "").strip() or None,
+            "stock_code": str(item.get("stock_code") or "").strip() or None,
+            "report_nm": raw_title,
+            "pblntf_ty": pblntf_ty,
+        }
+
+        out.append(
+            EconomicCollectDto(
+                source_type=source_type,
+                source_url=url,
+                raw_title=raw_title,
+                investor_name=investor_name,
+                target_company_or_fund=None,
+                investment_amount=None,
+                published_at=published_at,
+                raw_metadata=raw_metadata,
+            )
+        )
+    return out
+
+
 class DartEconomicCollector:
     """Open DART 공시 목록 API — 주요사항보고(B) + 지분공시(D), 제목 키워드 필터.
 
     운영 보완: 접수일 KST 자정 해석, source_type 규칙 기반 분류, 서비스 계층에서 수집 예외 격리.
     """
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, *, cache: DartResponseCache | None = None):
         if not api_key or not api_key.strip():
             raise ValueError("DART API 키가 비어 있습니다. DART_API_KEY 또는 OPENDART_API_KEY 를 설정하세요.")
         self._api_key = api_key.strip()
+        self._cache = cache if cache is not None else get_response_cache()
 
-    def _collect_pblntf_ty_sync(
-        self,
-        *,
-        pblntf_ty: str,
-        begin: str,
-        end: str,
-        title_keywords: Sequence[str],
-        classify_source_type: Callable[[str], str],
-        page_count: int,
-        last_reprt_at: str = "Y",
-    ) -> list[EconomicCollectDto]:
-        """단일 공시 유형에 대해 페이지네이션 전체 순회."""
-        out: list[EconomicCollectDto] = []
-        page_no = 1
-
-        while True:
-            try:
-                res = dart.search(
-                    bgn_de=begin,
-                    end_de=end,
-                    pblntf_ty=pblntf_ty,
-                    page_no=page_no,
-                    page_count=min(page_count, 100),
-                    last_reprt_at=last_reprt_at,
-                )
-            except Exception:
-                logger.exception(
-                    "DART dart.search 실패 (pblntf_ty=%s, page=%s)", pblntf_ty, page_no
-                )
-                raise
-
-            for report in res.report_list:
-                try:
-                    title = getattr(report, "report_nm", "") or ""
-                except AttributeError:
-                    title = ""
-
-                if not any(k in title for k in title_keywords):
-                    continue
-
-                try:
-                    corp_name = getattr(report, "corp_name", "") or ""
-                except AttributeError:
-                    corp_name = ""
-
-                rcp = getattr(report, "rcp_no", None) or getattr(report, "rcept_no", None)
-                if not rcp:
-                    continue
-
-                rcept_raw = getattr(report, "rcept_dt", None)
-                rcept_dt = (
-                    rcept_raw.strip()
-                    if isinstance(rcept_raw, str)
-                    else (str(rcept_raw).strip() if rcept_raw is not None else "")
-                )
-                if len(rcept_dt) > 8 and rcept_dt[:8].isdigit():
-                    rcept_dt = rcept_dt[:8]
-                published_at = _published_at_kst_from_rcept_dt(rcept_dt if len(rcept_dt) == 8 else None)
-
-                url = f"https://dart.fss.or.kr/dsaf001/main.do?rcpNo={rcp}"
-
-                source_type = classify_source_type(title)
-
-                raw_title = (title or "").strip()
-                if not raw_title:
-                    raw_title = f"공시_{rcp}"
-                if len(raw_title) > 500:
-                    raw_title = raw_title[:497] + "..."
-
-                investor_name = (corp_name or "").strip() or None
-
-                # 주요사항보고서 상세 API는 corp_code + bgn_de + end_de 가 필수이므로
-                # 리스트 단계에서 raw_metadata 에 보존한다.
-                try:
-                    corp_code = getattr(report, "corp_code", None) or ""
-                except AttributeError:
-                    corp_code = ""
-
-                raw_metadata: dict[str, Any] = {
-                    "rcept_no": str(rcp),
-                    "rcept_dt": rcept_dt if len(rcept_dt) == 8 else None,
-                    "corp_code": (corp_code or "").strip() or None,
-                    "report_nm": raw_title,
-                    "pblntf_ty": pblntf_ty,
-                }
-
-                out.append(
-                    EconomicCollectDto(
-                        source_type=source_type,
-                        source_url=url,
-                        raw_title=raw_title,
-                        investor_name=investor_name,
-                        target_company_or_fund=None,
-                        investment_amount=None,
-                        published_at=published_at,
-                        raw_metadata=raw_metadata,
-                    )
-                )
-
-            total_page = int(getattr(res, "total_page", None) or 1)
-            if page_no >= total_page:
-                break
-            page_no += 1
-
-        return out
-
-    def collect_sync(
+    async def collect_list(
         self,
+        client: httpx.AsyncClient,
         bgn_de: str | None = None,
         end_de: str | None = None,
         *,
         page_count: int = 100,
         include_ownership_disclosure: bool = False,
     ) -> list[EconomicCollectDto]:
-        dart.set_api_key(self._api_key)
-
+        """B(+D) 공시 목록을 페이지·유형 병렬로 조회해 키워드 필터된 DTO 반환."""
         end = end_de or datetime.now().strftime("%Y%m%d")
         begin = bgn_de or (datetime.now() - timedelta(days=7)).strftime("%Y%m%d")
 
-        out = self._collect_pblntf_ty_sync(
+        corp_codes = await DartCorpCodeMaster(self._api_key).load(client)
+        list_client = DartListClient(self._api_key, client, corp_codes=corp_codes)
+
+        types = ("B", "D") if include_ownership_disclosure else ("B",)
+        by_type = await list_client.search_many(
+            types,
+            bgn_de=begin,
+            end_de=end,
+            last_reprt_at="Y",
+            page_count=page_count,
+        )
+
+        out = _items_to_dtos(
+            by_type["B"],
             pblntf_ty="B",
-            begin=begin,
-            end=end,
-            title_keywords=_REPORT_KEYWORDS,
+            title_matcher=_REPORT_MATCHER,
             classify_source_type=_classify_source_type,
-            page_count=page_count,
-            last_reprt_at="Y",
         )
         n_b = len(out)
 
         if include_ownership_disclosure:
-            out_d = self._collect_pblntf_ty_sync(
+            out_d = _items_to_dtos(
+                by_type["D"],
                 pblntf_ty="D",
-                begin=begin,
-                end=end,
-                title_keywords=_D_REPORT_KEYWORDS,
+                title_matcher=_D_REPORT_MATCHER,
                 classify_source_type=_classify_source_type_ownership,
-                page_count=page_count,
-                last_reprt_at="Y",
             )
             out.extend(out_d)
             n_d = len(out_d)
@@ -345,23 +324,29 @@ class DartEconomicCollector:
         enrich_details: bool = True,
     ) -> list[EconomicCollectDto]:
         """리스트 수집 → (옵션) 보고서 유형별 상세 조회로 금액·대상 정보 보강."""
-        dtos = await asyncio.to_thread(
-            lambda: self.collect_sync(
+        async with httpx.AsyncClient(
+            timeout=30.0, event_hooks={"request": [httpx_quota_hook("dart")]}
+        ) as client:
+            dtos = await self.collect_list(
+                client,
                 bgn_de,
                 end_de,
                 page_count=page_count,
                 include_ownership_disclosure=include_ownership_disclosure,
             )
-        )
-        if not enrich_details or not dtos:
-            return dtos
-        return await self._enrich_with_detail_api(dtos)
+            if not enrich_details or not dtos:
+                return dtos
+            return await self._enrich_with_detail_api(dtos, client)
 
     async def _enrich_with_detail_api(
         self,
         dtos: list[EconomicCollectDto],
+        client: httpx.AsyncClient,
     ) -> list[EconomicCollectDto]:
-        """제목 라우팅 + raw_metadata(corp_code, rcept_dt, rcept_no) 로 상세 API 호출."""
+        """제목 라우팅 + raw_metadata(corp_code, rcept_dt, rcept_no) 로 상세 API 호출.
+
+        rcept_no 단위로 `DartResponseCache` 를 먼저 조회해 처음 보는 공시만 호출한다.
+        """
         tasks: list[tuple[int, DartDetailRoute, str, str, str]] = []
         for idx, dto in enumerate(dtos):
             route = route_for_title(dto.raw_title or "")
@@ -379,48 +364,74 @@ class DartEconomicCollector:
             logger.info("DART 상세 조회 대상 0건 (라우팅·메타 미충족) — 보강 스킵")
             return dtos
 
-        sem = asyncio.Semaphore(_DETAIL_FETCH_CONCURRENCY)
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            async def _bounded_fetch(
-                idx: int,
-                route: DartDetailRoute,
-                rcept: str,
-                corp: str,
-                dt: str,
-            ) -> tuple[int, DartDetailRoute, dict | None]:
-                async with sem:
-                    detail = await fetch_detail(
-                        client,
-                        self._api_key,
-                        route.endpoint,
-                        rcept_no=rcept,
-                        corp_code=corp,
-                        rcept_dt=dt,
-                    )
-                return idx, route, detail
-
-            results = await asyncio.gather(
-                *(_bounded_fetch(i, r, rc, cc, dt) for (i, r, rc, cc, dt) in tasks),
-                return_exceptions=True,
-            )
-
+        try:
+            cached = await self._cache.get_details((t[2], t[1].endpoint) for t in tasks)
+        except Exception:
+            logger.warning("DART 상세 응답 캐시 조회 실패 — 전체 API 호출", exc_info=True)
+            cached = {}
         enriched_count = 0
         amount_filled = 0
+        pending: list[tuple[int, DartDetailRoute, str, str, str]] = []
+        for task in tasks:
+            idx, route, rcept_no = task[0], task[1], task[2]
+            detail = cached.get(rcept_no)
+            if detail is None:
+                pending.append(task)
+                continue
+            dtos[idx] = _merge_detail_into_dto(dtos[idx], detail, route)
+            enriched_count += 1
+            if dtos[idx].investment_amount is not None:
+                amount_filled += 1
+
+        sem = asyncio.Semaphore(_DETAIL_FETCH_CONCURRENCY)
+
+        async def _bounded_fetch(
+            idx: int,
+            route: DartDetailRoute,
+            rcept: str,
+            corp: str,
+            dt: str,
+        ) -> tuple[int, DartDetailRoute, str, dict | None]:
+            async with sem:
+                detail = await fetch_detail(
+                    client,
+                    self._api_key,
+                    route.endpoint,
+                    rcept_no=rcept,
+                    corp_code=corp,
+                    rcept_dt=dt,
+                )
+            return idx, route, rcept, detail
+
+        results = await asyncio.gather(
+            *(_bounded_fetch(i, r, rc, cc, dt) for (i, r, rc, cc, dt) in pending),
+            return_exceptions=True,
+        )
+
+        to_cache: list[tuple[str, str, dict[str, Any]]] = []
         for res in results:
             if isinstance(res, BaseException):
                 logger.debug("DART 상세 조회 예외: %s", res)
                 continue
-            idx, route, detail = res
+            idx, route, rcept_no, detail = res
             if not detail:
                 continue
+            to_cache.append((rcept_no, route.endpoint, detail))
             dtos[idx] = _merge_detail_into_dto(dtos[idx], detail, route)
             enriched_count += 1
             if dtos[idx].investment_amount is not None:
                 amount_filled += 1
 
+        try:
+            await self._cache.put_details(to_cache)
+        except Exception:
+            logger.warning("DART 상세 응답 캐시 저장 실패", exc_info=True)
+
         logger.info(
-            "DART 상세 조회 보강 완료: 대상=%s, 응답=%s, 금액채움=%s",
+            "DART 상세 조회 보강 완료: 대상=%s, 캐시적중=%s, API호출=%s, 응답=%s, 금액채움=%s",
             len(tasks),
+            len(tasks) - len(pending),
+            len(pending),
             enriched_count,
             amount_filled,
         )
@@ -0,0 +1,169 @@
+"""DART 고유번호(corp_code) 마스터 — 디스크 캐시 + 압축 인덱스.
+
+`dart-fss` 는 최초 검색 시 프로세스마다 `corpCode.xml` ZIP(수십 MB XML)을 내려받아
+전체를 파싱한다. 본 모듈은 그 결과를 **하루 1회**만 갱신해 TSV 인덱스
+(``corp_code \\t stock_code \\t corp_name``)로 디스크에 저장하고, 이후 프로세스는
+인덱스 파일만 읽어 즉시 시작한다.
+
+  - 원본: https://opendart.fss.or.kr/api/corpCode.xml (ZIP → CORPCODE.xml)
+  - 갱신: 인덱스 mtime 이 ``max_age`` 보다 오래됐을 때만 재다운로드
+  - 다운로드 실패 시 오래된 인덱스라도 그대로 사용 (없으면 빈 마스터)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import os
+import time
+import zipfile
+from datetime import timedelta
+from pathlib import Path
+from xml.etree import ElementTree
+
+import httpx
+
+from domain.master.hub.services.collectors.economic.common._cache_dir import cache_dir
+
+logger = logging.getLogger(__name__)
+
+_CORP_CODE_URL = "https://opendart.fss.or.kr/api/corpCode.xml"
+_INDEX_FILENAME = "corp_codes.tsv"
+_DEFAULT_MAX_AGE = timedelta(days=1)
+
+# 프로세스 내 메모 — (인덱스 경로) → (mtime, corp_code → (stock_code, corp_name))
+_LOADED: dict[Path, tuple[float, dict[str, tuple[str, str]]]] = {}
+
+
+def _parse_corp_code_zip(payload: bytes) -> list[tuple[str, str, str]]:
+    """corpCode.xml ZIP → [(corp_code, stock_code, corp_name)] (iterparse 로 스트리밍)."""
+    rows: list[tuple[str, str, str]] = []
+    with zipfile.ZipFile(io.BytesIO(payload)) as zf:
+        name = next((n for n in zf.namelist() if n.lower().endswith(".xml")), None)
+        if name is None:
+            return rows
+        with zf.open(name) as fp:
+            for _, elem in ElementTree.iterparse(fp, events=("end",)):
+                if elem.tag != "list":
+                    continue
+                code = (elem.findtext("corp_code") or "").strip()
+                if code:
+                    rows.append(
+                        (
+                            code,
+                            (elem.findtext("stock_code") or "").strip(),
+                            (elem.findtext("corp_name") or "").strip().replace("\t", " "),
+                        )
+                    )
+                elem.clear()
+    return rows
+
+
+def _write_index(path: Path, rows: list[tuple[str, str, str]]) -> None:
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        for code, stock, name in sorted(rows):
+            f.write(f"{code}\t{stock}\t{name}\n")
+    os.replace(tmp, path)
+
+
+def _read_index(path: Path) -> dict[str, tuple[str, str]]:
+    out: dict[str, tuple[str, str]] = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            parts = line.rstrip("\n").split("\t", 2)
+            if len(parts) == 3:
+                out[parts[0]] = (parts[1], parts[2])
+    return out
+
+
+class DartCorpCodeMaster:
+    """corp_code → (stock_code, corp_name) 조회. ``await load()`` 후 사용."""
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        directory: Path | None = None,
+        max_age: timedelta = _DEFAULT_MAX_AGE,
+    ) -> None:
+        self._api_key = api_key
+        self._path = (directory or cache_dir("dart")) / _INDEX_FILENAME
+        self._max_age = max_age.total_seconds()
+        self._by_code: dict[str, tuple[str, str]] = {}
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _is_fresh(self) -> bool:
+        try:
+            return time.time() - self._path.stat().st_mtime < self._max_age
+        except FileNotFoundError:
+            return False
+
+    async def _refresh(self, client: httpx.AsyncClient) -> bool:
+        try:
+            resp = await client.get(
+                _CORP_CODE_URL, params={"crtfc_key": self._api_key}, timeout=60.0
+            )
+            resp.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning("DART corpCode.xml 다운로드 실패: %s", e)
+            return False
+
+        try:
+            rows = await asyncio.to_thread(_parse_corp_code_zip, resp.content)
+        except (zipfile.BadZipFile, ElementTree.ParseError):
+            # 키 오류 등은 ZIP 대신 JSON/XML 에러 본문이 온다.
+            logger.warning("DART corpCode.xml 응답 파싱 실패 body_prefix=%r", resp.content[:200])
+            return False
+        if not rows:
+            return False
+
+        await asyncio.to_thread(_write_index, self._path, rows)
+        logger.info("DART corp-code 마스터 갱신: %s 법인 → %s", len(rows), self._path)
+        return True
+
+    async def load(self, client: httpx.AsyncClient | None = None) -> "DartCorpCodeMaster":
+        """인덱스가 하루 이상 지났으면 갱신 후 메모리에 로드 (프로세스 내 재사용)."""
+        if not self._is_fresh():
+            if client is None:
+                async with httpx.AsyncClient() as own:
+                    await self._refresh(own)
+            else:
+                await self._refresh(client)
+
+        try:
+            mtime = self._path.stat().st_mtime
+        except FileNotFoundError:
+            logger.warning("DART corp-code 인덱스 없음 — 빈 마스터로 진행")
+            return self
+
+        cached = _LOADED.get(self._path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, await asyncio.to_thread(_read_index, self._path))
+            _LOADED[self._path] = cached
+        self._by_code = cached[1]
+        return self
+
+    def __len__(self) -> int:
+        return len(self._by_code)
+
+    def __contains__(self, corp_code: str) -> bool:
+        return corp_code in self._by_code
+
+    def stock_code(self, corp_code: str) -> str | None:
+        entry = self._by_code.get(corp_code)
+        return (entry[0] or None) if entry else None
+
+    def corp_name(self, corp_code: str) -> str | None:
+        entry = self._by_code.get(corp_code)
+        return entry[1] if entry else None
+
+    def is_listed(self, corp_code: str) -> bool:
+        return self.stock_code(corp_code) is not None
+
+
+__all__ = ["DartCorpCodeMaster"]
@@ -21,6 +21,8 @@ from typing import Any
 
 import aiohttp
 
+from core.api_quota import aiohttp_quota_trace
+from domain.master.hub.services.collectors.economic.common.keyword_matcher import KeywordMatcher
 from domain.master.models.transfer.economic_collect_dto import EconomicCollectDto
 
 logger = logging.getLogger(__name__)
@@ -61,11 +63,14 @@ def _parse_rcept_dt(s: str | None) -> datetime | None:
         return None
 
 
+_IPO_MATCHER: KeywordMatcher[str] = KeywordMatcher(_IPO_KEYWORDS)
+_EXCLUDE_MATCHER: KeywordMatcher[str] = KeywordMatcher(_EXCLUDE_KEYWORDS)
+
+
 def _is_ipo_related(report_nm: str) -> bool:
-    nm = report_nm or ""
-    if any(ex in nm for ex in _EXCLUDE_KEYWORDS):
+    if _EXCLUDE_MATCHER.any(report_nm):
         return False
-    return any(kw in nm for kw in _IPO_KEYWORDS)
+    return _IPO_MATCHER.any(report_nm)
 
 
 class DartIpoCollector:
@@ -100,7 +105,7 @@ class DartIpoCollector:
         items: list[dict[str, Any]] = []
 
         timeout = aiohttp.ClientTimeout(total=20)
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(trace_configs=[aiohttp_quota_trace("dart")]) as session:
             for page in range(1, max_pages + 1):
                 params = {
                     "crtfc_key": self._key,
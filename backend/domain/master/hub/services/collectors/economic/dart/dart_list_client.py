@@ -0,0 +1,156 @@
+"""OpenDART 공시검색(`list.json`) 네이티브 async 클라이언트.
+
+`dart_fss.search` 를 스레드 오프로딩하던 경로를 대체한다.
+
+  - 1페이지로 ``total_page`` 를 확인한 뒤 나머지 페이지를 **동시에** 조회 (세마포어로 상한)
+  - 여러 ``pblntf_ty`` (예: B 주요사항 + D 지분공시) 를 한 번에 병렬 조회
+  - 응답 항목은 list.json 원본 dict 그대로 반환
+    (corp_code, corp_name, stock_code, corp_cls, report_nm, rcept_no, flr_nm, rcept_dt, rm)
+  - 선택적으로 ``DartCorpCodeMaster`` 를 받아 ``stock_code`` 누락 항목을 보정
+
+응답 status:
+  - ``000`` 정상 / ``013`` 조회된 데이터 없음(빈 목록) / 그 외는 ``DartApiError``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+import httpx
+
+from domain.master.hub.services.collectors.economic.dart.dart_corp_code_master import (
+    DartCorpCodeMaster,
+)
+
+logger = logging.getLogger(__name__)
+
+_DART_LIST_URL = "https://opendart.fss.or.kr/api/list.json"
+_MAX_PAGE_COUNT = 100
+
+# 페이지 동시 조회 상한 — DART API 분당 호출 제한 보호.
+_LIST_CONCURRENCY = 5
+
+
+class DartApiError(RuntimeError):
+    """OpenDART 가 ``000``/``013`` 이외의 status 를 돌려준 경우."""
+
+    def __init__(self, status: str, message: str) -> None:
+        super().__init__(f"DART status={status} msg={message}")
+        self.status = status
+        self.message = message
+
+
+class DartListClient:
+    """공시검색 API 페이지 병렬 조회. ``httpx.AsyncClient`` 는 호출 측이 소유한다."""
+
+    def __init__(
+        self,
+        api_key: str,
+        client: httpx.AsyncClient,
+        *,
+        corp_codes: DartCorpCodeMaster | None = None,
+        concurrency: int = _LIST_CONCURRENCY,
+    ) -> None:
+        self._api_key = api_key
+        self._client = client
+        self._corp_codes = corp_codes
+        self._sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def _fetch_page(self, params: dict[str, Any], page_no: int) -> dict[str, Any]:
+        async with self._sem:
+            resp = await self._client.get(
+                _DART_LIST_URL,
+                params={**params, "crtfc_key": self._api_key, "page_no": page_no},
+                timeout=30.0,
+            )
+        resp.raise_for_status()
+        body = resp.json()
+        status = str(body.get("status") or "").strip()
+        if status == "013":
+            return {"list": [], "total_page": 0}
+        if status != "000":
+            raise DartApiError(status, str(body.get("message") or ""))
+        return body
+
+    def _fill_from_master(self, items: list[dict[str, Any]]) -> None:
+        if self._corp_codes is None or not len(self._corp_codes):
+            return
+        for item in items:
+            if item.get("stock_code"):
+                continue
+            stock = self._corp_codes.stock_code(str(item.get("corp_code") or ""))
+            if stock:
+                item["stock_code"] = stock
+
+    async def search(
+        self,
+        *,
+        pblntf_ty: str,
+        bgn_de: str,
+        end_de: str,
+        last_reprt_at: str = "Y",
+        page_count: int = _MAX_PAGE_COUNT,
+        corp_code: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """단일 공시 유형 전 페이지 조회 → list.json 항목 (페이지 순서 유지)."""
+        params: dict[str, Any] = {
+            "bgn_de": bgn_de,
+            "end_de": end_de,
+            "pblntf_ty": pblntf_ty,
+            "last_reprt_at": last_reprt_at,
+            "page_count": min(page_count, _MAX_PAGE_COUNT),
+        }
+        if corp_code:
+            params["corp_code"] = corp_code
+
+        first = await self._fetch_page(params, 1)
+        items: list[dict[str, Any]] = list(first.get("list") or [])
+        total_page = int(first.get("total_page") or 1)
+
+        if total_page > 1:
+            pages = await asyncio.gather(
+                *(self._fetch_page(params, p) for p in range(2, total_page + 1))
+            )
+            for body in pages:
+                items.extend(body.get("list") or [])
+
+        self._fill_from_master(items)
+        logger.debug(
+            "DART list pblntf_ty=%s %s~%s: %s건 (%s페이지)",
+            pblntf_ty,
+            bgn_de,
+            end_de,
+            len(items),
+            total_page,
+        )
+        return items
+
+    async def search_many(
+        self,
+        pblntf_types: Sequence[str],
+        *,
+        bgn_de: str,
+        end_de: str,
+        last_reprt_at: str = "Y",
+        page_count: int = _MAX_PAGE_COUNT,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """여러 공시 유형을 병렬 조회 → ``{pblntf_ty: items}``."""
+        results = await asyncio.gather(
+            *(
+                self.search(
+                    pblntf_ty=ty,
+                    bgn_de=bgn_de,
+                    end_de=end_de,
+                    last_reprt_at=last_reprt_at,
+                    page_count=page_count,
+                )
+                for ty in pblntf_types
+            )
+        )
+        return dict(zip(pblntf_types, results))
+
+
+__all__ = ["DartApiError", "DartListClient"]
@@ -2,9 +2,11 @@
 
 전략 (ECONOMIC_FLOW_IMPLEMENTATION_ROADMAP.md §4.3):
   - pblntf_ty=A: 사업보고서(A001) / 반기보고서(A002) 수집
-  - dart_fss 라이브러리 스레드 오프로딩 (기존 DartEconomicCollector 패턴 동일)
-  - R&D/CAPEX 금액 추출: fnlttSinglAcntAll.json 1회 호출 후 Python sj_div 필터
-    - sj_div 파라미터는 DART API에서 무시되므로 전체 계정을 받아 Python에서 분리
+  - 목록 조회: `DartListClient` 네이티브 async list.json (기존 DartEconomicCollector 와 동일, 페이지 병렬)
+  - R&D/CAPEX 금액 추출:
+    1) 재무정보 일괄다운로드 스토어(`DartBulkFinancials`, 상장사 전체) 를 stock_code 로 조회
+    2) 미적중(비상장·미적재 분기)만 fnlttSinglAcntAll.json 1회 호출 후 Python sj_div 필터
+       - sj_div 파라미터는 DART API에서 무시되므로 전체 계정을 받아 Python에서 분리
   - source_type: DART_PERIODIC_ANNUAL(사업보고서) / DART_PERIODIC_SEMIANNUAL(반기)
   - 상세 API 동시성: 5 (DART API 분당 제한 보호)
 
@@ -22,9 +24,26 @@ from collections.abc import Callable, Sequence
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-import dart_fss as dart
 import httpx
 
+from core.api_quota import httpx_quota_hook
+from domain.master.hub.services.collectors.economic.common.keyword_matcher import KeywordMatcher
+from domain.master.hub.services.collectors.economic.dart.dart_bulk_financials import (
+    CAPEX_KEYWORDS,
+    RND_KEYWORDS,
+    DartBulkFinancials,
+)
+from domain.master.hub.services.collectors.economic.dart.dart_corp_code_master import (
+    DartCorpCodeMaster,
+)
+from domain.master.hub.services.collectors.economic.dart.dart_list_client import (
+    DartApiError,
+    DartListClient,
+)
+from domain.master.hub.services.collectors.economic.dart.dart_response_cache import (
+    DartResponseCache,
+    get_response_cache,
+)
 from domain.master.models.transfer.economic_collect_dto import EconomicCollectDto
 
 logger = logging.getLogger(__name__)
@@ -49,10 +68,13 @@ _REPRT_CODE: dict[str, str] = {
     "분기보고서":   "11013",
 }
 
-# R&D 추출 키워드 (IS: 손익계산서)
-_RND_KEYWORDS: tuple[str, ...] = ("연구개발", "연구비", "개발비")
-# CAPEX 추출 키워드 (CF: 현금흐름표)
-_CAPEX_KEYWORDS: tuple[str, ...] = ("유형자산취득", "유형자산의취득", "설비투자")
+_REPORT_TYPE_MATCHER: KeywordMatcher[str] = KeywordMatcher(_PERIODIC_REPORT_TYPES)
+_TARGET_REPORT_MATCHER: KeywordMatcher[str] = KeywordMatcher(_TARGET_REPORT_KEYWORDS)
+_REPRT_CODE_MATCHER: KeywordMatcher[str] = KeywordMatcher(_REPRT_CODE.items())
+
+# R&D(IS) / CAPEX(CF) 추출 키워드 — 일괄 파일 경로와 공유
+_RND_MATCHER: KeywordMatcher[str] = KeywordMatcher(RND_KEYWORDS)
+_CAPEX_MATCHER: KeywordMatcher[str] = KeywordMatcher(CAPEX_KEYWORDS)
 
 
 # ---------------------------------------------------------------------------
@@ -70,17 +92,11 @@ def _published_at(rcept_dt: str | None) -> datetime | None:
 
 
 def _classify_source_type(report_nm: str) -> str:
-    for keyword, stype in _PERIODIC_REPORT_TYPES:
-        if keyword in report_nm:
-            return stype
-    return "DART_PERIODIC_ANNUAL"
+    return _REPORT_TYPE_MATCHER.first(report_nm, "DART_PERIODIC_ANNUAL")
 
 
 def _get_reprt_code(report_nm: str) -> str:
-    for keyword, code in _REPRT_CODE.items():
-        if keyword in report_nm:
-            return code
-    return "11011"
+    return _REPRT_CODE_MATCHER.first(report_nm, "11011")
 
 
 def _bsns_year_from_report(report_nm: str, rcept_dt: str) -> str | None:
@@ -147,7 +163,7 @@ def _extract_rnd_amount(accounts: list[dict[str, Any]]) -> int | None:
         if acc.get("sj_div") not in ("IS", "CIS"):
             continue
         nm = (acc.get("account_nm") or "").replace(" ", "")
-        if any(kw in nm for kw in _RND_KEYWORDS):
+        if _RND_MATCHER.any(nm):
             v = _to_int(acc.get("thstrm_amount"))
             if v:
                 total += v
@@ -163,7 +179,7 @@ def _extract_capex_amount(accounts: list[dict[str, Any]]) -> int | None:
         if acc.get("sj_div") != "CF":
             continue
         nm = (acc.get("account_nm") or "").replace(" ", "")
-        if any(kw in nm for kw in _CAPEX_KEYWORDS):
+        if _CAPEX_MATCHER.any(nm):
             v = _to_int(acc.get("thstrm_amount"))
             if v:
                 total += v
@@ -179,71 +195,63 @@ def _extract_capex_amount(accounts: list[dict[str, Any]]) -> int | None:
 class DartPeriodicCollector:
     """DART 정기공시(A) — 사업보고서·반기보고서 목록 + R&D/CAPEX 재무 보강.
 
-    기존 DartEconomicCollector 와 동일하게 `dart_fss` 를 동기 스레드 오프로딩으로 실행한다.
+    기존 DartEconomicCollector 와 동일하게 `DartListClient` 로 목록을 async 조회한다.
     """
 
-    def __init__(self, api_key: str):
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        cache: DartResponseCache | None = None,
+        bulk: DartBulkFinancials | None = None,
+    ):
         if not api_key or not api_key.strip():
             raise ValueError("DART API 키가 비어 있습니다.")
         self._api_key = api_key.strip()
+        self._cache = cache if cache is not None else get_response_cache()
+        self._bulk = bulk
 
-    def _collect_list_sync(
+    async def _collect_list(
         self,
+        client: httpx.AsyncClient,
         begin: str,
         end: str,
         page_count: int = 100,
     ) -> list[dict[str, Any]]:
-        """dart.search(pblntf_ty=A) 전 페이지 순회 → raw dict 목록."""
-        dart.set_api_key(self._api_key)
-        out: list[dict[str, Any]] = []
-        page_no = 1
-        while True:
-            try:
-                res = dart.search(
-                    bgn_de=begin,
-                    end_de=end,
-                    pblntf_ty="A",
-                    page_no=page_no,
-                    page_count=min(page_count, 100),
-                    last_reprt_at="Y",
-                )
-            except Exception:
-                logger.exception("DART 정기공시 목록 조회 실패 page=%s", page_no)
-                break
-
-            for rpt in res.report_list:
-                nm = (getattr(rpt, "report_nm", "") or "").strip()
-                if not any(kw in nm for kw in _TARGET_REPORT_KEYWORDS):
-                    continue
-                rcp = (
-                    getattr(rpt, "rcp_no", None)
-                    or getattr(rpt, "rcept_no", None)
-                )
-                if not rcp:
-                    continue
-                corp_code = (getattr(rpt, "corp_code", "") or "").strip()
-                corp_nm = (getattr(rpt, "corp_name", "") or "").strip()
-                rcept_raw = getattr(rpt, "rcept_dt", None)
-                rcept_dt = (
-                    str(rcept_raw).strip()[:8]
-                    if rcept_raw is not None
-                    else ""
-                )
-                out.append(
-                    {
-                        "rcept_no": str(rcp),
-                        "corp_code": corp_code,
-                        "corp_name": corp_nm,
-                        "report_nm": nm,
-                        "rcept_dt": rcept_dt,
-                        "corp_cls": (getattr(rpt, "corp_cls", "") or ""),
-                    }
-                )
+        """list.json(pblntf_ty=A) 전 페이지 병렬 조회 → 대상 보고서 raw dict 목록."""
+        corp_codes = await DartCorpCodeMaster(self._api_key).load(client)
+        list_client = DartListClient(self._api_key, client, corp_codes=corp_codes)
+        try:
+            items = await list_client.search(
+                pblntf_ty="A",
+                bgn_de=begin,
+                end_de=end,
+                last_reprt_at="Y",
+                page_count=page_count,
+            )
+        except (DartApiError, httpx.HTTPError):
+            logger.exception("DART 정기공시 목록 조회 실패 %s~%s", begin, end)
+            return []
 
-            total_page = int(getattr(res, "total_page", None) or 1)
-            if page_no >= total_page:
-                break
-            page_no += 1
+        out: list[dict[str, Any]] = []
+        for item in items:
+            nm = str(item.get("report_nm") or "").strip()
+            if not _TARGET_REPORT_MATCHER.any(nm):
+                continue
+            rcp = str(item.get("rcept_no") or "").strip()
+            if not rcp:
+                continue
+            out.append(
+                {
+                    "rcept_no": rcp,
+                    "corp_code": str(item.get("corp_code") or "").strip(),
+                    "corp_name": str(item.get("corp_name") or "").strip(),
+                    "stock_code": str(item.get("stock_code") or "").strip(),
+                    "report_nm": nm,
+                    "rcept_dt": str(item.get("rcept_dt") or "").strip()[:8],
+                    "corp_cls": str(item.get("corp_cls") or ""),
+                }
+            )
         return out
 
     async def collect(
@@ -258,18 +266,41 @@ class DartPeriodicCollector:
 
         Args:
             bgn_de/end_de: 접수일 범위 YYYYMMDD (미입력 시 최근 30일).
-            enrich_financials: True 면 fnlttSinglAcntAll 로 R&D·CAPEX 추출 시도.
-            max_enrich: 재무 보강 대상 최대 건수 (API 제한 보호).
+            enrich_financials: True 면 일괄 스토어 → fnlttSinglAcntAll 순으로 R&D·CAPEX 추출 시도.
+            max_enrich: 재무 API 실제 호출(일괄 스토어·캐시 미스) 최대 건수 (API 제한 보호).
+                일괄 스토어 적중분은 상한에 포함되지 않는다.
         """
         end = end_de or datetime.now(_KST).strftime("%Y%m%d")
         begin = bgn_de or (datetime.now(_KST) - timedelta(days=30)).strftime("%Y%m%d")
 
-        raw_list = await asyncio.to_thread(self._collect_list_sync, begin, end)
+        async with httpx.AsyncClient(
+            timeout=30.0, event_hooks={"request": [httpx_quota_hook("dart")]}
+        ) as client:
+            return await self._collect_with_client(
+                client,
+                begin,
+                end,
+                enrich_financials=enrich_financials,
+                max_enrich=max_enrich,
+            )
+
+    async def _collect_with_client(
+        self,
+        client: httpx.AsyncClient,
+        begin: str,
+        end: str,
+        *,
+        enrich_financials: bool,
+        max_enrich: int,
+    ) -> tuple[list[EconomicCollectDto], dict[str, int]]:
+        raw_list = await self._collect_list(client, begin, end)
         stats: dict[str, int] = {
             "fetched_list": len(raw_list),
             "enriched": 0,
             "rnd_found": 0,
             "capex_found": 0,
+            "bulk_hits": 0,
+            "cache_hits": 0,
         }
 
         if not raw_list:
@@ -283,15 +314,18 @@ class DartPeriodicCollector:
                 seen.add(r["rcept_no"])
                 unique.append(r)
 
-        # 재무 보강 (corp_code 있는 법인, 최대 max_enrich)
+        # 재무 보강 (corp_code 있는 법인)
         # Y/K 대기업은 CAPEX 위주, E/N 소형법인은 R&D 추출 가능 → 전체 포함
         if enrich_financials:
-            enrich_targets = [
-                r for r in unique if r.get("corp_code")
-            ][:max_enrich]
+            # 일괄 스토어·캐시 적중분은 API 비용이 없으므로
+            # max_enrich 상한은 실제 호출 건수에만 적용한다.
+            enrich_targets = [r for r in unique if r.get("corp_code")]
             enriched_map: dict[str, dict[str, int | None]] = {}
             if enrich_targets:
-                enriched_map = await self._enrich_financials(enrich_targets)
+                enriched_map, hits = await self._enrich_financials(
+                    client, enrich_targets, max_fetch=max_enrich
+                )
+                stats.update(hits)
                 stats["enriched"] = len(enriched_map)
                 stats["rnd_found"] = sum(
                     1 for v in enriched_map.values() if v.get("rnd") is not None
@@ -310,35 +344,90 @@ class DartPeriodicCollector:
         logger.info("[dart_periodic] dtos=%s stats=%s", len(dtos), stats)
         return dtos, stats
 
+    async def _load_bulk(self) -> DartBulkFinancials:
+        if self._bulk is None:
+            try:
+                self._bulk = await asyncio.to_thread(DartBulkFinancials().load)
+            except Exception:
+                logger.warning("[dart_periodic] 재무정보 일괄 스토어 로드 실패 — API 경로만 사용", exc_info=True)
+                self._bulk = DartBulkFinancials()
+        return self._bulk
+
     async def _enrich_financials(
         self,
+        client: httpx.AsyncClient,
         reports: list[dict[str, Any]],
-    ) -> dict[str, dict[str, int | None]]:
-        """rcept_no → {rnd, capex} 매핑."""
-        sem = asyncio.Semaphore(_DETAIL_CONCURRENCY)
+        *,
+        max_fetch: int | None = None,
+    ) -> tuple[dict[str, dict[str, int | None]], dict[str, int]]:
+        """rcept_no → {rnd, capex} 매핑 + {bulk_hits, cache_hits}.
+
+        키는 ``(corp_code|stock_code, bsns_year, reprt_code)``. 상장사는 `DartBulkFinancials` 에서
+        바로 채우고, 나머지는 `DartResponseCache` → ``fnlttSinglAcntAll`` 순으로 조회한다
+        (API 호출은 최대 ``max_fetch`` 건). 빈 응답은 캐시에 저장하지 않는다.
+        """
+        bulk = await self._load_bulk()
         results: dict[str, dict[str, int | None]] = {}
+        bulk_hits = 0
 
-        async def process(rpt: dict[str, Any]) -> None:
-            rcept_no = rpt["rcept_no"]
-            corp_code = rpt["corp_code"]
-            report_nm = rpt["report_nm"]
-            rcept_dt = rpt["rcept_dt"]
-            bsns_year = _bsns_year_from_report(report_nm, rcept_dt)
-            reprt_code = _get_reprt_code(report_nm)
+        keyed: list[tuple[str, tuple[str, str, str]]] = []
+        for rpt in reports:
+            corp_code = rpt.get("corp_code") or ""
+            bsns_year = _bsns_year_from_report(rpt["report_nm"], rpt["rcept_dt"])
             if not bsns_year or not corp_code:
-                return
-            async with sem:
-                all_accts = await _fetch_all_accounts(
-                    client, self._api_key, corp_code, bsns_year, reprt_code
-                )
+                continue
+            reprt_code = _get_reprt_code(rpt["report_nm"])
+            stock_code = rpt.get("stock_code") or ""
+            found = bulk.lookup(stock_code, bsns_year, reprt_code) if stock_code else None
+            if found is not None:
+                bulk_hits += 1
+                if found["rnd"] is not None or found["capex"] is not None:
+                    results[rpt["rcept_no"]] = found
+                continue
+            keyed.append((rpt["rcept_no"], (corp_code, bsns_year, reprt_code)))
+
+        try:
+            accounts_by_key = await self._cache.get_financials(key for _, key in keyed)
+        except Exception:
+            logger.warning("[dart_periodic] 재무 응답 캐시 조회 실패 — 전체 API 호출", exc_info=True)
+            accounts_by_key = {}
+        cache_hits = sum(1 for _, key in keyed if key in accounts_by_key)
+
+        misses = list(dict.fromkeys(key for _, key in keyed if key not in accounts_by_key))
+        if max_fetch is not None:
+            misses = misses[:max_fetch]
+
+        if misses:
+            sem = asyncio.Semaphore(_DETAIL_CONCURRENCY)
+
+            async def fetch(key: tuple[str, str, str]) -> tuple[tuple[str, str, str], list[dict[str, Any]]]:
+                async with sem:
+                    return key, await _fetch_all_accounts(client, self._api_key, *key)
+
+            fetched = [(key, accts) for key, accts in await asyncio.gather(*[fetch(k) for k in misses]) if accts]
+            accounts_by_key.update(fetched)
+            try:
+                await self._cache.put_financials(fetched)
+            except Exception:
+                logger.warning("[dart_periodic] 재무 응답 캐시 저장 실패", exc_info=True)
+
+        for rcept_no, key in keyed:
+            all_accts = accounts_by_key.get(key)
+            if not all_accts:
+                continue
             rnd = _extract_rnd_amount(all_accts)
             capex = _extract_capex_amount(all_accts)
             if rnd is not None or capex is not None:
                 results[rcept_no] = {"rnd": rnd, "capex": capex}
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            await asyncio.gather(*[process(r) for r in reports])
-        return results
+        logger.info(
+            "[dart_periodic] 재무 보강: 대상=%s, 일괄적중=%s, 캐시적중=%s, API호출=%s",
+            len(keyed) + bulk_hits,
+            bulk_hits,
+            cache_hits,
+            len(misses),
+        )
+        return results, {"bulk_hits": bulk_hits, "cache_hits": cache_hits}
 
     def _to_dto(
         self,
@@ -0,0 +1,182 @@
+"""DART 상세·재무 API 응답 영속 캐시 (SQLite, 디스크).
+
+공시는 접수번호(`rcept_no`) 단위로 불변이다(정정 공시는 새 rcept_no 를 받는다).
+따라서 한 번 받아 둔 응답은 다시 호출할 필요가 없다.
+
+  - 주요사항보고 상세 (`dart_detail_fetcher.fetch_detail`) : key = ``rcept_no`` (조회는 endpoint 도 일치해야 적중)
+  - 재무제표 전체 계정 (`fnlttSinglAcntAll`)               : key = ``(corp_code, bsns_year, reprt_code)``
+
+겹치는 수집 창(주간 35일 정기공시, 일일 7일 주요사항)이 같은 공시를 반복 조회하던 비용을
+없애, **처음 보는 공시만** API 호출을 소모하게 한다.
+
+정상 응답만 저장한다. 네트워크 오류·``013``(데이터 없음)은 다음 실행에서 재시도한다.
+값은 zlib 압축 JSON 으로 저장하며, 파일은 ``BRONZE_CACHE_DIR/dart/responses.sqlite3``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import zlib
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from domain.master.hub.services.collectors.economic.common._cache_dir import cache_dir
+
+logger = logging.getLogger(__name__)
+
+_DB_FILENAME = "responses.sqlite3"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS detail (
+        rcept_no   TEXT PRIMARY KEY,
+        endpoint   TEXT NOT NULL,
+        body       BLOB NOT NULL,
+        fetched_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS financials (
+        corp_code  TEXT NOT NULL,
+        bsns_year  TEXT NOT NULL,
+        reprt_code TEXT NOT NULL,
+        body       BLOB NOT NULL,
+        fetched_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (corp_code, bsns_year, reprt_code)
+    )
+    """,
+)
+
+FinancialKey = tuple[str, str, str]
+
+
+def _pack(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+
+def _unpack(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+
+class DartResponseCache:
+    """rcept_no / (corp_code, bsns_year, reprt_code) → DART 응답. 배치 조회·저장은 스레드 오프로딩."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path or (cache_dir("dart") / _DB_FILENAME)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self._path, check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            for ddl in _SCHEMA:
+                conn.execute(ddl)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ------------------------------------------------------------------ detail
+
+    def get_details_sync(self, keys: Iterable[tuple[str, str]]) -> dict[str, dict[str, Any]]:
+        """[(rcept_no, endpoint)] → rcept_no 별 상세. 저장된 endpoint 가 다르면(라우팅 변경) 미스."""
+        pairs = list(dict.fromkeys(keys))
+        if not pairs:
+            return {}
+        out: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            conn = self._connect()
+            for i in range(0, len(pairs), 400):
+                chunk = pairs[i : i + 400]
+                values = ",".join("(?, ?)" for _ in chunk)
+                params = [v for pair in chunk for v in pair]
+                for rcept_no, blob in conn.execute(
+                    f"SELECT rcept_no, body FROM detail WHERE (rcept_no, endpoint) IN (VALUES {values})",
+                    params,
+                ):
+                    out[rcept_no] = _unpack(blob)
+        return out
+
+    def put_details_sync(self, items: Iterable[tuple[str, str, dict[str, Any]]]) -> int:
+        """[(rcept_no, endpoint, detail)] 저장."""
+        rows = [(rcept_no, endpoint, _pack(detail)) for rcept_no, endpoint, detail in items]
+        if not rows:
+            return 0
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO detail (rcept_no, endpoint, body) VALUES (?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+        return len(rows)
+
+    async def get_details(self, keys: Iterable[tuple[str, str]]) -> dict[str, dict[str, Any]]:
+        return await asyncio.to_thread(self.get_details_sync, list(keys))
+
+    async def put_details(self, items: Iterable[tuple[str, str, dict[str, Any]]]) -> int:
+        return await asyncio.to_thread(self.put_details_sync, list(items))
+
+    # -------------------------------------------------------------- financials
+
+    def get_financials_sync(self, keys: Iterable[FinancialKey]) -> dict[FinancialKey, list[dict[str, Any]]]:
+        out: dict[FinancialKey, list[dict[str, Any]]] = {}
+        with self._lock:
+            conn = self._connect()
+            for key in dict.fromkeys(keys):
+                row = conn.execute(
+                    "SELECT body FROM financials WHERE corp_code = ? AND bsns_year = ? AND reprt_code = ?",
+                    key,
+                ).fetchone()
+                if row is not None:
+                    out[key] = _unpack(row[0])
+        return out
+
+    def put_financials_sync(self, items: Iterable[tuple[FinancialKey, list[dict[str, Any]]]]) -> int:
+        rows = [(*key, _pack(accounts)) for key, accounts in items]
+        if not rows:
+            return 0
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO financials (corp_code, bsns_year, reprt_code, body) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+        return len(rows)
+
+    async def get_financials(
+        self, keys: Iterable[FinancialKey]
+    ) -> dict[FinancialKey, list[dict[str, Any]]]:
+        return await asyncio.to_thread(self.get_financials_sync, list(keys))
+
+    async def put_financials(
+        self, items: Iterable[tuple[FinancialKey, list[dict[str, Any]]]]
+    ) -> int:
+        return await asyncio.to_thread(self.put_financials_sync, list(items))
+
+
+_DEFAULT_CACHE: DartResponseCache | None = None
+
+
+def get_response_cache() -> DartResponseCache:
+    """프로세스 공용 캐시 인스턴스 (기본 경로)."""
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = DartResponseCache()
+    return _DEFAULT_CACHE
+
+
+__all__ = ["DartResponseCache", "get_response_cache"]
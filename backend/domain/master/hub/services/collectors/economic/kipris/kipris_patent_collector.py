@@ -24,6 +24,7 @@ from typing import Any
 
 import aiohttp
 
+from core.api_quota import aiohttp_quota_trace
 from domain.master.models.transfer.economic_collect_dto import EconomicCollectDto
 
 logger = logging.getLogger(__name__)
@@ -125,7 +126,7 @@ class KiprisPatentCollector:
         dtos: list[EconomicCollectDto] = []
 
         timeout = aiohttp.ClientTimeout(total=15)
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(trace_configs=[aiohttp_quota_trace("kipris")]) as session:
             for group_name, keywords in _TECH_KEYWORD_GROUPS:
                 for keyword in keywords:
                     try:
@@ -3,6 +3,7 @@
 전략 (ECONOMIC_FLOW_IMPLEMENTATION_ROADMAP.md §4.2):
   - MFDS 보도자료는 **완전 정적 SSR** → MSIT BBS 패턴을 가볍게 클론.
   - 목록(`list.do?page=N`) 정적 테이블 파싱 → 상세(`view.do?seq=N`) 본문.
+    페이지 순회·상세 동시성은 공통 엔진(`common/board_crawl.crawl_board`)이 담당.
   - 필터: **등록일 연도 + 제목 키워드 리스트(any 매칭)** ("허가/신약/임상/품목허가/조건부/승인").
   - 워터마크: `seq`(정수) 또는 source_url.
   - `investment_amount = None` — 정성 트렌드 신호 (raw_metadata.data_role="TREND_SIGNAL").
@@ -21,13 +22,20 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 from urllib.parse import parse_qs, urlencode, urljoin, urlparse
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
+from core.html_parse import make_soup, select_text
 from domain.master.hub.services.collectors.economic.common._msit_common import (
-    async_get_html,
     make_async_client,
     parse_kst_date,
 )
+from domain.master.hub.services.collectors.economic.common.board_crawl import (
+    KEEP,
+    RowAction,
+    RowDecision,
+    crawl_board,
+)
+from domain.master.hub.services.collectors.economic.common.keyword_matcher import matcher_for
 from domain.master.models.transfer.economic_collect_dto import EconomicCollectDto
 
 logger = logging.getLogger(__name__)
@@ -35,8 +43,6 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://www.mfds.go.kr"
 _KST = timezone(timedelta(hours=9))
 
-BODY_FETCH_CONCURRENCY = 5
-
 # 신약 허가·임상 등 자본/산업 선행 신호 키워드 (제목에 하나라도 포함되면 채택)
 DEFAULT_KEYWORDS: tuple[str, ...] = (
     "허가",
@@ -168,7 +174,7 @@ def parse_mfds_list_rows(html: str, board: MfdsBoardConfig = PRESS_BOARD) -> lis
         list of {title, url, seq, published_at(datetime|None), published_year, raw_date}.
         제목 링크/식별자가 없는 행(헤더·공지 더미)은 제외.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     rows: list[Tag] = []
     for sel in _LIST_ROW_SELECTORS:
         rows = soup.select(sel)
@@ -217,7 +223,7 @@ def parse_mfds_list_rows(html: str, board: MfdsBoardConfig = PRESS_BOARD) -> lis
 
 
 def row_matches_keyword(title: str, keywords: tuple[str, ...]) -> bool:
-    return any(kw in title for kw in keywords)
+    return matcher_for(tuple(keywords)).any(title)
 
 
 # ---------------------------------------------------------------------------
@@ -265,33 +271,39 @@ class MfdsBbsCollector:
             "filtered_keyword": 0,
             "skipped_watermark": 0,
         }
-        kept: list[dict[str, Any]] = []
-
         async with make_async_client() as client:
-            for page in range(1, max_pages + 1):
-                url = self._page_url(page)
-                logger.info("[%s] page=%s url=%s", self.board.board_key, page, url)
-                try:
-                    html = await async_get_html(client, url, timeout=30.0)
-                except Exception:
-                    logger.exception("[%s] list fetch failed page=%s", self.board.board_key, page)
-                    break
-
-                rows = parse_mfds_list_rows(html, self.board)
-                if not rows:
-                    logger.info("[%s] no list rows page=%s — stop", self.board.board_key, page)
-                    break
-
-                hit = self._consume_rows(rows, stats, kept, last_seq, last_url, max_items)
-                if hit:
-                    break
-                await asyncio.sleep(0.35)
-
-            dtos = await self._build_dtos(client, kept, fetch_body)
-
-        logger.info("[%s] collected dtos=%s stats=%s", self.board.board_key, len(dtos), stats)
+            dtos = await crawl_board(
+                _MfdsCrawlSpec(self, last_seq, last_url),
+                client,
+                max_pages=max_pages,
+                max_items=max_items,
+                fetch_body=fetch_body,
+                stats=stats,
+            )
         return dtos, stats
 
+    def _decide(
+        self,
+        row: dict[str, Any],
+        last_seq: int | None,
+        last_url: str | None,
+    ) -> RowDecision:
+        # 워터마크 — 직전 수집 지점 도달 시 중단(증분)
+        if last_seq is not None and row.get("seq") == last_seq:
+            return RowDecision(RowAction.STOP, "skipped_watermark")
+        if last_url and row.get("url") == last_url:
+            return RowDecision(RowAction.STOP, "skipped_watermark")
+
+        # 연도 필터 — 불일치는 continue(공지·고정행이 섞여도 조기 종료 방지, max_pages 로 bound)
+        if self.board.target_year is not None:
+            if row.get("published_year") != self.board.target_year:
+                return RowDecision(RowAction.SKIP, "filtered_year")
+
+        # 제목 키워드(any) 필터
+        if not row_matches_keyword(row["title"], self.board.keywords):
+            return RowDecision(RowAction.SKIP, "filtered_keyword")
+        return KEEP
+
     def _consume_rows(
         self,
         rows: list[dict[str, Any]],
@@ -301,66 +313,23 @@ class MfdsBbsCollector:
         last_url: str | None,
         max_items: int,
     ) -> bool:
-        """필터링·워터마크 적용. 반환 True 면 페이지네이션 중단."""
+        """필터링·워터마크 적용 (엔진 없이 한 페이지 판정). 반환 True 면 페이지네이션 중단."""
         for row in rows:
             stats["fetched_total"] += 1
-
-            # 워터마크 — 직전 수집 지점 도달 시 중단(증분)
-            if last_seq is not None and row.get("seq") == last_seq:
-                stats["skipped_watermark"] += 1
-                return True
-            if last_url and row.get("url") == last_url:
-                stats["skipped_watermark"] += 1
+            decision = self._decide(row, last_seq, last_url)
+            if decision.stat:
+                stats[decision.stat] += 1
+            if decision.action is RowAction.STOP:
                 return True
-
-            # 연도 필터 — 불일치는 continue(공지·고정행이 섞여도 조기 종료 방지, max_pages 로 bound)
-            if self.board.target_year is not None:
-                if row.get("published_year") != self.board.target_year:
-                    stats["filtered_year"] += 1
-                    continue
-
-            # 제목 키워드(any) 필터
-            if not row_matches_keyword(row["title"], self.board.keywords):
-                stats["filtered_keyword"] += 1
+            if decision.action is not RowAction.KEEP:
                 continue
-
             kept.append(dict(row))
             if len(kept) >= max_items:
                 return True
         return False
 
-    async def _build_dtos(
-        self,
-        client: Any,
-        kept: list[dict[str, Any]],
-        fetch_body: bool,
-    ) -> list[EconomicCollectDto]:
-        if not kept:
-            return []
-
-        sem = asyncio.Semaphore(BODY_FETCH_CONCURRENCY)
-
-        async def body_for(row: dict[str, Any]) -> str:
-            if not fetch_body:
-                return ""
-            url = row.get("url")
-            if not isinstance(url, str):
-                return ""
-            async with sem:
-                try:
-                    html = await async_get_html(client, url, timeout=30.0)
-                except Exception:
-                    logger.exception("[%s] body fetch failed url=%s", self.board.board_key, url)
-                    return ""
-                return self._extract_main_text(html)
-
-        bodies = await asyncio.gather(*[body_for(dict(r)) for r in kept])
-        return [self._to_dto(row, body) for row, body in zip(kept, bodies)]
-
     def _extract_main_text(self, html: str) -> str:
-        soup = BeautifulSoup(html, "html.parser")
-        node = _first_match(soup, _VIEW_CONTENT_SELECTORS) or soup.body or soup
-        text = node.get_text(separator="\n", strip=True)
+        text = select_text(html, _VIEW_CONTENT_SELECTORS)
         text = re.sub(r"[ \t]+", " ", text)
         text = re.sub(r"\n{3,}", "\n\n", text)
         return text[:20000]
@@ -403,6 +372,35 @@ class MfdsBbsCollector:
         )
 
 
+class _MfdsCrawlSpec:
+    """`crawl_board` 플러그인 — 1회 수집 단위(워터마크 고정)."""
+
+    def __init__(self, collector: MfdsBbsCollector, last_seq: int | None, last_url: str | None) -> None:
+        self._c = collector
+        self._last_seq = last_seq
+        self._last_url = last_url
+        self.board_key = collector.board.board_key
+
+    def page_url(self, page: int) -> str:
+        return self._c._page_url(page)
+
+    async def list_rows(self, client: Any, html: str, page: int) -> list[dict[str, Any]]:
+        return parse_mfds_list_rows(html, self._c.board)
+
+    def decide(self, row: dict[str, Any]) -> RowDecision:
+        return self._c._decide(row, self._last_seq, self._last_url)
+
+    def detail_url(self, row: dict[str, Any]) -> str | None:
+        url = row.get("url")
+        return url if isinstance(url, str) else None
+
+    def parse_detail(self, html: str, row: dict[str, Any]) -> str:
+        return self._c._extract_main_text(html)
+
+    def to_dto(self, row: dict[str, Any], body_text: str) -> EconomicCollectDto:
+        return self._c._to_dto(row, body_text)
+
+
 def _with_year(cfg: MfdsBoardConfig, target_year: int | None) -> MfdsBoardConfig:
     if target_year == cfg.target_year:
         return cfg
@@ -0,0 +1,175 @@
+"""기재부 로컬 문서 ingest 매니페스트 (SQLite, 디스크) — 디렉터리 증분 적재.
+
+`MoefLocalPdfCollector` 는 받은 파일을 매번 전부 파싱하고, 중복은 적재 시점에
+``local://moef/<sha1>/...`` URL UNIQUE 로만 걸러졌다. 부서 공유 폴더를 주기적으로 스캔하면
+이미 적재한 수십 개 예산서를 매번 다시 파싱하게 된다.
+
+매니페스트는 ``path → (size, mtime_ns, sha256, row_id)`` 를 기록해:
+
+  - 경로·크기·mtime 이 그대로면 해시도 계산하지 않고 건너뛴다.
+  - 바뀌었거나 처음 보는 경로는 SHA-256 을 구해, 같은 내용이 이미 적재돼 있으면
+    (파일 이동·복사·같은 파일 재업로드) 파싱 없이 stat 만 갱신한다.
+  - 그 외(새 내용)만 파싱 대상.
+
+``row_id`` 는 `raw_economic_data.id` — 호출부가 행 존재를 확인해 삭제(purge)된 행을 가리키는
+항목은 다시 적재한다. 파일은 ``BRONZE_CACHE_DIR/moef/ingest_manifest.sqlite3``.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+from domain.master.hub.services.collectors.economic.common._cache_dir import cache_dir
+from domain.master.hub.services.collectors.economic.common.parsed_doc_cache import file_sha256
+
+logger = logging.getLogger(__name__)
+
+_DB_FILENAME = "ingest_manifest.sqlite3"
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS files (
+        path        TEXT PRIMARY KEY,
+        size_bytes  INTEGER NOT NULL,
+        mtime_ns    INTEGER NOT NULL,
+        sha256      TEXT NOT NULL,
+        row_id      INTEGER,
+        ingested_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS files_sha256 ON files (sha256)",
+)
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    path: Path
+    size_bytes: int
+    mtime_ns: int
+    sha256: str | None = None      # 미변경(stat 일치) 항목은 기록된 값, 새 파일은 계산값
+    row_id: int | None = None
+
+
+@dataclass
+class IngestPlan:
+    """``fresh`` = 파싱·적재 대상, ``known`` = 이미 적재된 내용 (``row_id`` 보유),
+    ``duplicates`` = 같은 배치의 ``fresh`` 와 내용이 같은 파일 (적재 후 같은 ``row_id`` 로 기록)."""
+
+    fresh: list[ManifestEntry] = field(default_factory=list)
+    known: list[ManifestEntry] = field(default_factory=list)
+    duplicates: list[ManifestEntry] = field(default_factory=list)
+    missing: list[Path] = field(default_factory=list)
+
+
+class MoefIngestManifest:
+    def __init__(self, path: Path | None = None) -> None:
+        self._path = path or (cache_dir("moef") / _DB_FILENAME)
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self._path, check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            for ddl in _SCHEMA:
+                conn.execute(ddl)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def plan(
+        self, paths: Iterable[Path], *, known_hashes: Mapping[Path, str] | None = None
+    ) -> IngestPlan:
+        """경로별 stat·해시를 매니페스트와 비교해 파싱 대상을 가른다 (블로킹 — 스레드에서 호출).
+
+        ``known_hashes`` 에 있는 경로는 파일을 다시 읽지 않고 그 SHA-256 을 쓴다 (업로드 시 계산값).
+        """
+        result = IngestPlan()
+        hashes = known_hashes or {}
+        fresh_hashes: set[str] = set()
+        for path in dict.fromkeys(Path(p) for p in paths):
+            try:
+                st = path.stat()
+            except OSError:
+                result.missing.append(path)
+                continue
+            key = str(path.resolve())
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT size_bytes, mtime_ns, sha256, row_id FROM files WHERE path = ?", (key,)
+                ).fetchone()
+            if row and row[0] == st.st_size and row[1] == st.st_mtime_ns and row[3] is not None:
+                result.known.append(ManifestEntry(path, st.st_size, st.st_mtime_ns, row[2], row[3]))
+                continue
+
+            try:
+                sha256 = hashes.get(path) or file_sha256(path)
+            except OSError:
+                result.missing.append(path)
+                continue
+            entry = ManifestEntry(path, st.st_size, st.st_mtime_ns, sha256)
+            with self._lock:
+                same = self._connect().execute(
+                    "SELECT row_id FROM files WHERE sha256 = ? AND row_id IS NOT NULL "
+                    "ORDER BY ingested_at DESC LIMIT 1",
+                    (sha256,),
+                ).fetchone()
+            if same:
+                result.known.append(replace(entry, row_id=same[0]))
+            elif sha256 in fresh_hashes:
+                result.duplicates.append(entry)
+            else:
+                fresh_hashes.add(sha256)
+                result.fresh.append(entry)
+        return result
+
+    def record(self, entries: Iterable[ManifestEntry]) -> int:
+        """적재(또는 재확인)된 항목 기록. ``sha256`` 없는 항목은 무시."""
+        rows = [
+            (str(e.path.resolve()), e.size_bytes, e.mtime_ns, e.sha256, e.row_id)
+            for e in entries
+            if e.sha256
+        ]
+        if not rows:
+            return 0
+        with self._lock:
+            conn = self._connect()
+            conn.executemany(
+                "INSERT OR REPLACE INTO files (path, size_bytes, mtime_ns, sha256, row_id) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+        return len(rows)
+
+
+_DEFAULT_MANIFEST: MoefIngestManifest | None = None
+_default_lock = threading.Lock()
+
+
+def get_moef_manifest() -> MoefIngestManifest:
+    """프로세스 공용 매니페스트 (기본 경로)."""
+    global _DEFAULT_MANIFEST
+    with _default_lock:
+        if _DEFAULT_MANIFEST is None:
+            _DEFAULT_MANIFEST = MoefIngestManifest()
+        return _DEFAULT_MANIFEST
+
+
+__all__ = [
+    "IngestPlan",
+    "ManifestEntry",
+    "MoefIngestManifest",
+    "get_moef_manifest",
+]
@@ -9,6 +9,9 @@
   1) 통합 테스트·파서 회귀 — `backend/scripts/*.pdf` 시드 파일
   2) 운영 배치 — 사용자가 부서 공유 폴더에 떨어뜨린 파일을 cron 으로 적재
   3) 업로드 API — `BackgroundTasks` 가 임시 파일 경로를 본 컬렉터에 위임
+
+경로에 디렉터리를 주면 하위의 지원 포맷 파일 전체로 펼친다 (`expand_paths`).
+이미 적재한 파일 건너뛰기는 `moef_ingest_manifest` 로 호출부(ingest 서비스)가 거른다.
 """
 
 from __future__ import annotations
@@ -16,14 +19,15 @@ from __future__ import annotations
 import hashlib
 import logging
 import re
+import threading
+import time
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from domain.master.hub.services.collectors.economic.common._doc_parsers import (
-    parse_document,
-    supports,
-)
+from domain.master.hub.services.collectors.economic.common._doc_parsers import supports
+from domain.master.hub.services.collectors.economic.common.doc_parse_pool import get_parse_pool
 from domain.master.models.transfer.economic_collect_dto import EconomicCollectDto
 
 logger = logging.getLogger(__name__)
@@ -61,11 +65,15 @@ class MoefLocalPdfCollector:
         raw_title: str | None = None,
         original_filename: str | None = None,
         text_cap: int = _FULL_TEXT_HARD_CAP,
+        content_hashes: dict[Path, str] | None = None,
+        preparsed: dict[Path, dict[str, Any]] | None = None,
     ) -> tuple[list[EconomicCollectDto], dict[str, int]]:
-        """여러 파일을 순차 파싱.
+        """여러 파일을 문서 파싱 프로세스 풀에서 병렬 파싱 (결과는 입력 순서 유지).
+
+        파일마다 완료 순으로 ``[moef-local] progress i/n`` 로그를 남긴다 (대량 배치 진행률).
 
         Args:
-            paths: 파싱 대상 파일 경로.
+            paths: 파싱 대상 파일·디렉터리 경로 (디렉터리는 `expand_paths` 로 펼침).
             source_type: 명시적으로 source_type 강제. None 이면 파일명 규칙 기반 추정.
             published_at: 명시적으로 게시일 부여. None 이면 파일명에서 연도 추정 → 1월 1일.
             source_url: 명시적으로 출처 URL. None 이면 `local://<sha1>` 형식으로 deterministic 생성.
@@ -74,6 +82,9 @@ class MoefLocalPdfCollector:
             original_filename: 업로드 시 보존해야 할 원본 파일명 (단일 파일 시나리오 권장).
                 다중 파일 시나리오에서 사용하면 모든 행이 동일한 제목·메타로 채워지니 주의.
             text_cap: raw_metadata.full_text 길이 컷.
+            content_hashes: 호출부가 이미 구한 파일 SHA-256 — 파싱 캐시 키로 재사용하고
+                ``raw_metadata.content_sha256`` 에 남긴다.
+            preparsed: 호출부가 이미 파싱한 결과 (업로드 잡) — 해당 경로는 파싱 풀을 거치지 않는다.
 
         Returns:
             (dtos, stats) — stats: total / parsed_ok / parse_failed / unsupported.
@@ -86,8 +97,9 @@ class MoefLocalPdfCollector:
         }
         dtos: list[EconomicCollectDto] = []
 
-        for raw_path in paths:
-            path = Path(raw_path)
+        hashes = content_hashes or {}
+        targets: list[Path] = []
+        for path in expand_paths(paths):
             stats["total"] += 1
 
             if not path.exists():
@@ -98,8 +110,19 @@ class MoefLocalPdfCollector:
                 logger.warning("[moef-local] unsupported extension: %s", path)
                 stats["unsupported"] += 1
                 continue
-
-            parsed = parse_document(path)
+            targets.append(path)
+
+        given = preparsed or {}
+        to_parse = [p for p in targets if p not in given]
+        progress = _Progress(len(to_parse), to_parse)
+        parsed_now = get_parse_pool().parse_many_sync(
+            to_parse,
+            sha256s=[hashes.get(p) for p in to_parse],
+            on_result=progress.done,
+        ) if to_parse else []
+        results_by_path = {**dict(zip(to_parse, parsed_now)), **given}
+        for path in targets:
+            parsed = results_by_path[path]
             if parsed.get("error"):
                 stats["parse_failed"] += 1
                 logger.error(
@@ -120,6 +143,8 @@ class MoefLocalPdfCollector:
                 original_filename=original_filename,
                 text_cap=text_cap,
             )
+            if path in hashes:
+                dto.raw_metadata["content_sha256"] = hashes[path]
             dtos.append(dto)
 
         logger.info("[moef-local] collected dtos=%s stats=%s", len(dtos), stats)
@@ -189,6 +214,46 @@ class MoefLocalPdfCollector:
 # ---------------------------------------------------------------------------
 
 
+def expand_paths(paths: Iterable[Path | str]) -> list[Path]:
+    """디렉터리는 하위 지원 포맷 파일(정렬, 숨김 파일 제외)로 펼친다. 파일 경로는 그대로."""
+    out: list[Path] = []
+    for raw in paths:
+        path = Path(raw)
+        if path.is_dir():
+            out.extend(
+                p
+                for p in sorted(path.rglob("*"))
+                if p.is_file() and supports(p) and not p.name.startswith(".")
+            )
+        else:
+            out.append(path)
+    return list(dict.fromkeys(out))
+
+
+class _Progress:
+    """파싱 완료 순 진행 로그 (대기 스레드에서 호출)."""
+
+    def __init__(self, total: int, paths: list[Path]) -> None:
+        self._total = total
+        self._paths = paths
+        self._done = 0
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def done(self, index: int, parsed: dict[str, Any]) -> None:
+        with self._lock:
+            self._done += 1
+            done = self._done
+        logger.info(
+            "[moef-local] progress %d/%d file=%s %s elapsed=%.1fs",
+            done,
+            self._total,
+            self._paths[index].name,
+            "failed" if parsed.get("error") else f"ok chars={parsed.get('full_text_length', 0)}",
+            time.monotonic() - self._started,
+        )
+
+
 def _guess_source_type(filename: str) -> str:
     for pat, stype in _TYPE_RULES:
         if pat.search(filename):
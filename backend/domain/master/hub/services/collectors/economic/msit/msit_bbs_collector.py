@@ -2,7 +2,8 @@
 
 전략:
   - 목록 추출은 `MSITBbsListStrategy` 구현체에 위임 (인라인 JSON / 테이블+div 폴백).
-  - `httpx.AsyncClient` + 제한된 병렬도로 목록·본문 GET.
+  - 페이지 순회·본문 GET 은 공통 엔진(`common/board_crawl.crawl_board`) — 목록/상세 파이프라인,
+    워터마크 페이지에서 중단, 상세 동시성 상한.
   - 워터마크: 정규화 URL 또는 (`ntt_seq_no`, `published_at`) 동시 일치.
 """
 
@@ -18,8 +19,8 @@ from typing import Any, Protocol, runtime_checkable
 from urllib.parse import urlencode
 
 import httpx
-from bs4 import BeautifulSoup
 
+from core.html_parse import select_text
 from domain.master.hub.services.collectors.economic.common._msit_common import (
     BASE_URL,
     _INLINE_SEARCH_DATA_RE,
@@ -34,6 +35,14 @@ from domain.master.hub.services.collectors.economic.common._msit_common import (
     normalize_inline_row,
     today_kst,
 )
+from domain.master.hub.services.collectors.economic.common.board_crawl import (
+    DETAIL_FETCH_CONCURRENCY,
+    KEEP,
+    PREFETCHED_HTML_KEY,
+    RowAction,
+    RowDecision,
+    crawl_board,
+)
 from domain.master.hub.services.collectors.economic.msit.msit_watermark import (
     bbs_row_matches_watermark,
     normalize_msit_url,
@@ -43,8 +52,16 @@ from domain.master.models.transfer.economic_collect_dto import EconomicCollectDt
 
 logger = logging.getLogger(__name__)
 
-LIST_PAGE_CONCURRENCY = 4
-BODY_FETCH_CONCURRENCY = 5
+BODY_FETCH_CONCURRENCY = DETAIL_FETCH_CONCURRENCY
+
+_VIEW_CONTENT_SELECTORS: tuple[str, ...] = (
+    "div.board_view_con",
+    "div.board_view",
+    "div.view_con",
+    "div.view_content",
+    "div.bbs_view",
+    "div.contents",
+)
 
 
 # ---------------------------------------------------------------------------
@@ -223,7 +240,7 @@ class MSITDivFallbackListStrategy:
                     "published_year": year,
                     "raw_date": raw_date,
                     "ntt_seq_no": ntt,
-                    "_prefetched_view_html": vhtml,
+                    PREFETCHED_HTML_KEY: vhtml,
                 }
 
         parts = await asyncio.gather(*[load_one(n) for n in ntt_ids])
@@ -303,233 +320,52 @@ class MsitBbsCollector:
         wm = watermark
         if wm is None and last_seen_url:
             wm = MsitBbsIngestWatermark(source_url=last_seen_url)
-        last_norm = normalize_msit_url(wm.source_url) if wm and wm.source_url else None
-        last_ntt = wm.ntt_seq_no if wm else None
-        last_pub = wm.published_at if wm else None
 
-        strategy = _list_strategy_for(self.board)
         stats = {
             "fetched_total": 0,
             "filtered_year": 0,
             "filtered_keyword": 0,
             "skipped_watermark": 0,
         }
-        kept: list[dict[str, Any]] = []
-
         async with make_async_client() as client:
-            page = 1
-            html_by_page: dict[int, str] = {}
-
-            while page <= max_pages:
-                hi = min(page + LIST_PAGE_CONCURRENCY - 1, max_pages)
-                pages_to_load = [p for p in range(page, hi + 1) if p not in html_by_page]
-                if pages_to_load:
-
-                    async def _load(p: int) -> tuple[int, str]:
-                        u = self._build_page_url(p)
-                        h = await async_get_html(client, u, timeout=30.0)
-                        return p, h
-
-                    for p, h in await asyncio.gather(*[_load(p) for p in pages_to_load]):
-                        html_by_page[p] = h
-
-                list_html = html_by_page.pop(page, "")
-                if not list_html:
-                    break
-
-                logger.info(
-                    "[%s] page=%s url=%s",
-                    self.board.board_key,
-                    page,
-                    self._build_page_url(page),
-                )
-
-                try:
-                    rows, total = await strategy.fetch_list_rows(
-                        client,
-                        self.board,
-                        list_html,
-                        list_url=self._build_page_url(page),
-                    )
-                except Exception:
-                    logger.exception("[%s] list parse/fetch failed page=%s", self.board.board_key, page)
-                    break
-
-                if self.board.use_inline_search_json and page == 1 and total is not None:
-                    logger.info(
-                        "[%s] inline search total=%s (kw=%s)",
-                        self.board.board_key,
-                        total,
-                        self.board.title_keyword,
-                    )
-
-                if not rows:
-                    logger.info("[%s] no list rows on page=%s — stop", self.board.board_key, page)
-                    break
-
-                if self.board.use_inline_search_json:
-                    hit = self._consume_inline_rows(
-                        rows, stats, kept, last_norm, last_ntt, last_pub, max_items
-                    )
-                else:
-                    hit = self._consume_table_like_rows(
-                        rows, stats, kept, last_norm, last_ntt, last_pub, max_items
-                    )
-
-                if hit:
-                    break
-                page += 1
-                await asyncio.sleep(0.35)
-
-            dtos = await self._build_dtos(client, kept, fetch_body)
-
-        logger.info("[%s] collected dtos=%s stats=%s", self.board.board_key, len(dtos), stats)
+            dtos = await crawl_board(
+                _MsitCrawlSpec(self, wm),
+                client,
+                max_pages=max_pages,
+                max_items=max_items,
+                fetch_body=fetch_body,
+                stats=stats,
+            )
         return dtos, stats
 
-    async def _build_dtos(
+    def _decide(
         self,
-        client: httpx.AsyncClient,
-        kept: list[dict[str, Any]],
-        fetch_body: bool,
-    ) -> list[EconomicCollectDto]:
-        if not kept:
-            return []
-
-        sem = asyncio.Semaphore(BODY_FETCH_CONCURRENCY)
-
-        async def body_for(row: dict[str, Any]) -> str:
-            pref = row.get("_prefetched_view_html")
-            if isinstance(pref, str) and pref:
-                return self._extract_main_text_from_html(pref)
-            if not fetch_body:
-                return ""
-            url = row.get("url")
-            if not isinstance(url, str):
-                return ""
-            async with sem:
-                try:
-                    html = await async_get_html(client, url, timeout=30.0)
-                except Exception:
-                    logger.exception("[%s] body fetch failed url=%s", self.board.board_key, url)
-                    return ""
-                return self._extract_main_text_from_html(html)
-
-        bodies = await asyncio.gather(*[body_for(dict(r)) for r in kept])
-        out: list[EconomicCollectDto] = []
-        for row, body_text in zip(kept, bodies):
-            r = dict(row)
-            r.pop("_prefetched_view_html", None)
-            out.append(self._to_dto(r, body_text))
-        return out
-
-    def _consume_inline_rows(
-        self,
-        rows: list[dict[str, Any]],
-        stats: dict[str, int],
-        kept: list[dict[str, Any]],
-        last_norm: str | None,
-        last_ntt: int | None,
-        last_pub: datetime | None,
-        max_items: int,
-    ) -> bool:
-        hit_watermark = False
-        saw_older_year = False
-
-        for row in rows:
-            stats["fetched_total"] += 1
-
-            if bbs_row_matches_watermark(
-                row,
-                last_norm_url=last_norm,
-                last_ntt=last_ntt,
-                last_published_at=last_pub,
-            ):
-                stats["skipped_watermark"] += 1
-                hit_watermark = True
-                break
-
-            year = row.get("published_year")
-            if year is not None and year < self.board.target_year:
-                saw_older_year = True
-                stats["filtered_year"] += 1
-                continue
-
-            if year != self.board.target_year:
-                stats["filtered_year"] += 1
-                continue
-
-            if self.board.title_keyword not in row["title"]:
-                stats["filtered_keyword"] += 1
-                continue
-
-            kept.append(dict(row))
-            if len(kept) >= max_items:
-                hit_watermark = True
-                break
-
-        if saw_older_year and not hit_watermark:
-            hit_watermark = True
-
-        return hit_watermark
-
-    def _consume_table_like_rows(
-        self,
-        rows: list[dict[str, Any]],
-        stats: dict[str, int],
-        kept: list[dict[str, Any]],
+        row: dict[str, Any],
         last_norm: str | None,
         last_ntt: int | None,
         last_pub: datetime | None,
-        max_items: int,
-    ) -> bool:
-        hit_watermark = False
-        for row in rows:
-            stats["fetched_total"] += 1
-
-            if bbs_row_matches_watermark(
-                row,
-                last_norm_url=last_norm,
-                last_ntt=last_ntt,
-                last_published_at=last_pub,
-            ):
-                stats["skipped_watermark"] += 1
-                hit_watermark = True
-                break
-
-            year = row.get("published_year")
-            if year != self.board.target_year:
-                stats["filtered_year"] += 1
-                continue
-
-            if self.board.title_keyword not in row["title"]:
-                stats["filtered_keyword"] += 1
-                continue
-
-            kept.append(dict(row))
-            if len(kept) >= max_items:
-                hit_watermark = True
-                break
-        return hit_watermark
+    ) -> RowDecision:
+        if bbs_row_matches_watermark(
+            row,
+            last_norm_url=last_norm,
+            last_ntt=last_ntt,
+            last_published_at=last_pub,
+        ):
+            return RowDecision(RowAction.STOP, "skipped_watermark")
+
+        year = row.get("published_year")
+        if year != self.board.target_year:
+            # 인라인 검색 결과는 최신순 — 대상 연도보다 오래된 행이 나오면 이 페이지까지만 본다.
+            if self.board.use_inline_search_json and year is not None and year < self.board.target_year:
+                return RowDecision(RowAction.SKIP_LAST_PAGE, "filtered_year")
+            return RowDecision(RowAction.SKIP, "filtered_year")
+
+        if self.board.title_keyword not in row["title"]:
+            return RowDecision(RowAction.SKIP, "filtered_keyword")
+        return KEEP
 
     def _extract_main_text_from_html(self, html: str) -> str:
-        soup = BeautifulSoup(html, "html.parser")
-        candidates = (
-            "div.board_view_con",
-            "div.board_view",
-            "div.view_con",
-            "div.view_content",
-            "div.bbs_view",
-            "div.contents",
-        )
-        node = None
-        for sel in candidates:
-            node = soup.select_one(sel)
-            if node:
-                break
-        if not node:
-            node = soup.body or soup
-
-        text = node.get_text(separator="\n", strip=True)
+        text = select_text(html, _VIEW_CONTENT_SELECTORS)
         text = re.sub(r"[ \t]+", " ", text)
         text = re.sub(r"\n{3,}", "\n\n", text)
         return text[:20000]
@@ -588,6 +424,48 @@ class MsitBbsCollector:
         )
 
 
+class _MsitCrawlSpec:
+    """`crawl_board` 플러그인 — 1회 수집 단위(워터마크 고정)."""
+
+    def __init__(self, collector: MsitBbsCollector, wm: MsitBbsIngestWatermark | None) -> None:
+        self._c = collector
+        self._strategy = _list_strategy_for(collector.board)
+        self._last_norm = normalize_msit_url(wm.source_url) if wm and wm.source_url else None
+        self._last_ntt = wm.ntt_seq_no if wm else None
+        self._last_pub = wm.published_at if wm else None
+        self.board_key = collector.board.board_key
+
+    def page_url(self, page: int) -> str:
+        return self._c._build_page_url(page)
+
+    async def list_rows(self, client: httpx.AsyncClient, html: str, page: int) -> list[dict[str, Any]]:
+        board = self._c.board
+        rows, total = await self._strategy.fetch_list_rows(
+            client, board, html, list_url=self.page_url(page)
+        )
+        if board.use_inline_search_json and page == 1 and total is not None:
+            logger.info(
+                "[%s] inline search total=%s (kw=%s)",
+                board.board_key,
+                total,
+                board.title_keyword,
+            )
+        return rows
+
+    def decide(self, row: dict[str, Any]) -> RowDecision:
+        return self._c._decide(row, self._last_norm, self._last_ntt, self._last_pub)
+
+    def detail_url(self, row: dict[str, Any]) -> str | None:
+        url = row.get("url")
+        return url if isinstance(url, str) else None
+
+    def parse_detail(self, html: str, row: dict[str, Any]) -> str:
+        return self._c._extract_main_text_from_html(html)
+
+    def to_dto(self, row: dict[str, Any], body_text: str) -> EconomicCollectDto:
+        return self._c._to_dto(row, body_text)
+
+
 def _with_year(cfg: BoardConfig, target_year: int | None) -> BoardConfig:
     if target_year is None or target_year == cfg.target_year:
         return cfg
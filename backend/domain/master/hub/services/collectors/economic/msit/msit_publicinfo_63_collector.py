@@ -6,13 +6,15 @@
   3) 상세 페이지 `publicinfo/view.do?referKey={295,N}&...` 진입
   4) `<ul class="down_file">` 에서 `.hwpx` 첨부 1순위 선택
   5) POST `/ssm/file/fileDown.do` 로 다운로드 (Referer = 상세 URL)
-  6) Content-Disposition 의 파일명으로 임시 저장 → `_doc_parsers.parse_hwpx()`
+  6) 청크 스트리밍 + SHA-256 동시 계산 → `<sha256><ext>` 로 임시 저장 (크기 상한)
+     → 같은 해시는 한 번만 파싱 (`doc_parse_pool`) → 실행 종료 시 임시 파일 삭제
   7) `full_text` 를 `raw_metadata.full_text` 에 보존하고 DTO 생성
 
 설계 노트:
   - MSIT 사이트 마크업은 흔히 개편되므로 핵심 셀렉터/파라미터 추출 부분에 다중 폴백을 둔다.
   - HWPX 우선, 없으면 `.hwp` → `.pdf` 순으로 폴백 (파서가 지원하는 포맷에 한해서만 다운로드).
   - 워터마크: `last_seen_list_seq_no` (`publictListSeqNo` 정수) 이하는 스킵.
+  - 첨부 상한 ``ATTACHMENT_MAX_BYTES`` (Content-Length 로 사전 차단, 스트리밍 중 초과 시 중단).
 """
 
 from __future__ import annotations
@@ -30,9 +32,15 @@ from urllib.parse import urlencode, urljoin
 import httpx
 from bs4 import BeautifulSoup, Tag
 
-from domain.master.hub.services.collectors.economic.common._doc_parsers import (
-    parse_document,
+from core.html_parse import make_soup
+from domain.master.hub.services.collectors.economic.common.content_store import (
+    FileTooLargeError,
+    StoredFile,
+    gc_directory,
+    remove_files,
+    store_stream,
 )
+from domain.master.hub.services.collectors.economic.common.doc_parse_pool import get_parse_pool
 from domain.master.hub.services.collectors.economic.common._msit_common import (
     BASE_URL,
     DEFAULT_HEADERS,
@@ -59,6 +67,12 @@ LIST_URL_BUDGET = (
 )
 DOWNLOAD_URL = f"{BASE_URL}/ssm/file/fileDown.do"
 
+# 예산서 HWPX/PDF 는 수~수십 MB — 그 이상은 비정상 응답으로 본다
+ATTACHMENT_MAX_BYTES = 200 * 1024 * 1024
+_DOWNLOAD_CHUNK_BYTES = 64 * 1024
+# 중단된 이전 실행이 남긴 임시 파일 정리 기준
+_STALE_TMP_SECONDS = 6 * 3600
+
 
 _PREFERRED_EXT_ORDER = (".hwpx", ".pdf", ".xlsx", ".xls", ".hwp")
 
@@ -122,6 +136,8 @@ class MsitPublicInfo63Collector:
             "skipped_watermark": 0,
             "no_attachment": 0,
             "download_failed": 0,
+            "download_too_large": 0,
+            "duplicate_attachment": 0,
             "parsed_ok": 0,
         }
         kept_rows: list[_ListRow] = []
@@ -161,8 +177,22 @@ class MsitPublicInfo63Collector:
 
             tmp_dir = Path(tempfile.gettempdir()) / "msit_publicinfo_63"
             tmp_dir.mkdir(parents=True, exist_ok=True)
+            gc_directory(tmp_dir, older_than_seconds=_STALE_TMP_SECONDS)
 
             sem = asyncio.Semaphore(4)
+            # sha256 → 파싱 태스크. 여러 행이 같은 첨부를 가리키면 한 번만 파싱한다.
+            parse_tasks: dict[str, asyncio.Task[dict[str, Any]]] = {}
+            stored_paths: list[Path] = []
+
+            async def parse_stored(stored: StoredFile) -> dict[str, Any]:
+                try:
+                    # CPU 바운드 파싱은 프로세스 풀로 — 이벤트 루프·GIL 비점유, 문서별 타임아웃
+                    return await get_parse_pool().parse(stored.path, sha256=stored.sha256)
+                except Exception as exc:
+                    logger.exception(
+                        "[%s] attachment parse failed path=%s", BOARD_KEY, stored.path
+                    )
+                    return {"error": str(exc)}
 
             async def process_row(
                 row: _ListRow,
@@ -182,45 +212,45 @@ class MsitPublicInfo63Collector:
                         part["no_attachment"] = 1
                         return self._to_dto(row, attach=None, parsed=None), part
 
-                    local_path = await self._download_attachment(
-                        client,
-                        attach=attach,
-                        referer=row.view_url,
-                        tmp_dir=tmp_dir,
-                    )
-                    if not local_path:
-                        part["download_failed"] = 1
-                        return self._to_dto(row, attach=attach, parsed=None), part
-
                     try:
-                        parsed = await asyncio.to_thread(parse_document, local_path)
-                    except Exception as exc:
-                        logger.exception(
-                            "[%s] attachment parse failed path=%s",
-                            BOARD_KEY,
-                            local_path,
+                        stored = await self._download_attachment(
+                            client,
+                            attach=attach,
+                            referer=row.view_url,
+                            tmp_dir=tmp_dir,
                         )
-                        parsed = {"error": str(exc)}
-                    finally:
-                        try:
-                            local_path.unlink(missing_ok=True)
-                        except OSError:
-                            logger.warning(
-                                "[%s] temporary attachment cleanup failed path=%s",
-                                BOARD_KEY,
-                                local_path,
-                            )
-                    if not parsed.get("error"):
-                        part["parsed_ok"] = 1
-                    return self._to_dto(row, attach=attach, parsed=parsed), part
+                    except FileTooLargeError as exc:
+                        logger.warning("[%s] attachment skipped: %s url=%s", BOARD_KEY, exc, row.view_url)
+                        part["download_too_large"] = 1
+                        return self._to_dto(row, attach=attach, parsed=None), part
+                    if not stored:
+                        part["download_failed"] = 1
+                        return self._to_dto(row, attach=attach, parsed=None), part
+                    stored_paths.append(stored.path)
+
+                # 파싱 대기는 세마포어 밖에서 — 다운로드 슬롯을 붙잡지 않는다
+                task = parse_tasks.get(stored.sha256)
+                if task is None:
+                    task = parse_tasks[stored.sha256] = asyncio.create_task(parse_stored(stored))
+                else:
+                    part["duplicate_attachment"] = 1
+                parsed = await asyncio.shield(task)
+                if not parsed.get("error"):
+                    part["parsed_ok"] = 1
+                return self._to_dto(row, attach=attach, parsed=parsed, stored=stored), part
 
             dtos: list[EconomicCollectDto] = []
-            for dto, part in await asyncio.gather(
-                *[process_row(r) for r in kept_rows]
-            ):
-                dtos.append(dto)
-                for k, v in part.items():
-                    stats[k] += v
+            try:
+                for dto, part in await asyncio.gather(
+                    *[process_row(r) for r in kept_rows]
+                ):
+                    dtos.append(dto)
+                    for k, v in part.items():
+                        stats[k] += v
+            finally:
+                for task in parse_tasks.values():
+                    task.cancel()
+                remove_files(stored_paths)
 
         logger.info("[%s] collected dtos=%s stats=%s", BOARD_KEY, len(dtos), stats)
         return dtos, stats
@@ -251,7 +281,7 @@ class MsitPublicInfo63Collector:
 
         레거시 `<table>/<tbody>/<tr>` 구조도 호환 유지(첨부 폴백).
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         rows: list[_ListRow] = []
         seen_seq: set[int] = set()
 
@@ -386,7 +416,7 @@ class MsitPublicInfo63Collector:
 
     def _pick_preferred_attachment(self, view_html: str) -> _Attachment | None:
         """`<ul class="down_file">` 의 li 중 우선순위 확장자를 선택."""
-        soup = BeautifulSoup(view_html, "html.parser")
+        soup = make_soup(view_html)
         ul = soup.select_one("ul.down_file") or soup.select_one("ul.attach_list")
         if not ul:
             # 폴백: 전체 페이지에서 onclick="fnFileDown(...)" 패턴 찾기
@@ -423,7 +453,11 @@ class MsitPublicInfo63Collector:
         attach: _Attachment,
         referer: str,
         tmp_dir: Path,
-    ) -> Path | None:
+    ) -> StoredFile | None:
+        """첨부를 ``tmp_dir/<sha256><ext>`` 로 스트리밍 저장.
+
+        상한 초과는 `FileTooLargeError` 로 올리고, 그 외 실패는 로그 후 None.
+        """
         headers = {
             **DEFAULT_HEADERS,
             "Content-Type": "application/x-www-form-urlencoded",
@@ -449,16 +483,23 @@ class MsitPublicInfo63Collector:
                     or f"msit_{int(time.time())}{attach.ext or '.bin'}"
                 )
                 filename = _sanitize_filename(filename)
-                local_path = tmp_dir / filename
+                declared = resp.headers.get("Content-Length")
+                if declared and declared.isdigit() and int(declared) > ATTACHMENT_MAX_BYTES:
+                    raise FileTooLargeError(ATTACHMENT_MAX_BYTES, int(declared))
                 try:
-                    with local_path.open("wb") as f:
-                        async for chunk in resp.aiter_bytes(chunk_size=64 * 1024):
-                            if chunk:
-                                f.write(chunk)
+                    return await store_stream(
+                        resp.aiter_bytes(chunk_size=_DOWNLOAD_CHUNK_BYTES),
+                        tmp_dir,
+                        suffix=_extension_of(filename) or attach.ext,
+                        max_bytes=ATTACHMENT_MAX_BYTES,
+                    )
+                except (FileTooLargeError, httpx.HTTPError):
+                    raise
                 except Exception:
                     logger.exception("[%s] write local file failed", BOARD_KEY)
                     return None
-                return local_path
+        except FileTooLargeError:
+            raise
         except Exception:
             logger.exception(
                 "[%s] download POST failed payload=%s",
@@ -475,6 +516,7 @@ class MsitPublicInfo63Collector:
         *,
         attach: _Attachment | None,
         parsed: dict[str, Any] | None,
+        stored: StoredFile | None = None,
     ) -> EconomicCollectDto:
         raw_metadata: dict[str, Any] = {
             "board_key": BOARD_KEY,
@@ -492,6 +534,9 @@ class MsitPublicInfo63Collector:
                 "filename": attach.filename,
                 "ext": attach.ext,
             }
+            if stored:
+                raw_metadata["attachment"]["sha256"] = stored.sha256
+                raw_metadata["attachment"]["size_bytes"] = stored.size_bytes
         if parsed:
             # `full_text` 가 너무 크면 적재량 폭주 → 30KB 컷 (Silver 가 chunking)
             full_text = parsed.get("full_text") or ""
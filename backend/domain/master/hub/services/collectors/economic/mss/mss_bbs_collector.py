@@ -8,6 +8,8 @@ watermark: 마지막으로 수집한 bcIdx (내림차순 — 높을수록 최신
   - 1차 실행: max_items 개수만큼 수집 후 최대 bcIdx 저장
   - 이후 실행: 저장된 bcIdx 이하가 나오면 중단
 
+페이지 순회·상세 본문(선택) 동시성은 공통 엔진(`common/board_crawl.crawl_board`)이 담당.
+
 금액 추출: 제목에서 억원·만원 등 한국어 금액 파싱 (parse_krw_amount 재사용)
 """
 
@@ -19,9 +21,14 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-import aiohttp
-from bs4 import BeautifulSoup
-
+from core.html_parse import make_soup, select_text
+from domain.master.hub.services.collectors.economic.common._msit_common import make_async_client
+from domain.master.hub.services.collectors.economic.common.board_crawl import (
+    KEEP,
+    RowAction,
+    RowDecision,
+    crawl_board,
+)
 from domain.master.models.transfer.economic_collect_dto import EconomicCollectDto
 from domain.master.hub.services.collectors.economic.subsidy24.subsidy24_collector import (
     parse_krw_amount,
@@ -46,6 +53,14 @@ _HEADERS = {
 
 _BC_IDX_RE = re.compile(r"doBbsFView\('86','(\d+)'")
 
+_VIEW_CONTENT_SELECTORS: tuple[str, ...] = (
+    "div.view_cont",
+    "div.bbs_view",
+    "div.board_view",
+    "div.view_con",
+    "div.contents",
+)
+
 
 @dataclass(frozen=True)
 class MssWatermark:
@@ -63,9 +78,13 @@ def _parse_date(date_str: str | None) -> datetime | None:
     return None
 
 
+def _view_url(bc_idx: int) -> str:
+    return f"{_BASE_VIEW_URL}?cbIdx={_CB_IDX}&bcIdx={bc_idx}"
+
+
 def _parse_list_page(html: str) -> list[dict[str, Any]]:
     """BBS 목록 HTML → 보도자료 항목 리스트."""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     result: list[dict[str, Any]] = []
     for row in soup.select("table tbody tr"):
         tds = row.find_all("td")
@@ -97,12 +116,16 @@ class MssBbsCollector:
         self,
         *,
         max_items: int = 200,
+        max_pages: int = 20,
+        fetch_body: bool = False,
         watermark: MssWatermark | None = None,
     ) -> tuple[list[EconomicCollectDto], dict[str, int]]:
         """보도자료 수집.
 
         Args:
             max_items: 최대 수집 건수 (기본 200).
+            max_pages: 목록 페이지 상한 (페이지당 10건).
+            fetch_body: 상세(View.do) 본문 수집 여부.
             watermark: 이전 실행 워터마크 — bc_idx 이하 항목은 skip.
 
         Returns:
@@ -114,56 +137,42 @@ class MssBbsCollector:
             "skipped_watermark": 0,
             "converted": 0,
         }
-        prev_bc_idx = watermark.bc_idx if watermark else None
-        items: list[dict[str, Any]] = []
-        stop = False
-
-        timeout = aiohttp.ClientTimeout(total=15)
-        async with aiohttp.ClientSession(headers=_HEADERS) as session:
-            page_no = 1
-            while not stop and len(items) < max_items:
-                url = f"{_BASE_LIST_URL}?cbIdx={_CB_IDX}&nPage={page_no}"
-                try:
-                    async with session.get(url, timeout=timeout) as r:
-                        html = await r.text(encoding="utf-8", errors="ignore")
-                except Exception as exc:
-                    logger.warning("[mss_bbs] 목록 페이지 %s 오류: %s", page_no, exc)
-                    break
-
-                page_items = _parse_list_page(html)
-                stats["pages_fetched"] += 1
-
-                if not page_items:
-                    break
-
-                for item in page_items:
-                    stats["fetched_total"] += 1
-                    if prev_bc_idx is not None and item["bc_idx"] <= prev_bc_idx:
-                        stats["skipped_watermark"] += 1
-                        stop = True
-                        break
-                    items.append(item)
-                    if len(items) >= max_items:
-                        break
-
-                page_no += 1
-
-        dtos = [self._to_dto(item) for item in items]
+        spec = _MssCrawlSpec(watermark.bc_idx if watermark else None)
+        async with make_async_client(headers=dict(_HEADERS)) as client:
+            dtos = await crawl_board(
+                spec,
+                client,
+                max_pages=max_pages,
+                max_items=max_items,
+                fetch_body=fetch_body,
+                stats=stats,
+            )
         stats["converted"] = len(dtos)
-        logger.info("[mss_bbs] pages=%s fetched=%s dtos=%s", stats["pages_fetched"], stats["fetched_total"], len(dtos))
         return dtos, stats
 
     @staticmethod
-    def _to_dto(item: dict[str, Any]) -> EconomicCollectDto:
+    def _to_dto(item: dict[str, Any], body_text: str = "") -> EconomicCollectDto:
         bc_idx: int = item["bc_idx"]
         title: str = item["title"]
         dept: str = item.get("dept") or ""
         date_str: str = item.get("date_str") or ""
 
-        source_url = f"{_BASE_VIEW_URL}?cbIdx={_CB_IDX}&bcIdx={bc_idx}"
+        source_url = _view_url(bc_idx)
         pub_at = _parse_date(date_str)
         amount = parse_krw_amount(title)
 
+        raw_metadata: dict[str, Any] = {
+            "bc_idx": bc_idx,
+            "dept": dept,
+            "date_raw": date_str,
+            "data_role": "POLICY_SIGNAL",
+            "industry_sector": "SME_STARTUP",
+            "collected_via": "mss-bbs-scraper",
+        }
+        if body_text:
+            raw_metadata["body_text"] = body_text
+            raw_metadata["body_text_length"] = len(body_text)
+
         return EconomicCollectDto(
             source_type=_SOURCE_TYPE,
             source_url=source_url,
@@ -172,16 +181,41 @@ class MssBbsCollector:
             target_company_or_fund=None,
             investment_amount=amount,
             currency="KRW",
-            raw_metadata={
-                "bc_idx": bc_idx,
-                "dept": dept,
-                "date_raw": date_str,
-                "data_role": "POLICY_SIGNAL",
-                "industry_sector": "SME_STARTUP",
-                "collected_via": "mss-bbs-scraper",
-            },
+            raw_metadata=raw_metadata,
             published_at=pub_at,
         )
 
 
+class _MssCrawlSpec:
+    """`crawl_board` 플러그인 — bcIdx 내림차순 목록, 워터마크 이하 도달 시 중단."""
+
+    board_key = "mss_bbs"
+
+    def __init__(self, prev_bc_idx: int | None) -> None:
+        self._prev_bc_idx = prev_bc_idx
+
+    def page_url(self, page: int) -> str:
+        return f"{_BASE_LIST_URL}?cbIdx={_CB_IDX}&nPage={page}"
+
+    async def list_rows(self, client: Any, html: str, page: int) -> list[dict[str, Any]]:
+        return _parse_list_page(html)
+
+    def decide(self, row: dict[str, Any]) -> RowDecision:
+        if self._prev_bc_idx is not None and row["bc_idx"] <= self._prev_bc_idx:
+            return RowDecision(RowAction.STOP, "skipped_watermark")
+        return KEEP
+
+    def detail_url(self, row: dict[str, Any]) -> str | None:
+        return _view_url(row["bc_idx"])
+
+    def parse_detail(self, html: str, row: dict[str, Any]) -> str:
+        text = select_text(html, _VIEW_CONTENT_SELECTORS)
+        text = re.sub(r"[ \t]+", " ", text)
+        text = re.sub(r"\n{3,}", "\n\n", text)
+        return text[:20000]
+
+    def to_dto(self, row: dict[str, Any], body_text: str) -> EconomicCollectDto:
+        return MssBbsCollector._to_dto(row, body_text)
+
+
 __all__ = ["MssBbsCollector", "MssWatermark", "_parse_list_page", "_parse_date"]
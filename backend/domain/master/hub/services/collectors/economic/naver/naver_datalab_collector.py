@@ -25,6 +25,7 @@ from typing import Any
 
 import aiohttp
 
+from core.api_quota import aiohttp_quota_trace
 from domain.master.models.transfer.economic_collect_dto import EconomicCollectDto
 
 logger = logging.getLogger(__name__)
@@ -111,7 +112,7 @@ class NaverDatalabCollector:
         }
         timeout = aiohttp.ClientTimeout(total=15)
 
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(trace_configs=[aiohttp_quota_trace("naver_datalab")]) as session:
             # 5그룹씩 배치 요청
             groups = _DATALAB_KEYWORD_GROUPS
             for batch_start in range(0, len(groups), _BATCH_SIZE):
@@ -25,6 +25,7 @@ from urllib.parse import quote
 
 import aiohttp
 
+from core.api_quota import aiohttp_quota_trace
 from domain.master.models.transfer.economic_collect_dto import EconomicCollectDto
 
 logger = logging.getLogger(__name__)
@@ -114,7 +115,7 @@ class NaverSearchCollector:
         timeout = aiohttp.ClientTimeout(total=10)
         all_dtos: list[EconomicCollectDto] = []
 
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(trace_configs=[aiohttp_quota_trace("naver_search")]) as session:
             for group_name, keywords in _NEWS_KEYWORD_GROUPS:
                 for keyword in keywords:
                     params: dict[str, Any] = {
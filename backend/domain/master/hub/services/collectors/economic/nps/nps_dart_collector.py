@@ -19,6 +19,7 @@ from typing import Any
 
 import aiohttp
 
+from core.api_quota import aiohttp_quota_trace
 from domain.master.models.transfer.economic_collect_dto import EconomicCollectDto
 
 logger = logging.getLogger(__name__)
@@ -87,7 +88,7 @@ class NpsDartCollector:
         items: list[dict[str, Any]] = []
 
         timeout = aiohttp.ClientTimeout(total=20)
-        async with aiohttp.ClientSession() as session:
+        async with aiohttp.ClientSession(trace_configs=[aiohttp_quota_trace("dart")]) as session:
             for page in range(1, max_pages + 1):
                 params = {
                     "crtfc_key": self._key,
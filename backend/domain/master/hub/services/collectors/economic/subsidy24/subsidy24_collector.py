@@ -19,6 +19,7 @@ from typing import Any
 
 import aiohttp
 
+from core.api_quota import aiohttp_quota_trace
 from domain.master.models.transfer.economic_collect_dto import EconomicCollectDto
 
 logger = logging.getLogger(__name__)
@@ -130,7 +131,7 @@ class Subsidy24Collector:
         timeout = aiohttp.ClientTimeout(total=30)
         page = 1
 
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with aiohttp.ClientSession(timeout=timeout, trace_configs=[aiohttp_quota_trace("subsidy24")]) as session:
             while len(kept) < max_items:
                 params: dict[str, Any] = {
                     "page": page,
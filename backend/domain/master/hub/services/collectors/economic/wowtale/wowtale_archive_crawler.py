@@ -9,8 +9,11 @@ RSS는 최근 50건만 제공한다. 1년치 이상 과거 데이터가 필요
     Global-news      → raw_economic_data  (해외 투자, 필터 적용)
 
 설계 원칙:
-    - 동기 HTTP(httpx.Client) + asyncio.to_thread  → 기존 rss_wordpress_sync 패턴 통일
-    - 1초 sleep (페이지 간), 0.5초 (기사 상세 간)  → 서버 부하 방지
+    - 비동기 HTTP(공유 httpx.AsyncClient). 카테고리는 동시에 순회하고, 페이지 안의 기사 상세는
+      동시에 받는다 — 서버 부하는 **호스트 단위 예산**(`HostRateBudget`: 동시 요청 수 +
+      요청 간 최소 간격)으로 제한한다. 카테고리가 늘어도 wowtale.net 에 가는 총량은 같다.
+    - 페이지마다 ``on_page`` (적재) → 체크포인트(카테고리, 페이지, 마지막 URL) 기록.
+      중단된 Backfill 은 같은 인자로 다시 실행하면 다음 페이지부터 이어간다.
     - source_url UNIQUE 제약 기반 중복 제거 → Repository 단 ON CONFLICT DO NOTHING
     - from_date 컷오프: URL 경로의 날짜(/YYYY/MM/DD/)로 조기 중단 판단
 """
@@ -20,17 +23,23 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
-import time as _time_module
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Final, Sequence
+from typing import Any, Final, Sequence
 
 import httpx
-from bs4 import BeautifulSoup
 
-from domain.master.hub.services.collectors.economic.common._rss_investment_krw import (
-    extract_investment_amount_krw,
+from core.html_parse import make_soup
+from domain.master.hub.services.collectors.economic.common.crawl_checkpoint import (
+    CrawlCheckpointStore,
+    get_crawl_checkpoints,
 )
+from domain.master.hub.services.collectors.economic.common.financial_entities import (
+    extract as extract_entities,
+    title_first_token,
+)
+from domain.master.hub.services.collectors.economic.common.host_rate_budget import HostRateBudget
 from domain.master.hub.services.collectors.economic.common.rss_wordpress_sync import (
     wordpress_main_text,
 )
@@ -45,6 +54,14 @@ logger = logging.getLogger(__name__)
 _KST: Final = timezone(timedelta(hours=9))
 _BASE_URL: Final = "https://wowtale.net"
 
+# wowtale.net 요청 예산 (카테고리·상세 전체 공유): 초당 최대 4회, 동시 4개
+ARCHIVE_MIN_INTERVAL_SECONDS: Final = 0.25
+ARCHIVE_HOST_CONCURRENCY: Final = 4
+CHECKPOINT_SCOPE: Final = "wowtale_archive"
+
+# 페이지 적재 콜백: (카테고리 slug, 그 페이지의 DTO 목록)
+PageSink = Callable[[str, list[EconomicCollectDto]], Awaitable[Any]]
+
 # 카테고리 slug → source_type 고정값 (None 이면 제목 기반 자동 분류)
 _CATEGORY_SOURCE_TYPE: dict[str, str | None] = {
     "funding": None,            # 제목 기반: WOWTALE_MA / IPO / FUND / INVEST
@@ -103,22 +120,58 @@ def _parse_date_from_url(url: str) -> datetime | None:
         return None
 
 
-def _fetch_html(url: str, *, timeout: float = 25.0) -> str:
-    """동기 HTTP GET. 실패 시 빈 문자열 반환."""
+async def _fetch_html(
+    client: httpx.AsyncClient,
+    url: str,
+    *,
+    budget: HostRateBudget | None = None,
+    timeout: float = 25.0,
+) -> str:
+    """비동기 GET (호스트 예산 안에서). 실패 시 빈 문자열 반환."""
     try:
-        with httpx.Client(
-            timeout=timeout,
-            follow_redirects=True,
-            headers=_HEADERS,
-        ) as client:
-            resp = client.get(url)
-            resp.raise_for_status()
-            return resp.text
+        if budget is None:
+            resp = await client.get(url, timeout=timeout)
+        else:
+            async with budget.slot(url):
+                resp = await client.get(url, timeout=timeout)
+        resp.raise_for_status()
+        return resp.text
     except Exception:
         logger.warning("Wowtale archive fetch 실패: %s", url, exc_info=False)
         return ""
 
 
+def make_archive_client(**kwargs: Any) -> httpx.AsyncClient:
+    kw: dict[str, Any] = {
+        "headers": dict(_HEADERS),
+        "follow_redirects": True,
+        "timeout": httpx.Timeout(25.0),
+    }
+    kw.update(kwargs)
+    return httpx.AsyncClient(**kw)
+
+
+def _category_page_url(category_slug: str, page_num: int) -> str:
+    if page_num == 1:
+        return f"{_BASE_URL}/category/{category_slug}/"
+    return f"{_BASE_URL}/category/{category_slug}/page/{page_num}/"
+
+
+def _checkpoint_key(
+    category_slug: str,
+    *,
+    from_date: datetime | None,
+    apply_investment_filter: bool,
+    fetch_article_body: bool,
+) -> str:
+    """결과에 영향을 주는 인자가 같아야 같은 Backfill 로 보고 재개한다."""
+    cutoff = from_date.date().isoformat() if from_date else "-"
+    return (
+        f"{category_slug}|from={cutoff}"
+        f"|filter={int(apply_investment_filter)}|body={int(fetch_article_body)}"
+    )
+
+
 def _parse_archive_page(
     html: str,
     category_slug: str,
@@ -133,7 +186,7 @@ def _parse_archive_page(
     if not html:
         return [], False
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
 
     articles = (
         soup.select("article.post")
@@ -181,7 +234,7 @@ def _parse_article_page(html: str) -> tuple[datetime | None, str]:
     if not html:
         return None, ""
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
 
     published_at: datetime | None = None
     for sel in (
@@ -208,17 +261,6 @@ def _parse_article_page(html: str) -> tuple[datetime | None, str]:
     return published_at, body_text
 
 
-def _extract_investor_from_title(title: str) -> str | None:
-    """제목에서 투자사 간단 추출 (wowtale_collector 의 인스턴스 메서드와 동일 로직)."""
-    m = re.match(r"^([^,·]+)", title)
-    if not m:
-        return None
-    candidate = m.group(1).strip()
-    if not candidate or len(candidate) >= 50:
-        return None
-    return candidate[:255]
-
-
 # ---------------------------------------------------------------------------
 # 크롤러 클래스
 # ---------------------------------------------------------------------------
@@ -228,13 +270,14 @@ class WowtaleArchiveCrawler:
     """Wowtale 카테고리 아카이브 페이지를 순회하는 Backfill 전용 크롤러.
 
     RSS 수집기(WowtaleEconomicCollector)가 최근 50건만 제공하는 한계를 보완한다.
-    각 카테고리 아카이브 페이지를 순서대로 GET하며 기사 URL을 수집하고,
-    선택적으로 기사 상세 페이지를 방문해 본문·정확한 날짜를 추출한다.
+    카테고리 아카이브 페이지를 GET하며 기사 URL을 수집하고, 선택적으로 기사 상세 페이지를
+    방문해 본문·정확한 날짜를 추출한다. 카테고리끼리, 한 페이지의 상세끼리 동시에 진행하되
+    모든 요청은 하나의 호스트 예산을 공유한다.
 
     사용 예::
 
         crawler = WowtaleArchiveCrawler()
-        dtos = await crawler.crawl_all(max_pages=50, from_date=one_year_ago)
+        dtos = await crawler.crawl_all(max_pages=50, from_date=one_year_ago, on_page=insert)
     """
 
     # (카테고리 slug, 투자 노이즈 필터 적용 여부)
@@ -247,15 +290,33 @@ class WowtaleArchiveCrawler:
     def __init__(
         self,
         *,
-        sleep_sec: float = 1.0,
-        article_sleep_sec: float = 0.5,
+        sleep_sec: float = ARCHIVE_MIN_INTERVAL_SECONDS,
+        max_concurrency: int = ARCHIVE_HOST_CONCURRENCY,
         fetch_article_body: bool = True,
         request_timeout: float = 25.0,
+        checkpoints: CrawlCheckpointStore | None = None,
+        resume: bool = True,
     ) -> None:
-        self._sleep_sec = sleep_sec
-        self._article_sleep_sec = article_sleep_sec
+        """
+        Args:
+            sleep_sec: 같은 호스트 요청 시작 간 최소 간격(초) — 카테고리·상세 요청 전체에 적용.
+            max_concurrency: 같은 호스트 동시 요청 수 상한.
+            checkpoints: 체크포인트 저장소 (기본: 프로세스 공용 `get_crawl_checkpoints()`).
+            resume: False 면 체크포인트를 무시하고 1페이지부터 (진행 기록은 새로 남긴다).
+        """
+        self._budget = HostRateBudget(min_interval=sleep_sec, max_concurrency=max_concurrency)
         self._fetch_article_body = fetch_article_body
         self._timeout = request_timeout
+        self._checkpoints = checkpoints
+        self._resume = resume
+        # 카테고리별 진행 요약 (마지막 실행) — 적재 결과 리포트용
+        self.stats: dict[str, dict[str, Any]] = {}
+
+    @property
+    def checkpoints(self) -> CrawlCheckpointStore:
+        if self._checkpoints is None:
+            self._checkpoints = get_crawl_checkpoints()
+        return self._checkpoints
 
     # ------------------------------------------------------------------
     # Public API
@@ -269,27 +330,35 @@ class WowtaleArchiveCrawler:
         from_date: datetime | None = None,
         apply_investment_filter: bool = False,
         known_urls: set[str] | None = None,
+        on_page: PageSink | None = None,
+        client: httpx.AsyncClient | None = None,
     ) -> list[EconomicCollectDto]:
-        """단일 카테고리 아카이브 전체 순회.
+        """단일 카테고리 아카이브 순회 (체크포인트가 있으면 이어서).
 
         Args:
             category_slug: 'funding', 'venture-capital' 등 WordPress 카테고리 slug.
-            max_pages: 최대 순회 페이지 수 (페이지당 약 20건).
+            max_pages: 최대 페이지 번호 (페이지당 약 20건). 재개 시에도 같은 상한.
             from_date: 이 날짜 이전 기사는 수집 중단. None이면 max_pages까지 순회.
             apply_investment_filter: True면 _is_investment_relevant 필터 적용.
-            known_urls: 이미 DB에 있는 URL 집합. 포함된 URL은 상세 크롤링 스킵.
+            known_urls: 이미 DB에 있는(또는 다른 카테고리가 가져간) URL 집합 — 상세 크롤링 스킵.
+                        전달한 set 에 이번에 수집한 URL 이 추가된다.
+            on_page: 페이지마다 DTO 를 넘겨 받는 비동기 콜백 (적재). 끝나야 체크포인트가 기록된다.
+            client: 공유 클라이언트 (없으면 이 호출 동안 새로 만든다).
 
         Returns:
-            수집된 EconomicCollectDto 리스트.
+            이번 실행에서 수집된 EconomicCollectDto 리스트.
         """
-        return await asyncio.to_thread(
-            self._crawl_category_sync,
-            category_slug,
-            max_pages=max_pages,
-            from_date=from_date,
-            apply_investment_filter=apply_investment_filter,
-            known_urls=set(known_urls or set()),
-        )
+        seen = known_urls if known_urls is not None else set()
+        if client is not None:
+            return await self._crawl_category(
+                client, category_slug, max_pages=max_pages, from_date=from_date,
+                apply_investment_filter=apply_investment_filter, known_urls=seen, on_page=on_page,
+            )
+        async with make_archive_client(timeout=httpx.Timeout(self._timeout)) as own:
+            return await self._crawl_category(
+                own, category_slug, max_pages=max_pages, from_date=from_date,
+                apply_investment_filter=apply_investment_filter, known_urls=seen, on_page=on_page,
+            )
 
     async def crawl_all(
         self,
@@ -298,120 +367,190 @@ class WowtaleArchiveCrawler:
         max_pages: int = 50,
         from_date: datetime | None = None,
         known_urls: set[str] | None = None,
+        on_page: PageSink | None = None,
     ) -> list[EconomicCollectDto]:
-        """기본(또는 지정) 카테고리를 순차적으로 순회.
+        """기본(또는 지정) 카테고리를 동시에 순회 — 결과는 카테고리 순서대로 합친다.
 
-        카테고리 간에는 sleep_sec * 2 를 추가로 대기한다.
+        한 카테고리의 실패는 로깅만 하고 나머지는 계속한다 (체크포인트가 남아 다음 실행에서 재개).
         """
         targets = list(categories or self.DEFAULT_CATEGORIES)
-        all_dtos: list[EconomicCollectDto] = []
         seen: set[str] = set(known_urls or set())
 
-        for slug, apply_filter in targets:
-            logger.info("Wowtale archive: 카테고리 '%s' 시작", slug)
-            try:
-                dtos = await self.crawl_category(
-                    slug,
-                    max_pages=max_pages,
-                    from_date=from_date,
-                    apply_investment_filter=apply_filter,
-                    known_urls=seen,
-                )
-            except Exception:
-                logger.exception("Wowtale archive: 카테고리 '%s' 실패 → 스킵", slug)
-                dtos = []
-
-            # 다음 카테고리에서 동일 URL 재크롤링 방지
-            seen.update(d.source_url for d in dtos if d.source_url)
-            all_dtos.extend(dtos)
-            logger.info("Wowtale archive: 카테고리 '%s' 완료 → %s건", slug, len(dtos))
+        async with make_archive_client(timeout=httpx.Timeout(self._timeout)) as client:
+
+            async def run(slug: str, apply_filter: bool) -> list[EconomicCollectDto]:
+                logger.info("Wowtale archive: 카테고리 '%s' 시작", slug)
+                try:
+                    dtos = await self._crawl_category(
+                        client,
+                        slug,
+                        max_pages=max_pages,
+                        from_date=from_date,
+                        apply_investment_filter=apply_filter,
+                        known_urls=seen,
+                        on_page=on_page,
+                    )
+                except Exception:
+                    logger.exception("Wowtale archive: 카테고리 '%s' 실패 → 스킵", slug)
+                    self.stats.setdefault(slug, {})["failed"] = True
+                    return []
+                logger.info("Wowtale archive: 카테고리 '%s' 완료 → %s건", slug, len(dtos))
+                return dtos
 
-            await asyncio.sleep(self._sleep_sec * 2)
+            per_category = await asyncio.gather(*(run(slug, f) for slug, f in targets))
 
+        all_dtos = [d for dtos in per_category for d in dtos]
         logger.info("Wowtale archive: 전체 완료 → 총 %s건", len(all_dtos))
         return all_dtos
 
     # ------------------------------------------------------------------
-    # 내부 동기 구현 (asyncio.to_thread 로 실행)
+    # 내부 구현
     # ------------------------------------------------------------------
 
-    def _crawl_category_sync(
+    async def _crawl_category(
         self,
+        client: httpx.AsyncClient,
         category_slug: str,
         *,
         max_pages: int,
         from_date: datetime | None,
         apply_investment_filter: bool,
         known_urls: set[str],
+        on_page: PageSink | None,
     ) -> list[EconomicCollectDto]:
         source_type_override = _CATEGORY_SOURCE_TYPE.get(category_slug)
-        out: list[EconomicCollectDto] = []
-        stop_crawl = False
-
-        for page_num in range(1, max_pages + 1):
-            if stop_crawl:
-                break
-
-            page_url = (
-                f"{_BASE_URL}/category/{category_slug}/"
-                if page_num == 1
-                else f"{_BASE_URL}/category/{category_slug}/page/{page_num}/"
-            )
+        cp_key = _checkpoint_key(
+            category_slug,
+            from_date=from_date,
+            apply_investment_filter=apply_investment_filter,
+            fetch_article_body=self._fetch_article_body,
+        )
+        start_page, resume_after = 1, None
+        if self._resume:
+            cp = await asyncio.to_thread(self.checkpoints.get, CHECKPOINT_SCOPE, cp_key)
+            if cp is not None and not cp.done:
+                start_page, resume_after = cp.page + 1, cp.last_url
+                logger.info(
+                    "Wowtale archive: %s 체크포인트 재개 p%s (마지막 URL %s, %s)",
+                    category_slug, start_page, resume_after, cp.updated_at,
+                )
+        stats = self.stats[category_slug] = {
+            "start_page": start_page,
+            "pages": 0,
+            "articles": 0,
+            "completed": False,
+        }
 
+        out: list[EconomicCollectDto] = []
+        for page_num in range(start_page, max_pages + 1):
+            page_url = _category_page_url(category_slug, page_num)
             logger.debug("Wowtale archive: %s p%s GET", category_slug, page_num)
-            html = _fetch_html(page_url, timeout=self._timeout)
+            html = await _fetch_html(client, page_url, budget=self._budget, timeout=self._timeout)
             if not html:
+                # 완료 표시 없이 중단 → 다음 실행이 이 페이지부터 재시도
                 logger.warning("Wowtale archive: %s p%s 빈 응답 → 중단", category_slug, page_num)
                 break
 
             refs, has_next = _parse_archive_page(html, category_slug)
             if not refs:
                 logger.info("Wowtale archive: %s p%s 기사 없음 → 중단", category_slug, page_num)
+                stats["completed"] = True
+                await asyncio.to_thread(
+                    self.checkpoints.save,
+                    CHECKPOINT_SCOPE, cp_key, page=page_num, last_url=None, done=True,
+                )
                 break
 
-            for ref in refs:
-                # from_date 컷오프: URL 날짜 기준 (느슨한 조건)
-                if from_date and ref.published_at and ref.published_at < from_date:
-                    logger.info(
-                        "Wowtale archive: %s p%s from_date(%s) 도달 → 중단",
-                        category_slug,
-                        page_num,
-                        from_date.date(),
+            page_last_url = refs[-1].url
+            # 재개 직후: 새 글이 올라와 목록이 밀렸다면 이미 적재한 항목이 이 페이지에 다시 보인다
+            if resume_after is not None:
+                urls = [r.url for r in refs]
+                if resume_after in urls:
+                    refs = refs[urls.index(resume_after) + 1:]
+                resume_after = None
+
+            selected, reached_cutoff = self._select_refs(
+                refs, category_slug, page_num,
+                from_date=from_date, apply_investment_filter=apply_investment_filter,
+            )
+            dtos = await asyncio.gather(
+                *(
+                    self._build_dto(
+                        client,
+                        ref,
+                        source_type_override=source_type_override,
+                        skip_article_fetch=skip,
                     )
-                    stop_crawl = True
-                    break
-
-                # 투자 관련 필터 (Global-news 등 복합 카테고리용)
-                if apply_investment_filter and not _is_investment_relevant(ref.title, []):
-                    continue
-
-                # 이미 알고 있는 URL: 상세 크롤링 스킵, DTO는 title+날짜만으로 생성
-                already_known = ref.url in known_urls
-
-                dto = self._build_dto(
-                    ref,
-                    source_type_override=source_type_override,
-                    skip_article_fetch=already_known or not self._fetch_article_body,
+                    for ref, skip in self._claim(selected, known_urls)
                 )
-                if dto:
-                    out.append(dto)
-                    known_urls.add(ref.url)
-
-                # 상세 페이지를 실제로 GET한 경우에만 sleep
-                if not already_known and self._fetch_article_body:
-                    _time_module.sleep(self._article_sleep_sec)
-
-            if not has_next:
-                logger.info("Wowtale archive: %s p%s 마지막 페이지", category_slug, page_num)
+            )
+            page_dtos = [d for d in dtos if d is not None]
+            if on_page is not None and page_dtos:
+                await on_page(category_slug, page_dtos)
+            out.extend(page_dtos)
+            stats["pages"] += 1
+            stats["articles"] += len(page_dtos)
+
+            finished = reached_cutoff or not has_next or page_num >= max_pages
+            # SQLite 커밋(fsync)이 이벤트 루프를 막지 않도록 스레드에서
+            await asyncio.to_thread(
+                self.checkpoints.save,
+                CHECKPOINT_SCOPE, cp_key, page=page_num, last_url=page_last_url,
+                done=finished,
+            )
+            if finished:
+                stats["completed"] = True
+                if not has_next:
+                    logger.info("Wowtale archive: %s p%s 마지막 페이지", category_slug, page_num)
                 break
 
-            _time_module.sleep(self._sleep_sec)
-
         logger.info("Wowtale archive: %s 수집 완료 → %s건", category_slug, len(out))
         return out
 
-    def _build_dto(
+    @staticmethod
+    def _select_refs(
+        refs: list[_ArticleRef],
+        category_slug: str,
+        page_num: int,
+        *,
+        from_date: datetime | None,
+        apply_investment_filter: bool,
+    ) -> tuple[list[_ArticleRef], bool]:
+        """컷오프·투자 필터 적용 → (대상 ref, from_date 도달 여부)."""
+        selected: list[_ArticleRef] = []
+        for ref in refs:
+            # from_date 컷오프: URL 날짜 기준 (느슨한 조건)
+            if from_date and ref.published_at and ref.published_at < from_date:
+                logger.info(
+                    "Wowtale archive: %s p%s from_date(%s) 도달 → 중단",
+                    category_slug,
+                    page_num,
+                    from_date.date(),
+                )
+                return selected, True
+            # 투자 관련 필터 (Global-news 등 복합 카테고리용)
+            if apply_investment_filter and not _is_investment_relevant(ref.title, []):
+                continue
+            selected.append(ref)
+        return selected, False
+
+    def _claim(
+        self, refs: list[_ArticleRef], known_urls: set[str]
+    ) -> list[tuple[_ArticleRef, bool]]:
+        """(ref, 상세 생략 여부). 이미 알고 있는 URL 은 title+날짜만으로 DTO 를 만든다.
+
+        동시에 도는 다른 카테고리가 같은 기사를 중복으로 받지 않도록 상세 GET 전에 URL 을 선점한다.
+        """
+        claimed: list[tuple[_ArticleRef, bool]] = []
+        for ref in refs:
+            already_known = ref.url in known_urls
+            known_urls.add(ref.url)
+            claimed.append((ref, already_known or not self._fetch_article_body))
+        return claimed
+
+    async def _build_dto(
         self,
+        client: httpx.AsyncClient,
         ref: _ArticleRef,
         *,
         source_type_override: str | None,
@@ -427,22 +566,23 @@ class WowtaleArchiveCrawler:
         content_source = "archive_url_date"
 
         if not skip_article_fetch:
-            article_html = _fetch_html(ref.url, timeout=self._timeout)
+            article_html = await _fetch_html(
+                client, ref.url, budget=self._budget, timeout=self._timeout
+            )
             if article_html:
                 precise_date, body_text = _parse_article_page(article_html)
                 if precise_date:
                     published_at = precise_date
                 content_source = "article_page" if body_text else "article_page_empty"
-
-        # 투자 금액: 제목 + 본문 합쳐서 추출 (큰 값 우선)
-        haystack = f"{ref.title}\n{body_text}"
-        investment_amount = extract_investment_amount_krw(haystack)
+        # 투자 금액·라운드·투자사 후보: 제목 + 본문 1회 스캔 (금액은 큰 값 우선)
+        entities = extract_entities(ref.title, body_text)
+        investment_amount = entities.amount_krw
 
         # source_type: 카테고리 고정값 또는 제목 기반 자동 분류
         source_type = source_type_override or _classify_source_type(ref.title, [])
 
         # 투자자: 제목 첫 토큰 (Phase 1 임시 규칙)
-        investor_name = _extract_investor_from_title(ref.title)
+        investor_name = title_first_token(ref.title)
 
         raw_metadata: dict[str, object] = {
             "category_slug": ref.category_slug,
@@ -453,6 +593,7 @@ class WowtaleArchiveCrawler:
         if investment_amount is not None:
             raw_metadata["investment_amount_krw_extracted"] = investment_amount
             raw_metadata["investment_amount_extraction"] = "regex_korean_units"
+        raw_metadata.update(entities.metadata())
 
         return EconomicCollectDto(
             source_type=source_type,
@@ -13,6 +13,7 @@ Option B 핵심 차별점 (이번 확장에 반영):
   - **NaN 마지막행 안전처리**: yfinance 가 한국 시장 마감 전 마지막 행을 NaN 으로 줄 수 있음
     → 종가/거래량이 NaN 인 후행 행을 모두 제거하고 가장 최근 유효 거래일을 사용
   - **티커 간 0.5s sleep**: IP 차단 방어 (티커 수가 5→16 으로 늘면서 호출 빈도 증가)
+    → 유니버스 확장(수백 티커) 이후: 스레드 샤딩 병렬 다운로드 + 전역 rate budget 으로 대체
   - **타임존**: 글로벌 ETF 는 미 동부시간(ET) → tz-aware 그대로 보존
   - **source_type 네임스페이스 분리**:
       * `YAHOO_ETF_*`      — 한국 테마 ETF (기존)
@@ -31,13 +32,17 @@ from __future__ import annotations
 import asyncio
 import logging
 import math
-import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 
-import yfinance as yf
-from pandas import DataFrame, Timestamp
+import numpy as np
+from pandas import DataFrame, Series, Timestamp
 
+from domain.master.hub.services.collectors.economic.yahoo.yahoo_history_fetcher import (
+    DEFAULT_MAX_WORKERS,
+    RateBudget,
+    fetch_histories,
+)
 from domain.master.models.transfer.economic_collect_dto import EconomicCollectDto
 
 logger = logging.getLogger(__name__)
@@ -57,7 +62,7 @@ class VolumeSurgeTarget:
     name: str
     theme: str
     source_type: str
-    threshold: float  # 20일 평균 거래량 대비 N배
+    threshold: float | None  # 20일 평균 거래량 대비 N배 (None → 티커 자체 분포로 자동 산출)
     currency_code: str  # "KRW" or "USD"
 
 
@@ -223,8 +228,15 @@ _MA_WINDOW = 20
 # `period` 인자: 20일 이동평균 + 장기 시계열. 1y 권장(BRONZE 시계열 확충).
 _HISTORY_PERIOD = "1y"
 
-# IP 차단 방어용 티커 간 sleep. 16개 티커 × 0.5초 = 약 8초 — 운영에 무리 없는 수준.
-_INTER_TICKER_SLEEP_SEC = 0.5
+# 자동 임계값: "20일 평균 대비 거래량 비율" 분포의 상위 분위수를 티커별 임계값으로 사용.
+#   - 평가 거래일 직전 `_ADAPTIVE_WINDOW` 거래일만 사용 (당일·미래 거래일 제외 → look-ahead 없음)
+#   - 분위수 0.95 ≒ 평소 1년에 12거래일 정도만 넘는 수준
+#   - 하한/상한으로 과소·과대 신호 방지, 표본 부족 시 기본값
+_ADAPTIVE_WINDOW = 250
+_ADAPTIVE_QUANTILE = 0.95
+_ADAPTIVE_MIN_THRESHOLD = 1.5
+_ADAPTIVE_MAX_THRESHOLD = 4.0
+_DEFAULT_THRESHOLD = 2.0
 
 
 def _to_kst(ts: Timestamp) -> datetime:
@@ -244,37 +256,69 @@ def _drop_trailing_nan(hist: DataFrame) -> DataFrame:
     """yfinance 가 한국 시장 마감 전 마지막 행을 NaN 으로 주는 경우 대비.
 
     필수 컬럼(`Close`, `Volume`) 중 하나라도 NaN 인 후행 행을 모두 잘라낸다.
-    중간 행에 들어간 NaN(휴장 등)은 보존한다.
+    중간 행에 들어간 NaN(휴장 등)은 보존한다. 행 단위 역방향 스캔 대신
+    컬럼 단위 NaN 마스크로 마지막 유효 행을 찾는다.
     """
     if hist is None or hist.empty:
         return hist
 
-    last_valid_idx = -1
-    for i in range(len(hist) - 1, -1, -1):
-        row = hist.iloc[i]
-        ok = True
-        for col in _REQUIRED_COLS:
-            if col not in hist.columns:
-                ok = False
-                break
-            val = row[col]
-            if val is None or (isinstance(val, float) and math.isnan(val)):
-                ok = False
-                break
-        if ok:
-            last_valid_idx = i
-            break
-
-    if last_valid_idx < 0:
+    if any(col not in hist.columns for col in _REQUIRED_COLS):
+        return hist.iloc[0:0]
+
+    valid = hist.loc[:, list(_REQUIRED_COLS)].notna().all(axis=1).to_numpy()
+    valid_idx = np.flatnonzero(valid)
+    if valid_idx.size == 0:
         return hist.iloc[0:0]  # 모두 NaN — 빈 프레임 반환
-    return hist.iloc[: last_valid_idx + 1]
+    return hist.iloc[: int(valid_idx[-1]) + 1]
+
+
+def _adaptive_thresholds(hist: DataFrame) -> Series:
+    """거래일별 자동 임계값 — 각 거래일 **이전** 비율만으로 산출 (look-ahead 없음).
+
+    ``volume / 이전 20일 평균`` 비율을 컬럼 연산으로 구하고, 직전 ``_ADAPTIVE_WINDOW`` 거래일
+    (당일 제외) 의 ``_ADAPTIVE_QUANTILE`` 분위수를 [하한, 상한] 으로 클램프한다.
+    표본이 ``_MA_WINDOW`` 개 미만인 구간은 ``_DEFAULT_THRESHOLD``.
+    """
+    volume = hist["Volume"].astype(float)
+    prev_avg = volume.rolling(_MA_WINDOW).mean().shift(1)
+    ratio = volume / prev_avg
+    ratio = ratio.where(np.isfinite(ratio) & (ratio > 0))
+    trailing_q = (
+        ratio.rolling(_ADAPTIVE_WINDOW, min_periods=_MA_WINDOW)
+        .quantile(_ADAPTIVE_QUANTILE)
+        .shift(1)
+    )
+    return trailing_q.clip(_ADAPTIVE_MIN_THRESHOLD, _ADAPTIVE_MAX_THRESHOLD).fillna(
+        _DEFAULT_THRESHOLD
+    )
+
+
+def _adaptive_threshold(hist: DataFrame) -> float:
+    """마지막 거래일에 적용할 자동 임계값 (마지막 행 이전 분포 기준)."""
+    if hist is None or hist.empty or "Volume" not in hist.columns:
+        return _DEFAULT_THRESHOLD
+    return float(_adaptive_thresholds(hist).iloc[-1])
+
+
+def _resolve_threshold(target: VolumeSurgeTarget, hist: DataFrame) -> float:
+    """고정 임계값이 있으면 그대로, 없으면 마지막 유효 거래일 직전까지의 history 로 자동 산출."""
+    if target.threshold is not None:
+        return target.threshold
+    return _adaptive_threshold(_drop_trailing_nan(hist))
 
 
 def _compute_inflow_dto(
     target: VolumeSurgeTarget,
     hist: DataFrame,
+    *,
+    threshold: float | None = None,
 ) -> EconomicCollectDto | None:
-    """마지막 유효 거래일의 거래량이 임계값을 넘으면 Bronze DTO 1건 반환."""
+    """마지막 유효 거래일의 거래량이 임계값을 넘으면 Bronze DTO 1건 반환.
+
+    ``threshold`` 를 주지 않으면 ``_resolve_threshold`` 로 결정한다.
+    """
+    if threshold is None:
+        threshold = _resolve_threshold(target, hist)
     hist = _drop_trailing_nan(hist)
 
     if hist is None or hist.empty or len(hist) < _MA_WINDOW + 1:
@@ -300,12 +344,12 @@ def _compute_inflow_dto(
         return None
 
     volume_ratio = last_volume / avg_volume
-    if volume_ratio < target.threshold:
+    if volume_ratio < threshold:
         logger.debug(
             "Yahoo[%s] 임계값 미달 — ratio=%.2f < %.2f",
             target.ticker,
             volume_ratio,
-            target.threshold,
+            threshold,
         )
         return None
 
@@ -336,7 +380,8 @@ def _compute_inflow_dto(
         "volume": int(last_volume),
         "avg_volume_20d": int(avg_volume),
         "volume_ratio": round(volume_ratio, 3),
-        "threshold": target.threshold,
+        "threshold": round(threshold, 3),
+        "threshold_mode": "fixed" if target.threshold is not None else "adaptive",
         "ohlc": {
             "open": float(last["Open"]),
             "high": high,
@@ -366,15 +411,15 @@ class YahooFinanceEtfCollector:
     """거래량 급증(Volume Surge) Collector — 한국 ETF/대형주 + 글로벌 ETF 통합.
 
     동작:
-      1) `VOLUME_SURGE_TARGETS` 각 자산에 대해 시세 다운로드(기본 ``period=1y``)
+      1) 유니버스(`yahoo-universe.yml`, 없으면 `VOLUME_SURGE_TARGETS`) 각 자산 시세 다운로드(기본 ``period=1y``)
       2) NaN 후행 행 제거 (한국 시장 마감 전 호출 대비)
       3) 이전 20일 평균 거래량 대비 마지막 거래일 거래량 비율 계산
-      4) 자산별 멀티 레벨 임계값(`threshold`) 초과 시 Bronze DTO 1건 생성
+      4) 자산별 임계값(`threshold`, 미지정 시 티커별 자동 산출) 초과 시 Bronze DTO 1건 생성
       5) 유입 금액은 VWAP 근사 (`volume × (high+low+close)/3`) 로 추정
 
     IP 차단 방어:
-      - 티커 간 `_INTER_TICKER_SLEEP_SEC` 만큼 대기
-      - `asyncio.to_thread` 안에서 동기 `time.sleep` 사용 (이벤트 루프 비차단)
+      - 티커를 `max_workers` 스레드에 샤딩해 병렬 다운로드
+      - 모든 워커가 `yahoo_history_fetcher` 의 전역 rate budget 을 공유 (요청 간 최소 간격 유지)
 
     실패 격리:
       - 특정 티커 다운로드/계산 실패는 logger.exception 으로 흡수
@@ -383,12 +428,28 @@ class YahooFinanceEtfCollector:
 
     def __init__(
         self,
-        targets: tuple[VolumeSurgeTarget, ...] = VOLUME_SURGE_TARGETS,
+        targets: tuple[VolumeSurgeTarget, ...] | None = None,
         *,
-        inter_ticker_sleep_sec: float = _INTER_TICKER_SLEEP_SEC,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        budget: RateBudget | None = None,
     ):
+        if targets is None:
+            from domain.master.hub.services.collectors.economic.yahoo.yahoo_universe import (
+                load_universe,
+            )
+
+            targets = load_universe()
         self._targets = targets
-        self._sleep_sec = inter_ticker_sleep_sec
+        self._max_workers = max_workers
+        self._budget = budget
+
+    def _histories(self, period: str):
+        return fetch_histories(
+            self._targets,
+            period=period,
+            max_workers=self._max_workers,
+            budget=self._budget,
+        )
 
     def collect_sync(
         self, *, period: str | None = None
@@ -405,19 +466,8 @@ class YahooFinanceEtfCollector:
         out: list[EconomicCollectDto] = []
         skipped = 0
 
-        for i, target in enumerate(self._targets):
-            if i > 0 and self._sleep_sec > 0:
-                time.sleep(self._sleep_sec)
-
-            try:
-                hist = yf.Ticker(target.ticker).history(
-                    period=p,
-                    auto_adjust=False,
-                )
-            except Exception:
-                logger.exception(
-                    "Yahoo[%s] history 다운로드 실패 — 다음 티커로 진행", target.ticker
-                )
+        for target, hist in self._histories(p):
+            if hist is None:
                 skipped += 1
                 continue
 
@@ -451,6 +501,7 @@ class YahooFinanceEtfCollector:
 
         일일 스케줄 잡은 ``collect_sync`` 만 호출해도 되고, 초기 적재 시에만
         본 메서드를 사용하면 과거 급증일이 ``source_url`` 기준으로 누적된다.
+        자동 임계값 티커는 거래일마다 그 이전 구간의 분포로 산출한다 (``_adaptive_thresholds``).
 
         Returns:
             (DTO 리스트, 티커 단위 완전 실패 수)
@@ -459,19 +510,8 @@ class YahooFinanceEtfCollector:
         out: list[EconomicCollectDto] = []
         failed_tickers = 0
 
-        for i, target in enumerate(self._targets):
-            if i > 0 and self._sleep_sec > 0:
-                time.sleep(self._sleep_sec)
-
-            try:
-                hist = yf.Ticker(target.ticker).history(
-                    period=p,
-                    auto_adjust=False,
-                )
-            except Exception:
-                logger.exception(
-                    "Yahoo[%s] history(backfill) 다운로드 실패", target.ticker
-                )
+        for target, hist in self._histories(p):
+            if hist is None:
                 failed_tickers += 1
                 continue
 
@@ -480,10 +520,14 @@ class YahooFinanceEtfCollector:
                 failed_tickers += 1
                 continue
 
+            if target.threshold is not None:
+                thresholds = np.full(len(hist), target.threshold)
+            else:
+                thresholds = _adaptive_thresholds(hist).to_numpy()
             for end_idx in range(_MA_WINDOW, len(hist)):
                 sub = hist.iloc[: end_idx + 1]
                 try:
-                    dto = _compute_inflow_dto(target, sub)
+                    dto = _compute_inflow_dto(target, sub, threshold=float(thresholds[end_idx]))
                 except Exception:
                     continue
                 if dto is not None:
@@ -1,27 +1,32 @@
 """Yahoo Finance 일별 OHLCV → `raw_market_timeseries` Bronze 수집.
 
-`yahoo_finance_collector` 와 동일한 16개 티커(`VOLUME_SURGE_TARGETS`)에 대해
-급증 여부와 무관하게 **모든 유효 거래일**의 OHLCV·추정 거래대금을 적재한다.
+`yahoo_finance_collector` 와 동일한 유니버스(`yahoo-universe.yml`, 없으면
+`VOLUME_SURGE_TARGETS` 16종)에 대해 급증 여부와 무관하게 **모든 유효 거래일**의
+OHLCV·추정 거래대금을 적재한다. 다운로드는 `yahoo_history_fetcher` 로 병렬화한다.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-import math
-import time
-from datetime import date
+from typing import Any
 
-from pandas import Timestamp
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from pydantic import ValidationError
 
 from domain.master.hub.services.collectors.economic.yahoo.yahoo_finance_collector import (
-    VOLUME_SURGE_TARGETS,
     VolumeSurgeTarget,
-    _INTER_TICKER_SLEEP_SEC,
+    _KST,
     _drop_trailing_nan,
-    _to_kst,
-    _vwap_approx,
 )
+from domain.master.hub.services.collectors.economic.yahoo.yahoo_history_fetcher import (
+    DEFAULT_MAX_WORKERS,
+    RateBudget,
+    fetch_histories,
+)
+from domain.master.hub.services.collectors.economic.yahoo.yahoo_universe import load_universe
 from domain.master.models.transfer.market_timeseries_dto import MarketTimeseriesDto
 
 logger = logging.getLogger(__name__)
@@ -29,131 +34,165 @@ logger = logging.getLogger(__name__)
 _DEFAULT_PERIOD = "1y"
 _INCREMENTAL_PERIOD = "1mo"
 
+_TURNOVER_CALC = "volume * (high + low + close) / 3"
 
-def _trade_date_from_index(ts: Timestamp) -> date:
-    return _to_kst(ts).date()
 
+def _float_col(hist: DataFrame, col: str) -> np.ndarray:
+    """컬럼을 float64 배열로 — 없거나 숫자가 아닌 값은 NaN."""
+    if col not in hist.columns:
+        return np.full(len(hist), np.nan)
+    return pd.to_numeric(hist[col], errors="coerce").to_numpy(dtype=float)
 
-def _row_to_dto(target: VolumeSurgeTarget, row, trade_dt: date) -> MarketTimeseriesDto | None:
-    try:
-        close = float(row["Close"])
-        volume = int(float(row["Volume"]))
-    except (TypeError, ValueError, KeyError):
-        return None
 
-    if volume <= 0 or math.isnan(close) or close <= 0:
-        return None
+def _nullable(values: np.ndarray) -> list[float | None]:
+    """NaN → None 으로 바꾼 파이썬 float 리스트."""
+    out = values.astype(object)
+    out[np.isnan(values)] = None
+    return out.tolist()
 
-    def _f(col: str) -> float | None:
-        if col not in row.index:
-            return None
-        try:
-            v = float(row[col])
-            if math.isnan(v):
-                return None
-            return v
-        except (TypeError, ValueError):
-            return None
-
-    high = _f("High")
-    low = _f("Low")
-    open_p = _f("Open")
-    h = high if high is not None else close
-    l = low if low is not None else close
-    vwap = _vwap_approx(h, l, close)
-    turnover = int(round(volume * vwap))
-
-    return MarketTimeseriesDto(
-        ticker=target.ticker,
-        trade_date=trade_dt,
-        source_type=target.source_type,
-        asset_name=target.name,
-        theme=target.theme,
-        currency=target.currency_code,
-        open_price=open_p,
-        high_price=high,
-        low_price=low,
-        close_price=close,
-        volume=volume,
-        turnover_amount=turnover,
-        raw_metadata={
-            "data_provider": "yfinance",
-            "vwap_approx": round(vwap, 4),
-            "turnover_calc": "volume * (high + low + close) / 3",
-        },
-    )
-
-
-def _hist_to_dtos(target: VolumeSurgeTarget, hist) -> list[MarketTimeseriesDto]:
+
+def _trade_dates(index: pd.Index) -> np.ndarray:
+    """DatetimeIndex → KST 기준 `date` 배열 (`_to_kst(ts).date()` 의 컬럼 버전)."""
+    idx = pd.DatetimeIndex(index)
+    idx = idx.tz_localize(_KST) if idx.tz is None else idx.tz_convert(_KST)
+    return idx.date
+
+
+def _hist_to_rows(target: VolumeSurgeTarget, hist: DataFrame) -> list[dict[str, Any]]:
+    """yfinance history → `raw_market_timeseries` upsert 용 dict 행 (컬럼 단위 변환).
+
+    유효성(거래량 ≥ 1, 종가 > 0)·VWAP·거래대금을 컬럼 연산으로 한 번에 계산하고,
+    행 dict 는 마지막에 zip 으로만 만든다. 키는 Repository payload 와 동일하다.
+    """
     hist = _drop_trailing_nan(hist)
     if hist is None or hist.empty:
         return []
 
-    out: list[MarketTimeseriesDto] = []
-    for i in range(len(hist)):
-        row = hist.iloc[i]
-        ts: Timestamp = hist.index[i]  # type: ignore[assignment]
-        trade_dt = _trade_date_from_index(ts)
-        dto = _row_to_dto(target, row, trade_dt)
-        if dto is not None:
-            out.append(dto)
+    close = _float_col(hist, "Close")
+    volume = _float_col(hist, "Volume")
+    valid = np.isfinite(volume) & (volume >= 1) & np.isfinite(close) & (close > 0)
+    if not valid.any():
+        return []
+
+    close = close[valid]
+    volume_int = np.trunc(volume[valid]).astype(np.int64)
+    open_p = _float_col(hist, "Open")[valid]
+    high = _float_col(hist, "High")[valid]
+    low = _float_col(hist, "Low")[valid]
+
+    h = np.where(np.isnan(high), close, high)
+    l = np.where(np.isnan(low), close, low)
+    vwap = (h + l + close) / 3.0
+    turnover = np.rint(volume_int * vwap).astype(np.int64)
+
+    ticker = target.ticker.strip()[:32]
+    source_type = target.source_type[:50]
+    asset_name = target.name[:255]
+    theme = target.theme[:100] if target.theme else None
+    currency = target.currency_code[:10]
+
+    return [
+        {
+            "ticker": ticker,
+            "trade_date": trade_dt,
+            "source_type": source_type,
+            "asset_name": asset_name,
+            "theme": theme,
+            "currency": currency,
+            "open_price": o,
+            "high_price": hi,
+            "low_price": lo,
+            "close_price": c,
+            "volume": v,
+            "turnover_amount": t,
+            "raw_metadata": {
+                "data_provider": "yfinance",
+                "vwap_approx": vw,
+                "turnover_calc": _TURNOVER_CALC,
+            },
+        }
+        for trade_dt, o, hi, lo, c, v, t, vw in zip(
+            _trade_dates(hist.index)[valid].tolist(),
+            _nullable(open_p),
+            _nullable(high),
+            _nullable(low),
+            close.tolist(),
+            volume_int.tolist(),
+            turnover.tolist(),
+            np.round(vwap, 4).tolist(),
+        )
+    ]
+
+
+def _validate_rows(ticker: str, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """`MarketTimeseriesDto` 스키마 검증 — 통과한 행만 반환 (선택 단계)."""
+    out: list[dict[str, Any]] = []
+    for row in rows:
+        try:
+            MarketTimeseriesDto(**row)
+        except ValidationError:
+            logger.warning("Yahoo TS[%s] 스키마 검증 실패 — %s 스킵", ticker, row.get("trade_date"))
+            continue
+        out.append(row)
     return out
 
 
 class YahooMarketTimeseriesCollector:
-    """16개 모니터링 티커의 일별 OHLCV 시계열 수집."""
+    """모니터링 유니버스 티커의 일별 OHLCV 시계열 수집."""
 
     def __init__(
         self,
-        targets: tuple[VolumeSurgeTarget, ...] = VOLUME_SURGE_TARGETS,
+        targets: tuple[VolumeSurgeTarget, ...] | None = None,
         *,
-        inter_ticker_sleep_sec: float = _INTER_TICKER_SLEEP_SEC,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        budget: RateBudget | None = None,
     ):
-        self._targets = targets
-        self._sleep_sec = inter_ticker_sleep_sec
+        self._targets = targets if targets is not None else load_universe()
+        self._max_workers = max_workers
+        self._budget = budget
 
-    def collect_sync(
+    @staticmethod
+    def _resolve_period(period: str | None, incremental: bool) -> str:
+        if period:
+            return period
+        return _INCREMENTAL_PERIOD if incremental else _DEFAULT_PERIOD
+
+    def collect_rows_sync(
         self,
         *,
         period: str | None = None,
         incremental: bool = True,
-    ) -> tuple[list[MarketTimeseriesDto], int]:
-        """동기 수집 — yfinance history 전 거래일 파싱.
+        validate: bool = False,
+    ) -> tuple[list[dict[str, Any]], int]:
+        """동기 수집 — yfinance history 를 컬럼 단위로 변환해 dict 행으로 반환.
 
         Args:
             period: yfinance ``history(period=...)``. None이면 incremental 여부에 따라 기본값.
             incremental: True면 ``1mo``(일일 스케줄용), False면 ``1y``(초기 backfill).
-        """
-        import yfinance as yf
+            validate: True면 행마다 ``MarketTimeseriesDto`` 스키마 검증(느림, 디버깅용).
 
-        if period:
-            p = period
-        elif incremental:
-            p = _INCREMENTAL_PERIOD
-        else:
-            p = _DEFAULT_PERIOD
+        Returns:
+            (``MarketTimeseriesRepository.upsert_rows`` 에 바로 넘길 dict 행, 실패 티커 수)
+        """
+        p = self._resolve_period(period, incremental)
 
-        out: list[MarketTimeseriesDto] = []
+        out: list[dict[str, Any]] = []
         failed = 0
 
-        for i, target in enumerate(self._targets):
-            if i > 0 and self._sleep_sec > 0:
-                time.sleep(self._sleep_sec)
-
-            try:
-                hist = yf.Ticker(target.ticker).history(
-                    period=p,
-                    auto_adjust=False,
-                )
-            except Exception:
-                logger.exception(
-                    "Yahoo TS[%s] history 다운로드 실패", target.ticker
-                )
+        for target, hist in fetch_histories(
+            self._targets,
+            period=p,
+            max_workers=self._max_workers,
+            budget=self._budget,
+        ):
+            if hist is None:
                 failed += 1
                 continue
 
             try:
-                rows = _hist_to_dtos(target, hist)
+                rows = _hist_to_rows(target, hist)
+                if validate:
+                    rows = _validate_rows(target.ticker, rows)
             except Exception:
                 logger.exception(
                     "Yahoo TS[%s] OHLCV 파싱 실패", target.ticker
@@ -178,6 +217,30 @@ class YahooMarketTimeseriesCollector:
         )
         return out, failed
 
+    def collect_sync(
+        self,
+        *,
+        period: str | None = None,
+        incremental: bool = True,
+    ) -> tuple[list[MarketTimeseriesDto], int]:
+        """동기 수집 — ``collect_rows_sync`` 결과를 DTO 로 감싼 하위 호환 경로."""
+        rows, failed = self.collect_rows_sync(period=period, incremental=incremental)
+        return [MarketTimeseriesDto(**row) for row in rows], failed
+
+    async def collect_rows(
+        self,
+        *,
+        period: str | None = None,
+        incremental: bool = True,
+        validate: bool = False,
+    ) -> tuple[list[dict[str, Any]], int]:
+        return await asyncio.to_thread(
+            self.collect_rows_sync,
+            period=period,
+            incremental=incremental,
+            validate=validate,
+        )
+
     async def collect(
         self,
         *,
@@ -0,0 +1,100 @@
+"""Yahoo Finance 모니터링 유니버스 로더 (`yahoo-universe.yml`).
+
+하드코딩된 16개 ``VolumeSurgeTarget`` 대신 설정 파일에서 티커 목록을 읽는다.
+파일이 없거나 비어 있으면 ``VOLUME_SURGE_TARGETS`` 로 폴백한다.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from domain.master.hub.services.collectors.economic.yahoo.yahoo_finance_collector import (
+    VOLUME_SURGE_TARGETS,
+    VolumeSurgeTarget,
+)
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_UNIVERSE_PATH = Path(__file__).parent / "yahoo-universe.yml"
+_UNIVERSE_PATH_ENV = "YAHOO_UNIVERSE_PATH"
+
+
+def _symbol(ticker: str) -> str:
+    """``005930.KS`` → ``005930`` (source_type 접미사용)."""
+    return ticker.split(".", 1)[0].replace("^", "").replace("=", "").upper()
+
+
+def _parse_threshold(value: Any) -> float | None:
+    """숫자면 고정 임계값, 비었거나 ``auto`` 면 None(티커별 자동 산출)."""
+    if value is None or (isinstance(value, str) and value.strip().lower() in ("", "auto")):
+        return None
+    return float(value)
+
+
+def _parse_group(name: str, group: dict[str, Any]) -> list[VolumeSurgeTarget]:
+    currency = str(group.get("currency") or "KRW")
+    prefix = str(group.get("source_type_prefix") or "YAHOO")
+    group_theme = group.get("theme")
+
+    out: list[VolumeSurgeTarget] = []
+    for item in group.get("targets") or []:
+        ticker = str(item.get("ticker") or "").strip()
+        if not ticker:
+            continue
+        try:
+            threshold = _parse_threshold(item.get("threshold"))
+        except (TypeError, ValueError):
+            logger.warning("Yahoo universe[%s] %s 임계값 형식 오류 — 자동 산출", name, ticker)
+            threshold = None
+        out.append(
+            VolumeSurgeTarget(
+                ticker=ticker,
+                name=str(item.get("name") or ticker),
+                theme=str(item.get("theme") or group_theme or name),
+                source_type=str(item.get("source_type") or f"{prefix}_{_symbol(ticker)}")[:50],
+                threshold=threshold,
+                currency_code=str(item.get("currency") or currency),
+            )
+        )
+    return out
+
+
+def parse_universe(config: dict[str, Any]) -> tuple[VolumeSurgeTarget, ...]:
+    """YAML dict → 티커 중복 제거된 ``VolumeSurgeTarget`` 튜플 (먼저 나온 항목 우선)."""
+    groups = (config.get("yahoo") or {}).get("groups") or {}
+    seen: dict[str, VolumeSurgeTarget] = {}
+    for name, group in groups.items():
+        if not isinstance(group, dict) or not group.get("enabled", True):
+            continue
+        for target in _parse_group(name, group):
+            seen.setdefault(target.ticker, target)
+    return tuple(seen.values())
+
+
+@lru_cache(maxsize=4)
+def load_universe(path: str | None = None) -> tuple[VolumeSurgeTarget, ...]:
+    """유니버스 로드. 경로 우선순위: 인자 → ``YAHOO_UNIVERSE_PATH`` → 모듈 기본 파일."""
+    config_path = Path(path or os.getenv(_UNIVERSE_PATH_ENV) or _DEFAULT_UNIVERSE_PATH)
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        logger.warning("Yahoo universe 파일 없음: %s — 기본 16종 사용", config_path)
+        return VOLUME_SURGE_TARGETS
+    except Exception:
+        logger.exception("Yahoo universe 파일 로드 실패: %s — 기본 16종 사용", config_path)
+        return VOLUME_SURGE_TARGETS
+
+    targets = parse_universe(config)
+    if not targets:
+        logger.warning("Yahoo universe 비어 있음: %s — 기본 16종 사용", config_path)
+        return VOLUME_SURGE_TARGETS
+
+    logger.info("Yahoo universe 로드: %s 티커 (%s)", len(targets), config_path)
+    return targets
@@ -25,6 +25,7 @@ from typing import Any, Optional
 import aiohttp
 import xmltodict
 
+from core.api_quota import aiohttp_quota_trace
 from domain.master.models.transfer.opportunity_collect_dto import OpportunityCollectDto
 
 logger = logging.getLogger(__name__)
@@ -224,7 +225,7 @@ class SmesOpenAPICollector:
             params["endDate"] = ed
 
         timeout = aiohttp.ClientTimeout(total=30)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        async with aiohttp.ClientSession(timeout=timeout, trace_configs=[aiohttp_quota_trace("smes")]) as session:
             try:
                 async with session.get(self.BASE_URL, params=params) as resp:
                     if resp.status != 200:
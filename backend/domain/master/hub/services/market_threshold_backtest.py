@@ -0,0 +1,271 @@
+"""급증 임계값 오프라인 백테스트 — `raw_market_timeseries` 기반 벡터화 그리드 평가.
+
+Collector 의 임계값(거래량 급증 1.5~2.5배, Macro Z-score 2.0 등)은 수작업 상수다.
+본 모듈은 적재된 일별 시계열을 NumPy 행렬로 한 번 로드한 뒤 (window, threshold)
+조합 전체를 **모든 티커에 대해 동시에** 평가해 신호 빈도와 선행 수익률을 보고한다.
+Collector 재실행 없이 수 초 안에 임계값을 튜닝하기 위한 용도다.
+
+행렬 레이아웃:
+  - 열 = 티커, 행 = **티커 자신의 거래일 순번** (날짜가 아니라 순번으로 정렬)
+    → 한국/미국 휴장일이 달라도 각 열의 롤링 윈도우가 연속 거래일 기준으로 계산된다.
+  - 거래일 수가 짧은 티커는 아래쪽이 NaN 패딩.
+
+탐지기(detector):
+  - ``volume``  : ratio = volume_t / mean(volume, 직전 window 거래일)   (`yahoo_finance_collector`)
+  - ``price_z`` : Z = |r_t| / std(r, 직전 window 거래일, ddof=1)         (`yahoo_macro_collector`)
+    선행 수익률은 신호 방향(sign r_t)을 곱해 "추세 지속"이 양수가 되도록 보고한다.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import asdict, dataclass
+from datetime import date
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.master.hub.repositories.market_timeseries_repository import (
+    MarketTimeseriesRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+DETECTORS: tuple[str, ...] = ("volume", "price_z")
+
+DEFAULT_WINDOWS: tuple[int, ...] = (10, 20, 60)
+DEFAULT_VOLUME_THRESHOLDS: tuple[float, ...] = (1.5, 1.8, 2.0, 2.2, 2.5, 3.0)
+DEFAULT_Z_THRESHOLDS: tuple[float, ...] = (1.5, 2.0, 2.5, 3.0)
+DEFAULT_HORIZONS: tuple[int, ...] = (1, 5, 20)
+
+_TRADING_DAYS_PER_YEAR = 252
+
+
+@dataclass(frozen=True)
+class MarketPanel:
+    """티커별 거래일 순번 × 티커 행렬 (NaN = 해당 순번 데이터 없음)."""
+
+    tickers: tuple[str, ...]
+    dates: np.ndarray  # (K, N) datetime64[D], NaT 패딩
+    close: np.ndarray  # (K, N) float64
+    volume: np.ndarray  # (K, N) float64
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.close.shape  # type: ignore[return-value]
+
+
+@dataclass(frozen=True)
+class HorizonStats:
+    horizon: int
+    samples: int
+    mean_return: float | None
+    hit_rate: float | None
+    baseline_mean_return: float | None
+
+
+@dataclass(frozen=True)
+class GridResult:
+    detector: str
+    window: int
+    threshold: float
+    observations: int
+    signals: int
+    signal_rate: float
+    signals_per_ticker_year: float
+    tickers_with_signal: int
+    horizons: tuple[HorizonStats, ...]
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def build_panel(rows: Iterable[tuple[str, date, float, int]]) -> MarketPanel:
+    """(ticker, trade_date, close, volume) 행 → ``MarketPanel`` (정렬 여부 무관)."""
+    rows = list(rows)
+    if not rows:
+        empty = np.empty((0, 0))
+        return MarketPanel((), np.empty((0, 0), dtype="datetime64[D]"), empty, empty)
+
+    tickers_raw = np.array([r[0] for r in rows], dtype=object)
+    dates = np.array([r[1] for r in rows], dtype="datetime64[D]")
+    close = np.array([r[2] for r in rows], dtype=float)
+    volume = np.array([r[3] for r in rows], dtype=float)
+
+    tickers, codes = np.unique(tickers_raw.astype(str), return_inverse=True)
+    order = np.lexsort((dates, codes))
+    codes, dates, close, volume = codes[order], dates[order], close[order], volume[order]
+
+    counts = np.bincount(codes, minlength=len(tickers))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    local = np.arange(len(codes)) - starts[codes]
+    k, n = int(counts.max()), len(tickers)
+
+    close_m = np.full((k, n), np.nan)
+    volume_m = np.full((k, n), np.nan)
+    dates_m = np.full((k, n), np.datetime64("NaT"), dtype="datetime64[D]")
+    close_m[local, codes] = close
+    volume_m[local, codes] = volume
+    dates_m[local, codes] = dates
+
+    return MarketPanel(tuple(tickers.tolist()), dates_m, close_m, volume_m)
+
+
+async def load_panel(
+    session: AsyncSession,
+    *,
+    tickers: list[str] | None = None,
+    since: date | None = None,
+) -> MarketPanel:
+    rows = await MarketTimeseriesRepository(session).fetch_close_volume(
+        tickers=tickers, since=since
+    )
+    panel = build_panel(rows)
+    logger.info(
+        "Backtest panel 로드: %s rows → %s 거래일 × %s 티커",
+        len(rows),
+        panel.shape[0],
+        panel.shape[1],
+    )
+    return panel
+
+
+def _prev_window_sums(x: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """각 행 t 에 대해 직전 ``window`` 행(t 제외)의 (합, 제곱합, 유효 개수) — 누적합 차분."""
+    k, n = x.shape
+    finite = np.isfinite(x)
+    filled = np.where(finite, x, 0.0)
+
+    c1 = np.zeros((k + 1, n))
+    c2 = np.zeros((k + 1, n))
+    cn = np.zeros((k + 1, n))
+    np.cumsum(filled, axis=0, out=c1[1:])
+    np.cumsum(filled * filled, axis=0, out=c2[1:])
+    np.cumsum(finite, axis=0, out=cn[1:])
+
+    s1 = np.full((k, n), np.nan)
+    s2 = np.full((k, n), np.nan)
+    cnt = np.zeros((k, n))
+    if k > window:
+        s1[window:] = c1[window:k] - c1[: k - window]
+        s2[window:] = c2[window:k] - c2[: k - window]
+        cnt[window:] = cn[window:k] - cn[: k - window]
+    return s1, s2, cnt
+
+
+def prev_window_mean(x: np.ndarray, window: int) -> np.ndarray:
+    s1, _, cnt = _prev_window_sums(x, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(cnt == window, s1 / window, np.nan)
+
+
+def prev_window_std(x: np.ndarray, window: int) -> np.ndarray:
+    """표본 표준편차(ddof=1) — pandas ``Series.std()`` 와 동일 정의."""
+    s1, s2, cnt = _prev_window_sums(x, window)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        var = (s2 - s1 * s1 / window) / (window - 1)
+        return np.where(cnt == window, np.sqrt(np.clip(var, 0.0, None)), np.nan)
+
+
+def daily_returns(close: np.ndarray) -> np.ndarray:
+    r = np.full(close.shape, np.nan)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        r[1:] = close[1:] / close[:-1] - 1.0
+    return r
+
+
+def forward_returns(close: np.ndarray, horizon: int) -> np.ndarray:
+    fr = np.full(close.shape, np.nan)
+    if horizon < close.shape[0]:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            fr[:-horizon] = close[horizon:] / close[:-horizon] - 1.0
+    return fr
+
+
+def detector_scores(panel: MarketPanel, detector: str, window: int) -> tuple[np.ndarray, np.ndarray]:
+    """(점수 행렬, 선행 수익률 부호 행렬) — 점수 NaN 은 평가 불가 구간."""
+    if detector == "volume":
+        avg = prev_window_mean(panel.volume, window)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            score = np.where(avg > 0, panel.volume / avg, np.nan)
+        return score, np.ones(score.shape)
+
+    if detector == "price_z":
+        r = daily_returns(panel.close)
+        std = prev_window_std(r, window)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            score = np.where(std > 0, np.abs(r) / std, np.nan)
+        return score, np.sign(r)
+
+    raise ValueError(f"지원하지 않는 detector: {detector} (가능: {', '.join(DETECTORS)})")
+
+
+def _mean_or_none(total: float, count: int) -> float | None:
+    return round(total / count, 6) if count else None
+
+
+def run_grid(
+    panel: MarketPanel,
+    *,
+    detector: str = "volume",
+    windows: Sequence[int] = DEFAULT_WINDOWS,
+    thresholds: Sequence[float] | None = None,
+    horizons: Sequence[int] = DEFAULT_HORIZONS,
+) -> list[GridResult]:
+    """(window × threshold) 그리드 평가. 각 조합은 전 티커 행렬 연산 1회."""
+    if thresholds is None:
+        thresholds = DEFAULT_VOLUME_THRESHOLDS if detector == "volume" else DEFAULT_Z_THRESHOLDS
+    if panel.close.size == 0:
+        return []
+
+    fwd = {h: forward_returns(panel.close, h) for h in horizons}
+    results: list[GridResult] = []
+
+    for window in windows:
+        score, direction = detector_scores(panel, detector, window)
+        evaluable = np.isfinite(score)
+        observations = int(evaluable.sum())
+
+        directed = {h: fr * direction for h, fr in fwd.items()}
+        fwd_valid = {h: evaluable & np.isfinite(fr) for h, fr in directed.items()}
+        baseline = {
+            h: _mean_or_none(float(directed[h][m].sum()), int(m.sum()))
+            for h, m in fwd_valid.items()
+        }
+
+        for thr in thresholds:
+            hits = evaluable & (score >= thr)
+            n_signals = int(hits.sum())
+
+            horizon_stats: list[HorizonStats] = []
+            for h in horizons:
+                m = hits & fwd_valid[h]
+                samples = int(m.sum())
+                vals = directed[h][m]
+                horizon_stats.append(
+                    HorizonStats(
+                        horizon=h,
+                        samples=samples,
+                        mean_return=_mean_or_none(float(vals.sum()), samples),
+                        hit_rate=_mean_or_none(float((vals > 0).sum()), samples),
+                        baseline_mean_return=baseline[h],
+                    )
+                )
+
+            rate = n_signals / observations if observations else 0.0
+            results.append(
+                GridResult(
+                    detector=detector,
+                    window=int(window),
+                    threshold=float(thr),
+                    observations=observations,
+                    signals=n_signals,
+                    signal_rate=round(rate, 6),
+                    signals_per_ticker_year=round(rate * _TRADING_DAYS_PER_YEAR, 3),
+                    tickers_with_signal=int(hits.any(axis=0).sum()),
+                    horizons=tuple(horizon_stats),
+                )
+            )
+
+    return results
@@ -0,0 +1,223 @@
+"""기재부 문서 업로드(`/bronze/economic/moef-upload`) 잡 — 스트리밍 저장·파싱·적재 진행 상태.
+
+흐름:
+  1) uploading : 요청 본문을 청크 단위로 content store 에 저장 (SHA-256 동시 계산, 크기 상한)
+  2) uploaded  : 202 응답. 같은 내용의 잡이 진행 중이면 새 잡을 만들지 않고 그 잡을 돌려준다.
+  3) parsing   : 문서 파싱 프로세스 풀에서 파싱 — PDF 는 페이지 진행률(``pages_done/pages_total``)
+  4) inserting → inserted : `ingest_moef_local_pdfs` 에 파싱 결과·SHA-256 을 그대로 넘겨 적재 (매니페스트 반영)
+  파싱 실패·예외 시 ``failed`` + ``error`` (파싱 실패는 적재하지 않는다).
+
+잡 상태는 **프로세스 메모리**에만 둔다 (API 워커 1개 기준, 재시작 시 유실).
+최근 ``_MAX_JOBS`` 개까지 보관하고 오래된 완료 잡부터 버린다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from core.database import AsyncSessionLocal
+from domain.master.hub.services.bronze_economic_ingest_service import BronzeEconomicIngestService
+from domain.master.hub.services.collectors.economic.common._doc_parsers import (
+    pdf_page_count,
+    resolve_format,
+)
+from domain.master.hub.services.collectors.economic.common.content_store import StoredFile
+from domain.master.hub.services.collectors.economic.common.doc_parse_pool import get_parse_pool
+
+logger = logging.getLogger(__name__)
+
+MOEF_UPLOAD_MAX_BYTES = 1024 * 1024 * 1024  # 1GB
+UPLOAD_ROOT = Path(tempfile.gettempdir()) / "moef_uploads"
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+_MAX_JOBS = 200
+
+STAGE_UPLOADING = "uploading"
+STAGE_UPLOADED = "uploaded"
+STAGE_PARSING = "parsing"
+STAGE_INSERTING = "inserting"
+STAGE_INSERTED = "inserted"
+STAGE_FAILED = "failed"
+_FINISHED = (STAGE_INSERTED, STAGE_FAILED)
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class MoefUploadJob:
+    job_id: str
+    original_filename: str
+    stage: str = STAGE_UPLOADING
+    sha256: str | None = None
+    size_bytes: int = 0
+    pages_done: int = 0
+    pages_total: int | None = None
+    stage_times: dict[str, str] = field(default_factory=dict)
+    durations: dict[str, float] = field(default_factory=dict)
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    _started: float = field(default_factory=time.monotonic, repr=False)
+    _stage_started: float = field(default_factory=time.monotonic, repr=False)
+
+    def set_stage(self, stage: str) -> None:
+        now = time.monotonic()
+        self.durations[self.stage] = round(now - self._stage_started, 3)
+        self.stage = stage
+        self.stage_times[stage] = _now()
+        self._stage_started = now
+        if stage in _FINISHED:
+            self.durations["total"] = round(now - self._started, 3)
+
+    @property
+    def upload_dir(self) -> Path:
+        """잡 전용 디렉터리 — 같은 내용을 동시에 올려도 서로의 파일을 지우지 않는다."""
+        return UPLOAD_ROOT / self.job_id
+
+    def on_pages(self, done: int, total: int) -> None:
+        self.pages_done = done
+        self.pages_total = total
+
+    def to_dict(self) -> dict[str, Any]:
+        data = {k: v for k, v in asdict(self).items() if not k.startswith("_")}
+        data["elapsed_seconds"] = round(time.monotonic() - self._started, 3)
+        return data
+
+
+class MoefUploadJobRegistry:
+    def __init__(self, max_jobs: int = _MAX_JOBS) -> None:
+        self._jobs: OrderedDict[str, MoefUploadJob] = OrderedDict()
+        self._active_by_sha: dict[str, str] = {}
+        self._max_jobs = max_jobs
+        self._lock = threading.Lock()
+
+    def create(self, original_filename: str) -> MoefUploadJob:
+        job = MoefUploadJob(job_id=uuid.uuid4().hex, original_filename=original_filename)
+        job.stage_times[STAGE_UPLOADING] = _now()
+        with self._lock:
+            self._jobs[job.job_id] = job
+            self._evict()
+        return job
+
+    def get(self, job_id: str) -> MoefUploadJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def claim(self, job: MoefUploadJob, stored: StoredFile) -> MoefUploadJob | None:
+        """업로드 완료 기록. 같은 내용의 잡이 진행 중이면 그 잡을 반환 (이 잡은 폐기)."""
+        with self._lock:
+            active_id = self._active_by_sha.get(stored.sha256)
+            active = self._jobs.get(active_id) if active_id else None
+            if active is not None and active.stage not in _FINISHED:
+                self._jobs.pop(job.job_id, None)
+                return active
+            self._active_by_sha[stored.sha256] = job.job_id
+        job.sha256 = stored.sha256
+        job.size_bytes = stored.size_bytes
+        job.set_stage(STAGE_UPLOADED)
+        return None
+
+    def discard(self, job: MoefUploadJob) -> None:
+        with self._lock:
+            self._jobs.pop(job.job_id, None)
+
+    def release(self, job: MoefUploadJob) -> None:
+        with self._lock:
+            if job.sha256 and self._active_by_sha.get(job.sha256) == job.job_id:
+                del self._active_by_sha[job.sha256]
+
+    def _evict(self) -> None:
+        while len(self._jobs) > self._max_jobs:
+            victim = next(
+                (jid for jid, j in self._jobs.items() if j.stage in _FINISHED),
+                next(iter(self._jobs)),
+            )
+            self._jobs.pop(victim)
+
+
+_registry = MoefUploadJobRegistry()
+
+
+def get_upload_jobs() -> MoefUploadJobRegistry:
+    return _registry
+
+
+async def iter_upload_chunks(read: Any, chunk_bytes: int = UPLOAD_CHUNK_BYTES) -> AsyncIterator[bytes]:
+    """``UploadFile.read`` 를 청크 비동기 이터레이터로."""
+    while True:
+        chunk = await read(chunk_bytes)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def run_moef_upload_job(
+    job: MoefUploadJob,
+    stored: StoredFile,
+    *,
+    source_type: str | None,
+    raw_title: str | None,
+    source_url: str | None,
+    published_at: datetime | None,
+) -> None:
+    """파싱(프로세스 풀) → 적재. 독립 세션·예외 격리, 끝나면 업로드 파일 삭제."""
+    try:
+        job.set_stage(STAGE_PARSING)
+        if resolve_format(stored.path) == ".pdf":
+            job.pages_total = await asyncio.to_thread(pdf_page_count, stored.path)
+        parsed = await get_parse_pool().parse(stored.path, sha256=stored.sha256, on_pages=job.on_pages)
+        if parsed.get("error"):
+            # 실패 행은 적재하지 않는다 — 적재 단계로 넘기면 같은 파일을 다시 파싱(실패는 캐시 안 됨)할 뿐
+            logger.warning("MOEF upload job parse error job=%s error=%s", job.job_id, parsed["error"])
+            job.error = f"parse error: {parsed['error']}"
+            job.set_stage(STAGE_FAILED)
+            return
+
+        job.set_stage(STAGE_INSERTING)
+        async with AsyncSessionLocal() as session:
+            svc = BronzeEconomicIngestService(session, None)
+            try:
+                job.result = await svc.ingest_moef_local_pdfs(
+                    paths=[stored.path],
+                    source_type=source_type,
+                    source_url=source_url,
+                    published_at=published_at,
+                    raw_title=raw_title,
+                    original_filename=job.original_filename,
+                    content_hashes={stored.path: stored.sha256},
+                    preparsed={stored.path: parsed},
+                )
+            finally:
+                await session.close()
+        job.set_stage(STAGE_INSERTED)
+        logger.info("MOEF upload job done job=%s file=%s result=%s", job.job_id, job.original_filename, job.result)
+    except Exception as exc:
+        logger.exception("MOEF upload job 실패 job=%s file=%s", job.job_id, job.original_filename)
+        job.error = str(exc)
+        job.set_stage(STAGE_FAILED)
+    finally:
+        get_upload_jobs().release(job)
+        await asyncio.to_thread(shutil.rmtree, job.upload_dir, True)
+
+
+__all__ = [
+    "MOEF_UPLOAD_MAX_BYTES",
+    "UPLOAD_ROOT",
+    "MoefUploadJob",
+    "MoefUploadJobRegistry",
+    "get_upload_jobs",
+    "iter_upload_chunks",
+    "run_moef_upload_job",
+]
@@ -0,0 +1,43 @@
+"""외부 API 키 쿼터 사용량 원장 (`api_quota_usage`) — Redis 장애 시 폴백 저장소.
+
+정상 경로는 Redis 해시(`core.api_quota`)이며, 본 테이블은 Redis 에 접근할 수 없을 때
+동일한 (provider, period_key) 단위로 사용량을 누적한다.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from core.database import Base
+
+
+class ApiQuotaUsage(Base):
+    __tablename__ = "api_quota_usage"
+    __table_args__ = ({"comment": "외부 API 키별 기간(일/월) 호출 사용량"},)
+
+    provider: Mapped[str] = mapped_column(
+        String(50), primary_key=True, comment="dart, naver_search, kipris 등 쿼터 단위"
+    )
+    period_key: Mapped[str] = mapped_column(
+        String(10), primary_key=True, comment="KST 기준 YYYY-MM-DD(일) 또는 YYYY-MM(월)"
+    )
+
+    used: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0", comment="전체 호출 수")
+    scheduled_used: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0", comment="스케줄 잡 호출 수 (예약분 차감)"
+    )
+    by_job: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, server_default="{}", comment="job 이름 → 호출 수"
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="마지막 차감 시각",
+    )
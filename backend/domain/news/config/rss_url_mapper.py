@@ -132,6 +132,45 @@ class RssUrlMapper:
         logger.info(f"카테고리 '{category}'의 RSS URL 개수: {len(rss_urls)}")
         return rss_urls
     
+    def get_feed_timeouts(self) -> Dict[str, float]:
+        """
+        피드별 요청 제한 시간 (source 에 ``timeout`` 이 지정된 것만)
+        
+        Returns:
+            RSS URL → 제한 시간(초)
+        """
+        timeouts = {}
+        sources = self.rss_config.get('rss', {}).get('sources', {})
+        for category_sources in sources.values():
+            for source in category_sources or []:
+                if source.get('url') and source.get('timeout'):
+                    timeouts[source['url']] = float(source['timeout'])
+        return timeouts
+    
+    def get_distinct_rss_urls(self, categories: List[str]) -> List[str]:
+        """
+        여러 카테고리의 RSS URL 합집합 (첫 등장 순서 유지)
+        
+        개발/기술/과학/IT → it-science, 이슈/사회 → society 처럼 같은 피드를 가리키는
+        카테고리는 URL 을 한 번만 담는다.
+        
+        Args:
+            categories: 카테고리명 목록 (한글 또는 영문)
+            
+        Returns:
+            중복 없는 RSS URL 목록
+        """
+        urls: Dict[str, None] = {}
+        seen_keys = set()
+        for category in categories:
+            category_key = self.CATEGORY_MAPPING.get(category, category.lower())
+            if category_key in seen_keys:
+                continue
+            seen_keys.add(category_key)
+            for url in self.get_rss_urls_by_category(category):
+                urls.setdefault(url, None)
+        return list(urls)
+    
     def get_all_categories(self) -> List[str]:
         """모든 카테고리 목록 반환"""
         return list(self.CATEGORY_MAPPING.keys())
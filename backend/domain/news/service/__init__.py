@@ -1,5 +1,6 @@
+from .feed_cache import FeedCache
 from .news_service import NewsService
 from .rss_service import RssService
 
-__all__ = ["NewsService", "RssService"]
+__all__ = ["FeedCache", "NewsService", "RssService"]
 
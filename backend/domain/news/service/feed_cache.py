@@ -0,0 +1,169 @@
+"""RSS 피드 메모리 캐시 — 피드 URL 별 파싱된 `NewsArticle` 목록 (stale-while-revalidate).
+
+``/api/news/search?query=<카테고리>`` 가 요청마다 카테고리의 피드를 전부 다시 받아 파싱하던 것을
+프로세스 메모리에서 바로 돌려준다.
+
+  - ``fresh``  : 수집 후 ``ttl - refresh_ahead`` 초 안 → 그대로 반환
+  - ``stale``  : 그 뒤 ``ttl`` 까지 → 캐시를 반환하고 백그라운드에서 다시 수집
+  - 만료       : ``ttl`` 이후 → 다시 수집할 때까지 기다린다. 수집이 실패(빈 목록·예외)하면
+                 ``max_stale`` 안의 이전 목록을 대신 돌려준다. 직전 수집이 ``retry_after`` 안에
+                 실패했다면 기다리지 않고 이전 목록을 바로 돌려주며 백그라운드에서 다시 수집한다
+                 (응답 없는 피드가 요청마다 타임아웃만큼 붙잡지 않도록)
+  - single-flight : 같은 URL 의 수집은 동시에 하나만 돈다 (동시 요청·백그라운드 갱신이 같은 Task 를 기다림)
+
+수집 실패 뒤에는 ``retry_after`` 초 동안 백그라운드 갱신을 다시 시작하지 않는다 (장애 피드 연타 방지).
+반환 목록은 캐시와 공유하므로 호출부에서 변경하지 않는다.
+
+설정 (환경 변수, 초): ``NEWS_RSS_CACHE_TTL_SEC`` (기본 300) · ``NEWS_RSS_REFRESH_AHEAD_SEC`` (60) ·
+``NEWS_RSS_MAX_STALE_SEC`` (3600) · ``NEWS_RSS_RETRY_AFTER_SEC`` (30)
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from ..model.news_article import NewsArticle
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_REFRESH_AHEAD_SECONDS = 60.0
+DEFAULT_MAX_STALE_SECONDS = 3600.0
+DEFAULT_RETRY_AFTER_SECONDS = 30.0
+
+FeedLoader = Callable[[str], Awaitable[List[NewsArticle]]]
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name) or default)
+    except ValueError:
+        return default
+
+
+@dataclass
+class _Entry:
+    articles: List[NewsArticle]
+    fetched_at: float
+    failed_at: float = 0.0
+
+
+class FeedCache:
+    """피드 URL → 파싱된 기사 목록. ``loader(url)`` 로 수집하고 TTL 안에서는 메모리에서 반환."""
+
+    def __init__(
+        self,
+        loader: FeedLoader,
+        *,
+        ttl: Optional[float] = None,
+        refresh_ahead: Optional[float] = None,
+        max_stale: Optional[float] = None,
+        retry_after: Optional[float] = None,
+    ):
+        self._loader = loader
+        self.ttl = ttl if ttl is not None else _env_float("NEWS_RSS_CACHE_TTL_SEC", DEFAULT_TTL_SECONDS)
+        ahead = (
+            refresh_ahead
+            if refresh_ahead is not None
+            else _env_float("NEWS_RSS_REFRESH_AHEAD_SEC", DEFAULT_REFRESH_AHEAD_SECONDS)
+        )
+        self.refresh_after = max(0.0, self.ttl - ahead)
+        self.max_stale = (
+            max_stale
+            if max_stale is not None
+            else _env_float("NEWS_RSS_MAX_STALE_SEC", DEFAULT_MAX_STALE_SECONDS)
+        )
+        self.retry_after = (
+            retry_after
+            if retry_after is not None
+            else _env_float("NEWS_RSS_RETRY_AFTER_SEC", DEFAULT_RETRY_AFTER_SECONDS)
+        )
+        self._entries: Dict[str, _Entry] = {}
+        self._inflight: Dict[str, "asyncio.Task[List[NewsArticle]]"] = {}
+        # 새 목록이 저장될 때마다 증가 — 캐시 내용으로 만든 파생 결과의 무효화 판단용
+        self.version = 0
+        self._counters = {"hit": 0, "stale_hit": 0, "miss": 0, "refresh": 0, "refresh_failed": 0}
+
+    async def get(self, url: str) -> List[NewsArticle]:
+        """캐시된 기사 목록 (필요하면 수집을 기다리거나 백그라운드 갱신을 건다)."""
+        entry = self._entries.get(url)
+        now = time.monotonic()
+        if entry is not None:
+            age = now - entry.fetched_at
+            if age < self.refresh_after:
+                self._counters["hit"] += 1
+                return entry.articles
+            if age < self.ttl:
+                self._counters["stale_hit"] += 1
+                if now - entry.failed_at >= self.retry_after:
+                    self._refresh(url)
+                return entry.articles
+            # 만료됐지만 방금 수집이 실패했다 — 다시 타임아웃을 기다리지 않고 이전 목록 + 백그라운드 재수집
+            recently_failed = entry.failed_at > 0 and now - entry.failed_at < self.retry_after
+            if recently_failed and age < self.ttl + self.max_stale:
+                self._counters["stale_hit"] += 1
+                self._refresh(url)
+                return entry.articles
+        self._counters["miss"] += 1
+        articles = await asyncio.shield(self._refresh(url))
+        if articles:
+            return articles
+        # 수집 실패 — 너무 오래되지 않은 이전 목록으로 대신한다
+        entry = self._entries.get(url)
+        if entry is not None and now - entry.fetched_at < self.ttl + self.max_stale:
+            return entry.articles
+        return []
+
+    async def get_many(self, urls: List[str]) -> List[List[NewsArticle]]:
+        """여러 피드를 동시에 — 입력 순서대로 목록 반환."""
+        return list(await asyncio.gather(*(self.get(url) for url in urls)))
+
+    def _refresh(self, url: str) -> "asyncio.Task[List[NewsArticle]]":
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(self._load(url))
+            self._inflight[url] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(url, None))
+        return task
+
+    async def _load(self, url: str) -> List[NewsArticle]:
+        self._counters["refresh"] += 1
+        try:
+            articles = await self._loader(url)
+        except Exception as e:
+            logger.error(f"RSS 피드 갱신 실패: URL={url}, error={e}")
+            articles = []
+        now = time.monotonic()
+        if articles:
+            previous = self._entries.get(url)
+            self._entries[url] = _Entry(articles=articles, fetched_at=now)
+            # 변경 없는 피드(304 등)는 같은 목록 객체가 돌아온다 — 파생 결과를 다시 만들 필요 없음
+            if previous is None or previous.articles is not articles:
+                self.version += 1
+        else:
+            self._counters["refresh_failed"] += 1
+            entry = self._entries.get(url)
+            if entry is not None:
+                entry.failed_at = now
+        return articles
+
+    async def aclose(self) -> None:
+        """진행 중인 수집(백그라운드 갱신 포함)을 취소하고 끝날 때까지 기다린다 (앱 종료 시)."""
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def invalidate(self, url: Optional[str] = None) -> None:
+        """캐시 비우기 (``url`` 없으면 전체)."""
+        if url is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(url, None)
+        self.version += 1
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._counters, "feeds": len(self._entries), "inflight": len(self._inflight)}
@@ -1,15 +1,25 @@
-import asyncio
+import heapq
 import httpx
-from typing import List, Optional
+import json
+from typing import Dict, List, Optional, Tuple
 import logging
-from bs4 import BeautifulSoup
 from datetime import datetime
+from core.api_quota import httpx_quota_hook
+from core.html_parse import first_image_src, html_text, text_and_first_image
 from ..model.news_article import NewsArticle
 from ..config.rss_url_mapper import RssUrlMapper
+from .feed_cache import FeedCache
 from .rss_service import RssService
 
 logger = logging.getLogger(__name__)
 
+# /api/news/latest 통합 대상 (Spring Boot와 동일한 카테고리 목록)
+LATEST_CATEGORIES = ["경제", "개발", "이슈", "정치", "사회", "과학", "기술", "엔터테인먼트", "스포츠", "세계"]
+# 피드 하나에서 통합 목록에 넣는 최대 기사 수 (한 피드가 목록을 독차지하지 않도록)
+LATEST_PER_FEED = 15
+# display 값별 직렬화 응답 캐시 최대 개수
+_LATEST_RESPONSE_CACHE_MAX = 32
+
 
 class NewsService:
     """뉴스 서비스 (RSS 및 네이버 API 통합)"""
@@ -24,8 +34,12 @@ class NewsService:
         """
         self.naver_client_id = naver_client_id
         self.naver_client_secret = naver_client_secret
-        self.rss_service = RssService()
         self.rss_url_mapper = RssUrlMapper()
+        self.rss_service = RssService(feed_timeouts=self.rss_url_mapper.get_feed_timeouts())
+        # 피드 URL 별 파싱 결과 캐시 (TTL·백그라운드 갱신·중복 수집 방지)
+        self.feed_cache = FeedCache(self.rss_service.fetch_news)
+        # display → (만들 때의 feed_cache.version, 직렬화된 /latest 응답)
+        self._latest_responses: Dict[Optional[int], Tuple[int, bytes]] = {}
         self.naver_api_url = "https://openapi.naver.com/v1/search/news.json"
     
     async def search_news(
@@ -86,25 +100,89 @@ class NewsService:
             return []
     
     async def _fetch_multiple_rss_feeds(self, rss_urls: List[str]) -> List[NewsArticle]:
-        """여러 RSS 피드를 비동기 병렬로 수집"""
-        # 동기 함수를 비동기로 실행
-        loop = asyncio.get_event_loop()
-        tasks = [
-            loop.run_in_executor(None, self.rss_service.fetch_news_from_rss, url)
-            for url in rss_urls
-        ]
-        
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        """여러 RSS 피드를 캐시에서 (없거나 만료된 피드만 비동기 병렬 수집)"""
+        results = await self.feed_cache.get_many(rss_urls)
         
         all_articles = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"RSS 피드 수집 실패: URL={rss_urls[i]}, error={result}")
-                continue
-            all_articles.extend(result)
+        for articles in results:
+            all_articles.extend(articles)
         
         return all_articles
     
+    async def get_latest_news(self, display: Optional[int] = None) -> List[NewsArticle]:
+        """
+        최신 뉴스 (여러 카테고리 통합)
+        
+        카테고리들이 가리키는 RSS URL 을 먼저 중복 없이 모아 한 번씩만 (캐시 경유, 병렬) 수집하고,
+        피드별 최신순 목록을 날짜 기준 힙 병합한 뒤 제목 중복을 제거한다.
+        
+        Args:
+            display: 반환할 최대 기사 수 (None 이면 전체)
+            
+        Returns:
+            최신순 뉴스 기사 목록
+        """
+        rss_urls = self.rss_url_mapper.get_distinct_rss_urls(LATEST_CATEGORIES)
+        feeds = await self.feed_cache.get_many(rss_urls)
+        return self._merge_latest(feeds, display)
+    
+    async def get_latest_news_response(self, display: Optional[int] = None) -> bytes:
+        """
+        ``/api/news/latest`` 응답 JSON (직렬화 결과 캐시)
+        
+        피드 캐시 내용이 바뀌지 않았으면 (``feed_cache.version`` 동일) 이전에 만든 바이트를 그대로 반환한다.
+        """
+        rss_urls = self.rss_url_mapper.get_distinct_rss_urls(LATEST_CATEGORIES)
+        # 수집 전에 읽는다 — 수집 중 갱신이 끼면 다음 요청에서 다시 만든다
+        version = self.feed_cache.version
+        feeds = await self.feed_cache.get_many(rss_urls)
+        
+        cached = self._latest_responses.get(display)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        articles = self._merge_latest(feeds, display)
+        body = json.dumps(
+            {
+                "success": True,
+                "articles": [article.dict() for article in articles],
+                "count": len(articles)
+            },
+            ensure_ascii=False,
+            separators=(",", ":")
+        ).encode("utf-8")
+        
+        if len(self._latest_responses) >= _LATEST_RESPONSE_CACHE_MAX:
+            self._latest_responses.clear()
+        self._latest_responses[display] = (version, body)
+        logger.info(f"최신 뉴스 응답 생성: 피드 수={len(rss_urls)}, 기사 수={len(articles)}")
+        return body
+    
+    def _merge_latest(
+        self, 
+        feeds: List[List[NewsArticle]], 
+        display: Optional[int]
+    ) -> List[NewsArticle]:
+        """피드별 최신순 목록 → 날짜 기준 힙 병합 + 제목 중복 제거 (display 개에서 중단)"""
+        heads = [feed[:LATEST_PER_FEED] for feed in feeds]
+        merged = heapq.merge(*heads, key=lambda article: article.date, reverse=True)
+        
+        seen = set()
+        articles = []
+        for article in merged:
+            if article.title in seen:
+                continue
+            seen.add(article.title)
+            articles.append(article)
+            if display and len(articles) >= display:
+                break
+        return articles
+    
+    async def aclose(self) -> None:
+        """진행 중인 피드 갱신을 취소한 뒤 RSS 공용 HTTP 클라이언트 종료 (앱 종료 시)"""
+        await self.feed_cache.aclose()
+        await self.rss_service.aclose()
+    
     def _remove_duplicates(self, articles: List[NewsArticle]) -> List[NewsArticle]:
         """중복 제거 (제목 기준)"""
         seen = set()
@@ -145,7 +223,9 @@ class NewsService:
             display = display or 20
             start = start or 1
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(
+                timeout=30.0, event_hooks={"request": [httpx_quota_hook("naver_search")]}
+            ) as client:
                 response = await client.get(
                     self.naver_api_url,
                     params={
@@ -187,13 +267,15 @@ class NewsService:
         """네이버 뉴스 아이템을 NewsArticle로 변환"""
         # HTML 태그 제거
         title = self._clean_html(item.get("title", ""))
-        description = self._clean_html(item.get("description", ""))
+        # description 은 한 번만 파싱해 텍스트와 첫 이미지를 함께 얻는다
+        description_text, description_img = text_and_first_image(item.get("description", ""))
+        description = self._decode_entities(description_text)
         
         # 날짜 포맷팅 (RFC 822 -> yyyy.MM.dd)
         date = self._format_naver_date(item.get("pubDate", ""))
         
         # 이미지 추출
-        image_url = self._extract_image_from_description(item.get("description", ""))
+        image_url = self._image_from_attrs(description_img)
         
         return NewsArticle(
             type=query or "뉴스",
@@ -210,16 +292,17 @@ class NewsService:
             return ""
         
         try:
-            soup = BeautifulSoup(html, "html.parser")
-            text = soup.get_text()
-            # HTML 엔티티 디코딩
-            text = text.replace("&quot;", "\"").replace("&amp;", "&")
-            text = text.replace("&lt;", "<").replace("&gt;", ">")
-            return text.strip()
+            return self._decode_entities(html_text(html))
         except Exception as e:
             logger.warning(f"HTML 정리 실패: {e}")
             return html
     
+    def _decode_entities(self, text: str) -> str:
+        """이중 이스케이프된 HTML 엔티티 디코딩"""
+        text = text.replace("&quot;", "\"").replace("&amp;", "&")
+        text = text.replace("&lt;", "<").replace("&gt;", ">")
+        return text.strip()
+    
     def _format_naver_date(self, pub_date: str) -> str:
         """네이버 API 날짜 포맷팅 (RFC 822 -> yyyy.MM.dd)"""
         if not pub_date:
@@ -249,20 +332,22 @@ class NewsService:
             return "https://placehold.co/400x250/000000/FFFFFF?text=NEWS"
         
         try:
-            soup = BeautifulSoup(description, "html.parser")
-            img = soup.find("img")
-            
-            if img:
-                # src, data-src 순서로 확인
-                for attr in ["src", "data-src", "data-lazy-src"]:
-                    url = img.get(attr, "")
-                    if url:
-                        if url.startswith("//"):
-                            return "https:" + url
-                        elif url.startswith("http://") or url.startswith("https://"):
-                            return url
+            _, img = text_and_first_image(description)
+            return self._image_from_attrs(img)
         except Exception as e:
             logger.debug(f"이미지 추출 실패: {e}")
         
         return "https://placehold.co/400x250/000000/FFFFFF?text=NEWS"
+    
+    def _image_from_attrs(self, img: Optional[dict]) -> str:
+        """<img> 속성에서 src, data-src, data-lazy-src 순서로 확인"""
+        if img:
+            for attr in ["src", "data-src", "data-lazy-src"]:
+                url = first_image_src(img, (attr,))
+                if url:
+                    if url.startswith("//"):
+                        return "https:" + url
+                    elif url.startswith("http://") or url.startswith("https://"):
+                        return url
+        return "https://placehold.co/400x250/000000/FFFFFF?text=NEWS"
 
@@ -1,20 +1,145 @@
+import asyncio
 import feedparser
-from bs4 import BeautifulSoup
+import hashlib
+import httpx
+import os
 import re
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional
 from datetime import datetime
 import logging
+from core.html_parse import first_image_src, html_text, text_and_first_image
 from ..model.news_article import NewsArticle
 
 logger = logging.getLogger(__name__)
 
+# 피드 1건 요청의 전체 제한 시간 (초) — rss-urls.yml source 의 ``timeout`` 으로 피드별 지정 가능
+DEFAULT_FEED_TIMEOUT_SECONDS = 10.0
+_FEED_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; NewsRssReader/1.0)",
+    "Accept": "application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8",
+}
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name) or default)
+    except ValueError:
+        return default
+
+
+@dataclass
+class _FeedState:
+    """피드별 마지막 응답 — 조건부 요청 헤더와 파싱 결과"""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    digest: bytes
+    articles: List[NewsArticle]
+
 
 class RssService:
     """RSS 피드 파싱 서비스"""
     
+    def __init__(self, feed_timeouts: Optional[Dict[str, float]] = None):
+        """
+        RssService 초기화
+        
+        Args:
+            feed_timeouts: 피드 URL → 요청 제한 시간(초). 없으면 ``NEWS_RSS_TIMEOUT_SEC`` (기본 10)
+        """
+        self.feed_timeouts = dict(feed_timeouts or {})
+        self.default_timeout = _env_float("NEWS_RSS_TIMEOUT_SEC", DEFAULT_FEED_TIMEOUT_SECONDS)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._closed = False
+        self._states: Dict[str, _FeedState] = {}
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """피드 공용 클라이언트 (호스트별 keep-alive 커넥션 재사용)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers=_FEED_HEADERS,
+                follow_redirects=True,
+                timeout=httpx.Timeout(self.default_timeout),
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """공용 클라이언트 종료 — 이후 ``fetch_news`` 는 클라이언트를 다시 만들지 않고 빈 목록을 반환"""
+        self._closed = True
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    async def fetch_news(self, rss_url: str) -> List[NewsArticle]:
+        """
+        RSS 피드에서 뉴스 기사 목록 반환 (비동기, 조건부 요청)
+        
+        이전 응답의 ETag / Last-Modified 로 ``If-None-Match`` / ``If-Modified-Since`` 를 보내고,
+        304 이거나 본문이 이전과 같으면 다시 파싱하지 않고 이전 목록을 그대로 반환한다.
+        feedparser 에는 받은 바이트만 넘긴다 (파싱은 스레드에서).
+        
+        Args:
+            rss_url: RSS 피드 URL
+            
+        Returns:
+            뉴스 기사 목록 (실패·종료 후 빈 목록)
+        """
+        if self._closed:
+            # 종료 뒤 남은 백그라운드 갱신이 닫히지 않을 새 클라이언트를 만들지 않도록
+            return []
+        state = self._states.get(rss_url)
+        headers = {}
+        if state is not None:
+            if state.etag:
+                headers["If-None-Match"] = state.etag
+            if state.last_modified:
+                headers["If-Modified-Since"] = state.last_modified
+        
+        timeout = self.feed_timeouts.get(rss_url, self.default_timeout)
+        try:
+            # httpx 타임아웃은 연결·읽기 단위라 전체 시간은 wait_for 로 묶는다
+            response = await asyncio.wait_for(
+                self._get_client().get(rss_url, headers=headers, timeout=timeout),
+                timeout=timeout
+            )
+            if response.status_code == 304 and state is not None:
+                logger.info(f"RSS 피드 변경 없음 (304): URL={rss_url}")
+                return state.articles
+            response.raise_for_status()
+        except asyncio.TimeoutError:
+            logger.error(f"RSS 피드 읽기 시간 초과: URL={rss_url}, timeout={timeout}s")
+            return []
+        except Exception as e:
+            logger.error(f"RSS 피드 읽기 실패: URL={rss_url}, 에러={e}")
+            return []
+        
+        content = response.content
+        digest = hashlib.sha256(content).digest()
+        if state is not None and state.digest == digest:
+            logger.info(f"RSS 피드 본문 동일: URL={rss_url}")
+            articles = state.articles
+        else:
+            response_headers = {
+                "content-type": response.headers.get("content-type", ""),
+                "content-location": str(response.url)
+            }
+            articles = await asyncio.to_thread(
+                self._parse_feed, content, rss_url, response_headers
+            )
+        
+        if articles:
+            self._states[rss_url] = _FeedState(
+                etag=response.headers.get("etag"),
+                last_modified=response.headers.get("last-modified"),
+                digest=digest,
+                articles=articles
+            )
+        return articles
+    
     def fetch_news_from_rss(self, rss_url: str) -> List[NewsArticle]:
         """
-        RSS 피드에서 뉴스 기사 목록 반환
+        RSS 피드에서 뉴스 기사 목록 반환 (동기 — feedparser 가 직접 HTTP 요청)
         
         Args:
             rss_url: RSS 피드 URL
@@ -22,8 +147,17 @@ class RssService:
         Returns:
             뉴스 기사 목록
         """
+        return self._parse_feed(rss_url, rss_url)
+    
+    def _parse_feed(
+        self, 
+        source, 
+        rss_url: str, 
+        response_headers: Optional[Dict[str, str]] = None
+    ) -> List[NewsArticle]:
+        """feedparser 입력(바이트 또는 URL) → 날짜순 기사 목록"""
         try:
-            feed = feedparser.parse(rss_url)
+            feed = feedparser.parse(source, response_headers=response_headers)
             
             if feed.bozo:
                 logger.warning(f"RSS 피드 파싱 오류: {rss_url}, {feed.bozo_exception}")
@@ -55,14 +189,16 @@ class RssService:
             if not title:
                 return None
             
-            description = self._clean_html(entry.get('description', ''))
+            # description 은 한 번만 파싱해 텍스트와 첫 이미지를 함께 얻는다
+            description_text, description_img = text_and_first_image(entry.get('description', ''))
+            description = self._decode_entities(description_text)
             link = entry.get('link', '')
             
             # 날짜 추출 및 포맷팅
             date = self._format_date(entry)
             
             # 이미지 URL 추출
-            image_url = self._extract_image_url(entry, rss_url)
+            image_url = self._extract_image_url(entry, rss_url, description_img or {})
             
             # 카테고리 추출
             category = self._extract_category_from_url(rss_url)
@@ -85,17 +221,17 @@ class RssService:
             return ""
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            text = soup.get_text()
-            # HTML 엔티티 디코딩
-            text = text.replace("&quot;", "\"").replace("&amp;", "&")
-            text = text.replace("&lt;", "<").replace("&gt;", ">")
-            text = text.replace("&nbsp;", " ").strip()
-            return text
+            return self._decode_entities(html_text(html))
         except Exception as e:
             logger.warning(f"HTML 정리 실패: {e}")
             return html
     
+    def _decode_entities(self, text: str) -> str:
+        """이중 이스케이프된 HTML 엔티티 디코딩"""
+        text = text.replace("&quot;", "\"").replace("&amp;", "&")
+        text = text.replace("&lt;", "<").replace("&gt;", ">")
+        return text.replace("&nbsp;", " ").strip()
+    
     def _format_date(self, entry) -> str:
         """날짜 포맷팅 (yyyy.MM.dd)"""
         try:
@@ -110,7 +246,7 @@ class RssService:
         
         return datetime.now().strftime("%Y.%m.%d")
     
-    def _extract_image_url(self, entry, rss_url: str) -> str:
+    def _extract_image_url(self, entry, rss_url: str, description_img: Optional[dict] = None) -> str:
         """이미지 URL 추출 (다양한 전략)"""
         # 1. 연합뉴스 전용 파서
         if 'yonhapnews' in rss_url or 'yna.co.kr' in rss_url:
@@ -126,8 +262,12 @@ class RssService:
                     if url:
                         return self._normalize_image_url(url)
         
-        # 3. Description HTML 파싱
-        if hasattr(entry, 'description'):
+        # 3. Description HTML 파싱 (호출부에서 이미 파싱했으면 그 결과 재사용)
+        if description_img is not None:
+            image_url = self._image_from_attrs(description_img)
+            if image_url:
+                return image_url
+        elif hasattr(entry, 'description'):
             image_url = self._extract_image_from_html(entry.description)
             if image_url:
                 return image_url
@@ -148,22 +288,25 @@ class RssService:
             return None
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
-            img = soup.find('img')
-            
-            if img:
-                # src, data-src, data-lazy-src 순서로 확인
-                for attr in ['src', 'data-src', 'data-lazy-src']:
-                    url = img.get(attr, '')
-                    if url:
-                        normalized = self._normalize_image_url(url)
-                        if self._is_valid_image_url(normalized):
-                            return normalized
+            _, img = text_and_first_image(html)
+            return self._image_from_attrs(img)
         except Exception as e:
             logger.debug(f"HTML 이미지 추출 실패: {e}")
         
         return None
     
+    def _image_from_attrs(self, img: Optional[dict]) -> Optional[str]:
+        """<img> 속성에서 src, data-src, data-lazy-src 순서로 유효한 URL"""
+        if not img:
+            return None
+        for attr in ['src', 'data-src', 'data-lazy-src']:
+            url = first_image_src(img, (attr,))
+            if url:
+                normalized = self._normalize_image_url(url)
+                if self._is_valid_image_url(normalized):
+                    return normalized
+        return None
+    
     def _extract_yonhap_image(self, entry) -> Optional[str]:
         """연합뉴스 전용 이미지 추출"""
         # 프로토콜 없는 URL 패턴: //img.yonhapnews.co.kr/...
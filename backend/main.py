@@ -23,10 +23,11 @@ sys.path.insert(0, str(Path(__file__).parent))
 # include_router(..., prefix="/api") 와 결합 시 최종 경로는 /api/oauth, ...
 # ---------------------------------------------------------------------------
 from api.v1.master.master_routor import router as master_v1_router
-from api.v1.news.news_routor import router as news_v1_router
+from api.v1.news.news_routor import news_service, router as news_v1_router
 from api.v1.oauth.oauth_routor import router as oauth_v1_router
 from api.v1.user.user_routor import router as user_v1_router
 from core.scheduler import start_scheduler, stop_scheduler
+from domain.master.hub.services.collectors.economic.common.doc_parse_pool import shutdown_parse_pool
 
 API_V1_PREFIX = "/api"
 
@@ -39,6 +40,8 @@ async def lifespan(app: FastAPI):
         yield
     finally:
         stop_scheduler()
+        shutdown_parse_pool()
+        await news_service.aclose()
 
 
 # Create FastAPI app
@@ -0,0 +1,68 @@
+"""DART 재무정보 일괄다운로드 파일 → R&D·CAPEX 로컬 스토어 적재.
+
+`DartPeriodicCollector` 재무 보강은 이 스토어를 먼저 조회하고, 미적중분만
+`fnlttSinglAcntAll` API 를 호출한다.
+
+파일 받기: https://opendart.fss.or.kr/disclosureinfo/fnltt/dwld/main.do
+  - 분기별 손익계산서(PL) · 현금흐름표(CF) ZIP 을 받는다 (BS 는 불필요)
+
+사용법::
+
+    cd backend
+
+    # ZIP/TXT 파일 또는 디렉터리 (기존 스토어와 병합)
+    python scripts/dart_bulk_financials_ingest.py ~/Downloads/2024_4Q_PL.zip ~/Downloads/2024_4Q_CF.zip
+    python scripts/dart_bulk_financials_ingest.py ~/Downloads/dart_bulk/
+
+    # 기존 스토어 무시하고 새로 생성
+    python scripts/dart_bulk_financials_ingest.py ~/Downloads/dart_bulk/ --replace
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+# backend 패키지를 Python path에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from domain.master.hub.services.collectors.economic.dart.dart_bulk_financials import (
+    build_store,
+    store_path,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger("dart_bulk_financials_ingest")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="DART 재무정보 일괄 파일 → R&D·CAPEX 스토어",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("paths", nargs="+", type=Path, help="ZIP/TXT 파일 또는 디렉터리")
+    parser.add_argument("--out", type=Path, default=None, help=f"스토어 경로. 기본: {store_path()}")
+    parser.add_argument("--replace", action="store_true", help="기존 스토어와 병합하지 않음")
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    df = build_store(args.paths, out=args.out, merge=not args.replace)
+    logger.info(
+        "완료: %s 키 (R&D %s · CAPEX %s), %.1fs",
+        len(df),
+        int(df["rnd"].notna().sum()),
+        int(df["capex"].notna().sum()),
+        time.perf_counter() - t0,
+    )
+
+
+if __name__ == "__main__":
+    main()
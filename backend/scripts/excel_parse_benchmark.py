@@ -0,0 +1,184 @@
+"""Excel 파싱 벤치마크 — pandas ``read_excel`` 전체 적재 vs openpyxl ``read_only`` 스트리밍.
+
+측정 항목 (엔진마다 새 프로세스):
+  - time   : 파싱 소요 시간
+  - rss    : 최대 RSS
+  - parity : pandas 결과 대비 셀 토큰 일치율 (공백 기준 토큰 다중집합, pandas 의 ``NaN`` 제외)
+
+파일을 주지 않으면 예산 편성표 모양의 합성 워크북(다중 시트 + 숨김·빈 시트)을 임시로 만든다.
+먼저 저장된 ``<dimension ref="A1"/>`` 이 틀린 5×4 워크북(기계 생성 정부 xlsx 에 흔함)으로 두 경로가
+같은 격자를 내는지 확인한다.
+
+사용법::
+
+    cd backend
+    python scripts/excel_parse_benchmark.py
+    python scripts/excel_parse_benchmark.py --sheets 12 --rows 30000
+    python scripts/excel_parse_benchmark.py path/to/budget.xlsx
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import random
+import resource
+import sys
+import tempfile
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+# backend 패키지를 Python path에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from domain.master.hub.services.collectors.economic.common._doc_parsers import (  # noqa: E402
+    _parse_excel_pandas,
+    _parse_excel_stream,
+)
+
+_ENGINES = {
+    "pandas read_excel": _parse_excel_pandas,
+    "openpyxl stream": _parse_excel_stream,
+}
+
+
+def _build_workbook(path: Path, sheets: int, rows: int) -> None:
+    import openpyxl
+
+    rng = random.Random(42)
+    wb = openpyxl.Workbook(write_only=True)
+    for s in range(sheets):
+        ws = wb.create_sheet(f"세출_{s + 1:02d}")
+        ws.append(["소관", "회계", "분야", "부문", "프로그램", "단위사업", "2025 예산", "2026 정부안", "증감", "증감률"])
+        for r in range(rows):
+            base = rng.randint(1_000, 5_000_000)
+            plan = base + rng.randint(-50_000, 200_000)
+            ws.append([
+                "과학기술정보통신부", "일반회계", "과학기술", f"부문{r % 17}", f"프로그램{r % 211}",
+                f"단위사업{r}", base, plan, plan - base, round((plan - base) / base * 100, 2),
+            ])
+    hidden = wb.create_sheet("내부계산")
+    hidden.sheet_state = "hidden"
+    for r in range(rows // 10):
+        hidden.append([r, r * 2, r * 3])
+    wb.create_sheet("빈시트")
+    wb.save(path)
+
+
+_DIMENSION_GRID = [
+    ["연도", "세입", "세출", "수지"],
+    ["2022", "553", "682", "-129"],
+    ["2023", "497", "610", "-113"],
+    ["2024", "502", "640", "-138"],
+    ["2025", "539", "673", "-134"],
+]
+
+
+def _build_wrong_dimension_workbook(path: Path) -> None:
+    """5×4 표를 쓰고 sheet1.xml 의 ``<dimension>`` 을 ``A1`` 으로 바꿔 저장."""
+    import openpyxl
+
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "재정수지"
+    for row in _DIMENSION_GRID:
+        ws.append([int(v) if v.lstrip("-").isdigit() else v for v in row])
+    raw = path.with_suffix(".raw.xlsx")
+    wb.save(raw)
+    with zipfile.ZipFile(raw) as src, zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                data = data.replace(b'<dimension ref="A1:D5"/>', b'<dimension ref="A1"/>')
+                assert b'<dimension ref="A1"/>' in data
+            dst.writestr(item, data)
+    raw.unlink()
+
+
+def _grid(full_text: str) -> list[list[str]]:
+    """파서 출력 → 셀 격자 (시트 머리줄 제외, pandas 의 ``NaN``·헤더 인덱스 없이 값만)."""
+    rows = []
+    for line in full_text.splitlines():
+        if not line.strip() or line.startswith("[시트:"):
+            continue
+        rows.append([c for c in line.split() if c != "NaN"])
+    return rows
+
+
+def _check_wrong_dimension(tmp: Path) -> None:
+    path = tmp / "wrong_dimension.xlsx"
+    _build_wrong_dimension_workbook(path)
+    print("저장된 dimension 이 틀린 워크북 (5×4, ref=\"A1\"):")
+    for label, parse in _ENGINES.items():
+        result = parse(path)
+        if result.get("error"):
+            print(f"  {label:<20} 건너뜀 ({result['error']})")
+            continue
+        grid = _grid(result.get("full_text") or "")
+        status = "OK" if grid == _DIMENSION_GRID else f"불일치 {grid}"
+        print(f"  {label:<20} {len(grid)}×{max((len(r) for r in grid), default=0)}  {status}")
+
+
+def _max_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _run(engine: str, path_str: str) -> dict[str, Any]:
+    t0 = time.perf_counter()
+    result = _ENGINES[engine](Path(path_str))
+    return {"seconds": time.perf_counter() - t0, "rss_mb": _max_rss_mb(), "result": result}
+
+
+def _in_fresh_process(engine: str, path: Path) -> dict[str, Any]:
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as ex:
+        return ex.submit(_run, engine, str(path)).result()
+
+
+def _parity(baseline: str, text: str) -> float:
+    a = Counter(t for t in baseline.split() if t != "NaN")
+    b = Counter(text.split())
+    total = max(sum(a.values()), sum(b.values()))
+    return sum((a & b).values()) / total if total else 1.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Excel 파싱 벤치마크")
+    parser.add_argument("xlsx", nargs="?", type=Path, default=None)
+    parser.add_argument("--sheets", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=20_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _check_wrong_dimension(Path(tmp))
+        path = args.xlsx
+        if path is None:
+            path = Path(tmp) / "synthetic_budget.xlsx"
+            t0 = time.perf_counter()
+            _build_workbook(path, args.sheets, args.rows)
+            print(f"합성 워크북: {args.sheets} 시트 × {args.rows:,} 행 + 숨김·빈 시트 "
+                  f"({path.stat().st_size / 1024 / 1024:.1f}MB, {time.perf_counter() - t0:.1f}s)")
+
+        runs = {engine: _in_fresh_process(engine, path) for engine in _ENGINES}
+        base = runs["pandas read_excel"]
+        base_text = base["result"].get("full_text") or ""
+        print(f"\n[{path.name}]")
+        print(f"  {'engine':<20} {'time':>9} {'speedup':>8} {'rss':>9} {'parity':>7} {'chars':>12} {'sheets':>6}")
+        for label, run in runs.items():
+            result = run["result"]
+            if result.get("error"):
+                print(f"  {label:<20} ERROR {result['error']}")
+                continue
+            text = result.get("full_text") or ""
+            print(
+                f"  {label:<20} {run['seconds']:8.2f}s {base['seconds'] / run['seconds']:7.1f}x "
+                f"{run['rss_mb']:7.0f}MB {_parity(base_text, text):7.3f} {len(text):12,d} "
+                f"{result.get('sheet_count', '-'):>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
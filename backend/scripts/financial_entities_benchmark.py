@@ -0,0 +1,201 @@
+"""금융 엔티티 추출 벤치마크 — 기존 금액 정규식 6개 + 제목 규칙 vs `financial_entities` 1회 스캔.
+
+스타트업 미디어 기사 모양(제목 + 본문 2천/8천/1만2천자)의 합성 문서로 문서당 소요 시간을 비교한다.
+
+  - legacy        : 기존 ``extract_investment_amount_krw`` (단위별 정규식 6개 순차) + 제목 첫 토큰
+  - legacy+multi  : 위 + 라운드·투자사·대상을 패턴별로 따로 스캔 (엔진과 같은 정보를 다중 패스로)
+  - extract       : `financial_entities.extract` (문서당 1회 스캔, 전 종류)
+  - extract_many  : `financial_entities.extract_many` (배치 전체 1회 스캔)
+
+마지막에 기존 함수와 금액을 비교한 샘플(복합·소수·외화 표기, 통화명으로 시작하는 한글 단어)을 보여준다. 네트워크·DB 불필요.
+
+사용법::
+
+    cd backend
+    python scripts/financial_entities_benchmark.py
+    python scripts/financial_entities_benchmark.py --docs 500 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import timeit
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+# backend 패키지를 Python path에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from domain.master.hub.services.collectors.economic.common import financial_entities
+from domain.master.hub.services.collectors.economic.common.financial_entities import (
+    extract,
+    extract_many,
+)
+
+# ---------------------------------------------------------------------------
+# 기존 구현 (비교 기준) — common/_rss_investment_krw.py · 수집기별 _extract_investor_from_title
+# ---------------------------------------------------------------------------
+
+_NUM = r"(\d{1,4}(?:,\d{3})+|\d+)"
+_LEGACY_PATTERNS: tuple[tuple[re.Pattern[str], int], ...] = (
+    (re.compile(_NUM + r"\s*조(?:\s*원)?"), 1_000_000_000_000),
+    (re.compile(_NUM + r"\s*억(?:\s*원)?"), 100_000_000),
+    (re.compile(_NUM + r"\s*만\s*원"), 10_000),
+    (re.compile(_NUM + r"\s*만원"), 10_000),
+    (re.compile(_NUM + r"\s*천\s*원"), 1_000),
+    (re.compile(_NUM + r"\s*천원"), 1_000),
+)
+
+
+def legacy_amount_krw(text: str | None) -> int | None:
+    if not text or not str(text).strip():
+        return None
+    s = str(text)
+    best: int | None = None
+    for pat, mult in _LEGACY_PATTERNS:
+        for m in pat.finditer(s):
+            raw = m.group(1).replace(",", "").strip()
+            if not raw.isdigit():
+                continue
+            val = int(raw) * mult
+            if val > 0 and (best is None or val > best):
+                best = val
+    return best
+
+
+def legacy_investor(title: str) -> str | None:
+    m = re.match(r"^([^,·]+)", title)
+    if not m:
+        return None
+    candidate = m.group(1).strip()
+    if not candidate or len(candidate) >= 50:
+        return None
+    return candidate[:255]
+
+
+def _split_alternatives() -> list[re.Pattern[str]]:
+    """엔진 분기를 종류별 정규식으로 따로 컴파일 (다중 패스 비교용, 금액은 기존 6개 정규식으로)."""
+    by_kind: dict[str, list[str]] = {}
+    for rx, kind in financial_entities._BRANCHES:
+        if kind != financial_entities.AMOUNT:
+            by_kind.setdefault(kind, []).append(rx)
+    return [re.compile("|".join(parts)) for parts in by_kind.values()]
+
+
+_MULTI = _split_alternatives()
+
+
+def legacy_multi(title: str, body: str) -> tuple[object, ...]:
+    text = f"{title}\n{body}"
+    return (
+        legacy_amount_krw(text),
+        legacy_investor(title),
+        *([m.group() for m in pat.finditer(text)] for pat in _MULTI),
+    )
+
+
+# ---------------------------------------------------------------------------
+# 합성 문서
+# ---------------------------------------------------------------------------
+
+_TITLES: tuple[str, ...] = (
+    "AI 스타트업 ○○, 150억원 규모 시리즈B 투자 유치",
+    "○○벤처스, 500억원 규모 세컨더리 펀드 결성",
+    "핀테크 기업 ○○, 프리IPO 라운드서 1,200억 조달",
+    "[AI서머리] ○○ 시드 투자 유치‧○○ 코스닥 상장 예비심사 청구",
+    "정부, 내년 창업지원 예산 3조원 편성",
+    "[인터뷰] 창업 10년차 대표가 말하는 조직문화",
+)
+_SENTENCES: tuple[str, ...] = (
+    "이번 라운드에는 카카오벤처스와 한국투자파트너스가 참여했다.",
+    "회사는 산업은행으로부터 후속 투자를 받았다고 밝혔다.",
+    "누적 투자금은 320억 원이며 기업가치는 약 2천억 원으로 평가받았다.",
+    "알토스벤처스는 바이오 스타트업에 50억 원을 투자했다.",
+    "스타트업 생태계 동향과 정책 변화에 대한 해설 기사 본문입니다.",
+    "행사에는 창업자 300여 명이 참석해 네트워킹 시간을 가졌다.",
+    "지난해 매출은 85억 원, 영업손실은 12억 원을 기록했다.",
+    "Altos Ventures and SoftBank Ventures Asia joined the Series A round.",
+    # 엔티티 없는 서술 문장 — 실제 기사처럼 본문 대부분을 차지
+    "대표는 고객 데이터를 기반으로 제품 완성도를 높이는 데 집중하겠다고 말했다.",
+    "해당 서비스는 출시 이후 빠르게 이용자를 늘리며 시장에서 주목을 받고 있다.",
+    "업계에서는 규제 환경 변화가 서비스 확장의 변수가 될 것으로 보고 있다.",
+    "회사는 하반기 중 동남아시아 시장 진출을 목표로 현지 파트너를 물색하고 있다.",
+    "이 플랫폼은 중소 제조사의 재고 관리와 물류 과정을 자동화한다.",
+    "공동창업자들은 대기업 연구소 출신으로 관련 분야에서 오랜 경험을 쌓았다.",
+    "채용 규모를 늘려 개발 조직을 두 배 이상 키운다는 계획이다.",
+    "전문가들은 기술 경쟁력과 함께 수익 구조를 증명하는 것이 관건이라고 지적했다.",
+)
+
+
+def _make_docs(n: int, body_chars: int, seed: int = 7) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    docs: list[tuple[str, str]] = []
+    for i in range(n):
+        parts: list[str] = []
+        size = 0
+        while size < body_chars:
+            s = rng.choice(_SENTENCES)
+            parts.append(s)
+            size += len(s) + 1
+        docs.append((_TITLES[i % len(_TITLES)], " ".join(parts)[:body_chars]))
+    return docs
+
+
+def _per_doc_us(fn: Callable[[], object], n_docs: int, repeat: int) -> float:
+    total = timeit.timeit(fn, number=repeat)
+    return total / repeat / n_docs * 1e6
+
+
+def _bench(docs: Sequence[tuple[str, str]], repeat: int) -> dict[str, float]:
+    n = len(docs)
+    return {
+        "legacy": _per_doc_us(
+            lambda: [(legacy_amount_krw(f"{t}\n{b}"), legacy_investor(t)) for t, b in docs], n, repeat
+        ),
+        "legacy+multi": _per_doc_us(lambda: [legacy_multi(t, b) for t, b in docs], n, repeat),
+        "extract": _per_doc_us(lambda: [extract(t, b) for t, b in docs], n, repeat),
+        "extract_many": _per_doc_us(lambda: extract_many(docs), n, repeat),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="금융 엔티티 추출 벤치마크")
+    parser.add_argument("--docs", type=int, default=200, help="본문 길이별 문서 수")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'body chars':>10}  timings (us/doc)")
+    print("-" * 90)
+    for chars in (0, 2000, 8000, 12000):
+        docs = _make_docs(args.docs, chars)
+        cells = "  ".join(f"{k}={v:8.1f}" for k, v in _bench(docs, args.repeat).items())
+        print(f"{chars:>10}  {cells}")
+
+    print("\n금액 비교 (legacy → extract):")
+    for text in (
+        "1조 5000억 원 규모 펀드 결성",
+        "3억 5천만 원 시드 투자",
+        "기업가치 2천억 원 인정",
+        "총 1.5조 원 규모",
+        "1억 달러 투자 유치",
+        "1억 엔을 투자 유치",
+        "참석자 3천 명, 5만 명 방문",
+        "5천만 원을 투자",
+        # 통화명으로 시작하는 한글 단어 — 통화가 아니므로 원화 금액 유지
+        "50억 엔터테인먼트 부문",
+        "50억 엔진 개발",
+        "50억 엔지니어링 계약",
+        "50억 엔비디아 칩 구매",
+        "50억 엔씨소프트 지분",
+        "50억 원자력 연구",
+        "50억 유로파 리그",
+        "50억 위안부 피해 지원",
+    ):
+        print(f"  {text:<26} {legacy_amount_krw(text)!s:>16} → {extract(text).amount_krw!s:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""HTML 파싱 벤치마크 — bs4(html.parser) vs bs4(lxml) vs `core.html_parse` 빠른 경로.
+
+측정 작업 (수집기·뉴스 서비스 실제 사용 패턴):
+  - list   : 게시판 목록 트리 + 행 select (``parse_bbs_list_rows`` 류)
+  - body   : 상세 페이지 본문 셀렉터 → 텍스트 (``_extract_main_text``·``wordpress_main_text`` 류)
+  - rss    : RSS description 텍스트 + 첫 ``<img>`` (기존: 같은 HTML 2회 파싱)
+
+녹화된 페이지 디렉터리를 주면 그 파일들로, 없으면 내장 합성 페이지로 측정한다.
+파일명에 ``list`` 가 들어가면 목록, ``rss``/``desc`` 면 description, 나머지는 상세로 취급.
+
+사용법::
+
+    cd backend
+    python scripts/html_parse_benchmark.py
+    python scripts/html_parse_benchmark.py --pages /tmp/recorded_pages --repeat 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# backend 패키지를 Python path에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup
+
+from core.html_parse import HTML_PARSER, select_text, text_and_first_image
+
+_BODY_SELECTORS = (
+    "div.board_view_con",
+    "div.board_view",
+    "div.view_con",
+    "div.bbs_view",
+    "article .entry-content",
+    "div.contents",
+)
+_LIST_ROW_SELECTOR = "table tbody tr"
+
+
+def _synthetic_pages() -> dict[str, list[str]]:
+    nav = "".join(f'<li><a href="/m{i}">메뉴 {i}</a></li>' for i in range(120))
+    rows = "".join(
+        f'<tr><td>{i}</td><td class="title"><a href="/bbs/view.do?nttSeqNo={1000 + i}">'
+        f"2026년 창업지원 사업 공고 {i}</a></td><td>담당부서</td><td class=\"date\">2026.06.{i % 28 + 1:02d}</td></tr>"
+        for i in range(10)
+    )
+    list_page = (
+        f"<html><head><script>var a = {{}};</script></head><body><ul class='gnb'>{nav}</ul>"
+        f"<table class='board_list'><thead><tr><th>번호</th></tr></thead><tbody>{rows}</tbody></table>"
+        f"<footer>{nav}</footer></body></html>"
+    )
+    para = "<p>중소벤처기업부는 올해 창업 생태계 활성화를 위해 예산을 확대한다고 밝혔다. &nbsp;</p>"
+    detail = (
+        f"<html><body><ul class='gnb'>{nav}</ul><div class='board_view'><h2>제목</h2>"
+        f"<div class='board_view_con'>{para * 120}</div></div><footer>{nav}</footer></body></html>"
+    )
+    desc = (
+        '<p><img src="//img.example.co.kr/photo/2026/06/01/a.jpg" alt="사진"></p>'
+        "<p>스타트업 ○○가 150억원 규모 시리즈B 투자를 유치했다. &amp; 후속 투자 예정.</p>"
+    )
+    return {"list": [list_page], "body": [detail], "rss": [desc] * 20}
+
+
+def _recorded_pages(root: Path) -> dict[str, list[str]]:
+    pages: dict[str, list[str]] = {"list": [], "body": [], "rss": []}
+    for path in sorted(root.glob("*.htm*")):
+        name = path.name.lower()
+        kind = "list" if "list" in name else "rss" if ("rss" in name or "desc" in name) else "body"
+        pages[kind].append(path.read_text(encoding="utf-8", errors="ignore"))
+    return pages
+
+
+def _bench(fn: Callable[[str], object], docs: list[str], repeat: int) -> float:
+    """문서당 평균 ms."""
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for doc in docs:
+            fn(doc)
+    return (time.perf_counter() - t0) / (repeat * len(docs)) * 1000
+
+
+def _bs4_body(parser: str) -> Callable[[str], str]:
+    def run(html: str) -> str:
+        soup = BeautifulSoup(html, parser)
+        for sel in _BODY_SELECTORS:
+            node = soup.select_one(sel)
+            if node:
+                return node.get_text(separator="\n", strip=True)
+        return (soup.body or soup).get_text(separator="\n", strip=True)
+
+    return run
+
+
+def _bs4_list(parser: str) -> Callable[[str], int]:
+    def run(html: str) -> int:
+        soup = BeautifulSoup(html, parser)
+        return sum(1 for tr in soup.select(_LIST_ROW_SELECTOR) if tr.select_one("td.title a"))
+
+    return run
+
+
+def _bs4_rss_twice(html: str) -> tuple[str, object]:
+    text = BeautifulSoup(html, "html.parser").get_text()
+    img = BeautifulSoup(html, "html.parser").find("img")
+    return text, img
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTML 파싱 백엔드 벤치마크")
+    parser.add_argument("--pages", type=Path, default=None, help="녹화된 *.html 디렉터리")
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    pages = _recorded_pages(args.pages) if args.pages else _synthetic_pages()
+    print(f"fast-path backend: {HTML_PARSER}  pages: " + ", ".join(f"{k}={len(v)}" for k, v in pages.items()))
+    if HTML_PARSER != "lxml":
+        print("lxml 미설치 — 빠른 경로가 html.parser 로 폴백되므로 차이가 나지 않는다.")
+
+    suites: dict[str, dict[str, Callable[[str], object]]] = {
+        "list": {
+            "bs4/html.parser": _bs4_list("html.parser"),
+            f"bs4/{HTML_PARSER} (make_soup)": _bs4_list(HTML_PARSER),
+        },
+        "body": {
+            "bs4/html.parser": _bs4_body("html.parser"),
+            f"bs4/{HTML_PARSER}": _bs4_body(HTML_PARSER),
+            "select_text": lambda h: select_text(h, _BODY_SELECTORS),
+        },
+        "rss": {
+            "bs4/html.parser x2": _bs4_rss_twice,
+            "text_and_first_image": text_and_first_image,
+        },
+    }
+    for kind, impls in suites.items():
+        docs = pages.get(kind) or []
+        if not docs:
+            continue
+        baseline: float | None = None
+        print(f"\n[{kind}]")
+        for label, fn in impls.items():
+            ms = _bench(fn, docs, args.repeat)
+            baseline = baseline or ms
+            print(f"  {label:<28} {ms:8.3f} ms/doc   x{baseline / ms:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
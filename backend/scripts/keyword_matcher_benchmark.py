@@ -0,0 +1,140 @@
+"""키워드 매처 마이크로 벤치마크 — 기존 수집기 루프 vs `KeywordMatcher` (scan / Aho-Corasick).
+
+각 수집기의 실제 규칙 집합으로 제목·본문 샘플을 분류해 항목당 소요 시간을 비교하고,
+패턴 수를 늘린 합성 집합으로 두 엔진의 교차점(`AC_MIN_PATTERNS` 근거)을 확인한다.
+네트워크·DB 불필요.
+
+사용법::
+
+    cd backend
+    python scripts/keyword_matcher_benchmark.py
+    python scripts/keyword_matcher_benchmark.py --repeat 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+# backend 패키지를 Python path에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from domain.master.hub.services.collectors.economic.common.keyword_matcher import (
+    AC_MIN_PATTERNS,
+    KeywordMatcher,
+)
+from domain.master.hub.services.collectors.economic.dart import dart_collector
+from domain.master.hub.services.collectors.economic.wowtale import wowtale_collector
+
+_TITLES: tuple[str, ...] = (
+    "주요사항보고서(유상증자결정)",
+    "[기재정정]주요사항보고서(타법인주식및출자증권취득결정)",
+    "주요사항보고서(전환사채권발행결정)",
+    "임원ㆍ주요주주특정증권등소유상황보고서",
+    "주요사항보고서(회사분할합병결정)",
+    "AI 스타트업 ○○, 150억원 규모 시리즈B 투자 유치",
+    "○○벤처스, 500억원 규모 세컨더리 펀드 결성",
+    "핀테크 기업 ○○, 코스닥 상장 예비심사 청구",
+    "[인터뷰] 창업 10년차 대표가 말하는 조직문화",
+    "정부, 내년 창업지원 예산 3조원 편성",
+)
+_BODY = ("스타트업 생태계 동향과 정책 변화에 대한 해설 기사 본문입니다. " * 40)[:2000]
+
+
+def _legacy_first(rules: Sequence[tuple[str, str]], default: str) -> Callable[[str], str]:
+    def classify(text: str) -> str:
+        for keyword, value in rules:
+            if keyword in text:
+                return value
+        return default
+
+    return classify
+
+
+def _legacy_any(keywords: Sequence[str]) -> Callable[[str], bool]:
+    def matches(text: str) -> bool:
+        return any(k in text for k in keywords)
+
+    return matches
+
+
+def _per_item_us(fn: Callable[[str], object], texts: Sequence[str], repeat: int) -> float:
+    total = timeit.timeit(lambda: [fn(t) for t in texts], number=repeat)
+    return total / repeat / len(texts) * 1e6
+
+
+def _row(label: str, n_patterns: int, texts: Sequence[str], fns: dict[str, Callable[[str], object]], repeat: int) -> None:
+    cells = "  ".join(f"{name}={_per_item_us(fn, texts, repeat):7.2f}" for name, fn in fns.items())
+    print(f"{label:<34} {n_patterns:>4}  {cells}  (us/item)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="KeywordMatcher 마이크로 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5000)
+    args = parser.parse_args()
+    repeat = args.repeat
+
+    print(f"AC_MIN_PATTERNS={AC_MIN_PATTERNS}\n")
+    print(f"{'rule set':<34} {'pats':>4}  timings")
+    print("-" * 100)
+
+    dart_rules = dart_collector._CLASSIFICATION_RULES
+    _row(
+        "DART 분류 (first, 제목)",
+        len(dart_rules),
+        _TITLES,
+        {
+            "legacy": _legacy_first(dart_rules, "-"),
+            "scan": KeywordMatcher(dart_rules, engine="scan").first,
+            "ac": KeywordMatcher(dart_rules, engine="ac").first,
+        },
+        repeat,
+    )
+
+    invest = wowtale_collector._INVESTMENT_KEYWORDS
+    _row(
+        "RSS 투자 필터 (any, 제목)",
+        len(invest),
+        _TITLES,
+        {
+            "legacy": _legacy_any(invest),
+            "scan": KeywordMatcher(invest, engine="scan").any,
+            "ac": KeywordMatcher(invest, engine="ac").any,
+        },
+        repeat,
+    )
+    _row(
+        "RSS 투자 필터 (any, 본문 2천자 미매칭)",
+        len(invest),
+        (_BODY,),
+        {
+            "legacy": _legacy_any(invest),
+            "scan": KeywordMatcher(invest, engine="scan").any,
+            "ac": KeywordMatcher(invest, engine="ac").any,
+        },
+        max(1, repeat // 10),
+    )
+
+    # 합성: 기존 키워드에 가상 종목·기관명을 붙여 패턴 수를 늘려 교차점 측정
+    base = tuple(k for k, _ in dart_rules) + tuple(invest)
+    for n in (32, 64, 128, 256, 512):
+        pats = tuple(f"{base[i % len(base)]}{i}" if i >= len(base) else base[i] for i in range(n))
+        rules = tuple((p, p) for p in pats)
+        for label, texts, rep in (("제목", _TITLES, repeat), ("본문", (_BODY,), max(1, repeat // 10))):
+            _row(
+                f"합성 {n}패턴 (matches, {label})",
+                n,
+                texts,
+                {
+                    "scan": KeywordMatcher(rules, engine="scan").match_indices,
+                    "ac": KeywordMatcher(rules, engine="ac").match_indices,
+                },
+                rep,
+            )
+
+
+if __name__ == "__main__":
+    main()
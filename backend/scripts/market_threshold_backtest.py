@@ -0,0 +1,147 @@
+"""급증 임계값 백테스트 CLI — `raw_market_timeseries` 만으로 (window, threshold) 그리드 평가.
+
+Collector 를 다시 돌리지 않고 적재된 일별 OHLCV 로 임계값 후보를 비교한다.
+
+사용법::
+
+    cd backend
+
+    # 거래량 급증 기본 그리드 (window 10/20/60 × threshold 1.5~3.0)
+    python scripts/market_threshold_backtest.py --detector volume
+
+    # 가격 Z-score 그리드 + 특정 티커 · 기간
+    python scripts/market_threshold_backtest.py --detector price_z --tickers SPY,QQQ --since 2024-01-01
+
+    # 그리드 직접 지정
+    python scripts/market_threshold_backtest.py --windows 20 --thresholds 1.5,2,2.5 --horizons 1,5
+
+    # JSON 으로 저장
+    python scripts/market_threshold_backtest.py --detector all --json out.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+# backend 패키지를 Python path에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from core.database import AsyncSessionLocal
+from domain.master.hub.services.market_threshold_backtest import (
+    DEFAULT_HORIZONS,
+    DEFAULT_WINDOWS,
+    DETECTORS,
+    GridResult,
+    load_panel,
+    run_grid,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    handlers=[logging.StreamHandler(sys.stdout)],
+)
+logger = logging.getLogger("market_threshold_backtest")
+
+
+def _csv(value: str | None, cast):
+    if not value:
+        return None
+    return [cast(v.strip()) for v in value.split(",") if v.strip()]
+
+
+def _fmt(v: float | None, pct: bool = True) -> str:
+    if v is None:
+        return "-"
+    return f"{v * 100:+.2f}%" if pct else f"{v:.2f}"
+
+
+def _print_results(results: list[GridResult]) -> None:
+    if not results:
+        print("결과 없음 (적재된 시계열이 없거나 조건에 맞는 티커가 없습니다)")
+        return
+    horizons = [h.horizon for h in results[0].horizons]
+    header = f"{'detector':<8} {'win':>4} {'thr':>5} {'signals':>8} {'/tk·yr':>7} {'tickers':>7}"
+    for h in horizons:
+        header += f" | {f'fwd{h}d':>8} {'hit':>6} {'base':>8}"
+    print("\n" + header)
+    print("-" * len(header))
+    for r in results:
+        line = (
+            f"{r.detector:<8} {r.window:>4} {r.threshold:>5.2f} {r.signals:>8,} "
+            f"{r.signals_per_ticker_year:>7.2f} {r.tickers_with_signal:>7}"
+        )
+        for h in r.horizons:
+            hit = f"{h.hit_rate * 100:.1f}%" if h.hit_rate is not None else "-"
+            line += f" | {_fmt(h.mean_return):>8} {hit:>6} {_fmt(h.baseline_mean_return):>8}"
+        print(line)
+    print()
+
+
+async def run(args: argparse.Namespace) -> list[GridResult]:
+    since = date.fromisoformat(args.since) if args.since else None
+    async with AsyncSessionLocal() as session:
+        panel = await load_panel(session, tickers=_csv(args.tickers, str), since=since)
+
+    detectors = DETECTORS if args.detector == "all" else (args.detector,)
+    windows = _csv(args.windows, int) or list(DEFAULT_WINDOWS)
+    thresholds = _csv(args.thresholds, float)
+    horizons = _csv(args.horizons, int) or list(DEFAULT_HORIZONS)
+
+    results: list[GridResult] = []
+    t0 = time.perf_counter()
+    for detector in detectors:
+        results.extend(
+            run_grid(
+                panel,
+                detector=detector,
+                windows=windows,
+                thresholds=thresholds,
+                horizons=horizons,
+            )
+        )
+    logger.info(
+        "그리드 평가 완료: %s 조합, %.2fs (panel %s 거래일 × %s 티커)",
+        len(results),
+        time.perf_counter() - t0,
+        panel.shape[0],
+        panel.shape[1],
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="raw_market_timeseries 기반 급증 임계값 그리드 백테스트",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--detector", choices=[*DETECTORS, "all"], default="volume")
+    parser.add_argument("--windows", default=None, help="쉼표 구분 롤링 윈도우(거래일). 기본: 10,20,60")
+    parser.add_argument("--thresholds", default=None, help="쉼표 구분 임계값. 기본: detector 별 기본 그리드")
+    parser.add_argument("--horizons", default=None, help="쉼표 구분 선행 수익률 기간(거래일). 기본: 1,5,20")
+    parser.add_argument("--tickers", default=None, help="쉼표 구분 티커 필터. 기본: 전체")
+    parser.add_argument("--since", default=None, metavar="YYYY-MM-DD", help="이 날짜 이후 거래일만 사용")
+    parser.add_argument("--json", default=None, metavar="PATH", help="결과를 JSON 파일로 저장")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    _print_results(results)
+
+    if args.json:
+        Path(args.json).write_text(
+            json.dumps([r.to_dict() for r in results], ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+        logger.info("JSON 저장: %s", args.json)
+
+
+if __name__ == "__main__":
+    main()
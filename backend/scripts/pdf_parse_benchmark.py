@@ -0,0 +1,113 @@
+"""PDF 추출 엔진 벤치마크 — pdfplumber vs PyMuPDF 빠른 경로 vs 페이지 병렬(프로세스 풀).
+
+측정 항목 (문서별):
+  - time   : 추출 소요 시간 (파일 열기 포함)
+  - rss    : 측정 프로세스(및 풀 워커) 최대 RSS — 엔진마다 새 프로세스에서 측정
+  - parity : pdfplumber 결과 대비 텍스트 일치율 (공백 기준 토큰 다중집합 겹침)
+  - fb     : PyMuPDF 경로에서 표 위주로 판정돼 pdfplumber 로 다시 뽑은 페이지 수
+
+기본 대상은 ``backend/scripts/*.pdf`` (26년 예산안 국회통과, 2025~2029 국가재정운용계획).
+
+사용법::
+
+    cd backend
+    python scripts/pdf_parse_benchmark.py
+    python scripts/pdf_parse_benchmark.py "scripts/251202 26년 예산안 국회통과★ (1).pdf" --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+# backend 패키지를 Python path에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from domain.master.hub.services.collectors.economic.common._doc_parsers import parse_pdf  # noqa: E402
+from domain.master.hub.services.collectors.economic.common.doc_parse_pool import (  # noqa: E402
+    DocumentParsePool,
+)
+
+_SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+def _max_rss_mb() -> float:
+    """자신과 (종료·회수된) 자식 프로세스 중 최대 RSS — Linux ru_maxrss 는 KB."""
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return max(own, children) / 1024
+
+
+def _run_engine(path_str: str, engine: str) -> dict[str, Any]:
+    t0 = time.perf_counter()
+    result = parse_pdf(Path(path_str), engine=engine)
+    elapsed = time.perf_counter() - t0
+    return {"seconds": elapsed, "rss_mb": _max_rss_mb(), "result": result}
+
+
+def _run_pool(path_str: str, workers: int) -> dict[str, Any]:
+    pool = DocumentParsePool(max_workers=workers, use_cache=False, parallel_min_pages=1)
+    pool.parse_sync(path_str)  # 워커 spawn·import 비용은 측정에서 제외
+    t0 = time.perf_counter()
+    result = pool.parse_sync(path_str)
+    elapsed = time.perf_counter() - t0
+    pool.shutdown()
+    while multiprocessing.active_children():  # 워커 회수 → RUSAGE_CHILDREN 반영
+        time.sleep(0.05)
+    return {"seconds": elapsed, "rss_mb": _max_rss_mb(), "result": result}
+
+
+def _in_fresh_process(fn: Any, *args: Any) -> dict[str, Any]:
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as ex:
+        return ex.submit(fn, *args).result()
+
+
+def _parity(baseline: str, text: str) -> float:
+    a, b = Counter(baseline.split()), Counter(text.split())
+    total = max(sum(a.values()), sum(b.values()))
+    return sum((a & b).values()) / total if total else 1.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PDF 추출 엔진 벤치마크")
+    parser.add_argument("pdfs", nargs="*", type=Path, help="대상 PDF (기본: scripts/*.pdf)")
+    parser.add_argument("--workers", type=int, default=4, help="페이지 병렬 워커 수")
+    args = parser.parse_args()
+
+    pdfs = args.pdfs or sorted(_SCRIPTS_DIR.glob("*.pdf"))
+    if not pdfs:
+        print("대상 PDF 없음")
+        return
+
+    for pdf in pdfs:
+        runs = {
+            "pdfplumber": _in_fresh_process(_run_engine, str(pdf), "pdfplumber"),
+            "pymupdf": _in_fresh_process(_run_engine, str(pdf), "pymupdf"),
+            f"pymupdf pool x{args.workers}": _in_fresh_process(_run_pool, str(pdf), args.workers),
+        }
+        base = runs["pdfplumber"]
+        base_text = base["result"].get("full_text") or ""
+        print(f"\n[{pdf.name}] pages={base['result'].get('page_count')}  size={pdf.stat().st_size / 1024:.0f}KB")
+        print(f"  {'engine':<20} {'time':>9} {'speedup':>8} {'rss':>9} {'parity':>7} {'chars':>8} {'fb':>4}")
+        for label, run in runs.items():
+            result = run["result"]
+            if result.get("error"):
+                print(f"  {label:<20} ERROR {result['error']}")
+                continue
+            text = result.get("full_text") or ""
+            print(
+                f"  {label:<20} {run['seconds']:8.3f}s {base['seconds'] / run['seconds']:7.1f}x "
+                f"{run['rss_mb']:7.0f}MB {_parity(base_text, text):7.3f} {len(text):8,d} "
+                f"{result.get('table_fallback_pages', '-'):>4}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,7 @@ from domain.master.hub.services.collectors.economic.wowtale.wowtale_archive_craw
     _fetch_html,
     _parse_archive_page,
     _parse_article_page,
+    make_archive_client,
 )
 
 _KST = timezone(timedelta(hours=9))
@@ -40,7 +41,8 @@ async def test_archive_crawler() -> None:
     # [1] 카테고리 아카이브 페이지 파싱 테스트
     # ------------------------------------------------------------------
     print("\n[1/4] 카테고리 아카이브 페이지 파싱 테스트 (funding p.1)")
-    html = _fetch_html("https://wowtale.net/category/funding/")
+    async with make_archive_client() as client:
+        html = await _fetch_html(client, "https://wowtale.net/category/funding/")
     if not html:
         print("  FAIL: HTML 응답 없음")
         return
@@ -63,7 +65,8 @@ async def test_archive_crawler() -> None:
     # ------------------------------------------------------------------
     print("\n[2/4] 기사 상세 페이지 파싱 테스트")
     if refs:
-        article_html = _fetch_html(refs[0].url)
+        async with make_archive_client() as client:
+            article_html = await _fetch_html(client, refs[0].url)
         published_at, body_text = _parse_article_page(article_html)
         print(f"  발행일     : {published_at}")
         print(f"  본문 길이  : {len(body_text)}자")
@@ -76,7 +79,7 @@ async def test_archive_crawler() -> None:
     # [3] 크롤러 소규모 실행 테스트 (1페이지, DB 적재 전)
     # ------------------------------------------------------------------
     print("\n[3/4] 크롤러 소규모 실행 (funding 1페이지, DB 적재 안 함)")
-    crawler = WowtaleArchiveCrawler(sleep_sec=0.5, article_sleep_sec=0.3)
+    crawler = WowtaleArchiveCrawler(sleep_sec=0.3, resume=False)
     dtos = await crawler.crawl_category("funding", max_pages=1)
     print(f"  수집 건수   : {len(dtos)}건")
     if dtos:
@@ -1,8 +1,11 @@
-"""Wowtale 아카이브 과거 데이터 Backfill CLI.
+"""Wowtale 과거 데이터 Backfill CLI.
 
-카테고리 아카이브 페이지(/category/funding/page/N/ 등)를 순회해
 RSS 수집기가 커버하지 못하는 과거 기사를 raw_economic_data 에 적재한다.
 
+  - ``--mode rest`` (기본): WordPress REST API(wp-json/wp/v2/posts) 로 요청당 100건.
+    REST 가 막혀 있으면 자동으로 HTML 아카이브 크롤로 폴백한다.
+  - ``--mode html``: 카테고리 아카이브 페이지(/category/funding/page/N/ 등) + 기사 페이지 크롤.
+
 사용법::
 
     cd backend
@@ -19,9 +22,14 @@ RSS 수집기가 커버하지 못하는 과거 기사를 raw_economic_data 에 
     # 페이지 수 제한 (테스트용)
     python scripts/wowtale_backfill.py --max-pages 3 --categories funding
 
-예상 소요 시간 (기본 설정):
-    본문 크롤링 ON  : 3 카테고리 × 50 페이지 × 20건 × 1.5초 ≈ 75분
-    본문 크롤링 OFF : 3 카테고리 × 50 페이지 × 1초 ≈ 2.5분
+    # 중단된 Backfill 은 같은 인자로 다시 실행하면 체크포인트 다음 페이지부터 이어간다.
+    # 처음부터 다시 돌리려면 --no-resume
+
+예상 소요 시간 (--mode rest): 1년치 ≈ 카테고리 합산 글 수 / 100 요청 × 0.5초 — 수십 초
+
+예상 소요 시간 (--mode html, wowtale.net 요청 간격 0.25초 · 동시 4개, 카테고리 동시 순회):
+    본문 크롤링 ON  : 3 카테고리 × 50 페이지 × (1 + 20건) 요청 × 0.25초 ≈ 13분
+    본문 크롤링 OFF : 3 카테고리 × 50 페이지 × 0.25초 ≈ 40초
 """
 
 from __future__ import annotations
@@ -64,18 +72,29 @@ async def run_backfill(
     from_date: datetime | None,
     category_slugs: list[str] | None,
     fetch_article_body: bool,
-    sleep_sec: float,
+    sleep_sec: float | None,
+    resume: bool,
+    mode: str,
 ) -> dict:
     categories = _build_categories(category_slugs) if category_slugs else None
 
     async with AsyncSessionLocal() as session:
         svc = BronzeEconomicIngestService(session, None)
+        if mode == "rest":
+            return await svc.ingest_wordpress_backfill(
+                "wowtale",
+                categories=categories,
+                from_date=from_date,
+                max_pages=max_pages,
+                fetch_article_body=fetch_article_body,
+            )
         result = await svc.ingest_wowtale_archive(
             max_pages=max_pages,
             from_date=from_date,
             fetch_article_body=fetch_article_body,
             sleep_sec=sleep_sec,
             categories=categories,
+            resume=resume,
         )
 
     return result
@@ -88,6 +107,13 @@ def _print_result(result: dict) -> None:
     print(f"  수집 건수   : {result.get('fetched', 0):,}건")
     print(f"  신규 삽입   : {result.get('inserted', 0):,}건")
     print(f"  중복 스킵   : {result.get('not_inserted', 0):,}건")
+    if result.get("mode"):
+        print(f"  모드        : {result['mode']} (REST 요청 {result.get('requests', '-')}회)")
+    for slug, st in (result.get("categories") or {}).items():
+        print(
+            f"  [{slug}] p{st.get('start_page')}부터 {st.get('pages', 0)}페이지 · "
+            f"{st.get('articles', 0)}건 · {'완료' if st.get('completed') else '미완료(재개 가능)'}"
+        )
     type_counts = result.get("source_type_counts", {})
     if type_counts:
         print("\n  source_type 분포:")
@@ -102,6 +128,12 @@ def main() -> None:
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=__doc__,
     )
+    parser.add_argument(
+        "--mode",
+        choices=("rest", "html"),
+        default="rest",
+        help="rest: WordPress REST API (기본, HTML 폴백) / html: 아카이브 페이지 크롤",
+    )
     parser.add_argument(
         "--from-date",
         default=None,
@@ -133,9 +165,14 @@ def main() -> None:
     parser.add_argument(
         "--sleep",
         type=float,
-        default=1.0,
+        default=None,
         metavar="SEC",
-        help="페이지 요청 간 대기 시간(초) (기본: 1.0)",
+        help="wowtale.net 요청 간 최소 간격(초, 카테고리·상세 요청 전체 공유) (기본: 0.25)",
+    )
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="체크포인트를 무시하고 1페이지부터 다시 수집",
     )
     args = parser.parse_args()
 
@@ -151,7 +188,8 @@ def main() -> None:
         from_date = datetime.now(_KST) - timedelta(days=365)
 
     logger.info(
-        "Backfill 시작 | max_pages=%s | from_date=%s | categories=%s | article_body=%s",
+        "Backfill 시작 | mode=%s | max_pages=%s | from_date=%s | categories=%s | article_body=%s",
+        args.mode,
         args.max_pages,
         from_date.date(),
         args.categories or "기본값(funding, venture-capital, Global-news)",
@@ -165,6 +203,8 @@ def main() -> None:
             category_slugs=args.categories,
             fetch_article_body=not args.no_article_body,
             sleep_sec=args.sleep,
+            resume=not args.no_resume,
+            mode=args.mode,
         )
     )
     _print_result(result)